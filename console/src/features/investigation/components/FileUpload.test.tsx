@@ -35,14 +35,14 @@ describe("FileUpload", () => {
   it("renders drop zone with instruction text", () => {
     const { container } = renderWithProvider({ onFilesChanged: vi.fn() });
     const text = container.textContent ?? "";
-    expect(text).toContain("Drop CSV, Excel, or PDF");
+    expect(text).toContain("Drop CSV, Excel, PDF, or SMILES");
   });
 
   it("renders hidden file input with accepted types", () => {
     const { container } = renderWithProvider({ onFilesChanged: vi.fn() });
     const input = container.querySelector('input[type="file"]') as HTMLInputElement;
     expect(input).not.toBeNull();
-    expect(input.accept).toBe(".csv,.xlsx,.pdf");
+    expect(input.accept).toBe(".csv,.xlsx,.pdf,.smi");
     expect(input.multiple).toBe(true);
   });
 
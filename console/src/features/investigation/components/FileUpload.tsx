@@ -10,7 +10,7 @@ import { useUpload } from "../hooks/use-upload";
 import { DataPreview } from "./DataPreview";
 import type { UploadResponse } from "../types";
 
-const ACCEPTED_TYPES = ".csv,.xlsx,.pdf";
+const ACCEPTED_TYPES = ".csv,.xlsx,.pdf,.smi";
 const MAX_FILES = 10;
 const MAX_FILE_SIZE = 50 * 1024 * 1024; // 50 MB
 
@@ -170,7 +170,7 @@ export const FileUpload = forwardRef<FileUploadRef, FileUploadProps>(
                 <span className="font-mono text-[11px]">
                   {pendingCount > 0
                     ? `Uploading ${pendingCount} file${pendingCount > 1 ? "s" : ""}...`
-                    : "Drop CSV, Excel, or PDF files here, or click to browse"}
+                    : "Drop CSV, Excel, PDF, or SMILES files here, or click to browse"}
                 </span>
               </button>
             )}
@@ -11,24 +11,16 @@ from ehrlich.analysis.domain.enrichment import EnrichmentResult
 if TYPE_CHECKING:
     from ehrlich.analysis.domain.compound import CompoundSearchResult
     from ehrlich.analysis.domain.dataset import Dataset
-    from ehrlich.analysis.domain.repository import CompoundSearchRepository, DatasetRepository
+    from ehrlich.analysis.domain.repository import (
+        CompoundSearchRepository,
+        DatasetRepository,
+        SimilaritySearchRepository,
+    )
+    from ehrlich.shared.alerts import AlertCatalog
     from ehrlich.shared.chemistry_port import ChemistryPort
 
 logger = logging.getLogger(__name__)
 
-_KNOWN_SUBSTRUCTURES: dict[str, tuple[str, str]] = {
-    "beta_lactam": ("[C@@H]1([C@@H](N1)C(=O)O)S", "Beta-lactam ring (penicillins)"),
-    "fluoroquinolone": ("c1cc2c(cc1F)c(=O)c(cn2)C(=O)O", "Fluoroquinolone core"),
-    "sulfonamide": ("NS(=O)(=O)c1ccc(N)cc1", "Sulfonamide group"),
-    "benzene": ("c1ccccc1", "Benzene ring"),
-    "phenol": ("c1ccc(cc1)O", "Phenol group"),
-    "amine": ("[NX3;H2,H1,H0]", "Primary/secondary/tertiary amine"),
-    "carboxylic_acid": ("[CX3](=O)[OX2H1]", "Carboxylic acid"),
-    "amide": ("[CX3](=[OX1])[NX3]", "Amide bond"),
-    "hydroxyl": ("[OX2H]", "Hydroxyl group"),
-    "nitro": ("[NX3](=O)=O", "Nitro group"),
-}
-
 
 class AnalysisService:
     def __init__(
@@ -36,14 +28,22 @@ class AnalysisService:
         repository: DatasetRepository,
         compound_repo: CompoundSearchRepository | None = None,
         chemistry: ChemistryPort | None = None,
+        similarity_index: SimilaritySearchRepository | None = None,
+        alerts: AlertCatalog | None = None,
     ) -> None:
         self._repository = repository
         self._compound_repo = compound_repo
+        self._similarity_index = similarity_index
         if chemistry is None:
             from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
 
             chemistry = RDKitAdapter()
         self._adapter = chemistry
+        if alerts is None:
+            from ehrlich.chemistry.infrastructure.alert_catalog import load_alert_catalog
+
+            alerts = load_alert_catalog()
+        self._enrichment_alerts = alerts.select("enrichment")
 
     async def search_compounds(self, query: str, limit: int = 10) -> list[CompoundSearchResult]:
         if self._compound_repo is None:
@@ -57,6 +57,13 @@ class AnalysisService:
             return []
         return await self._compound_repo.search_by_similarity(smiles, threshold, limit)
 
+    async def search_local_similarity(
+        self, smiles: str, threshold: float = 0.4, limit: int = 10
+    ) -> list[CompoundSearchResult]:
+        if self._similarity_index is None:
+            return []
+        return await self._similarity_index.search_by_similarity(smiles, threshold, limit)
+
     async def explore(self, target: str, threshold: float = 1.0) -> Dataset:
         return await self._repository.load(target, threshold)
 
@@ -80,13 +87,12 @@ class AnalysisService:
         ]
         if not active_smiles or not inactive_smiles:
             return []
-        for name, (pattern, desc) in _KNOWN_SUBSTRUCTURES.items():
-            active_hits = sum(
-                1 for s in active_smiles if self._adapter.substructure_match(s, pattern)[0]
-            )
-            inactive_hits = sum(
-                1 for s in inactive_smiles if self._adapter.substructure_match(s, pattern)[0]
-            )
+        alerts = self._enrichment_alerts
+        active_counts = self._adapter.alert_matrix(active_smiles, alerts).hits.sum(axis=0)
+        inactive_counts = self._adapter.alert_matrix(inactive_smiles, alerts).hits.sum(axis=0)
+        for j, alert in enumerate(alerts):
+            active_hits = int(active_counts[j])
+            inactive_hits = int(inactive_counts[j])
             table = np.array(
                 [
                     [active_hits, len(active_smiles) - active_hits],
@@ -105,12 +111,12 @@ class AnalysisService:
             odds_ratio = (a * d) / (b * c) if (b * c) > 0 else float("inf")
             results.append(
                 EnrichmentResult(
-                    substructure=name,
+                    substructure=alert.name,
                     p_value=p_value,
                     odds_ratio=odds_ratio,
                     active_count=active_hits,
                     total_count=active_hits + inactive_hits,
-                    description=desc,
+                    description=alert.description,
                 )
             )
         results.sort(key=lambda r: r.p_value)
@@ -119,30 +125,24 @@ class AnalysisService:
     async def compute_properties(self, dataset: Dataset) -> dict[str, object]:
         if dataset.size == 0:
             return {"error": "Empty dataset"}
-        active_descs = []
-        inactive_descs = []
-        for i, smiles in enumerate(dataset.smiles_list):
-            try:
-                desc = self._adapter.compute_descriptors(smiles)
-            except Exception:
-                continue
-            if dataset.activities[i] >= 0.5:
-                active_descs.append(desc)
-            else:
-                inactive_descs.append(desc)
+        matrix = self._adapter.compute_descriptors_batch(dataset.smiles_list)
+        is_active = np.asarray(dataset.activities, dtype=np.float64) >= 0.5
+        active = matrix.values[matrix.valid & is_active]
+        inactive = matrix.values[matrix.valid & ~is_active]
         props = ["molecular_weight", "logp", "tpsa", "hbd", "hba", "rotatable_bonds", "qed"]
         summary: dict[str, object] = {
             "total": dataset.size,
-            "active_count": len(active_descs),
-            "inactive_count": len(inactive_descs),
+            "active_count": len(active),
+            "inactive_count": len(inactive),
         }
         for prop in props:
-            active_vals = [getattr(d, prop) for d in active_descs] if active_descs else []
-            inactive_vals = [getattr(d, prop) for d in inactive_descs] if inactive_descs else []
+            col = matrix.columns.index(prop)
+            active_vals = active[:, col]
+            inactive_vals = inactive[:, col]
             summary[prop] = {
-                "active_mean": float(np.mean(active_vals)) if active_vals else 0.0,
-                "active_std": float(np.std(active_vals)) if active_vals else 0.0,
-                "inactive_mean": float(np.mean(inactive_vals)) if inactive_vals else 0.0,
-                "inactive_std": float(np.std(inactive_vals)) if inactive_vals else 0.0,
+                "active_mean": float(np.mean(active_vals)) if active_vals.size else 0.0,
+                "active_std": float(np.std(active_vals)) if active_vals.size else 0.0,
+                "inactive_mean": float(np.mean(inactive_vals)) if inactive_vals.size else 0.0,
+                "inactive_std": float(np.std(inactive_vals)) if inactive_vals.size else 0.0,
             }
         return summary
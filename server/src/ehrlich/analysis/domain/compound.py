@@ -3,7 +3,7 @@ from dataclasses import dataclass
 
 @dataclass(frozen=True)
 class CompoundSearchResult:
-    """Compound search result from PubChem."""
+    """Compound search result from PubChem or the local ChEMBL similarity index."""
 
     cid: int
     smiles: str
@@ -11,3 +11,4 @@ class CompoundSearchResult:
     molecular_formula: str
     molecular_weight: float
     source: str = "pubchem"
+    similarity: float | None = None
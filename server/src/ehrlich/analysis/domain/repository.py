@@ -31,6 +31,13 @@ class CompoundSearchRepository(ABC):
     ) -> list[CompoundSearchResult]: ...
 
 
+class SimilaritySearchRepository(ABC):
+    @abstractmethod
+    async def search_by_similarity(
+        self, smiles: str, threshold: float = 0.4, limit: int = 10
+    ) -> list[CompoundSearchResult]: ...
+
+
 class PharmacologyRepository(ABC):
     @abstractmethod
     async def search(self, target: str, family: str = "") -> list[PharmacologyEntry]: ...
@@ -1,20 +1,37 @@
-import logging
+import asyncio
+import contextlib
 import math
+import os
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator
 from pathlib import Path
 
-import httpx
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from ehrlich.analysis.domain.dataset import Dataset
 from ehrlich.analysis.domain.repository import DatasetRepository
-from ehrlich.kernel.exceptions import ExternalServiceError
 from ehrlich.kernel.types import SMILES
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _CHEMBL_API = "https://www.ebi.ac.uk/chembl/api/data"
 _TIMEOUT = 30.0
-_CACHE_DIR = Path(__file__).resolve().parents[5] / "data" / "datasets"
+_PAGE_SIZE = 1000
+_MAX_ACTIVITIES = 20000
+_CONCURRENCY = 4
+CACHE_DIR = Path(__file__).resolve().parents[5] / "data" / "datasets"
+
+_SCHEMA = pa.schema(
+    [
+        ("smiles", pa.string()),
+        ("value_um", pa.float64()),
+        ("p_activity", pa.float64()),
+        ("standard_type", pa.string()),
+        ("assay_chembl_id", pa.string()),
+    ]
+)
 
 
 class ChEMBLLoader(DatasetRepository):
@@ -22,17 +39,21 @@ class ChEMBLLoader(DatasetRepository):
         self,
         cache_dir: Path | None = None,
         assay_types: list[str] | None = None,
+        max_activities: int = _MAX_ACTIVITIES,
+        page_size: int = _PAGE_SIZE,
+        concurrency: int = _CONCURRENCY,
     ) -> None:
-        self._cache_dir = cache_dir or _CACHE_DIR
+        self._cache_dir = cache_dir or CACHE_DIR
         self._cache_dir.mkdir(parents=True, exist_ok=True)
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("ChEMBL", timeout=_TIMEOUT)
         self._assay_types = assay_types or ["MIC", "IC50"]
+        self._max_activities = max_activities
+        self._page_size = page_size
+        self._concurrency = max(1, concurrency)
 
     async def load(self, target: str, threshold: float = 1.0) -> Dataset:
         cache_file = self._cache_dir / f"chembl_{target.replace(' ', '_').lower()}.parquet"
-        if cache_file.exists():
-            return self._load_from_cache(cache_file, target, threshold)
-        return await self._load_from_api(target, threshold, cache_file)
+        return await self._load(target, self._assay_types, threshold, cache_file)
 
     async def list_targets(self) -> list[str]:
         cached = list(self._cache_dir.glob("chembl_*.parquet"))
@@ -42,54 +63,121 @@ class ChEMBLLoader(DatasetRepository):
             targets.append(name)
         return targets
 
-    async def _load_from_api(self, target: str, threshold: float, cache_file: Path) -> Dataset:
-        try:
-            activities = await self._fetch_activities(target)
-            if not activities:
+    async def search_bioactivity(
+        self,
+        target: str,
+        assay_types: list[str] | None = None,
+        threshold: float = 1.0,
+    ) -> Dataset:
+        """Search bioactivity data with flexible assay types."""
+        types = assay_types or self._assay_types
+        type_key = "_".join(sorted(t.lower() for t in types))
+        cache_file = (
+            self._cache_dir / f"chembl_{target.replace(' ', '_').lower()}_{type_key}.parquet"
+        )
+        return await self._load(target, types, threshold, cache_file)
+
+    async def _load(
+        self, target: str, assay_types: list[str], threshold: float, cache_file: Path
+    ) -> Dataset:
+        if not cache_file.exists():
+            written = await self._fetch_to_parquet(target, assay_types, cache_file)
+            if not written:
                 return Dataset(name=f"ChEMBL {target}", target=target)
-            df = self._process_activities(activities, threshold)
-            df.to_parquet(cache_file, index=False)
-            return self._df_to_dataset(df, target)
-        except httpx.HTTPError as e:
-            raise ExternalServiceError("ChEMBL", str(e)) from e
-
-    async def _fetch_activities(self, target_organism: str) -> list[dict[str, object]]:
-        all_activities: list[dict[str, object]] = []
-        offset = 0
-        limit = 1000
-        while True:
-            try:
-                resp = await self._client.get(
-                    f"{_CHEMBL_API}/activity.json",
-                    params={
-                        "target_organism__iexact": target_organism,
-                        "standard_type__in": ",".join(self._assay_types),
-                        "standard_relation": "=",
-                        "limit": limit,
-                        "offset": offset,
-                    },
-                )
-                if resp.status_code == 429:
-                    raise ExternalServiceError("ChEMBL", "Rate limit exceeded")
-                resp.raise_for_status()
-                data = resp.json()
-                activities = data.get("activities", [])
-                if not activities:
-                    break
-                all_activities.extend(activities)
-                if len(activities) < limit:
-                    break
-                offset += limit
-                if offset >= 20000:
+        return self._load_from_cache(cache_file, target, threshold)
+
+    async def _fetch_to_parquet(
+        self, target_organism: str, assay_types: list[str], cache_file: Path
+    ) -> int:
+        """Stream activity pages into ``cache_file`` as Arrow batches. Returns rows written.
+
+        Rows go to a ``.part`` file that only replaces the cache once every
+        page has arrived, so an interrupted fetch never leaves a truncated cache.
+        The name is unique per fetch, so concurrent loads of one target (e.g. two
+        thresholds in one tool block) each publish a complete file.
+        """
+        params: dict[str, str | int] = {
+            "target_organism__iexact": target_organism,
+            "standard_type__in": ",".join(assay_types),
+            "standard_relation": "=",
+        }
+        first = await self._fetch_page(params, 0, self._max_activities)
+        meta = first.get("page_meta")
+        total = meta.get("total_count") if isinstance(meta, dict) else None
+        last = self._max_activities
+        if total is not None:
+            last = min(int(str(total)), self._max_activities)
+
+        part_file = cache_file.with_name(f"{cache_file.name}.{uuid.uuid4().hex}.part")
+        written = 0
+        try:
+            with pq.ParquetWriter(part_file, _SCHEMA) as writer:
+                activities = self._activities(first)
+                written += self._write_page(writer, activities)
+                if len(activities) == self._page_size:
+                    offsets = range(self._page_size, last, self._page_size)
+                    async for page in self._fetch_pages(params, offsets, last):
+                        written += self._write_page(writer, page)
+        except BaseException:
+            part_file.unlink(missing_ok=True)
+            raise
+        if written:
+            os.replace(part_file, cache_file)
+        else:
+            part_file.unlink(missing_ok=True)
+        return written
+
+    async def _fetch_pages(
+        self, params: dict[str, str | int], offsets: range, last: int
+    ) -> AsyncIterator[list[dict[str, object]]]:
+        """Yield pages in offset order with up to ``concurrency`` requests in flight.
+
+        The final page is shortened so no more than ``last`` activities are fetched.
+        """
+        remaining = iter(offsets)
+        pending: deque[asyncio.Task[dict[str, object]]] = deque()
+
+        def schedule() -> None:
+            offset = next(remaining, None)
+            if offset is not None:
+                task = self._fetch_page(params, offset, last - offset)
+                pending.append(asyncio.create_task(task))
+
+        for _ in range(self._concurrency):
+            schedule()
+        try:
+            while pending:
+                activities = self._activities(await pending.popleft())
+                yield activities
+                if len(activities) < self._page_size:
                     break
-            except httpx.TimeoutException as e:
-                logger.warning("ChEMBL timeout at offset %d: %s", offset, e)
-                break
-        return all_activities
+                schedule()
+        finally:
+            for task in pending:
+                task.cancel()
+            for task in pending:
+                with contextlib.suppress(BaseException):
+                    await task
+
+    async def _fetch_page(
+        self, params: dict[str, str | int], offset: int, limit: int
+    ) -> dict[str, object]:
+        resp = await self._client.get(
+            f"{_CHEMBL_API}/activity.json",
+            params={**params, "offset": offset, "limit": min(limit, self._page_size)},
+        )
+        return resp.json()  # type: ignore[no-any-return]
 
     @staticmethod
-    def _process_activities(activities: list[dict[str, object]], threshold: float) -> pd.DataFrame:
-        rows = []
+    def _activities(data: dict[str, object]) -> list[dict[str, object]]:
+        activities = data.get("activities", [])
+        return (
+            [a for a in activities if isinstance(a, dict)] if isinstance(activities, list) else []
+        )
+
+    @staticmethod
+    def _write_page(writer: pq.ParquetWriter, activities: list[dict[str, object]]) -> int:
+        columns: dict[str, list[object]] = {name: [] for name in _SCHEMA.names}
         for act in activities:
             smiles = act.get("canonical_smiles")
             value = act.get("standard_value")
@@ -108,19 +196,18 @@ class ChEMBLLoader(DatasetRepository):
                 continue
             if value_um <= 0:
                 continue
-            p_activity = -math.log10(value_um * 1e-6)
-            rows.append(
-                {
-                    "smiles": str(smiles),
-                    "value_um": value_um,
-                    "p_activity": p_activity,
-                    "standard_type": str(act.get("standard_type", "")),
-                    "assay_chembl_id": str(act.get("assay_chembl_id", "")),
-                }
-            )
-        if not rows:
-            return pd.DataFrame(columns=["smiles", "value_um", "p_activity"])
-        df = pd.DataFrame(rows)
+            columns["smiles"].append(str(smiles))
+            columns["value_um"].append(value_um)
+            columns["p_activity"].append(-math.log10(value_um * 1e-6))
+            columns["standard_type"].append(str(act.get("standard_type", "")))
+            columns["assay_chembl_id"].append(str(act.get("assay_chembl_id", "")))
+        rows = len(columns["smiles"])
+        if rows:
+            writer.write_batch(pa.RecordBatch.from_pydict(columns, schema=_SCHEMA))
+        return rows
+
+    @staticmethod
+    def _aggregate(df: pd.DataFrame, threshold: float) -> pd.DataFrame:
         df = df.groupby("smiles", as_index=False).agg(
             {
                 "value_um": "median",
@@ -129,8 +216,7 @@ class ChEMBLLoader(DatasetRepository):
                 "assay_chembl_id": "first",
             }
         )
-        active = (df["p_activity"] >= threshold).astype(float)
-        df["activity"] = active
+        df["activity"] = (df["p_activity"] >= threshold).astype(float)
         return df
 
     @staticmethod
@@ -147,62 +233,7 @@ class ChEMBLLoader(DatasetRepository):
             },
         )
 
-    async def search_bioactivity(
-        self,
-        target: str,
-        assay_types: list[str] | None = None,
-        threshold: float = 1.0,
-    ) -> Dataset:
-        """Search bioactivity data with flexible assay types."""
-        types = assay_types or self._assay_types
-        type_key = "_".join(sorted(t.lower() for t in types))
-        cache_file = (
-            self._cache_dir / f"chembl_{target.replace(' ', '_').lower()}_{type_key}.parquet"
-        )
-        if cache_file.exists():
-            return self._load_from_cache(cache_file, target, threshold)
-        try:
-            all_activities: list[dict[str, object]] = []
-            offset = 0
-            limit = 1000
-            while True:
-                try:
-                    resp = await self._client.get(
-                        f"{_CHEMBL_API}/activity.json",
-                        params={
-                            "target_organism__iexact": target,
-                            "standard_type__in": ",".join(types),
-                            "standard_relation": "=",
-                            "limit": limit,
-                            "offset": offset,
-                        },
-                    )
-                    if resp.status_code == 429:
-                        raise ExternalServiceError("ChEMBL", "Rate limit exceeded")
-                    resp.raise_for_status()
-                    data = resp.json()
-                    activities = data.get("activities", [])
-                    if not activities:
-                        break
-                    all_activities.extend(activities)
-                    if len(activities) < limit:
-                        break
-                    offset += limit
-                    if offset >= 20000:
-                        break
-                except httpx.TimeoutException as e:
-                    logger.warning("ChEMBL timeout at offset %d: %s", offset, e)
-                    break
-            if not all_activities:
-                return Dataset(name=f"ChEMBL {target}", target=target)
-            df = self._process_activities(all_activities, threshold)
-            df.to_parquet(cache_file, index=False)
-            return self._df_to_dataset(df, target)
-        except httpx.HTTPError as e:
-            raise ExternalServiceError("ChEMBL", str(e)) from e
-
     def _load_from_cache(self, path: Path, target: str, threshold: float) -> Dataset:
-        df = pd.read_parquet(path)
-        if "p_activity" in df.columns:
-            df["activity"] = (df["p_activity"] >= threshold).astype(float)
-        return self._df_to_dataset(df, target)
+        columns = ["smiles", "value_um", "p_activity", "standard_type", "assay_chembl_id"]
+        df = pd.read_parquet(path, columns=columns)
+        return self._df_to_dataset(self._aggregate(df, threshold), target)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pyarrow.parquet as pq
+
+from ehrlich.analysis.domain.compound import CompoundSearchResult
+from ehrlich.analysis.domain.repository import SimilaritySearchRepository
+from ehrlich.analysis.infrastructure.chembl_loader import CACHE_DIR
+from ehrlich.kernel.exceptions import InvalidSMILESError
+from ehrlich.kernel.types import SMILES
+from ehrlich.workers.pool import run_thread
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from ehrlich.chemistry.infrastructure.similarity_index import SimilarityIndex
+    from ehrlich.shared.chemistry_port import ChemistryPort
+
+logger = logging.getLogger(__name__)
+
+_INDEX_NAME = "similarity_index.npz"
+_FP_TYPE = "morgan"
+_N_BITS = 2048
+
+
+class ChEMBLSimilarityIndex(SimilaritySearchRepository):
+    """Offline analog search over the ChEMBL Parquet caches in ``cache_dir``.
+
+    Each query first stats the ``chembl_*.parquet`` files and fingerprints only
+    those added or rewritten since the last sync (dropping deleted ones), so a
+    new cache written by ``ChEMBLLoader`` is searchable on the next call. The
+    index is persisted next to the caches and reloaded on startup.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        chemistry: ChemistryPort | None = None,
+        index_path: Path | None = None,
+    ) -> None:
+        self._cache_dir = cache_dir or CACHE_DIR
+        self._index_path = index_path or self._cache_dir / _INDEX_NAME
+        if chemistry is None:
+            from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+
+            chemistry = RDKitAdapter()
+        self._chemistry = chemistry
+        self._index: SimilarityIndex | None = None
+        self._manifest: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+
+    async def search_by_similarity(
+        self, smiles: str, threshold: float = 0.4, limit: int = 10
+    ) -> list[CompoundSearchResult]:
+        return await run_thread(self.search, smiles, threshold, limit)
+
+    def search(
+        self, smiles: str, threshold: float = 0.4, limit: int = 10
+    ) -> list[CompoundSearchResult]:
+        index = self.sync()
+        query = self._chemistry.compute_fingerprints_batch([SMILES(smiles)], _FP_TYPE)
+        if not query.valid[0]:
+            raise InvalidSMILESError(smiles, query.errors.get(0, "Invalid SMILES string"))
+        matches = _collapse(index, query.words[0], threshold, limit)
+        return [
+            CompoundSearchResult(
+                cid=0,
+                smiles=label,
+                iupac_name="",
+                molecular_formula="",
+                molecular_weight=round(
+                    self._chemistry.compute_descriptors(SMILES(label)).molecular_weight, 2
+                ),
+                source=",".join(f"chembl:{segment}" for segment in segments),
+                similarity=round(similarity, 4),
+            )
+            for label, (similarity, segments) in matches.items()
+        ]
+
+    def sync(self) -> SimilarityIndex:
+        """Bring the index in line with the cache directory and return it."""
+        current = {
+            path.name: [path.stat().st_mtime_ns, path.stat().st_size]
+            for path in sorted(self._cache_dir.glob("chembl_*.parquet"))
+        }
+        with self._lock:
+            index = self._index or self._restore()
+            stale = [name for name in self._manifest if name not in current]
+            fresh = [name for name, stamp in current.items() if self._manifest.get(name) != stamp]
+            for name in stale:
+                index.remove(_segment(name))
+                del self._manifest[name]
+            for name in fresh:
+                index.add(_segment(name), *self._fingerprint(self._cache_dir / name))
+                self._manifest[name] = current[name]
+            if stale or fresh:
+                logger.info(
+                    "Similarity index: %d files added/updated, %d removed, %d compounds",
+                    len(fresh),
+                    len(stale),
+                    len(index),
+                )
+                index.save(self._index_path, manifest=dict(self._manifest))
+            self._index = index
+            return index
+
+    def _restore(self) -> SimilarityIndex:
+        from ehrlich.chemistry.infrastructure.similarity_index import SimilarityIndex
+
+        if self._index_path.exists():
+            try:
+                index, manifest = SimilarityIndex.load(self._index_path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("Rebuilding similarity index %s: %s", self._index_path, e)
+            else:
+                if index.fp_type == _FP_TYPE and index.n_bits == _N_BITS:
+                    self._manifest = {k: [int(x) for x in v] for k, v in manifest.items()}
+                    return index
+        self._manifest = {}
+        return SimilarityIndex(n_bits=_N_BITS, fp_type=_FP_TYPE)
+
+    def _fingerprint(self, path: Path) -> tuple[list[str], NDArray[np.uint64]]:
+        smiles = pq.read_table(path, columns=["smiles"]).column("smiles").unique().to_pylist()
+        fps = self._chemistry.compute_fingerprints_batch([SMILES(s) for s in smiles], _FP_TYPE)
+        labels = [s for s, ok in zip(smiles, fps.valid.tolist(), strict=True) if ok]
+        return labels, fps.words[fps.valid]
+
+
+def _collapse(
+    index: SimilarityIndex, query: NDArray[np.uint64], threshold: float, limit: int
+) -> dict[str, tuple[float, list[str]]]:
+    """Best ``limit`` distinct labels with every segment that holds them.
+
+    Overlapping caches store the same compound in several segments. Copies of
+    a label share its fingerprint and so its similarity, so the search is
+    widened until the last row returned falls below the ``limit``-th label and
+    every copy of the chosen labels is known.
+    """
+    if limit <= 0:
+        return {}
+    k = limit
+    while True:
+        hits = index.search(query, k=k, threshold=threshold)
+        grouped: dict[str, tuple[float, list[str]]] = {}
+        for hit in hits:
+            grouped.setdefault(hit.label, (hit.similarity, []))[1].append(hit.segment)
+        labels = list(grouped)[:limit]
+        if len(hits) < k or (len(labels) == limit and hits[-1].similarity < grouped[labels[-1]][0]):
+            return {label: (grouped[label][0], sorted(grouped[label][1])) for label in labels}
+        k *= 2
+
+
+def _segment(file_name: str) -> str:
+    return Path(file_name).stem.removeprefix("chembl_")
@@ -1,24 +1,15 @@
-import asyncio
-import logging
-
-import httpx
-
 from ehrlich.analysis.domain.pharmacology import PharmacologyEntry
 from ehrlich.analysis.domain.repository import PharmacologyRepository
-from ehrlich.kernel.exceptions import ExternalServiceError
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://www.guidetopharmacology.org/services"
 _TIMEOUT = 15.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 _MAX_TARGETS = 3
 
 
 class GtoPdbClient(PharmacologyRepository):
     def __init__(self) -> None:
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("GtoPdb", timeout=_TIMEOUT)
 
     async def search(self, target: str, family: str = "") -> list[PharmacologyEntry]:
         target_ids = await self._search_targets(target, family)
@@ -91,38 +82,5 @@ class GtoPdbClient(PharmacologyRepository):
     async def _execute_get(
         self, url: str, params: dict[str, str]
     ) -> list[object] | dict[str, object]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(url, params=params)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "GtoPdb rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("GtoPdb", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "GtoPdb timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("GtoPdb", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "GtoPdb", f"Request failed after {_MAX_RETRIES} attempts: {last_error}"
-        )
+        resp = await self._client.get(url, params=params)
+        return resp.json()  # type: ignore[no-any-return]
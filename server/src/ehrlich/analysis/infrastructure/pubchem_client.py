@@ -1,30 +1,22 @@
-import asyncio
 import contextlib
-import logging
 from urllib.parse import quote
 
-import httpx
-
 from ehrlich.analysis.domain.compound import CompoundSearchResult
 from ehrlich.analysis.domain.repository import CompoundSearchRepository
-from ehrlich.kernel.exceptions import ExternalServiceError
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
 _TIMEOUT = 15.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 
 class PubChemClient(CompoundSearchRepository):
     def __init__(self) -> None:
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("PubChem", timeout=_TIMEOUT)
 
     async def search(self, query: str, limit: int = 10) -> list[CompoundSearchResult]:
         encoded = quote(query, safe="")
         url = f"{_BASE_URL}/compound/name/{encoded}/JSON"
-        data = await self._request_with_retry(url)
+        data = await self._get(url)
         return self._parse_compounds(data, limit)
 
     async def search_by_similarity(
@@ -36,45 +28,14 @@ class PubChemClient(CompoundSearchRepository):
             f"{_BASE_URL}/compound/fastsimilarity_2d/smiles/{encoded}/JSON"
             f"?Threshold={threshold_int}&MaxRecords={limit}"
         )
-        data = await self._request_with_retry(url)
+        data = await self._get(url)
         return self._parse_compounds(data, limit)
 
-    async def _request_with_retry(self, url: str) -> dict[str, object]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(url)
-                if resp.status_code == 404:
-                    return {}
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "PubChem rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("PubChem", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "PubChem timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("PubChem", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError("PubChem", f"Failed after {_MAX_RETRIES} attempts: {last_error}")
+    async def _get(self, url: str) -> dict[str, object]:
+        resp = await self._client.get(url, allow_statuses=(404,))
+        if resp.status_code == 404:
+            return {}
+        return resp.json()  # type: ignore[no-any-return]
 
     @staticmethod
     def _parse_compounds(data: dict[str, object], limit: int) -> list[CompoundSearchResult]:
@@ -5,18 +5,32 @@ from ehrlich.analysis.application.causal_service import CausalService
 from ehrlich.analysis.application.statistics_service import StatisticsService
 from ehrlich.analysis.domain.causal import CausalEstimate
 from ehrlich.analysis.infrastructure.chembl_loader import ChEMBLLoader
+from ehrlich.analysis.infrastructure.chembl_similarity import ChEMBLSimilarityIndex
 from ehrlich.analysis.infrastructure.did_estimator import DiDEstimator
 from ehrlich.analysis.infrastructure.gtopdb_client import GtoPdbClient
 from ehrlich.analysis.infrastructure.psm_estimator import PSMEstimator
 from ehrlich.analysis.infrastructure.pubchem_client import PubChemClient
 from ehrlich.analysis.infrastructure.rdd_estimator import RDDEstimator
 from ehrlich.analysis.infrastructure.synthetic_control_estimator import SyntheticControlEstimator
-from ehrlich.kernel.exceptions import ExternalServiceError
-
-_loader = ChEMBLLoader()
+from ehrlich.chemistry.infrastructure.feature_store import shared_feature_store
+from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+from ehrlich.config import get_settings
+from ehrlich.kernel.exceptions import ExternalServiceError, InvalidSMILESError
+
+_settings = get_settings()
+_loader = ChEMBLLoader(
+    max_activities=_settings.chembl_max_activities,
+    concurrency=_settings.chembl_page_concurrency,
+)
 _pubchem = PubChemClient()
 _gtopdb = GtoPdbClient()
-_service = AnalysisService(repository=_loader, compound_repo=_pubchem)
+_similarity_index = ChEMBLSimilarityIndex()
+_service = AnalysisService(
+    repository=_loader,
+    compound_repo=_pubchem,
+    chemistry=RDKitAdapter(store=shared_feature_store()),
+    similarity_index=_similarity_index,
+)
 _pharmacology = _gtopdb
 _stats = StatisticsService()
 _did = DiDEstimator()
@@ -25,6 +39,8 @@ _rdd = RDDEstimator()
 _sc = SyntheticControlEstimator()
 _causal = CausalService()
 
+_LOCAL_SIMILARITY_THRESHOLD = 0.4
+
 
 async def explore_dataset(target: str, threshold: float = 1.0) -> str:
     """Load and explore a bioactivity dataset for the given target organism."""
@@ -57,14 +73,24 @@ async def explore_dataset(target: str, threshold: float = 1.0) -> str:
 
 
 async def search_compounds(query: str, search_type: str = "name", limit: int = 10) -> str:
-    """Search for compounds by name or SMILES similarity via PubChem."""
+    """Search for compounds by name or SMILES similarity.
+
+    search_type "name" and "similarity" query PubChem; "local_similarity" finds
+    analogs of a SMILES among compounds in the cached ChEMBL datasets, offline.
+    """
     try:
         if search_type == "similarity":
             results = await _service.search_by_similarity(query, threshold=0.8, limit=limit)
+        elif search_type == "local_similarity":
+            results = await _service.search_local_similarity(
+                query, threshold=_LOCAL_SIMILARITY_THRESHOLD, limit=limit
+            )
         else:
             results = await _service.search_compounds(query, limit=limit)
     except ExternalServiceError as e:
         return json.dumps({"error": f"PubChem error: {e.detail}", "query": query})
+    except InvalidSMILESError as e:
+        return json.dumps({"error": str(e), "query": query})
     return json.dumps(
         {
             "query": query,
@@ -78,6 +104,7 @@ async def search_compounds(query: str, search_type: str = "name", limit: int = 1
                     "molecular_formula": c.molecular_formula,
                     "molecular_weight": c.molecular_weight,
                     "source": c.source,
+                    **({"similarity": c.similarity} if c.similarity is not None else {}),
                 }
                 for c in results
             ],
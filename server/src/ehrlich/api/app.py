@@ -2,6 +2,7 @@ import importlib
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Any
 
 from fastapi import FastAPI
@@ -10,6 +11,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
+from ehrlich.api.routes.docking import router as docking_router
 from ehrlich.api.routes.health import router as health_router
 from ehrlich.api.routes.investigation import close_repository, init_repository
 from ehrlich.api.routes.investigation import router as investigation_router
@@ -17,13 +19,21 @@ from ehrlich.api.routes.methodology import router as methodology_router
 from ehrlich.api.routes.molecule import router as molecule_router
 from ehrlich.api.routes.stats import router as stats_router
 from ehrlich.api.routes.upload import router as upload_router
+from ehrlich.api.routes.upload import sweep_orphaned_spools
+from ehrlich.chemistry.infrastructure.depiction_cache import shared_depiction_cache
+from ehrlich.chemistry.infrastructure.feature_store import shared_feature_store
+from ehrlich.chemistry.infrastructure.mol_cache import shared_mol_cache
 from ehrlich.config import get_settings
 from ehrlich.investigation.application.registry_factory import build_tool_registry
+from ehrlich.simulation.application.docking_scheduler import shutdown_docking
+from ehrlich.transport.client import close_transport, enable_response_cache
+from ehrlich.workers.pool import configure_workers, shutdown_workers
 
 logger = logging.getLogger(__name__)
 
 _OPTIONAL_DEPS = {
     "chemprop": "Chemprop D-MPNN (deep learning)",
+    "vina": "AutoDock Vina (structure-based docking)",
 }
 
 
@@ -78,6 +88,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             settings.environment,
         )
 
+    if settings.http_cache_mode not in ("on", "off", "offline"):
+        msg = f"Unknown http_cache_mode: {settings.http_cache_mode!r}"
+        raise ValueError(msg)
+    if settings.http_cache_mode != "off":
+        enable_response_cache(
+            Path(settings.http_cache_path),
+            offline=settings.http_cache_mode == "offline",
+            max_entries=settings.http_cache_max_entries,
+        )
+        logger.info(
+            "HTTP response cache: %s (%s)", settings.http_cache_mode, settings.http_cache_path
+        )
+
+    shared_mol_cache().resize(settings.mol_cache_size)
+    shared_depiction_cache().resize(settings.depiction_cache_mb * 1024 * 1024)
+    configure_workers(settings.worker_processes, settings.worker_threads)
+    sweep_orphaned_spools()
+
     try:
         await init_repository(settings.database_url)
     except ConnectionError as exc:
@@ -89,6 +117,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     await close_repository()
     logger.info("PostgreSQL connection pool closed")
+    await close_transport()
+    shutdown_workers()
+    await shutdown_docking()
+    shared_feature_store().flush()
 
 
 def create_app() -> FastAPI:
@@ -110,6 +142,7 @@ def create_app() -> FastAPI:
         allow_headers=["Authorization", "Content-Type", "X-Anthropic-Key"],
     )
 
+    app.include_router(docking_router, prefix="/api/v1")
     app.include_router(health_router, prefix="/api/v1")
     app.include_router(investigation_router, prefix="/api/v1")
     app.include_router(methodology_router, prefix="/api/v1")
@@ -0,0 +1,120 @@
+import json
+from collections.abc import AsyncGenerator
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel, Field
+from sse_starlette.sse import EventSourceResponse
+
+from ehrlich.api.auth import get_current_user, get_current_user_sse
+from ehrlich.kernel.exceptions import TargetNotFoundError
+from ehrlich.kernel.types import SMILES
+from ehrlich.simulation.application.docking_scheduler import shared_docking_scheduler
+from ehrlich.simulation.domain.docking_job import DockingJob
+
+router = APIRouter(tags=["docking"])
+
+_MAX_LIGANDS = 1000
+_MAX_TARGETS = 20
+_MAX_PAIRS = 5000
+
+_require_user = Depends(get_current_user)
+_require_user_sse = Depends(get_current_user_sse)
+
+
+class DockingJobRequest(BaseModel):
+    smiles: list[Annotated[str, Field(max_length=500)]] = Field(
+        ..., min_length=1, max_length=_MAX_LIGANDS
+    )
+    targets: list[str] = Field(..., min_length=1, max_length=_MAX_TARGETS)
+
+
+def _job_summary(job: DockingJob) -> dict[str, Any]:
+    return {
+        "job_id": job.id,
+        "status": job.status.value,
+        "done": job.done,
+        "total": job.total,
+        "targets": list(job.targets),
+        "created_at": job.created_at,
+        "finished_at": job.finished_at,
+    }
+
+
+def _get_job(job_id: str, user: dict[str, Any]) -> DockingJob:
+    """Look up a job, raising 404 if unknown and 403 if another user submitted it."""
+    job = shared_docking_scheduler().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Docking job not found")
+    if job.owner != user["workos_id"]:
+        raise HTTPException(status_code=403, detail="Forbidden")
+    return job
+
+
+@router.post("/docking/jobs", status_code=202)
+async def submit_docking_job(
+    body: DockingJobRequest,
+    user: dict[str, Any] = _require_user,
+) -> dict[str, Any]:
+    """Queue every ligand against every target; follow progress at ``.../events``."""
+    if len(body.smiles) * len(body.targets) > _MAX_PAIRS:
+        raise HTTPException(
+            status_code=422, detail=f"At most {_MAX_PAIRS} ligand-target pairs per job"
+        )
+    try:
+        job = shared_docking_scheduler().submit(
+            [SMILES(smi) for smi in body.smiles], body.targets, owner=user["workos_id"]
+        )
+    except TargetNotFoundError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return _job_summary(job)
+
+
+@router.get("/docking/jobs/{job_id}")
+async def get_docking_job(
+    job_id: str,
+    user: dict[str, Any] = _require_user,
+) -> dict[str, Any]:
+    job = _get_job(job_id, user)
+    return {
+        **_job_summary(job),
+        "results": [
+            {
+                "smiles": str(r.smiles),
+                "target_id": r.target_id,
+                "binding_energy": r.binding_energy,
+                "interactions": r.interactions,
+                "pose": r.pose,
+            }
+            for r in job.results
+        ],
+        "errors": job.errors,
+    }
+
+
+@router.get("/docking/jobs/{job_id}/events")
+async def stream_docking_job(
+    job_id: str,
+    request: Request,
+    user: dict[str, Any] = _require_user_sse,
+) -> EventSourceResponse:
+    """SSE progress: one event per finished pair, then ``docking_completed``/``_cancelled``."""
+    _get_job(job_id, user)
+    raw = request.headers.get("Last-Event-ID") or request.query_params.get("last_event_id")
+    after = int(raw) + 1 if raw and raw.isdigit() else 0
+
+    async def events() -> AsyncGenerator[dict[str, str], None]:
+        async for event in shared_docking_scheduler().events(job_id, after):
+            yield {"event": event["type"], "data": json.dumps(event), "id": str(event["seq"])}
+
+    return EventSourceResponse(events())
+
+
+@router.post("/docking/jobs/{job_id}/cancel")
+async def cancel_docking_job(
+    job_id: str,
+    user: dict[str, Any] = _require_user,
+) -> dict[str, Any]:
+    job = _get_job(job_id, user)
+    shared_docking_scheduler().cancel(job.id)
+    return _job_summary(job)
@@ -1,8 +1,45 @@
+from typing import Any
+
 from fastapi import APIRouter
 
+from ehrlich.chemistry.infrastructure.conformer_store import shared_conformer_store
+from ehrlich.chemistry.infrastructure.depiction_cache import shared_depiction_cache
+from ehrlich.chemistry.infrastructure.mol_cache import shared_mol_cache
+from ehrlich.simulation.application.docking_scheduler import shared_docking_scheduler
+from ehrlich.transport.client import transport_stats
+from ehrlich.workers.pool import worker_stats
+
 router = APIRouter(tags=["health"])
 
 
 @router.get("/health")
 async def health() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/health/http")
+async def http_health() -> dict[str, Any]:
+    """Per-source request/error/latency counters and per-host circuit state."""
+    return transport_stats()
+
+
+@router.get("/health/chemistry")
+async def chemistry_health() -> dict[str, Any]:
+    """Size, hit rate, and evictions of the molecule, depiction, and conformer caches."""
+    return {
+        "mol_cache": shared_mol_cache().stats(),
+        "depiction_cache": shared_depiction_cache().stats(),
+        "conformer_cache": shared_conformer_store().stats(),
+    }
+
+
+@router.get("/health/workers")
+async def workers_health() -> dict[str, Any]:
+    """Queue depth, running jobs, and utilization of the process and thread pools."""
+    return worker_stats()
+
+
+@router.get("/health/docking")
+async def docking_health() -> dict[str, Any]:
+    """Vina availability, queued pairs, active jobs, and the docking result cache."""
+    return shared_docking_scheduler().stats()
@@ -9,6 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from sse_starlette.sse import EventSourceResponse
 
 from ehrlich.api.auth import get_current_user, get_current_user_sse
+from ehrlich.api.routes.upload import discard_spool
 from ehrlich.api.schemas.investigation import (
     ApproveRequest,
     CreditBalanceResponse,
@@ -24,21 +25,27 @@ from ehrlich.api.schemas.investigation import (
 )
 from ehrlich.api.sse import SSEEventType, domain_event_to_sse
 from ehrlich.config import get_settings
-from ehrlich.investigation.application.orchestrator_factory import create_orchestrator
+from ehrlich.investigation.application.orchestrator_factory import (
+    create_orchestrator,
+    create_tool_cache,
+)
 from ehrlich.investigation.application.paper_generator import extract_visualizations, generate_paper
 from ehrlich.investigation.application.registry_factory import (
     build_domain_registry,
     build_mcp_configs,
     build_tool_registry,
 )
+from ehrlich.investigation.application.single_flight import SingleFlight
 from ehrlich.investigation.domain.investigation import Investigation, InvestigationStatus
 from ehrlich.investigation.infrastructure.mcp_bridge import MCPBridge
 from ehrlich.investigation.infrastructure.repository import InvestigationRepository
+from ehrlich.workers.pool import cancel_jobs, job_group
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
     from ehrlich.investigation.application.multi_orchestrator import MultiModelOrchestrator
+    from ehrlich.investigation.application.tool_cache import ToolCache
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +75,10 @@ _TRANSIENT_EVENTS = frozenset({
 })
 
 _repository: InvestigationRepository | None = None
+# Shared by every orchestrator so tool results (and in-flight calls) are reused
+# across investigations
+_tool_cache: ToolCache | None = None
+_single_flight = SingleFlight()
 _active_investigations: dict[str, Investigation] = {}
 _active_orchestrators: dict[str, MultiModelOrchestrator] = {}
 _subscribers: dict[str, list[asyncio.Queue[dict[str, str] | None]]] = {}
@@ -76,13 +87,19 @@ _investigation_meta: dict[str, dict[str, Any]] = {}
 
 
 async def init_repository(database_url: str) -> None:
-    global _repository  # noqa: PLW0603
+    global _repository, _tool_cache  # noqa: PLW0603
     repo = InvestigationRepository(database_url)
     await repo.initialize()
     _repository = repo
+    _tool_cache = await create_tool_cache(get_settings(), repo)
 
 
 async def close_repository() -> None:
+    global _tool_cache  # noqa: PLW0603
+    if _tool_cache is not None:
+        logger.info("Tool cache stats: %s", await _tool_cache.stats())
+        await _tool_cache.close()
+        _tool_cache = None
     if _repository is not None:
         await _repository.close()
 
@@ -135,21 +152,23 @@ async def _run_orchestrator(
     """Run orchestrator as a background task, decoupled from SSE connections."""
     failed = False
     try:
-        async for domain_event in orchestrator.run(investigation):
-            sse_event = domain_event_to_sse(domain_event)
-            if sse_event is not None:
-                event: dict[str, str] = {
-                    "event": sse_event.event.value,
-                    "data": sse_event.format(),
-                }
-                if sse_event.event not in _TRANSIENT_EVENTS:
-                    event_id = await repo.save_event(
-                        investigation.id,
-                        sse_event.event.value,
-                        sse_event.format(),
-                    )
-                    event["id"] = str(event_id)
-                _broadcast_event(investigation.id, event)
+        # Pool jobs started by this investigation's tools are cancelled with it
+        with job_group(investigation.id):
+            async for domain_event in orchestrator.run(investigation):
+                sse_event = domain_event_to_sse(domain_event)
+                if sse_event is not None:
+                    event: dict[str, str] = {
+                        "event": sse_event.event.value,
+                        "data": sse_event.format(),
+                    }
+                    if sse_event.event not in _TRANSIENT_EVENTS:
+                        event_id = await repo.save_event(
+                            investigation.id,
+                            sse_event.event.value,
+                            sse_event.format(),
+                        )
+                        event["id"] = str(event_id)
+                    _broadcast_event(investigation.id, event)
     except Exception:
         failed = True
         logger.exception("Investigation %s failed in background task", investigation.id)
@@ -158,6 +177,8 @@ async def _run_orchestrator(
         await repo.update(investigation)
         _active_investigations.pop(investigation.id, None)
         _active_orchestrators.pop(investigation.id, None)
+        for uploaded in investigation.uploaded_files:
+            discard_spool(uploaded.file_id)
 
         if failed or investigation.status == InvestigationStatus.FAILED:
             credit_cost = meta.get("credit_cost", 0)
@@ -398,6 +419,7 @@ async def cancel_investigation(
     orchestrator = _active_orchestrators.get(investigation_id)
     if orchestrator is not None:
         orchestrator.cancel()
+        cancel_jobs(investigation_id)
         return {"status": "cancelled"}
 
     # No active orchestrator — check DB for cancellable states
@@ -483,6 +505,8 @@ async def stream_investigation(
         mcp_configs,
         api_key_override=api_key_override,
         director_model_override=director_model_override,
+        tool_cache=_tool_cache,
+        single_flight=_single_flight,
     )
     _active_orchestrators[investigation.id] = orchestrator
 
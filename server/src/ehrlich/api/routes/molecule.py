@@ -1,20 +1,54 @@
+import asyncio
+import functools
+import json
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
 from dataclasses import asdict
-from typing import Any
+from typing import Annotated, Any, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import Response
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
 
-from ehrlich.api.auth import get_optional_user
+from ehrlich.api.auth import get_current_user, get_optional_user
 from ehrlich.chemistry.application.chemistry_service import ChemistryService
+from ehrlich.chemistry.application.conformer_service import ConformerService
+from ehrlich.chemistry.infrastructure import bitset
+from ehrlich.chemistry.infrastructure.alert_catalog import load_alert_catalog
+from ehrlich.chemistry.infrastructure.conformer_store import shared_conformer_store
+from ehrlich.chemistry.infrastructure.depiction_cache import Depiction, shared_depiction_cache
+from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+from ehrlich.config import get_settings
 from ehrlich.kernel.exceptions import InvalidSMILESError
 from ehrlich.kernel.types import SMILES
+from ehrlich.shared.descriptors import DescriptorMatrix, MolecularDescriptors
+from ehrlich.shared.fingerprint import FingerprintMatrix
+from ehrlich.simulation.domain.admet_profile import ADMETProfile
+from ehrlich.simulation.infrastructure.pkcsm_client import PkCSMClient
 from ehrlich.simulation.infrastructure.protein_store import ProteinStore
+from ehrlich.workers.pool import cpu_workers, run_cpu
 
 router = APIRouter(tags=["molecule"])
 
+_MAX_CONFORMER_BATCH = 50
+_MAX_DEPICT_BATCH = 200
+_MAX_STREAM_BATCH = 10_000
+# SMILES per worker-pool job in the streaming batch endpoints.
+_STREAM_CHUNK = 250
+
+_settings = get_settings()
 _chemistry = ChemistryService()
+_depictions = shared_depiction_cache()
+_conformers = ConformerService(
+    store=shared_conformer_store(),
+    num_conformers=_settings.conformer_count,
+    num_threads=_settings.conformer_threads,
+)
+_admet = PkCSMClient(rdkit=RDKitAdapter(), alerts=load_alert_catalog())
 _protein_store = ProteinStore()
 _optional_user = Depends(get_optional_user)
+# The streaming batch endpoints fan up to 10,000 SMILES out to the pool per call.
+_require_user = Depends(get_current_user)
 
 _ERROR_SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}">
   <rect width="100%" height="100%" fill="#1a1e1a" rx="8"/>
@@ -23,22 +57,101 @@ _ERROR_SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}"
 </svg>"""
 
 
+def _svg_response(svg: str, etag: str | None = None, status_code: int = 200) -> Response:
+    headers = {"Cache-Control": "public, max-age=86400"}
+    if etag is not None:
+        headers["ETag"] = etag
+    return Response(
+        content=svg if status_code != 304 else None,
+        status_code=status_code,
+        media_type="image/svg+xml",
+        headers=headers,
+    )
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _canonical(smiles: str) -> str | None:
+    try:
+        return str(_chemistry.canonicalize(SMILES(smiles)))
+    except InvalidSMILESError:
+        return None
+
+
 @router.get("/molecule/depict")
 async def depict(
+    request: Request,
     smiles: str = Query(..., description="SMILES string", max_length=500),
     w: int = Query(300, ge=50, le=1000),
     h: int = Query(200, ge=50, le=1000),
     _user: dict[str, Any] | None = _optional_user,
 ) -> Response:
-    try:
-        svg = _chemistry.depict_2d(SMILES(smiles), width=w, height=h)
-    except (InvalidSMILESError, Exception):
-        svg = _ERROR_SVG.format(w=w, h=h)
-    return Response(
-        content=svg,
-        media_type="image/svg+xml",
-        headers={"Cache-Control": "public, max-age=86400"},
+    canonical = _canonical(smiles)
+    if canonical is None:
+        return _svg_response(_ERROR_SVG.format(w=w, h=h))
+    depiction = _depictions.get(canonical, w, h)
+    if depiction is None:
+        try:
+            svg = _chemistry.depict_2d(SMILES(canonical), width=w, height=h)
+        except Exception:
+            return _svg_response(_ERROR_SVG.format(w=w, h=h))
+        depiction = _depictions.put(canonical, w, h, svg)
+    if _etag_matches(request.headers.get("if-none-match"), depiction.etag):
+        return _svg_response("", etag=depiction.etag, status_code=304)
+    return _svg_response(depiction.svg, etag=depiction.etag)
+
+
+class DepictBatchRequest(BaseModel):
+    smiles: list[Annotated[str, Field(max_length=500)]] = Field(
+        ..., min_length=1, max_length=_MAX_DEPICT_BATCH
     )
+    w: int = Field(300, ge=50, le=1000)
+    h: int = Field(200, ge=50, le=1000)
+
+
+@router.post("/molecule/depict/batch")
+async def depict_batch(
+    body: DepictBatchRequest,
+    _user: dict[str, Any] | None = _optional_user,
+) -> list[dict[str, Any]]:
+    """SVGs for many molecules in one call; misses are rendered across the worker pool."""
+    canonicals = [_canonical(smi) for smi in body.smiles]
+    found: dict[str, Depiction] = {}
+    todo: list[str] = []
+    for canonical in dict.fromkeys(c for c in canonicals if c is not None):
+        depiction = _depictions.get(canonical, body.w, body.h)
+        if depiction is None:
+            todo.append(canonical)
+        else:
+            found[canonical] = depiction
+    if todo:
+        size = -(-len(todo) // cpu_workers())
+        chunks = [todo[i : i + size] for i in range(0, len(todo), size)]
+        rendered = await asyncio.gather(
+            *(
+                run_cpu(_chemistry.depict_2d_batch, [SMILES(c) for c in chunk], body.w, body.h)
+                for chunk in chunks
+            )
+        )
+        for chunk, svgs in zip(chunks, rendered, strict=True):
+            for canonical, svg in zip(chunk, svgs, strict=True):
+                if svg is not None:
+                    found[canonical] = _depictions.put(canonical, body.w, body.h, svg)
+
+    results: list[dict[str, Any]] = []
+    for smi, key in zip(body.smiles, canonicals, strict=True):
+        depiction = found.get(key) if key is not None else None
+        if depiction is None:
+            reason = "Invalid SMILES string" if key is None else "Cannot depict molecule"
+            results.append({"smiles": smi, "error": str(InvalidSMILESError(smi, reason))})
+        else:
+            results.append({"smiles": smi, "svg": depiction.svg, "etag": depiction.etag})
+    return results
 
 
 @router.get("/molecule/conformer")
@@ -47,12 +160,41 @@ async def conformer(
     _user: dict[str, Any] | None = _optional_user,
 ) -> dict[str, Any]:
     try:
-        conf = _chemistry.generate_conformer(SMILES(smiles))
+        conf = await _conformers.generate(SMILES(smiles))
         return {"mol_block": conf.mol_block, "energy": conf.energy, "num_atoms": conf.num_atoms}
     except InvalidSMILESError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
+class ConformerBatchRequest(BaseModel):
+    smiles: list[Annotated[str, Field(max_length=500)]] = Field(
+        ..., min_length=1, max_length=_MAX_CONFORMER_BATCH
+    )
+
+
+@router.post("/molecule/conformers")
+async def conformers(
+    body: ConformerBatchRequest,
+    _user: dict[str, Any] | None = _optional_user,
+) -> list[dict[str, Any]]:
+    """Conformers for several molecules; invalid entries carry an error instead."""
+    confs, errors = await _conformers.generate_many([SMILES(smi) for smi in body.smiles])
+    results: list[dict[str, Any]] = []
+    for i, (smi, conf) in enumerate(zip(body.smiles, confs, strict=True)):
+        if conf is None:
+            results.append({"smiles": smi, "error": errors[i]})
+        else:
+            results.append(
+                {
+                    "smiles": smi,
+                    "mol_block": conf.mol_block,
+                    "energy": conf.energy,
+                    "num_atoms": conf.num_atoms,
+                }
+            )
+    return results
+
+
 @router.get("/molecule/descriptors")
 async def descriptors(
     smiles: str = Query(..., description="SMILES string", max_length=500),
@@ -67,6 +209,126 @@ async def descriptors(
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
+class SmilesBatchRequest(BaseModel):
+    smiles: list[Annotated[str, Field(max_length=500)]] = Field(
+        ..., min_length=1, max_length=_MAX_STREAM_BATCH
+    )
+
+
+class FingerprintBatchRequest(SmilesBatchRequest):
+    fp_type: Literal["morgan", "maccs"] = "morgan"
+
+
+async def _ndjson[T](
+    smiles: list[str],
+    compute: Callable[[list[SMILES]], T],
+    rows: Callable[[list[str], T], Iterable[dict[str, Any]]],
+) -> AsyncIterator[str]:
+    """Stream one JSON line per input, in order, as worker-pool chunks complete.
+
+    ``compute`` runs in the pool on a chunk of SMILES; ``rows`` turns its
+    result into one dict per input of that chunk.
+    """
+    chunks = [smiles[i : i + _STREAM_CHUNK] for i in range(0, len(smiles), _STREAM_CHUNK)]
+    # Every chunk is queued up front; the pool's admission limit bounds how many run.
+    jobs = [
+        asyncio.ensure_future(run_cpu(compute, [SMILES(smi) for smi in chunk])) for chunk in chunks
+    ]
+    try:
+        index = 0
+        for chunk, job in zip(chunks, jobs, strict=True):
+            for row in rows(chunk, await job):
+                yield json.dumps({"index": index, **row}) + "\n"
+                index += 1
+    finally:
+        for job in jobs:
+            job.cancel()
+
+
+def _ndjson_response(lines: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
+def _validation_rows(chunk: list[str], canonical: list[SMILES | None]) -> Iterator[dict[str, Any]]:
+    for smi, canon in zip(chunk, canonical, strict=True):
+        yield {"smiles": smi, "valid": canon is not None, "canonical": canon}
+
+
+def _descriptor_rows(chunk: list[str], matrix: DescriptorMatrix) -> Iterator[dict[str, Any]]:
+    for i, smi in enumerate(chunk):
+        if not matrix.valid[i]:
+            yield {"smiles": smi, "error": matrix.errors.get(i, "Invalid SMILES string")}
+            continue
+        desc = MolecularDescriptors.from_row(matrix.values[i])
+        yield {"smiles": smi, **asdict(desc), "passes_lipinski": desc.passes_lipinski}
+
+
+def _fingerprint_rows(chunk: list[str], matrix: FingerprintMatrix) -> Iterator[dict[str, Any]]:
+    bits = bitset.unpack(matrix.words, matrix.n_bits)
+    for i, smi in enumerate(chunk):
+        if not matrix.valid[i]:
+            yield {"smiles": smi, "error": matrix.errors.get(i, "Invalid SMILES string")}
+            continue
+        on_bits = np.flatnonzero(bits[i]).tolist()
+        yield {
+            "smiles": smi,
+            "fp_type": matrix.fp_type,
+            "n_bits": matrix.n_bits,
+            "on_bits_count": len(on_bits),
+            "on_bits": on_bits,
+        }
+
+
+def _admet_rows(
+    chunk: list[str], result: tuple[list[ADMETProfile | None], dict[int, str]]
+) -> Iterator[dict[str, Any]]:
+    profiles, errors = result
+    for i, (smi, profile) in enumerate(zip(chunk, profiles, strict=True)):
+        if profile is None:
+            yield {"smiles": smi, "error": errors.get(i, "Invalid SMILES string")}
+            continue
+        yield {"smiles": smi, **asdict(profile), "has_toxicity_flags": profile.has_toxicity_flags}
+
+
+@router.post("/molecule/validate/batch")
+async def validate_batch(
+    body: SmilesBatchRequest,
+    _user: dict[str, Any] = _require_user,
+) -> StreamingResponse:
+    """NDJSON: ``{index, smiles, valid, canonical}`` per input."""
+    return _ndjson_response(_ndjson(body.smiles, _chemistry.canonicalize_batch, _validation_rows))
+
+
+@router.post("/molecule/descriptors/batch")
+async def descriptors_batch(
+    body: SmilesBatchRequest,
+    _user: dict[str, Any] = _require_user,
+) -> StreamingResponse:
+    """NDJSON: descriptors + ``passes_lipinski`` per input, or ``error``."""
+    return _ndjson_response(
+        _ndjson(body.smiles, _chemistry.compute_descriptors_batch, _descriptor_rows)
+    )
+
+
+@router.post("/molecule/fingerprints/batch")
+async def fingerprints_batch(
+    body: FingerprintBatchRequest,
+    _user: dict[str, Any] = _require_user,
+) -> StreamingResponse:
+    """NDJSON: fingerprint on-bits per input, or ``error``."""
+    compute = functools.partial(_chemistry.compute_fingerprints_batch, fp_type=body.fp_type)
+    return _ndjson_response(_ndjson(body.smiles, compute, _fingerprint_rows))
+
+
+@router.post("/molecule/admet/batch")
+async def admet_batch(
+    body: SmilesBatchRequest,
+    _user: dict[str, Any] = _require_user,
+) -> StreamingResponse:
+    """NDJSON: ADMET profile per input, or ``error``."""
+    return _ndjson_response(_ndjson(body.smiles, _admet.predict_batch, _admet_rows))
+
+
 @router.get("/targets")
 async def list_targets(
     _user: dict[str, Any] | None = _optional_user,
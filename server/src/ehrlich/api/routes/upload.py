@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import logging
 import time
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile
 from pydantic import BaseModel
 
 from ehrlich.api.auth import get_current_user
+from ehrlich.config import get_settings
 from ehrlich.investigation.application.file_processor import FileProcessor
+from ehrlich.investigation.domain.upload_limits import SPOOLED_EXTENSIONS
 
 if TYPE_CHECKING:
     from ehrlich.investigation.domain.uploaded_file import UploadedFile as UploadedFileEntity
@@ -29,6 +32,8 @@ _pending_upload_times: dict[str, float] = {}
 
 # TTL for pending uploads (30 minutes)
 _UPLOAD_TTL_SECONDS = 30 * 60
+# Spooled files older than this belong to no live investigation (e.g. left by a restart)
+_ORPHAN_SPOOL_SECONDS = 24 * 60 * 60
 
 
 class UploadResponse(BaseModel):
@@ -43,17 +48,19 @@ async def upload_file(
     file: UploadFile,
     user: dict[str, Any] = _require_user,
 ) -> UploadResponse:
-    """Upload a CSV, Excel, or PDF file for use in investigations."""
+    """Upload a CSV, Excel, PDF, or SMILES file for use in investigations."""
     if not file.filename:
         raise HTTPException(status_code=400, detail="Filename is required")
 
     content = await file.read()
+    _sweep_expired()
 
     try:
         uploaded = _processor.process(file.filename, content)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
+    _spool(uploaded.file_id, file.filename, content)
     _pending_uploads[uploaded.file_id] = (user["workos_id"], uploaded)
     _pending_upload_times[uploaded.file_id] = time.time()
 
@@ -95,8 +102,7 @@ def get_pending_upload(file_id: str, workos_id: str) -> UploadedFileEntity | Non
 
     # Check TTL
     if time.time() - upload_time > _UPLOAD_TTL_SECONDS:
-        _pending_uploads.pop(file_id, None)
-        _pending_upload_times.pop(file_id, None)
+        _expire(file_id)
         return None
 
     # Validate ownership
@@ -107,3 +113,46 @@ def get_pending_upload(file_id: str, workos_id: str) -> UploadedFileEntity | Non
     _pending_uploads.pop(file_id, None)
     _pending_upload_times.pop(file_id, None)
     return uploaded
+
+
+def _spool(file_id: str, filename: str, content: bytes) -> None:
+    """Keep the raw bytes of a library or table upload for ``screen_library``/``cluster_data``.
+
+    Parsing keeps only a sample of each table, which is not enough to screen or cluster.
+    """
+    ext = filename.rsplit(".", 1)[-1].lower()
+    if ext not in SPOOLED_EXTENSIONS:
+        return
+    upload_dir = Path(get_settings().upload_dir)
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    (upload_dir / f"{file_id}.{ext}").write_bytes(content)
+
+
+def discard_spool(file_id: str) -> None:
+    """Delete the spooled copy of an upload once its investigation has finished."""
+    for path in Path(get_settings().upload_dir).glob(f"{file_id}.*"):
+        path.unlink(missing_ok=True)
+
+
+def sweep_orphaned_spools() -> None:
+    """Delete spooled files old enough that no running investigation can still read them."""
+    upload_dir = Path(get_settings().upload_dir)
+    if not upload_dir.is_dir():
+        return
+    cutoff = time.time() - _ORPHAN_SPOOL_SECONDS
+    for path in upload_dir.iterdir():
+        if path.is_file() and path.stat().st_mtime < cutoff:
+            path.unlink(missing_ok=True)
+
+
+def _expire(file_id: str) -> None:
+    _pending_uploads.pop(file_id, None)
+    _pending_upload_times.pop(file_id, None)
+    discard_spool(file_id)
+
+
+def _sweep_expired() -> None:
+    """Drop uploads never claimed by an investigation within the TTL."""
+    cutoff = time.time() - _UPLOAD_TTL_SECONDS
+    for file_id in [f for f, t in _pending_upload_times.items() if t < cutoff]:
+        _expire(file_id)
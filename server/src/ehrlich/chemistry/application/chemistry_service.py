@@ -2,12 +2,16 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from ehrlich.kernel.exceptions import InvalidSMILESError
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from ehrlich.kernel.types import SMILES, InChIKey
     from ehrlich.shared.chemistry_port import ChemistryPort
     from ehrlich.shared.conformer import Conformer3D
-    from ehrlich.shared.descriptors import MolecularDescriptors
-    from ehrlich.shared.fingerprint import Fingerprint
+    from ehrlich.shared.descriptors import DescriptorMatrix, MolecularDescriptors
+    from ehrlich.shared.fingerprint import Fingerprint, FingerprintMatrix
 
 
 class ChemistryService:
@@ -24,6 +28,16 @@ class ChemistryService:
     def canonicalize(self, smiles: SMILES) -> SMILES:
         return self._adapter.canonicalize(smiles)
 
+    def canonicalize_batch(self, smiles: Sequence[SMILES]) -> list[SMILES | None]:
+        """Canonical form of each input, None where it does not parse."""
+        canonical: list[SMILES | None] = []
+        for smi in smiles:
+            try:
+                canonical.append(self._adapter.canonicalize(smi))
+            except InvalidSMILESError:
+                canonical.append(None)
+        return canonical
+
     def to_inchikey(self, smiles: SMILES) -> InChIKey:
         return self._adapter.to_inchikey(smiles)
 
@@ -33,6 +47,14 @@ class ChemistryService:
     def compute_fingerprint(self, smiles: SMILES, fp_type: str = "morgan") -> Fingerprint:
         return self._adapter.compute_fingerprint(smiles, fp_type)
 
+    def compute_descriptors_batch(self, smiles: Sequence[SMILES]) -> DescriptorMatrix:
+        return self._adapter.compute_descriptors_batch(smiles)
+
+    def compute_fingerprints_batch(
+        self, smiles: Sequence[SMILES], fp_type: str = "morgan"
+    ) -> FingerprintMatrix:
+        return self._adapter.compute_fingerprints_batch(smiles, fp_type)
+
     def tanimoto_similarity(self, fp1: Fingerprint, fp2: Fingerprint) -> float:
         return self._adapter.tanimoto_similarity(fp1, fp2)
 
@@ -42,5 +64,17 @@ class ChemistryService:
     def depict_2d(self, smiles: SMILES, width: int = 300, height: int = 200) -> str:
         return self._adapter.depict_2d(smiles, width, height)
 
+    def depict_2d_batch(
+        self, smiles: Sequence[SMILES], width: int = 300, height: int = 200
+    ) -> list[str | None]:
+        """One SVG per input, None where the SMILES could not be drawn."""
+        svgs: list[str | None] = []
+        for smi in smiles:
+            try:
+                svgs.append(self._adapter.depict_2d(smi, width, height))
+            except Exception:
+                svgs.append(None)
+        return svgs
+
     def substructure_match(self, smiles: SMILES, pattern: str) -> tuple[bool, tuple[int, ...]]:
         return self._adapter.substructure_match(smiles, pattern)
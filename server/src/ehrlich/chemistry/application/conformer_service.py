@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from ehrlich.chemistry.infrastructure.conformer_store import conformer_variant
+from ehrlich.kernel.exceptions import InvalidSMILESError
+from ehrlich.workers.pool import run_cpu, run_thread
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ehrlich.chemistry.infrastructure.conformer_store import ConformerStore
+    from ehrlich.kernel.types import SMILES
+    from ehrlich.shared.chemistry_port import ChemistryPort
+    from ehrlich.shared.conformer import Conformer3D
+
+_NUM_CONFORMERS = 10
+
+
+class ConformerService:
+    """Lowest-energy 3D conformers, served from a ``ConformerStore`` when it has them.
+
+    Misses are embedded in the worker pool, one job per distinct molecule. A
+    lone miss embeds and optimizes its ensemble on every core; when several
+    jobs fan out, each gets ``num_threads`` RDKit threads so concurrent pool
+    workers do not oversubscribe the CPU (``0`` is every core).
+    """
+
+    def __init__(
+        self,
+        adapter: ChemistryPort | None = None,
+        store: ConformerStore | None = None,
+        num_conformers: int = _NUM_CONFORMERS,
+        num_threads: int = 1,
+    ) -> None:
+        if adapter is None:
+            from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+
+            adapter = RDKitAdapter()
+        self._adapter = adapter
+        self._store = store
+        self._num_conformers = num_conformers
+        self._num_threads = num_threads
+        self._variant = conformer_variant(num_conformers)
+
+    async def generate(self, smiles: SMILES) -> Conformer3D:
+        (result,) = await self._generate([smiles])
+        if isinstance(result, InvalidSMILESError):
+            raise result
+        return result
+
+    async def generate_many(
+        self, smiles: Sequence[SMILES]
+    ) -> tuple[list[Conformer3D | None], dict[int, str]]:
+        """One conformer per input (None where it failed) and the failure messages."""
+        conformers: list[Conformer3D | None] = []
+        errors: dict[int, str] = {}
+        for i, result in enumerate(await self._generate(smiles)):
+            if isinstance(result, InvalidSMILESError):
+                conformers.append(None)
+                errors[i] = str(result)
+            else:
+                conformers.append(result)
+        return conformers, errors
+
+    async def _generate(self, smiles: Sequence[SMILES]) -> list[Conformer3D | InvalidSMILESError]:
+        keys: list[str | InvalidSMILESError] = []
+        for smi in smiles:
+            try:
+                keys.append(str(self._adapter.to_inchikey(smi)))
+            except InvalidSMILESError as e:
+                keys.append(e)
+
+        found: dict[str, Conformer3D | InvalidSMILESError] = {}
+        if self._store is not None:
+            found.update(
+                await run_thread(
+                    self._store.get_many, self._variant, [k for k in keys if isinstance(k, str)]
+                )
+            )
+
+        # Embedded once per InChIKey, however many spellings of it were asked for.
+        todo: dict[str, SMILES] = {}
+        for smi, key in zip(smiles, keys, strict=True):
+            if isinstance(key, str) and key not in found:
+                todo.setdefault(key, smi)
+        num_threads = 0 if len(todo) == 1 else self._num_threads
+        results = await asyncio.gather(
+            *(
+                run_cpu(
+                    self._adapter.generate_conformer,
+                    smi,
+                    self._num_conformers,
+                    num_threads,
+                )
+                for smi in todo.values()
+            ),
+            return_exceptions=True,
+        )
+        new: dict[str, Conformer3D] = {}
+        for key, result in zip(todo, results, strict=True):
+            if isinstance(result, InvalidSMILESError):
+                found[key] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                new[key] = found[key] = result
+        if self._store is not None and new:
+            await run_thread(self._store.put_many, self._variant, new)
+        return [found[key] if isinstance(key, str) else key for key in keys]
@@ -0,0 +1,132 @@
+"""The structural alert catalog and its compiled RDKit form.
+
+Alerts are defined here (toxicity alerts and the substructures used for
+enrichment) and in ``data/resistance/default.yaml`` (resistance-associated
+scaffolds). ``load_alert_catalog`` builds the catalog once per YAML file.
+
+``CompiledAlerts`` parses every SMARTS once and keeps its pattern
+fingerprint. Matching a molecule screens all patterns against the molecule's
+pattern fingerprint with integer bit tests, then runs the substructure search
+only for the patterns whose bits are a subset of the molecule's.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+import weakref
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import yaml
+from rdkit import Chem
+
+from ehrlich.shared.alerts import AlertCatalog, StructuralAlert
+
+if TYPE_CHECKING:
+    from ehrlich.chemistry.infrastructure.mol_cache import MolEntry
+
+logger = logging.getLogger(__name__)
+
+_RESISTANCE_YAML = Path(__file__).resolve().parents[5] / "data" / "resistance" / "default.yaml"
+PATTERN_FP_BITS = 2048
+
+_BUILTIN_ALERTS = (
+    StructuralAlert("nitro", "[NX3](=O)=O", "mutagenic", "Nitro group (uncharged)"),
+    StructuralAlert("nitro_charged", "[N+](=O)[O-]", "mutagenic", "Nitro group (charge-separated)"),
+    StructuralAlert("azide", "[N]=[N]=[N]", "mutagenic", "Azide"),
+    StructuralAlert("quinone", "O=C1C=CC(=O)C=C1", "mutagenic", "Quinone"),
+    StructuralAlert("acyl_chloride", "C(=O)Cl", "hepatotoxic", "Acyl chloride"),
+    StructuralAlert("thioester", "[SX2]C(=O)", "hepatotoxic", "Thioester"),
+    StructuralAlert(
+        "beta_lactam", "[C@@H]1([C@@H](N1)C(=O)O)S", "enrichment", "Beta-lactam ring (penicillins)"
+    ),
+    StructuralAlert(
+        "fluoroquinolone", "c1cc2c(cc1F)c(=O)c(cn2)C(=O)O", "enrichment", "Fluoroquinolone core"
+    ),
+    StructuralAlert("sulfonamide", "NS(=O)(=O)c1ccc(N)cc1", "enrichment", "Sulfonamide group"),
+    StructuralAlert("benzene", "c1ccccc1", "enrichment", "Benzene ring"),
+    StructuralAlert("phenol", "c1ccc(cc1)O", "enrichment", "Phenol group"),
+    StructuralAlert("amine", "[NX3;H2,H1,H0]", "enrichment", "Primary/secondary/tertiary amine"),
+    StructuralAlert("carboxylic_acid", "[CX3](=O)[OX2H1]", "enrichment", "Carboxylic acid"),
+    StructuralAlert("amide", "[CX3](=[OX1])[NX3]", "enrichment", "Amide bond"),
+    StructuralAlert("hydroxyl", "[OX2H]", "enrichment", "Hydroxyl group"),
+    StructuralAlert("nitro", "[NX3](=O)=O", "enrichment", "Nitro group"),
+)
+
+
+def _resistance_alerts(yaml_path: Path) -> list[StructuralAlert]:
+    if not yaml_path.exists():
+        logger.warning("Resistance YAML not found: %s", yaml_path)
+        return []
+    with open(yaml_path) as f:
+        data = yaml.safe_load(f) or {}
+    return [
+        StructuralAlert(
+            name=str(smarts),
+            smarts=str(smarts),
+            category="resistance",
+            targets=tuple(str(t).upper() for t in (info or {}).get("targets", [])),
+        )
+        for smarts, info in data.get("patterns", {}).items()
+    ]
+
+
+@functools.cache
+def load_alert_catalog(resistance_yaml: Path = _RESISTANCE_YAML) -> AlertCatalog:
+    """Built-in alerts plus the resistance patterns in ``resistance_yaml``, loaded once."""
+    return AlertCatalog([*_BUILTIN_ALERTS, *_resistance_alerts(resistance_yaml)])
+
+
+def compile_pattern(pattern: str) -> Chem.Mol | None:
+    """Parse ``pattern`` as SMARTS, falling back to SMILES. None if neither parses."""
+    pattern_mol = Chem.MolFromSmarts(pattern)
+    if pattern_mol is None:
+        pattern_mol = Chem.MolFromSmiles(pattern)
+    return pattern_mol
+
+
+def pattern_screen(mol: Chem.Mol) -> int:
+    """The pattern fingerprint of ``mol`` as an int, for subset tests."""
+    fp = Chem.PatternFingerprint(mol, fpSize=PATTERN_FP_BITS)
+    return sum(1 << bit for bit in fp.GetOnBits())
+
+
+class CompiledAlerts:
+    """Parsed patterns and screens for one catalog; identical SMARTS are matched once."""
+
+    def __init__(self, patterns: list[str]) -> None:
+        unique: dict[str, int] = {}
+        for i, pattern in enumerate(patterns):
+            unique[pattern] = unique.get(pattern, 0) | 1 << i
+        # (pattern mol, its screen bits, catalog bits it sets); unparseable patterns match nothing.
+        self._checks: list[tuple[Chem.Mol, int, int]] = []
+        for pattern, bits in unique.items():
+            pattern_mol = compile_pattern(pattern)
+            if pattern_mol is not None:
+                self._checks.append((pattern_mol, pattern_screen(pattern_mol), bits))
+
+    def match(self, entry: MolEntry) -> int:
+        """Hit bitmap of ``entry``'s molecule against every pattern."""
+        if entry.pattern_screen is None:
+            entry.pattern_screen = pattern_screen(entry.mol)
+        screen = entry.pattern_screen
+        bitmap = 0
+        for pattern_mol, required, bits in self._checks:
+            if required & screen == required and entry.mol.HasSubstructMatch(pattern_mol):
+                bitmap |= bits
+        return bitmap
+
+
+_compiled: weakref.WeakKeyDictionary[AlertCatalog, CompiledAlerts] = weakref.WeakKeyDictionary()
+_compiled_lock = threading.Lock()
+
+
+def compiled(catalog: AlertCatalog) -> CompiledAlerts:
+    """The compiled form of ``catalog``, built on first use and kept while it lives."""
+    with _compiled_lock:
+        result = _compiled.get(catalog)
+        if result is None:
+            result = _compiled[catalog] = CompiledAlerts([a.smarts for a in catalog])
+        return result
@@ -0,0 +1,100 @@
+"""Packed uint64 fingerprint bitsets and popcount Tanimoto kernels.
+
+Bit ``k`` lives in word ``k // 64`` at position ``k % 64``; words are
+little-endian so a row's bytes unpack with ``bitorder="little"``. Rows with
+no bits set have similarity 0.0 to everything, matching RDKit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from numpy.typing import NDArray
+
+WORD_BITS = 64
+_WORD = np.dtype("<u8")
+# Bound on each (rows, cols) block of intersection counts in tanimoto_blocks.
+_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def n_words(n_bits: int) -> int:
+    return -(-n_bits // WORD_BITS)
+
+
+def pack_on_bits(rows: Sequence[Sequence[int]], n_bits: int) -> NDArray[np.uint64]:
+    """Pack per-row on-bit indices into an ``(n, n_words)`` word matrix."""
+    words = np.zeros((len(rows), n_words(n_bits)), dtype=_WORD)
+    lengths = [len(r) for r in rows]
+    if sum(lengths):
+        row_idx = np.repeat(np.arange(len(rows)), lengths)
+        bits = np.fromiter((b for r in rows for b in r), dtype=np.int64, count=sum(lengths))
+        flat = words.reshape(-1)
+        np.bitwise_or.at(
+            flat,
+            row_idx * words.shape[1] + bits // WORD_BITS,
+            np.left_shift(np.uint64(1), (bits % WORD_BITS).astype(np.uint64)),
+        )
+    return words
+
+
+def unpack(words: NDArray[np.uint64], n_bits: int) -> NDArray[np.uint8]:
+    """Expand packed rows to a dense ``(n, n_bits)`` 0/1 matrix (e.g. model features)."""
+    as_bytes = np.ascontiguousarray(words, dtype=_WORD).view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1, count=n_bits, bitorder="little")
+
+
+def popcount(words: NDArray[np.uint64]) -> NDArray[np.int64]:
+    """Number of set bits per row."""
+    counts: NDArray[np.int64] = np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    return counts
+
+
+def tanimoto_one_to_many(
+    query: NDArray[np.uint64], matrix: NDArray[np.uint64]
+) -> NDArray[np.float64]:
+    """Tanimoto similarity of one packed row against every row of ``matrix``."""
+    inter = np.bitwise_count(matrix & query).sum(axis=1, dtype=np.int64)
+    union = popcount(matrix) + popcount(query) - inter
+    return _ratio(inter, union)
+
+
+def tanimoto_matrix(a: NDArray[np.uint64], b: NDArray[np.uint64]) -> NDArray[np.float64]:
+    """Pairwise Tanimoto similarity, shape ``(len(a), len(b))``, computed in row blocks."""
+    out = np.empty((a.shape[0], b.shape[0]), dtype=np.float64)
+    if out.size == 0:
+        return out
+    for start, sim in tanimoto_blocks(a, b):
+        out[start : start + len(sim)] = sim
+    return out
+
+
+def tanimoto_blocks(
+    a: NDArray[np.uint64], b: NDArray[np.uint64], block_rows: int | None = None
+) -> Iterator[tuple[int, NDArray[np.float64]]]:
+    """Yield ``(start, similarities)`` for consecutive row blocks of ``a`` against ``b``.
+
+    Intersections are accumulated one word column at a time, so scratch memory
+    is ``block_rows * len(b)`` rather than growing with the fingerprint width.
+    """
+    count_a = popcount(a)
+    count_b = popcount(b)
+    columns = np.ascontiguousarray(b.T)
+    rows = block_rows or max(1, _CHUNK_BYTES // max(1, b.shape[0] * 8))
+    for start in range(0, a.shape[0], rows):
+        block = a[start : start + rows]
+        inter = np.zeros((block.shape[0], b.shape[0]), dtype=np.int64)
+        for k in range(a.shape[1]):
+            inter += np.bitwise_count(block[:, k, None] & columns[k][None, :])
+        union = count_a[start : start + rows, None] + count_b[None, :] - inter
+        yield start, _ratio(inter, union)
+
+
+def _ratio(inter: NDArray[np.int64], union: NDArray[np.int64]) -> NDArray[np.float64]:
+    sim = np.zeros(inter.shape, dtype=np.float64)
+    np.divide(inter, union, out=sim, where=union > 0)
+    return sim
@@ -0,0 +1,102 @@
+"""Lowest-energy conformers persisted in SQLite, keyed by InChIKey.
+
+InChIKey rather than SMILES so every spelling of a molecule shares one entry.
+Rows also carry a variant naming how the conformer was made (ensemble size
+and RDKit version), so changing either starts fresh entries instead of
+serving conformers generated differently.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import rdkit
+
+from ehrlich.kernel.types import MolBlock
+from ehrlich.shared.conformer import Conformer3D
+from ehrlich.shared.sqlite_store import SQLiteStore
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+_MAX_ENTRIES = 100_000
+_QUERY_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conformers (
+    inchikey TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    mol_block TEXT NOT NULL,
+    energy REAL NOT NULL,
+    num_atoms INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (inchikey, variant)
+);
+CREATE INDEX IF NOT EXISTS idx_conformers_stored ON conformers(stored_at);
+"""
+
+
+def conformer_variant(num_conformers: int) -> str:
+    return f"etkdgv3-n{num_conformers}-rdkit{rdkit.__version__}"
+
+
+class ConformerStore(SQLiteStore):
+    _table = "conformers"
+    _schema = _SCHEMA
+    _recency = "stored_at"
+
+    def __init__(self, path: Path, max_entries: int = _MAX_ENTRIES) -> None:
+        super().__init__(path, max_entries)
+
+    def get_many(self, variant: str, inchikeys: Iterable[str]) -> dict[str, Conformer3D]:
+        """Stored conformers for whichever of ``inchikeys`` have one."""
+        keys = list(dict.fromkeys(inchikeys))
+        rows: list[tuple[str, str, float, int]] = []
+        with self._lock:
+            # Chunked to stay under SQLite's bound-parameter limit.
+            for start in range(0, len(keys), _QUERY_CHUNK):
+                chunk = keys[start : start + _QUERY_CHUNK]
+                where = f"variant = ? AND inchikey IN ({','.join('?' * len(chunk))})"
+                rows += self._conn.execute(
+                    f"SELECT inchikey, mol_block, energy, num_atoms FROM conformers WHERE {where}",
+                    (variant, *chunk),
+                ).fetchall()
+                self._touch(where, (variant, *chunk))
+            self._conn.commit()
+            self.hits += len(rows)
+            self.misses += len(keys) - len(rows)
+        return {
+            key: Conformer3D(mol_block=MolBlock(block), energy=energy, num_atoms=num_atoms)
+            for key, block, energy, num_atoms in rows
+        }
+
+    def put_many(self, variant: str, conformers: Mapping[str, Conformer3D]) -> None:
+        if not conformers:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO conformers "
+                "(inchikey, variant, mol_block, energy, num_atoms, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (key, variant, str(conf.mol_block), conf.energy, conf.num_atoms, now)
+                    for key, conf in conformers.items()
+                ],
+            )
+            self._trim()
+            self._conn.commit()
+
+
+@functools.cache
+def shared_conformer_store() -> ConformerStore:
+    """The process-wide store at ``EHRLICH_CONFORMER_CACHE_PATH``."""
+    from ehrlich.config import get_settings
+
+    settings = get_settings()
+    return ConformerStore(
+        Path(settings.conformer_cache_path), max_entries=settings.conformer_cache_max_entries
+    )
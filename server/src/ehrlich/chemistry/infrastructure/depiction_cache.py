@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Depiction:
+    svg: str
+    etag: str
+
+    @classmethod
+    def of(cls, svg: str) -> Depiction:
+        """Wrap ``svg`` with a strong ETag derived from its content."""
+        return cls(svg=svg, etag=f'"{hashlib.sha256(svg.encode()).hexdigest()[:32]}"')
+
+
+class DepictionCache:
+    """Bounded LRU of rendered 2D SVGs keyed by canonical SMILES and image size.
+
+    Bounded by the total size of the stored SVGs rather than their count, since
+    a 1000x1000 drawing of a macrocycle is many times larger than a thumbnail.
+    """
+
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 1:
+            msg = "max_bytes must be at least 1"
+            raise ValueError(msg)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, int, int], Depiction] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, canonical: str, width: int, height: int) -> Depiction | None:
+        key = (canonical, width, height)
+        with self._lock:
+            depiction = self._entries.get(key)
+            if depiction is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return depiction
+
+    def put(self, canonical: str, width: int, height: int, svg: str) -> Depiction:
+        depiction = Depiction.of(svg)
+        key = (canonical, width, height)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old.svg)
+            self._entries[key] = depiction
+            self._bytes += len(svg)
+            while self._bytes > self._max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.svg)
+                self.evictions += 1
+        return depiction
+
+    def resize(self, max_bytes: int) -> None:
+        if max_bytes < 1:
+            msg = "max_bytes must be at least 1"
+            raise ValueError(msg)
+        with self._lock:
+            self._max_bytes = max_bytes
+            while self._bytes > self._max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.svg)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_shared = DepictionCache()
+
+
+def shared_depiction_cache() -> DepictionCache:
+    """The process-wide cache behind the ``/molecule/depict`` endpoints."""
+    return _shared
@@ -0,0 +1,225 @@
+"""Per-molecule features persisted as Parquet next to the ChEMBL dataset caches.
+
+Rows are keyed by the SMILES string as the caller passed it (for datasets,
+ChEMBL's canonical SMILES), so a hit needs no RDKit parse at all. Each kind of
+feature lives in a partition named by a version stamp that spells out every
+parameter the value depends on, e.g. ``morgan-r2-2048-rdkit2026.09.1``:
+changing the fingerprint settings or upgrading RDKit starts a new partition
+instead of serving stale values.
+
+Only the most recently used ``max_rows`` rows are held in memory. A lookup
+that misses them reads just the requested keys from the partition's part
+files. New rows are buffered and written as one part once ``flush_rows`` are
+pending or the oldest has waited ``flush_seconds``, so a handful of molecules
+per tool call does not become a file each. Once a partition has more than
+``compact_after`` parts they are merged into one, sorted by key, from disk.
+Parts written by other processes are read like any other, and a part that
+vanishes mid-read (merged by another process) is skipped, since the merged
+file carries its rows.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+logger = logging.getLogger(__name__)
+
+_COMPACT_AFTER = 16
+_MAX_ROWS = 100_000
+_FLUSH_ROWS = 2000
+_FLUSH_SECONDS = 60.0
+_STAMP_RE = re.compile(r"^[A-Za-z0-9._-]+$")
+
+# (value, error): value is None when the molecule failed, with the reason in error.
+type StoredFeature = tuple[Any, str | None]
+
+
+class FeatureStore:
+    def __init__(
+        self,
+        root: Path,
+        compact_after: int = _COMPACT_AFTER,
+        max_rows: int = _MAX_ROWS,
+        flush_rows: int = _FLUSH_ROWS,
+        flush_seconds: float = _FLUSH_SECONDS,
+    ) -> None:
+        self._root = root
+        self._compact_after = compact_after
+        self._max_rows = max_rows
+        self._flush_rows = flush_rows
+        self._flush_seconds = flush_seconds
+        self._lock = threading.Lock()
+        self._rows: OrderedDict[tuple[str, str], StoredFeature] = OrderedDict()
+        self._pending: dict[str, dict[str, StoredFeature]] = {}
+        self._pending_since = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, stamp: str, keys: Iterable[str]) -> dict[str, StoredFeature]:
+        """Stored rows for whichever of ``keys`` the ``stamp`` partition has."""
+        keys = list(keys)
+        with self._lock:
+            partition = self._partition(stamp)
+            pending = self._pending.get(stamp, {})
+            found: dict[str, StoredFeature] = {}
+            missing: list[str] = []
+            for key in dict.fromkeys(keys):
+                row = pending.get(key) or self._rows.get((stamp, key))
+                if row is None:
+                    missing.append(key)
+                    continue
+                if (stamp, key) in self._rows:
+                    self._rows.move_to_end((stamp, key))
+                found[key] = row
+            if missing:
+                loaded = self._read(partition, missing)
+                for key, row in loaded.items():
+                    self._remember(stamp, key, row)
+                found.update(loaded)
+            self.hits += sum(1 for key in keys if key in found)
+            self.misses += sum(1 for key in keys if key not in found)
+            return found
+
+    def put_many(self, stamp: str, rows: Mapping[str, StoredFeature]) -> None:
+        """Queue ``rows`` for the ``stamp`` partition; written with the next flush."""
+        if not rows:
+            return
+        with self._lock:
+            self._partition(stamp)
+            pending = self._pending.setdefault(stamp, {})
+            if not any(self._pending.values()):
+                self._pending_since = time.monotonic()
+            for key, row in rows.items():
+                if key in pending or (stamp, key) in self._rows:
+                    continue
+                pending[key] = row
+                self._remember(stamp, key, row)
+            n_pending = sum(len(p) for p in self._pending.values())
+            if n_pending >= self._flush_rows or (
+                n_pending and time.monotonic() - self._pending_since >= self._flush_seconds
+            ):
+                self._flush()
+
+    def flush(self) -> None:
+        """Write every pending row to disk now (e.g. at shutdown)."""
+        with self._lock:
+            self._flush()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "rows": len(self._rows),
+                "max_rows": self._max_rows,
+                "pending": sum(len(p) for p in self._pending.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _partition(self, stamp: str) -> Path:
+        if not _STAMP_RE.match(stamp):
+            msg = f"Invalid feature stamp: {stamp!r}"
+            raise ValueError(msg)
+        return self._root / stamp
+
+    def _remember(self, stamp: str, key: str, row: StoredFeature) -> None:
+        self._rows[(stamp, key)] = row
+        self._rows.move_to_end((stamp, key))
+        while len(self._rows) > self._max_rows:
+            self._rows.popitem(last=False)
+
+    def _read(self, partition: Path, keys: list[str]) -> dict[str, StoredFeature]:
+        """Rows for ``keys`` from the part files, reading only matching rows."""
+        if not partition.is_dir():
+            return {}
+        found: dict[str, StoredFeature] = {}
+        wanted = pa.array(keys, type=pa.string())
+        for path in sorted(partition.glob("part-*.parquet")):
+            try:
+                table = pq.read_table(path, filters=pc.field("key").isin(wanted))
+            except FileNotFoundError:
+                continue
+            except (OSError, pa.ArrowException):
+                logger.warning("Skipping unreadable feature part %s", path)
+                continue
+            data = table.to_pydict()
+            for key, value, error in zip(data["key"], data["value"], data["error"], strict=True):
+                found.setdefault(key, (value, error))
+            if len(found) == len(keys):
+                break
+        return found
+
+    def _flush(self) -> None:
+        for stamp, rows in self._pending.items():
+            if not rows:
+                continue
+            partition = self._partition(stamp)
+            self._write_part(partition, _table(rows))
+            if len(list(partition.glob("part-*.parquet"))) > self._compact_after:
+                self._compact(partition)
+        self._pending.clear()
+
+    def _write_part(self, partition: Path, table: pa.Table) -> Path:
+        partition.mkdir(parents=True, exist_ok=True)
+        path = partition / f"part-{os.getpid()}-{uuid.uuid4().hex}.parquet"
+        tmp = path.with_name(f".{path.name}.tmp")
+        pq.write_table(table, tmp)
+        os.replace(tmp, path)
+        return path
+
+    def _compact(self, partition: Path) -> None:
+        parts = sorted(partition.glob("part-*.parquet"))
+        tables = []
+        for path in parts:
+            try:
+                tables.append(pq.read_table(path))
+            except FileNotFoundError:
+                continue
+            except (OSError, pa.ArrowException):
+                logger.warning("Skipping unreadable feature part %s", path)
+                continue
+        if not tables:
+            return
+        merged = pa.concat_tables(tables, promote_options="permissive")
+        first: dict[str, int] = {}
+        for i, key in enumerate(merged.column("key").to_pylist()):
+            first.setdefault(key, i)
+        # Sorted keys give each row group a narrow key range for filtered reads.
+        order = sorted(first, key=str)
+        self._write_part(partition, merged.take([first[key] for key in order]))
+        for path in parts:
+            path.unlink(missing_ok=True)
+
+
+def _table(rows: Mapping[str, StoredFeature]) -> pa.Table:
+    return pa.table(
+        {
+            "key": list(rows),
+            "value": [value for value, _ in rows.values()],
+            "error": [error for _, error in rows.values()],
+        }
+    )
+
+
+@functools.cache
+def shared_feature_store() -> FeatureStore:
+    """The process-wide store under ``EHRLICH_FEATURE_STORE_DIR``, shared by the tool modules."""
+    from ehrlich.config import get_settings
+
+    settings = get_settings()
+    return FeatureStore(Path(settings.feature_store_dir), max_rows=settings.feature_store_max_rows)
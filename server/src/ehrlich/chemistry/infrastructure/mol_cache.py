@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from rdkit import Chem
+
+if TYPE_CHECKING:
+    from ehrlich.shared.descriptors import MolecularDescriptors
+    from ehrlich.shared.fingerprint import Fingerprint
+
+_DEFAULT_MAX_SIZE = 4096
+# Input spellings remembered per canonical entry before the oldest are dropped.
+_ALIASES_PER_ENTRY = 4
+
+
+@dataclass
+class MolEntry:
+    """A parsed molecule and the values derived from it so far.
+
+    ``mol`` is shared by every caller and must be treated as read-only;
+    copy it (``Chem.Mol(entry.mol)``) before anything that mutates it.
+    """
+
+    canonical: str
+    mol: Chem.Mol
+    fingerprints: dict[str, Fingerprint] = field(default_factory=dict)
+    descriptors: MolecularDescriptors | None = None
+    # Pattern fingerprint as an int, for substructure pre-screening (see alert_catalog).
+    pattern_screen: int | None = None
+
+
+class MolCache:
+    """Bounded LRU of parsed molecules keyed by canonical SMILES.
+
+    Lookups go through the caller's spelling first, so ``OCC`` and ``CCO``
+    share one entry (and its fingerprints/descriptors) after the first parse.
+    Invalid SMILES are not cached.
+    """
+
+    def __init__(self, max_size: int = _DEFAULT_MAX_SIZE) -> None:
+        if max_size < 1:
+            msg = "max_size must be at least 1"
+            raise ValueError(msg)
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, MolEntry] = OrderedDict()
+        self._aliases: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def get(self, smiles: str) -> MolEntry | None:
+        """Return the entry for ``smiles``, parsing it on a miss. None if invalid."""
+        with self._lock:
+            canonical = self._aliases.get(smiles)
+            if canonical is not None:
+                entry = self._entries.get(canonical)
+                if entry is not None:
+                    self._entries.move_to_end(canonical)
+                    self._aliases.move_to_end(smiles)
+                    self.hits += 1
+                    return entry
+            self.misses += 1
+
+        # Parse outside the lock so concurrent misses don't serialize.
+        mol = Chem.MolFromSmiles(smiles)
+        if mol is None:
+            return None
+        canonical = Chem.MolToSmiles(mol)
+
+        with self._lock:
+            entry = self._entries.get(canonical)
+            if entry is None:
+                entry = self._entries[canonical] = MolEntry(canonical=canonical, mol=mol)
+            self._entries.move_to_end(canonical)
+            self._aliases[smiles] = canonical
+            self._aliases.move_to_end(smiles)
+            self._evict()
+            return entry
+
+    def resize(self, max_size: int) -> None:
+        if max_size < 1:
+            msg = "max_size must be at least 1"
+            raise ValueError(msg)
+        with self._lock:
+            self._max_size = max_size
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        # Aliases of evicted entries are dropped lazily on lookup or here by age.
+        while len(self._aliases) > self._max_size * _ALIASES_PER_ENTRY:
+            self._aliases.popitem(last=False)
+
+
+_shared = MolCache()
+
+
+def shared_mol_cache() -> MolCache:
+    """The process-wide cache used by every ``RDKitAdapter`` built without one."""
+    return _shared
@@ -1,3 +1,10 @@
+import hashlib
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+import rdkit
+from numpy.typing import NDArray
 from rdkit import Chem
 from rdkit.Chem import (
     QED,
@@ -5,35 +12,118 @@ from rdkit.Chem import (
     Descriptors,
     MACCSkeys,
     rdFingerprintGenerator,
+    rdForceFieldHelpers,
     rdMolDescriptors,
 )
 from rdkit.Chem.Draw import rdMolDraw2D
 from rdkit.Chem.inchi import MolToInchi
 from rdkit.Chem.Scaffolds.MurckoScaffold import GetScaffoldForMol
-from rdkit.DataStructs import TanimotoSimilarity
-from rdkit.ML.Cluster import Butina
 
+from ehrlich.chemistry.infrastructure import alert_catalog, bitset, clustering
+from ehrlich.chemistry.infrastructure.feature_store import FeatureStore, StoredFeature
+from ehrlich.chemistry.infrastructure.mol_cache import MolCache, MolEntry, shared_mol_cache
 from ehrlich.kernel.exceptions import InvalidSMILESError
 from ehrlich.kernel.types import SMILES, InChIKey, MolBlock
+from ehrlich.shared.alerts import AlertCatalog
 from ehrlich.shared.chemistry_port import ChemistryPort
 from ehrlich.shared.conformer import Conformer3D
-from ehrlich.shared.descriptors import MolecularDescriptors
-from ehrlich.shared.fingerprint import Fingerprint
+from ehrlich.shared.descriptors import DESCRIPTOR_COLUMNS, DescriptorMatrix, MolecularDescriptors
+from ehrlich.shared.fingerprint import Fingerprint, FingerprintMatrix
+from ehrlich.shared.substructure import SubstructureMatrix
+
+_MORGAN_RADIUS = 2
+_MORGAN_BITS = 2048
+_MACCS_BITS = 167
+_NUM_CONFORMERS = 10
+_CONFORMER_SEED = 42
+_CONFORMER_MAX_ITERS = 200
+
+# Feature store partitions: each stamp names every parameter its values depend on.
+_RDKIT = f"rdkit{rdkit.__version__}"
+_MORGAN_STAMP = f"morgan-r{_MORGAN_RADIUS}-{_MORGAN_BITS}-{_RDKIT}"
+_MACCS_STAMP = f"maccs-{_MACCS_BITS}-{_RDKIT}"
+_DESCRIPTOR_STAMP = (
+    f"descriptors-{hashlib.sha1(','.join(DESCRIPTOR_COLUMNS).encode()).hexdigest()[:12]}-{_RDKIT}"
+)
+_SCAFFOLD_STAMP = f"murcko-{_RDKIT}"
+
+
+def _substructure_stamp(patterns: Sequence[str]) -> str:
+    digest = hashlib.sha1("\n".join(patterns).encode()).hexdigest()[:12]
+    return f"substructure-{digest}-{_RDKIT}"
 
 
 class RDKitAdapter(ChemistryPort):
-    def _to_mol(self, smiles: SMILES) -> Chem.Mol:
-        mol = Chem.MolFromSmiles(str(smiles))
-        if mol is None:
+    """RDKit implementation of ``ChemistryPort``.
+
+    With a ``FeatureStore``, the batch methods read fingerprints, descriptors,
+    scaffolds, and substructure hits from it before computing anything, and
+    persist whatever they had to compute.
+    """
+
+    def __init__(self, cache: MolCache | None = None, store: FeatureStore | None = None) -> None:
+        self._cache = cache or shared_mol_cache()
+        self._store = store
+
+    def __reduce__(self) -> tuple[type[ChemistryPort], tuple[()]]:
+        # Sent to worker processes without the cache or store; each process uses its own.
+        return (RDKitAdapter, ())
+
+    def _stored[T](
+        self,
+        stamp: str,
+        smiles: Sequence[SMILES],
+        compute: Callable[[SMILES], T],
+        encode: Callable[[T], Any],
+        decode: Callable[[Any], T],
+    ) -> tuple[list[T | None], dict[int, str]]:
+        """``compute`` for each SMILES, going through the feature store when there is one.
+
+        Returns one value per input (None where it failed) and the failure messages.
+        Only invalid SMILES are persisted as failures; other errors are retried next time.
+        """
+        keys = [str(s) for s in smiles]
+        known = self._store.get_many(stamp, keys) if self._store is not None else {}
+        values: list[T | None] = []
+        errors: dict[int, str] = {}
+        new: dict[str, StoredFeature] = {}
+        for i, (smi, key) in enumerate(zip(smiles, keys, strict=True)):
+            value: T | None = None
+            if key in known:
+                raw, error = known[key]
+                if error is None:
+                    value = decode(raw)
+            else:
+                try:
+                    value, error = compute(smi), None
+                    new[key] = (encode(value), None)
+                except InvalidSMILESError as e:
+                    error = str(e)
+                    new[key] = (None, error)
+                except Exception as e:
+                    error = str(e)
+            values.append(value)
+            if error is not None:
+                errors[i] = error
+        if self._store is not None and new:
+            self._store.put_many(stamp, new)
+        return values, errors
+
+    def _entry(self, smiles: SMILES) -> MolEntry:
+        entry = self._cache.get(str(smiles))
+        if entry is None:
             raise InvalidSMILESError(str(smiles))
-        return mol
+        return entry
+
+    def _to_mol(self, smiles: SMILES) -> Chem.Mol:
+        # Shared with the cache: callers that mutate must copy first.
+        return self._entry(smiles).mol
 
     def validate_smiles(self, smiles: SMILES) -> bool:
-        return Chem.MolFromSmiles(str(smiles)) is not None
+        return self._cache.get(str(smiles)) is not None
 
     def canonicalize(self, smiles: SMILES) -> SMILES:
-        mol = self._to_mol(smiles)
-        return SMILES(Chem.MolToSmiles(mol))
+        return SMILES(self._entry(smiles).canonical)
 
     def to_inchikey(self, smiles: SMILES) -> InChIKey:
         mol = self._to_mol(smiles)
@@ -46,7 +136,13 @@ class RDKitAdapter(ChemistryPort):
         return InChIKey(key)
 
     def compute_descriptors(self, smiles: SMILES) -> MolecularDescriptors:
-        mol = self._to_mol(smiles)
+        entry = self._entry(smiles)
+        if entry.descriptors is None:
+            entry.descriptors = self._descriptors(entry.mol)
+        return entry.descriptors
+
+    @staticmethod
+    def _descriptors(mol: Chem.Mol) -> MolecularDescriptors:
         return MolecularDescriptors(
             molecular_weight=Descriptors.MolWt(mol),
             logp=Descriptors.MolLogP(mol),
@@ -58,56 +154,169 @@ class RDKitAdapter(ChemistryPort):
             num_rings=rdMolDescriptors.CalcNumRings(mol),
         )
 
-    _morgan_gen = rdFingerprintGenerator.GetMorganGenerator(radius=2, fpSize=2048)
+    _morgan_gen = rdFingerprintGenerator.GetMorganGenerator(
+        radius=_MORGAN_RADIUS, fpSize=_MORGAN_BITS
+    )
 
     def compute_fingerprint(self, smiles: SMILES, fp_type: str = "morgan") -> Fingerprint:
-        mol = self._to_mol(smiles)
+        entry = self._entry(smiles)
+        fp = entry.fingerprints.get(fp_type)
+        if fp is None:
+            fp = entry.fingerprints[fp_type] = self._fingerprint(entry.mol, fp_type)
+        return fp
+
+    def _fingerprint(self, mol: Chem.Mol, fp_type: str) -> Fingerprint:
         if fp_type == "maccs":
             fp = MACCSkeys.GenMACCSKeys(mol)
             on_bits = tuple(fp.GetOnBits())
-            return Fingerprint(bits=on_bits, fp_type="maccs", radius=0, n_bits=167)
+            return Fingerprint(bits=on_bits, fp_type="maccs", radius=0, n_bits=_MACCS_BITS)
         fp = self._morgan_gen.GetFingerprint(mol)
         on_bits = tuple(fp.GetOnBits())
-        return Fingerprint(bits=on_bits, fp_type="morgan", radius=2, n_bits=2048)
+        return Fingerprint(
+            bits=on_bits, fp_type="morgan", radius=_MORGAN_RADIUS, n_bits=_MORGAN_BITS
+        )
+
+    def compute_descriptors_batch(self, smiles: Sequence[SMILES]) -> DescriptorMatrix:
+        descriptors, errors = self._stored(
+            _DESCRIPTOR_STAMP,
+            smiles,
+            self.compute_descriptors,
+            lambda desc: [float(getattr(desc, col)) for col in DESCRIPTOR_COLUMNS],
+            MolecularDescriptors.from_row,
+        )
+        values = np.full((len(smiles), len(DESCRIPTOR_COLUMNS)), np.nan)
+        valid = np.zeros(len(smiles), dtype=bool)
+        for i, desc in enumerate(descriptors):
+            if desc is not None:
+                values[i] = [getattr(desc, col) for col in DESCRIPTOR_COLUMNS]
+                valid[i] = True
+        return DescriptorMatrix(values=values, valid=valid, errors=errors)
+
+    def compute_fingerprints_batch(
+        self, smiles: Sequence[SMILES], fp_type: str = "morgan"
+    ) -> FingerprintMatrix:
+        maccs = fp_type == "maccs"
+        n_bits = _MACCS_BITS if maccs else _MORGAN_BITS
+        bits: list[tuple[int, ...] | None]
+        bits, errors = self._stored(
+            _MACCS_STAMP if maccs else _MORGAN_STAMP,
+            smiles,
+            lambda smi: self.compute_fingerprint(smi, fp_type).bits,
+            list,
+            tuple,
+        )
+        return FingerprintMatrix(
+            words=bitset.pack_on_bits([b or () for b in bits], n_bits),
+            valid=np.array([b is not None for b in bits], dtype=bool),
+            fp_type="maccs" if maccs else "morgan",
+            n_bits=n_bits,
+            errors=errors,
+        )
+
+    def substructure_matrix(
+        self, smiles: Sequence[SMILES], patterns: Sequence[str]
+    ) -> SubstructureMatrix:
+        compiled = alert_catalog.CompiledAlerts(list(patterns))
+        return self._hit_matrix(smiles, compiled, tuple(patterns))
+
+    def match_alerts(self, smiles: SMILES, catalog: AlertCatalog) -> int:
+        return alert_catalog.compiled(catalog).match(self._entry(smiles))
+
+    def alert_matrix(self, smiles: Sequence[SMILES], catalog: AlertCatalog) -> SubstructureMatrix:
+        compiled = alert_catalog.compiled(catalog)
+        return self._hit_matrix(smiles, compiled, tuple(a.smarts for a in catalog))
+
+    def _hit_matrix(
+        self,
+        smiles: Sequence[SMILES],
+        compiled: alert_catalog.CompiledAlerts,
+        patterns: tuple[str, ...],
+    ) -> SubstructureMatrix:
+        # Bitmaps are stored as hex: catalogs can have more than 64 patterns.
+        bitmaps, errors = self._stored(
+            _substructure_stamp(patterns),
+            smiles,
+            lambda smi: compiled.match(self._entry(smi)),
+            lambda bitmap: format(bitmap, "x"),
+            lambda text: int(text, 16),
+        )
+        hits = np.zeros((len(smiles), len(patterns)), dtype=bool)
+        valid = np.zeros(len(smiles), dtype=bool)
+        for i, bitmap in enumerate(bitmaps):
+            if bitmap is None:
+                continue
+            if bitmap:
+                hits[i, [j for j in range(len(patterns)) if bitmap >> j & 1]] = True
+            valid[i] = True
+        return SubstructureMatrix(hits=hits, valid=valid, patterns=patterns, errors=errors)
 
     def tanimoto_similarity(self, fp1: Fingerprint, fp2: Fingerprint) -> float:
-        bv1 = self._fingerprint_to_bitvect(fp1)
-        bv2 = self._fingerprint_to_bitvect(fp2)
-        return float(TanimotoSimilarity(bv1, bv2))
+        bits1 = set(fp1.bits)
+        inter = len(bits1.intersection(fp2.bits))
+        union = len(bits1) + len(fp2.bits) - inter
+        return inter / union if union else 0.0
 
-    def _fingerprint_to_bitvect(self, fp: Fingerprint) -> Chem.DataStructs.ExplicitBitVect:
-        from rdkit.DataStructs import ExplicitBitVect
+    def tanimoto_one_to_many(
+        self, query: Fingerprint, fingerprints: FingerprintMatrix
+    ) -> NDArray[np.float64]:
+        packed = bitset.pack_on_bits([query.bits], fingerprints.n_bits)[0]
+        return bitset.tanimoto_one_to_many(packed, fingerprints.words)
 
-        bv = ExplicitBitVect(fp.n_bits)
-        for bit in fp.bits:
-            bv.SetBit(bit)
-        return bv
+    def tanimoto_matrix(
+        self, a: FingerprintMatrix, b: FingerprintMatrix | None = None
+    ) -> NDArray[np.float64]:
+        return bitset.tanimoto_matrix(a.words, a.words if b is None else b.words)
 
-    def generate_conformer(self, smiles: SMILES) -> Conformer3D:
-        mol = self._to_mol(smiles)
-        mol = Chem.AddHs(mol)
+    def generate_conformer(
+        self,
+        smiles: SMILES,
+        num_conformers: int = _NUM_CONFORMERS,
+        num_threads: int = 0,
+    ) -> Conformer3D:
+        """Lowest-energy member of an ETKDG ensemble after MMFF (or UFF) optimization.
+
+        Embedding and optimization run on ``num_threads`` RDKit threads
+        (0 uses every core); the GIL is released for both.
+        """
+        mol = Chem.AddHs(self._to_mol(smiles))
         params = AllChem.ETKDGv3()
-        params.randomSeed = 42
-        result = AllChem.EmbedMolecule(mol, params)
-        if result == -1:
+        params.randomSeed = _CONFORMER_SEED
+        params.numThreads = num_threads
+        conf_ids = list(AllChem.EmbedMultipleConfs(mol, max(num_conformers, 1), params))
+        if not conf_ids:
             raise InvalidSMILESError(str(smiles), "Cannot generate 3D conformer")
-        try:
-            AllChem.MMFFOptimizeMolecule(mol, maxIters=200)
-            energy = float(AllChem.MMFFGetMoleculeForceField(mol).CalcEnergy())
-        except Exception:
-            energy = 0.0
-        mol_block = Chem.MolToMolBlock(mol)
+        energies = self._optimize_conformers(mol, num_threads)
+        if energies is None:
+            best, energy = conf_ids[0], 0.0
+        else:
+            best, energy = min(zip(conf_ids, energies, strict=True), key=lambda pair: pair[1])
         return Conformer3D(
-            mol_block=MolBlock(mol_block),
+            mol_block=MolBlock(Chem.MolToMolBlock(mol, confId=best)),
             energy=energy,
             num_atoms=mol.GetNumAtoms(),
         )
 
+    @staticmethod
+    def _optimize_conformers(mol: Chem.Mol, num_threads: int) -> list[float] | None:
+        """Optimize every conformer in place; their energies, or None without force field."""
+        try:
+            if rdForceFieldHelpers.MMFFHasAllMoleculeParams(mol):
+                results = rdForceFieldHelpers.MMFFOptimizeMoleculeConfs(
+                    mol, numThreads=num_threads, maxIters=_CONFORMER_MAX_ITERS
+                )
+            elif rdForceFieldHelpers.UFFHasAllMoleculeParams(mol):
+                results = rdForceFieldHelpers.UFFOptimizeMoleculeConfs(
+                    mol, numThreads=num_threads, maxIters=_CONFORMER_MAX_ITERS
+                )
+            else:
+                return None
+        except Exception:
+            return None
+        return [float(energy) for _, energy in results]
+
     def substructure_match(self, smiles: SMILES, pattern: str) -> tuple[bool, tuple[int, ...]]:
         mol = self._to_mol(smiles)
-        pattern_mol = Chem.MolFromSmarts(pattern)
-        if pattern_mol is None:
-            pattern_mol = Chem.MolFromSmiles(pattern)
+        pattern_mol = alert_catalog.compile_pattern(pattern)
         if pattern_mol is None:
             return (False, ())
         match = mol.GetSubstructMatch(pattern_mol)
@@ -116,7 +325,7 @@ class RDKitAdapter(ChemistryPort):
         return (False, ())
 
     def depict_2d(self, smiles: SMILES, width: int = 300, height: int = 200) -> str:
-        mol = self._to_mol(smiles)
+        mol = Chem.Mol(self._to_mol(smiles))
         AllChem.Compute2DCoords(mol)
         drawer = rdMolDraw2D.MolDraw2DSVG(width, height)
         drawer.DrawMolecule(mol)
@@ -128,18 +337,25 @@ class RDKitAdapter(ChemistryPort):
         scaffold = GetScaffoldForMol(mol)
         return str(Chem.MolToSmiles(scaffold))
 
+    def murcko_scaffolds_batch(self, smiles: Sequence[SMILES]) -> list[str | None]:
+        scaffolds, _ = self._stored(_SCAFFOLD_STAMP, smiles, self.murcko_scaffold, str, str)
+        return scaffolds
+
     def butina_cluster(
         self, fingerprints: list[Fingerprint], cutoff: float = 0.35
     ) -> list[list[int]]:
-        n = len(fingerprints)
-        if n == 0:
+        if not fingerprints:
             return []
-        if n == 1:
-            return [[0]]
-        bvs = [self._fingerprint_to_bitvect(fp) for fp in fingerprints]
-        dists = []
-        for i in range(1, n):
-            for j in range(i):
-                dists.append(1.0 - float(TanimotoSimilarity(bvs[i], bvs[j])))
-        clusters = Butina.ClusterData(dists, n, cutoff, isDistData=True)
-        return [list(c) for c in clusters]
+        words = bitset.pack_on_bits([fp.bits for fp in fingerprints], fingerprints[0].n_bits)
+        return clustering.butina(clustering.neighbor_graph(words, cutoff))
+
+    def cluster_fingerprints(
+        self, fingerprints: FingerprintMatrix, cutoff: float = 0.35, method: str = "butina"
+    ) -> list[list[int]]:
+        """Cluster rows of ``fingerprints``: ``butina`` (exact) or ``leader`` (approximate)."""
+        if method == "leader":
+            return clustering.leader(fingerprints.words, cutoff)
+        if method != "butina":
+            msg = f"Unknown clustering method: {method!r}"
+            raise ValueError(msg)
+        return clustering.butina(clustering.neighbor_graph(fingerprints.words, cutoff))
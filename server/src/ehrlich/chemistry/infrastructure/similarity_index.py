@@ -0,0 +1,197 @@
+"""Persistent Tanimoto similarity index over packed fingerprints.
+
+Rows are kept sorted by popcount. For a query with ``a`` bits set, a row with
+``b`` bits can score at most ``min(a, b) / max(a, b)`` (the BitBound bound),
+so a search visits popcount bins in order of that bound and stops as soon as
+no remaining bin can reach the threshold or beat the current k-th best hit.
+Rows belong to named segments (one per source file) that can be replaced or
+dropped without rebuilding the rest.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ehrlich.chemistry.infrastructure import bitset
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+
+@dataclass(frozen=True)
+class SimilarityHit:
+    label: str
+    segment: str
+    similarity: float
+
+
+@dataclass(frozen=True)
+class _Rows:
+    words: NDArray[np.uint64]
+    counts: NDArray[np.int64]
+    labels: NDArray[np.str_]
+    segment_ids: NDArray[np.int32]
+    segments: tuple[str, ...]
+    # Popcount bins: rows bin_starts[i]:bin_ends[i] all have bin_counts[i] bits set.
+    bin_counts: NDArray[np.int64]
+    bin_starts: NDArray[np.int64]
+    bin_ends: NDArray[np.int64]
+
+
+class SimilarityIndex:
+    """Fingerprints sorted by popcount for BitBound-pruned top-k and threshold search.
+
+    Updates build a new row set and swap it in, so searches running on other
+    threads always see a consistent snapshot.
+    """
+
+    def __init__(self, n_bits: int = 2048, fp_type: str = "morgan") -> None:
+        self.n_bits = n_bits
+        self.fp_type = fp_type
+        self._rows = self._build(
+            np.zeros((0, bitset.n_words(n_bits)), dtype=np.uint64),
+            np.zeros(0, dtype=np.str_),
+            np.zeros(0, dtype=np.int32),
+            (),
+        )
+
+    def __len__(self) -> int:
+        return len(self._rows.labels)
+
+    @property
+    def segments(self) -> tuple[str, ...]:
+        rows = self._rows
+        present = np.unique(rows.segment_ids)
+        return tuple(rows.segments[i] for i in present.tolist())
+
+    def add(self, segment: str, labels: Sequence[str], words: NDArray[np.uint64]) -> None:
+        """Insert ``labels`` under ``segment``, replacing whatever it held before."""
+        if len(labels) != words.shape[0]:
+            msg = f"{len(labels)} labels for {words.shape[0]} fingerprint rows"
+            raise ValueError(msg)
+        rows = self._rows
+        keep = self._outside(rows, segment)
+        names = [s for s in rows.segments if s != segment]
+        remap = np.array([names.index(s) if s in names else -1 for s in rows.segments], np.int32)
+        ids = remap[rows.segment_ids[keep]]
+        self._rows = self._build(
+            np.concatenate([rows.words[keep], words.astype(np.uint64, copy=False)]),
+            np.concatenate([rows.labels[keep], np.asarray(labels, dtype=np.str_)]),
+            np.concatenate([ids, np.full(len(labels), len(names))]).astype(np.int32),
+            (*names, segment),
+        )
+
+    def remove(self, segment: str) -> None:
+        rows = self._rows
+        if segment not in rows.segments:
+            return
+        keep = self._outside(rows, segment)
+        self._rows = self._build(
+            rows.words[keep], rows.labels[keep], rows.segment_ids[keep], rows.segments
+        )
+
+    def search(
+        self, query: NDArray[np.uint64], k: int | None = 10, threshold: float = 0.0
+    ) -> list[SimilarityHit]:
+        """Rows with similarity ``>= threshold`` to ``query``, best first, at most ``k``.
+
+        ``k=None`` returns every row above the threshold.
+        """
+        rows = self._rows
+        q_count = int(bitset.popcount(query))
+        if q_count == 0 or not len(rows.labels) or k == 0:
+            return []
+        bounds = np.minimum(rows.bin_counts, q_count) / np.maximum(rows.bin_counts, q_count)
+        found_rows = np.zeros(0, dtype=np.int64)
+        found_sims = np.zeros(0, dtype=np.float64)
+        floor = threshold
+        for b in np.argsort(-bounds, kind="stable").tolist():
+            if bounds[b] < floor:
+                break
+            lo, hi = int(rows.bin_starts[b]), int(rows.bin_ends[b])
+            inter = np.bitwise_count(rows.words[lo:hi] & query).sum(axis=1, dtype=np.int64)
+            sims = inter / (rows.counts[lo:hi] + q_count - inter)
+            hit = np.flatnonzero(sims >= threshold)
+            found_rows = np.concatenate([found_rows, hit + lo])
+            found_sims = np.concatenate([found_sims, sims[hit]])
+            if k is not None and len(found_sims) >= k:
+                top = np.argpartition(-found_sims, k - 1)[:k]
+                found_rows, found_sims = found_rows[top], found_sims[top]
+                floor = max(threshold, float(found_sims.min()))
+        order = np.lexsort((found_rows, -found_sims))
+        return [
+            SimilarityHit(
+                label=str(rows.labels[r]),
+                segment=rows.segments[rows.segment_ids[r]],
+                similarity=float(s),
+            )
+            for r, s in zip(found_rows[order].tolist(), found_sims[order].tolist(), strict=True)
+        ]
+
+    def save(self, path: Path, manifest: dict[str, Any] | None = None) -> None:
+        """Write the index (and an opaque caller manifest) atomically to ``path``."""
+        rows = self._rows
+        meta = {
+            "n_bits": self.n_bits,
+            "fp_type": self.fp_type,
+            "segments": list(rows.segments),
+            "manifest": manifest or {},
+        }
+        tmp = path.with_name(path.name + ".part")
+        with tmp.open("wb") as fh:
+            np.savez(
+                fh,
+                words=rows.words,
+                labels=rows.labels,
+                segment_ids=rows.segment_ids,
+                meta=np.array(json.dumps(meta)),
+            )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> tuple[SimilarityIndex, dict[str, Any]]:
+        """Read an index written by ``save``; returns it with the saved manifest."""
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            index = cls(n_bits=int(meta["n_bits"]), fp_type=str(meta["fp_type"]))
+            index._rows = cls._build(
+                data["words"], data["labels"], data["segment_ids"], tuple(meta["segments"])
+            )
+        return index, dict(meta["manifest"])
+
+    @staticmethod
+    def _outside(rows: _Rows, segment: str) -> NDArray[np.bool_]:
+        if segment not in rows.segments:
+            return np.ones(len(rows.labels), dtype=bool)
+        keep: NDArray[np.bool_] = rows.segment_ids != rows.segments.index(segment)
+        return keep
+
+    @staticmethod
+    def _build(
+        words: NDArray[np.uint64],
+        labels: NDArray[np.str_],
+        segment_ids: NDArray[np.int32],
+        segments: tuple[str, ...],
+    ) -> _Rows:
+        counts = bitset.popcount(words)
+        order = np.argsort(counts, kind="stable")
+        counts = counts[order]
+        bin_counts, bin_starts = np.unique(counts, return_index=True)
+        return _Rows(
+            words=np.ascontiguousarray(words[order]),
+            counts=counts,
+            labels=labels[order],
+            segment_ids=segment_ids[order],
+            segments=segments,
+            bin_counts=bin_counts,
+            bin_starts=bin_starts.astype(np.int64),
+            bin_ends=np.append(bin_starts[1:], len(counts)).astype(np.int64),
+        )
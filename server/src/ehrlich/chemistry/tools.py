@@ -2,10 +2,19 @@ import json
 from dataclasses import asdict
 
 from ehrlich.chemistry.application.chemistry_service import ChemistryService
+from ehrlich.chemistry.application.conformer_service import ConformerService
+from ehrlich.chemistry.infrastructure.conformer_store import shared_conformer_store
+from ehrlich.config import get_settings
 from ehrlich.kernel.exceptions import InvalidSMILESError
 from ehrlich.kernel.types import SMILES
 
 _service = ChemistryService()
+_settings = get_settings()
+_conformers = ConformerService(
+    store=shared_conformer_store(),
+    num_conformers=_settings.conformer_count,
+    num_threads=_settings.conformer_threads,
+)
 
 
 async def validate_smiles(smiles: str) -> str:
@@ -56,7 +65,7 @@ async def tanimoto_similarity(smiles1: str, smiles2: str) -> str:
 async def generate_3d(smiles: str) -> str:
     """Generate a 3D conformer for the given SMILES. Returns MolBlock + energy."""
     try:
-        conf = _service.generate_conformer(SMILES(smiles))
+        conf = await _conformers.generate(SMILES(smiles))
         return json.dumps(
             {
                 "smiles": smiles,
@@ -1,9 +1,12 @@
 import os
+import tempfile
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 _ENV_FILE = Path(__file__).resolve().parents[3] / ".env"
+_DATA_DIR = Path(__file__).resolve().parents[3] / "data"
+_CACHE_DIR = _DATA_DIR / "cache"
 
 
 class Settings(BaseSettings):
@@ -18,7 +21,40 @@ class Settings(BaseSettings):
     researcher_model: str = "claude-sonnet-4-5-20250929"
     summarizer_model: str = "claude-haiku-4-5-20251001"
     summarizer_threshold: int = 2000
+    summary_cache_path: str = str(_CACHE_DIR / "summaries.db")
+    summary_cache_max_entries: int = 20_000
     max_iterations_per_experiment: int = 10
+    max_parallel_tools: int = 4
+    tool_cache_backend: str = "memory"
+    tool_cache_path: str = str(_CACHE_DIR / "tools.db")
+    tool_cache_max_entries: int = 10000
+    http_cache_mode: str = "on"
+    http_cache_path: str = str(_CACHE_DIR / "http.db")
+    http_cache_max_entries: int = 50000
+    chembl_max_activities: int = 20000
+    chembl_page_concurrency: int = 4
+    mol_cache_size: int = 4096
+    depiction_cache_mb: int = 64
+    feature_store_dir: str = str(_DATA_DIR / "datasets" / "features")
+    feature_store_max_rows: int = 100_000
+    conformer_cache_path: str = str(_CACHE_DIR / "conformers.db")
+    conformer_cache_max_entries: int = 100_000
+    conformer_count: int = 10
+    # RDKit threads per embedding job when several run in parallel; a lone job uses every core
+    conformer_threads: int = 1
+    docking_processes: int = 2
+    docking_exhaustiveness: int = 8
+    docking_cache_path: str = str(_CACHE_DIR / "docking.db")
+    docking_cache_max_entries: int = 200_000
+    worker_processes: int = 2
+    worker_threads: int = 4
+    permutation_budget: int = 100
+    models_dir: str = str(_DATA_DIR / "models")
+    model_cache_mb: int = 512
+    # Outside the source tree: spooled uploads are user data, deleted with their investigation
+    upload_dir: str = str(Path(tempfile.gettempdir()) / "ehrlich" / "uploads")
+    screening_library_dir: str = str(_DATA_DIR / "libraries")
+    screening_chunk_size: int = 2000
     director_effort: str = "high"
     log_level: str = "INFO"
     cors_origins: list[str] = ["http://localhost:5173", "http://localhost:3000"]
@@ -1,19 +1,11 @@
-import asyncio
-import logging
 import os
 
-import httpx
-
 from ehrlich.impact.domain.entities import DataPoint, EconomicSeries
 from ehrlich.impact.domain.repository import EconomicDataRepository
-from ehrlich.kernel.exceptions import ExternalServiceError
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://www.banxico.org.mx/SieAPIRest/service/v1/series"
 _TIMEOUT = 20.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 # Common Banxico series IDs for search
 _KNOWN_SERIES: dict[str, str] = {
@@ -33,7 +25,7 @@ _KNOWN_SERIES: dict[str, str] = {
 class BanxicoClient(EconomicDataRepository):
     def __init__(self, api_token: str | None = None) -> None:
         self._token = api_token or os.environ.get("BANXICO_API_TOKEN", "")
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("Banxico", timeout=_TIMEOUT)
 
     async def search_series(self, query: str, limit: int = 10) -> list[EconomicSeries]:
         if not self._token:
@@ -91,39 +83,5 @@ class BanxicoClient(EconomicDataRepository):
         )
 
     async def _get(self, url: str, params: dict[str, str]) -> dict[str, object]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(url, params=params)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "Banxico rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("Banxico", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "Banxico timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("Banxico", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "Banxico",
-            f"Request failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.get(url, params=params)
+        return resp.json()  # type: ignore[no-any-return]
@@ -1,25 +1,17 @@
-import asyncio
-import logging
 import os
 
-import httpx
-
 from ehrlich.impact.domain.entities import DataPoint, EconomicSeries
 from ehrlich.impact.domain.repository import EconomicDataRepository
-from ehrlich.kernel.exceptions import ExternalServiceError
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://api.bls.gov/publicAPI/v2/timeseries/data/"
 _TIMEOUT = 20.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 
 class BLSClient(EconomicDataRepository):
     def __init__(self, api_key: str | None = None) -> None:
         self._api_key = api_key or os.environ.get("BLS_API_KEY", "")
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("BLS", timeout=_TIMEOUT)
 
     async def search_series(self, query: str, limit: int = 10) -> list[EconomicSeries]:
         if not self._api_key:
@@ -93,39 +85,5 @@ class BLSClient(EconomicDataRepository):
         return await self._post_body(body)
 
     async def _post_body(self, body: dict[str, object]) -> dict[str, object]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.post(_BASE_URL, json=body)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "BLS rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("BLS", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "BLS timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("BLS", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "BLS",
-            f"Request failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.post(_BASE_URL, json=body)
+        return resp.json()  # type: ignore[no-any-return]
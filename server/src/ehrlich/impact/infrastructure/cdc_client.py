@@ -1,19 +1,14 @@
-import asyncio
 import logging
 import xml.etree.ElementTree as ET
 
-import httpx
-
 from ehrlich.impact.domain.entities import HealthIndicator
 from ehrlich.impact.domain.repository import HealthDataRepository
-from ehrlich.kernel.exceptions import ExternalServiceError
+from ehrlich.transport.client import ServiceClient
 
 logger = logging.getLogger(__name__)
 
 _BASE_URL = "https://wonder.cdc.gov/controller/datarequest"
 _TIMEOUT = 30.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 _DATABASES = {
     "mortality": "D76",
@@ -24,7 +19,7 @@ _DATABASES = {
 
 class CDCWonderClient(HealthDataRepository):
     def __init__(self) -> None:
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("CDC WONDER", timeout=_TIMEOUT)
 
     async def search_indicators(
         self,
@@ -109,40 +104,6 @@ class CDCWonderClient(HealthDataRepository):
         return results
 
     async def _post(self, url: str, xml_body: str) -> str:
-        last_error: Exception | None = None
         headers = {"Content-Type": "application/xml"}
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.post(url, content=xml_body, headers=headers)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "CDC WONDER rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("CDC WONDER", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.text
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "CDC WONDER timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("CDC WONDER", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "CDC WONDER",
-            f"Request failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.post(url, content=xml_body, headers=headers)
+        return resp.text
@@ -1,19 +1,11 @@
-import asyncio
-import logging
 import os
 
-import httpx
-
 from ehrlich.impact.domain.entities import Benchmark
 from ehrlich.impact.domain.repository import DevelopmentDataRepository
-from ehrlich.kernel.exceptions import ExternalServiceError
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://api.census.gov/data"
 _TIMEOUT = 20.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 _ACS_VARIABLES = {
     "population": "B01003_001E",
@@ -27,7 +19,7 @@ _ACS_VARIABLES = {
 class CensusClient(DevelopmentDataRepository):
     def __init__(self, api_key: str | None = None) -> None:
         self._api_key = api_key or os.environ.get("CENSUS_API_KEY", "")
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("Census", timeout=_TIMEOUT)
 
     async def search_indicators(
         self,
@@ -81,39 +73,5 @@ class CensusClient(DevelopmentDataRepository):
         return []
 
     async def _get(self, url: str, params: dict[str, str]) -> list[object]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(url, params=params)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "Census rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("Census", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "Census timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("Census", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "Census",
-            f"Request failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.get(url, params=params)
+        return resp.json()  # type: ignore[no-any-return]
@@ -1,25 +1,17 @@
-import asyncio
-import logging
 import os
 
-import httpx
-
 from ehrlich.impact.domain.entities import EducationRecord
 from ehrlich.impact.domain.repository import EducationDataRepository
-from ehrlich.kernel.exceptions import ExternalServiceError
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://api.data.gov/ed/collegescorecard/v1/schools"
 _TIMEOUT = 20.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 
 class CollegeScorecardClient(EducationDataRepository):
     def __init__(self, api_key: str | None = None) -> None:
         self._api_key = api_key or os.environ.get("COLLEGE_SCORECARD_API_KEY", "")
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("College Scorecard", timeout=_TIMEOUT)
 
     async def search_schools(
         self,
@@ -105,41 +97,5 @@ class CollegeScorecardClient(EducationDataRepository):
         return records
 
     async def _get(self, params: dict[str, str | int]) -> dict[str, object]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(_BASE_URL, params=params)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "College Scorecard rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("College Scorecard", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "College Scorecard timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError(
-                    "College Scorecard", f"HTTP {e.response.status_code}"
-                ) from e
-        raise ExternalServiceError(
-            "College Scorecard",
-            f"Request failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.get(_BASE_URL, params=params)
+        return resp.json()  # type: ignore[no-any-return]
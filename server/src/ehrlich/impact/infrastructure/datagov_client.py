@@ -1,23 +1,14 @@
-import asyncio
-import logging
-
-import httpx
-
 from ehrlich.impact.domain.entities import DatasetMetadata
 from ehrlich.impact.domain.repository import OpenDataRepository
-from ehrlich.kernel.exceptions import ExternalServiceError
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://catalog.data.gov/api/3/action"
 _TIMEOUT = 20.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 
 class DataGovClient(OpenDataRepository):
     def __init__(self) -> None:
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("data.gov", timeout=_TIMEOUT)
 
     async def search_datasets(
         self,
@@ -73,39 +64,5 @@ class DataGovClient(OpenDataRepository):
         return records
 
     async def _get(self, url: str, params: dict[str, str | int]) -> dict[str, object]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(url, params=params)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "data.gov rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("data.gov", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "data.gov timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("data.gov", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "data.gov",
-            f"Request failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.get(url, params=params)
+        return resp.json()  # type: ignore[no-any-return]
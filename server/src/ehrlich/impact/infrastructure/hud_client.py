@@ -1,25 +1,17 @@
-import asyncio
-import logging
 import os
 
-import httpx
-
 from ehrlich.impact.domain.entities import HousingData
 from ehrlich.impact.domain.repository import HousingDataRepository
-from ehrlich.kernel.exceptions import ExternalServiceError
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://www.huduser.gov/hudapi/public"
 _TIMEOUT = 20.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 
 class HUDClient(HousingDataRepository):
     def __init__(self, api_token: str | None = None) -> None:
         self._token = api_token or os.environ.get("HUD_API_TOKEN", "")
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("HUD", timeout=_TIMEOUT)
 
     async def search_housing_data(
         self,
@@ -74,39 +66,5 @@ class HUDClient(HousingDataRepository):
 
     async def _get(self, url: str, params: dict[str, str | int]) -> dict[str, object]:
         headers = {"Authorization": f"Bearer {self._token}"}
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(url, params=params, headers=headers)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "HUD rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("HUD", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "HUD timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("HUD", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "HUD",
-            f"Request failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.get(url, params=params, headers=headers)
+        return resp.json()  # type: ignore[no-any-return]
@@ -1,19 +1,11 @@
-import asyncio
-import logging
 import os
 
-import httpx
-
 from ehrlich.impact.domain.entities import DataPoint, EconomicSeries
 from ehrlich.impact.domain.repository import EconomicDataRepository
-from ehrlich.kernel.exceptions import ExternalServiceError
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://www.inegi.org.mx/app/api/indicadores/desarrolladores/jsonxml/INDICATOR"
 _TIMEOUT = 20.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 # Common INEGI indicator IDs for search fallback
 _KNOWN_INDICATORS: dict[str, str] = {
@@ -31,7 +23,7 @@ _KNOWN_INDICATORS: dict[str, str] = {
 class INEGIClient(EconomicDataRepository):
     def __init__(self, api_token: str | None = None) -> None:
         self._token = api_token or os.environ.get("INEGI_API_TOKEN", "")
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("INEGI", timeout=_TIMEOUT)
 
     async def search_series(self, query: str, limit: int = 10) -> list[EconomicSeries]:
         if not self._token:
@@ -86,39 +78,5 @@ class INEGIClient(EconomicDataRepository):
         )
 
     async def _get(self, url: str, params: dict[str, str]) -> dict[str, object]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(url, params=params)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "INEGI rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("INEGI", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "INEGI timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("INEGI", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "INEGI",
-            f"Request failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.get(url, params=params)
+        return resp.json()  # type: ignore[no-any-return]
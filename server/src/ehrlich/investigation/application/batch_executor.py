@@ -35,6 +35,7 @@ async def run_experiment_batch(
     batch: list[tuple[Hypothesis, Experiment, dict[str, Any]]],
     cost: CostTracker,
     state_lock: asyncio.Lock,
+    max_parallel_tools: int = 4,
 ) -> AsyncGenerator[DomainEvent, None]:
     """Run up to 2 experiments concurrently with sibling awareness."""
     if len(batch) == 1:
@@ -54,6 +55,7 @@ async def run_experiment_batch(
             cost,
             design,
             state_lock,
+            max_parallel_tools=max_parallel_tools,
         ):
             yield event
         return
@@ -96,6 +98,7 @@ async def run_experiment_batch(
                 design,
                 state_lock,
                 sibling_context=sib_ctx,
+                max_parallel_tools=max_parallel_tools,
             ):
                 await queue.put(ev)
         except Exception as e:
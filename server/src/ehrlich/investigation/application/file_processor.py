@@ -37,6 +37,8 @@ class FileProcessor:
             return self._process_csv(filename, content)
         if ext == "xlsx":
             return self._process_xlsx(filename, content)
+        if ext == "smi":
+            return self._process_smi(filename, content)
         return self._process_pdf(filename, content)
 
     def _validate_content_type(self, content: bytes, extension: str) -> None:
@@ -49,22 +51,33 @@ class FileProcessor:
             if len(content) < 4 or content[:4] != b"PK\x03\x04":
                 msg = "File content does not match XLSX format"
                 raise ValueError(msg)
-        elif extension == "csv":
-            # CSV should be valid UTF-8 text with no null bytes in first 1024 bytes
+        elif extension in ("csv", "smi"):
+            # Text formats should be valid UTF-8 with no null bytes in the first 1024 bytes
             check_size = min(len(content), 1024)
+            text_format = extension.upper()
             if b"\x00" in content[:check_size]:
-                msg = "File content does not match CSV format (contains null bytes)"
+                msg = f"File content does not match {text_format} format (contains null bytes)"
                 raise ValueError(msg)
             try:
                 content[:check_size].decode("utf-8")
             except UnicodeDecodeError as e:
-                msg = "File content does not match CSV format (invalid UTF-8)"
+                msg = f"File content does not match {text_format} format (invalid UTF-8)"
                 raise ValueError(msg) from e
 
     def _process_csv(self, filename: str, content: bytes) -> UploadedFile:
         df = pd.read_csv(io.BytesIO(content))
         return self._build_tabular(filename, "text/csv", df)
 
+    def _process_smi(self, filename: str, content: bytes) -> UploadedFile:
+        # One molecule per line: SMILES, then an optional name. '#' lines are comments.
+        rows = [
+            (fields[0], fields[1].strip() if len(fields) > 1 else "")
+            for line in content.decode("utf-8", errors="replace").splitlines()
+            if (fields := line.split(maxsplit=1)) and not fields[0].startswith("#")
+        ]
+        df = pd.DataFrame(rows, columns=["smiles", "name"])
+        return self._build_tabular(filename, "chemical/x-daylight-smiles", df)
+
     def _process_xlsx(self, filename: str, content: bytes) -> UploadedFile:
         df = pd.read_excel(io.BytesIO(content), engine="openpyxl")
         return self._build_tabular(
@@ -101,7 +114,8 @@ class FileProcessor:
         row_count = len(df)
 
         # Summary statistics for numeric columns
-        desc = df.describe()
+        numeric = df.select_dtypes("number")
+        desc = numeric.describe() if len(numeric.columns) else pd.DataFrame()
         summary_stats: dict[str, dict[str, float]] = {}
         for col in desc.columns:
             summary_stats[str(col)] = {str(k): round(float(v), 4) for k, v in desc[col].items()}
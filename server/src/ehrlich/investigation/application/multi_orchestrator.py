@@ -35,6 +35,7 @@ from ehrlich.investigation.domain.investigation import Investigation, Investigat
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
+    from ehrlich.investigation.application.single_flight import SingleFlight
     from ehrlich.investigation.application.tool_registry import ToolRegistry
     from ehrlich.investigation.application.tree_manager import TreeManager
     from ehrlich.investigation.domain.domain_config import DomainConfig
@@ -63,12 +64,15 @@ class MultiModelOrchestrator:
         max_iterations_per_experiment: int = 10,
         max_hypotheses: int = 6,
         summarizer_threshold: int = 2000,
+        max_parallel_tools: int = 4,
         require_approval: bool = False,
         repository: InvestigationRepository | None = None,
         domain_registry: DomainRegistry | None = None,
         mcp_bridge: MCPBridge | None = None,
         mcp_configs: list[MCPServerConfig] | None = None,
         tree_manager: TreeManager | None = None,
+        cache: ToolCache | None = None,
+        single_flight: SingleFlight | None = None,
     ) -> None:
         self._director = director
         self._researcher = researcher
@@ -77,6 +81,7 @@ class MultiModelOrchestrator:
         self._max_iterations_per_experiment = max_iterations_per_experiment
         self._max_hypotheses = max_hypotheses
         self._summarizer_threshold = summarizer_threshold
+        self._max_parallel_tools = max_parallel_tools
         self._require_approval = require_approval
         self._repository = repository
         self._domain_registry = domain_registry
@@ -85,8 +90,8 @@ class MultiModelOrchestrator:
         self._tree_manager = tree_manager
         self._active_config: DomainConfig | None = None
         self._researcher_prompt = RESEARCHER_EXPERIMENT_PROMPT
-        self._cache = ToolCache()
-        self._dispatcher = ToolDispatcher(registry, self._cache, repository, {})
+        self._cache = cache or ToolCache()
+        self._dispatcher = ToolDispatcher(registry, self._cache, repository, {}, single_flight)
         self._state_lock = asyncio.Lock()
         self._approval_event = asyncio.Event()
         self._investigation: Investigation | None = None
@@ -288,6 +293,7 @@ class MultiModelOrchestrator:
                 self._director_call,
                 self._cost_event,
                 tree_manager=self._tree_manager,
+                max_parallel_tools=self._max_parallel_tools,
             ):
                 yield event
 
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from ehrlich.investigation.application.multi_orchestrator import MultiModelOrchestrator
+from ehrlich.investigation.application.tool_cache import InMemoryToolCacheBackend, ToolCache
 from ehrlich.investigation.infrastructure.anthropic_client import AnthropicClientAdapter
+from ehrlich.investigation.infrastructure.tool_cache_backends import (
+    PostgresToolCacheBackend,
+    SQLiteToolCacheBackend,
+)
 
 if TYPE_CHECKING:
+    from ehrlich.investigation.application.single_flight import SingleFlight
     from ehrlich.investigation.application.tool_registry import ToolRegistry
     from ehrlich.investigation.domain.domain_registry import DomainRegistry
     from ehrlich.investigation.domain.mcp_config import MCPServerConfig
@@ -22,6 +29,25 @@ _TIER_RESEARCHER: dict[str, str] = {
 }
 
 
+async def create_tool_cache(settings: Any, repository: InvestigationRepository) -> ToolCache:
+    """Build the process-wide tool cache selected by ``settings.tool_cache_backend``.
+
+    ``memory`` (default), ``sqlite`` (on-disk at ``tool_cache_path``) or
+    ``postgres`` (shares the repository's connection pool).
+    """
+    max_entries = settings.tool_cache_max_entries
+    if settings.tool_cache_backend == "sqlite":
+        return ToolCache(SQLiteToolCacheBackend(Path(settings.tool_cache_path), max_entries))
+    if settings.tool_cache_backend == "postgres":
+        backend = PostgresToolCacheBackend(repository.pool, max_entries)
+        await backend.initialize()
+        return ToolCache(backend)
+    if settings.tool_cache_backend != "memory":
+        msg = f"Unknown tool cache backend: {settings.tool_cache_backend}"
+        raise ValueError(msg)
+    return ToolCache(InMemoryToolCacheBackend(max_entries))
+
+
 def create_orchestrator(
     settings: Any,
     registry: ToolRegistry,
@@ -31,6 +57,8 @@ def create_orchestrator(
     mcp_configs: list[MCPServerConfig] | None = None,
     api_key_override: str | None = None,
     director_model_override: str | None = None,
+    tool_cache: ToolCache | None = None,
+    single_flight: SingleFlight | None = None,
 ) -> MultiModelOrchestrator:
     """Wire up Anthropic adapters and build a MultiModelOrchestrator."""
     api_key = api_key_override or settings.anthropic_api_key or None
@@ -65,9 +93,12 @@ def create_orchestrator(
         registry=registry,
         max_iterations_per_experiment=settings.max_iterations_per_experiment,
         summarizer_threshold=settings.summarizer_threshold,
+        max_parallel_tools=settings.max_parallel_tools,
         require_approval=True,
         repository=repository,
         domain_registry=domain_registry,
         mcp_bridge=mcp_bridge,
         mcp_configs=mcp_configs,
+        cache=tool_cache,
+        single_flight=single_flight,
     )
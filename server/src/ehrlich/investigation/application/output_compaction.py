@@ -0,0 +1,78 @@
+"""Deterministic shrinking of JSON tool outputs, tried before the summarizer model.
+
+Compaction runs in escalating levels and stops at the first one that fits the
+budget. Every level drops empty values and bulk payloads meant for the
+console's viewers, and rounds floats to 6 significant digits. Later levels
+keep fewer items of each array, with an ``"... N more"`` marker, and clip long
+strings. Keys and item order are never changed, so the model still sees the
+tool's own schema.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# Structure payloads rendered by the console (3D viewers, depictions); the model never reads them.
+_BULK_FIELDS = frozenset({"mol_block", "pose", "svg", "pdb", "pdbqt", "sdf"})
+
+# Extra per-tool fields that add little once an output is too long to pass whole.
+_TOOL_DROP_FIELDS: dict[str, frozenset[str]] = {
+    "search_literature": frozenset({"authors"}),
+    "search_citations": frozenset({"authors"}),
+    "cluster_data": frozenset({"identifiers_truncated", "silhouette_sample"}),
+    "screen_library": frozenset({"alert_categories"}),
+}
+
+# (items kept per array, characters kept per string); None keeps everything.
+_LEVELS: tuple[tuple[int | None, int | None], ...] = (
+    (None, None),
+    (20, 500),
+    (10, 300),
+    (5, 200),
+    (3, 120),
+)
+
+
+def compact_output(tool_name: str, output: str, budget: int) -> str | None:
+    """The least-compacted form of ``output`` within ``budget`` characters.
+
+    Returns the most compacted form if no level fits, and ``None`` if
+    ``output`` is not a JSON object or array.
+    """
+    try:
+        data = json.loads(output)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if not isinstance(data, dict | list):
+        return None
+
+    drop = _BULK_FIELDS | _TOOL_DROP_FIELDS.get(tool_name, frozenset())
+    compacted = output
+    for max_items, max_chars in _LEVELS:
+        value = _compact(data, drop, max_items, max_chars)
+        compacted = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+        if len(compacted) <= budget:
+            break
+    return compacted
+
+
+def _compact(value: Any, drop: frozenset[str], max_items: int | None, max_chars: int | None) -> Any:
+    if isinstance(value, dict):
+        compacted = {}
+        for key, item in value.items():
+            if key in drop or item is None or item == "" or item == [] or item == {}:
+                continue
+            compacted[key] = _compact(item, drop, max_items, max_chars)
+        return compacted
+    if isinstance(value, list):
+        kept = value if max_items is None else value[:max_items]
+        items = [_compact(item, drop, max_items, max_chars) for item in kept]
+        if len(kept) < len(value):
+            items.append(f"... {len(value) - len(kept)} more")
+        return items
+    if isinstance(value, float):
+        return float(f"{value:.6g}")
+    if isinstance(value, str) and max_chars is not None and len(value) > max_chars:
+        return value[:max_chars] + "..."
+    return value
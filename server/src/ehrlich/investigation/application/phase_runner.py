@@ -333,6 +333,7 @@ async def run_hypothesis_testing_phase(
     director_call: Callable[..., AsyncGenerator[Any, None]],
     cost_event_fn: Callable[..., CostUpdate],
     tree_manager: TreeManager | None = None,
+    max_parallel_tools: int = 4,
 ) -> AsyncGenerator[DomainEvent, None]:
     """Phase 4: Batched parallel hypothesis testing + Director evaluation loop."""
 
@@ -464,6 +465,7 @@ async def run_hypothesis_testing_phase(
             batch,
             cost,
             state_lock,
+            max_parallel_tools=max_parallel_tools,
         ):
             yield event
 
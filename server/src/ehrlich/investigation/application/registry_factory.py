@@ -101,6 +101,7 @@ from ehrlich.prediction.tools import (
     cluster_data,
     predict_candidates,
     predict_scores,
+    screen_library,
     train_classifier,
     train_model,
 )
@@ -173,9 +174,10 @@ def build_tool_registry() -> ToolRegistry:
         ("analyze_substructures", analyze_substructures, _analysis),
         ("compute_properties", compute_properties, _analysis),
         ("search_pharmacology", search_pharmacology, _analysis),
-        # Prediction (3) -- molecular-specific
+        # Prediction (4) -- molecular-specific
         ("train_model", train_model, _pred),
         ("predict_candidates", predict_candidates, _pred),
+        ("screen_library", screen_library, _pred),
         ("cluster_compounds", cluster_compounds, _pred),
         # ML (3) -- domain-agnostic
         ("train_classifier", train_classifier, _ml),
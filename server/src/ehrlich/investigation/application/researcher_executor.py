@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 from typing import TYPE_CHECKING, Any
 
+from ehrlich.investigation.application.output_compaction import compact_output
 from ehrlich.investigation.application.prompts.constants import SUMMARIZER_PROMPT
 from ehrlich.investigation.domain.events import (
     DomainEvent,
@@ -17,9 +20,9 @@ from ehrlich.investigation.domain.events import (
 )
 from ehrlich.investigation.domain.finding import Finding
 from ehrlich.investigation.domain.negative_control import NegativeControl
+from ehrlich.investigation.infrastructure.summary_cache import shared_summary_cache
 
 if TYPE_CHECKING:
-    import asyncio
     from collections.abc import AsyncGenerator
 
     from ehrlich.investigation.application.cost_tracker import CostTracker
@@ -30,6 +33,7 @@ if TYPE_CHECKING:
     from ehrlich.investigation.domain.hypothesis import Hypothesis
     from ehrlich.investigation.domain.investigation import Investigation
     from ehrlich.investigation.infrastructure.anthropic_client import AnthropicClientAdapter
+    from ehrlich.investigation.infrastructure.summary_cache import SummaryCache
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +48,30 @@ _COMPACT_SCHEMAS: dict[str, list[str]] = {
 }
 
 
+# Tools that mutate investigation state; they run alone, in the order requested
+_SERIAL_TOOLS = frozenset({"record_finding", "record_negative_control"})
+
+
+def _group_tool_blocks(blocks: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Split tool_use blocks into ordered groups that may run concurrently.
+
+    Consecutive independent blocks share a group; each serial tool gets its own.
+    """
+    groups: list[list[dict[str, Any]]] = []
+    current: list[dict[str, Any]] = []
+    for block in blocks:
+        if block["name"] in _SERIAL_TOOLS:
+            if current:
+                groups.append(current)
+                current = []
+            groups.append([block])
+        else:
+            current.append(block)
+    if current:
+        groups.append(current)
+    return groups
+
+
 def _compact_result(tool_name: str, result: str) -> str:
     schema = _COMPACT_SCHEMAS.get(tool_name)
     if not schema:
@@ -56,6 +84,15 @@ def _compact_result(tool_name: str, result: str) -> str:
         return result
 
 
+def _summary_key(model: str, tool_name: str, output: str) -> str:
+    """Content hash naming everything a summary depends on, including the prompt."""
+    digest = hashlib.sha256()
+    for part in (model, SUMMARIZER_PROMPT, tool_name, output):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
 async def summarize_output(
     summarizer: AnthropicClientAdapter,
     cost: CostTracker,
@@ -63,14 +100,32 @@ async def summarize_output(
     output: str,
     investigation_id: str,
     threshold: int,
+    cache: SummaryCache | None = None,
 ) -> tuple[str, OutputSummarized | None]:
+    """Shrink ``output`` to ``threshold`` characters for the researcher's context.
+
+    JSON outputs are compacted locally first; the summarizer model is called
+    only if that doesn't fit, and its summaries are cached by content hash
+    (in the process-wide cache unless ``cache`` is given).
+    """
     if len(output) <= threshold:
         return output, None
 
+    compacted = compact_output(tool_name, output, threshold)
+    if compacted is not None and len(compacted) <= threshold:
+        return compacted, _summarized_event(tool_name, output, compacted, investigation_id)
+
+    cache = cache if cache is not None else shared_summary_cache()
+    key = _summary_key(summarizer.model, tool_name, output)
+    cached = await asyncio.to_thread(cache.get, key)
+    if cached is not None:
+        return cached, _summarized_event(tool_name, output, cached, investigation_id)
+
+    # The compacted form carries the same data in fewer input tokens.
     response = await summarizer.create_message(
         system=SUMMARIZER_PROMPT,
         messages=[
-            {"role": "user", "content": f"Tool: {tool_name}\nOutput:\n{output}"},
+            {"role": "user", "content": f"Tool: {tool_name}\nOutput:\n{compacted or output}"},
         ],
         tools=[],
     )
@@ -87,13 +142,41 @@ async def summarize_output(
         if block["type"] == "text":
             summarized += block["text"]
 
-    event = OutputSummarized(
+    if summarized:
+        await asyncio.to_thread(cache.put, key, summarized)
+    return summarized, _summarized_event(tool_name, output, summarized, investigation_id)
+
+
+def _summarized_event(
+    tool_name: str, output: str, summarized: str, investigation_id: str
+) -> OutputSummarized:
+    return OutputSummarized(
         tool_name=tool_name,
         original_length=len(output),
         summarized_length=len(summarized),
         investigation_id=investigation_id,
     )
-    return summarized, event
+
+
+async def _execute_tool(
+    dispatcher: ToolDispatcher,
+    summarizer: AnthropicClientAdapter,
+    cost: CostTracker,
+    investigation: Investigation,
+    tool_block: dict[str, Any],
+    summarizer_threshold: int,
+    semaphore: asyncio.Semaphore,
+) -> tuple[str, str, OutputSummarized | None]:
+    """Dispatch one tool call under the concurrency limit, then compact and summarize it."""
+    tool_name = tool_block["name"]
+    async with semaphore:
+        result_str = await dispatcher.dispatch(tool_name, tool_block["input"], investigation)
+    result_str = _compact_result(tool_name, result_str)
+    # Outside the semaphore: a summarizer round trip shouldn't hold a tool slot.
+    summarized_str, summarize_event = await summarize_output(
+        summarizer, cost, tool_name, result_str, investigation.id, summarizer_threshold
+    )
+    return result_str, summarized_str, summarize_event
 
 
 def maybe_viz_event(
@@ -119,6 +202,98 @@ def maybe_viz_event(
     )
 
 
+async def _apply_tool_outcome(
+    tool_block: dict[str, Any],
+    result_str: str,
+    summarize_event: OutputSummarized | None,
+    investigation: Investigation,
+    hypothesis: Hypothesis,
+    experiment: Experiment,
+    state_lock: asyncio.Lock,
+) -> AsyncGenerator[DomainEvent, None]:
+    """Emit events and record state for one completed tool call, in request order."""
+    tool_name = tool_block["name"]
+    tool_input = tool_block["input"]
+    if summarize_event is not None:
+        yield summarize_event
+
+    preview = result_str[:1500] if len(result_str) > 1500 else result_str
+    yield ToolResultEvent(
+        tool_name=tool_name,
+        result_preview=preview,
+        experiment_id=experiment.id,
+        investigation_id=investigation.id,
+    )
+
+    # Emit visualization event if tool returned viz payload
+    viz_event = maybe_viz_event(result_str, experiment.id, investigation.id)
+    if viz_event is not None:
+        yield viz_event
+
+    if tool_name == "record_finding":
+        h_id = tool_input.get("hypothesis_id", hypothesis.id)
+        e_type = tool_input.get("evidence_type", "neutral")
+        finding = Finding(
+            title=tool_input.get("title", ""),
+            detail=tool_input.get("detail", ""),
+            evidence=tool_input.get("evidence", ""),
+            hypothesis_id=h_id,
+            evidence_type=e_type,
+            source_type=tool_input.get("source_type", ""),
+            source_id=tool_input.get("source_id", ""),
+            evidence_level=int(tool_input.get("evidence_level", 0)),
+        )
+        async with state_lock:
+            investigation.record_finding(finding)
+            h = investigation.get_hypothesis(h_id)
+            if h:
+                if e_type == "supporting":
+                    h.supporting_evidence.append(finding.title)
+                elif e_type == "contradicting":
+                    h.contradicting_evidence.append(finding.title)
+        yield FindingRecorded(
+            title=finding.title,
+            detail=finding.detail,
+            hypothesis_id=h_id,
+            evidence_type=e_type,
+            evidence=finding.evidence,
+            source_type=finding.source_type,
+            source_id=finding.source_id,
+            evidence_level=finding.evidence_level,
+            investigation_id=investigation.id,
+        )
+
+    if tool_name == "train_model":
+        try:
+            train_result = json.loads(result_str)
+            if isinstance(train_result, dict) and "model_id" in train_result:
+                async with state_lock:
+                    investigation.trained_model_ids.append(train_result["model_id"])
+        except (json.JSONDecodeError, TypeError):
+            pass
+
+    if tool_name == "record_negative_control":
+        control = NegativeControl(
+            identifier=tool_input.get("identifier", tool_input.get("smiles", "")),
+            identifier_type=tool_input.get("identifier_type", ""),
+            name=tool_input.get("name", ""),
+            score=float(tool_input.get("score", tool_input.get("prediction_score", 0.0))),
+            threshold=float(tool_input.get("threshold", 0.5)),
+            source=tool_input.get("source", ""),
+        )
+        async with state_lock:
+            investigation.add_negative_control(control)
+        yield NegativeControlRecorded(
+            identifier=control.identifier,
+            identifier_type=control.identifier_type,
+            name=control.name,
+            score=control.score,
+            threshold=control.threshold,
+            correctly_classified=(control.correctly_classified),
+            investigation_id=investigation.id,
+        )
+
+
 async def run_researcher_experiment(
     researcher: AnthropicClientAdapter,
     summarizer: AnthropicClientAdapter,
@@ -135,7 +310,9 @@ async def run_researcher_experiment(
     design: dict[str, Any],
     state_lock: asyncio.Lock,
     sibling_context: str = "",
+    max_parallel_tools: int = 4,
 ) -> AsyncGenerator[DomainEvent, None]:
+    semaphore = asyncio.Semaphore(max_parallel_tools)
     planned = set(experiment.tool_plan) if experiment.tool_plan else set()
     control_tools = {"record_finding", "record_negative_control"}
     if planned:
@@ -233,112 +410,52 @@ async def run_researcher_experiment(
             break
 
         tool_results: list[dict[str, Any]] = []
-        for tool_block in tool_use_blocks:
-            tool_name = tool_block["name"]
-            tool_input = tool_block["input"]
-            tool_use_id = tool_block["id"]
-            async with state_lock:
-                cost.add_tool_call()
-
-            yield ToolCalled(
-                tool_name=tool_name,
-                tool_input=tool_input,
-                experiment_id=experiment.id,
-                investigation_id=investigation.id,
-            )
-
-            result_str = await dispatcher.dispatch(tool_name, tool_input, investigation)
-            result_str = _compact_result(tool_name, result_str)
-
-            summarized_str, summarize_event = await summarize_output(
-                summarizer, cost, tool_name, result_str, investigation.id, summarizer_threshold
-            )
-            if summarize_event is not None:
-                yield summarize_event
-
-            content_for_model = summarized_str if summarize_event else result_str
-            preview = result_str[:1500] if len(result_str) > 1500 else result_str
-            yield ToolResultEvent(
-                tool_name=tool_name,
-                result_preview=preview,
-                experiment_id=experiment.id,
-                investigation_id=investigation.id,
-            )
-
-            # Emit visualization event if tool returned viz payload
-            viz_event = maybe_viz_event(result_str, experiment.id, investigation.id)
-            if viz_event is not None:
-                yield viz_event
-
-            if tool_name == "record_finding":
-                h_id = tool_input.get("hypothesis_id", hypothesis.id)
-                e_type = tool_input.get("evidence_type", "neutral")
-                finding = Finding(
-                    title=tool_input.get("title", ""),
-                    detail=tool_input.get("detail", ""),
-                    evidence=tool_input.get("evidence", ""),
-                    hypothesis_id=h_id,
-                    evidence_type=e_type,
-                    source_type=tool_input.get("source_type", ""),
-                    source_id=tool_input.get("source_id", ""),
-                    evidence_level=int(tool_input.get("evidence_level", 0)),
-                )
+        for group in _group_tool_blocks(tool_use_blocks):
+            for tool_block in group:
                 async with state_lock:
-                    investigation.record_finding(finding)
-                    h = investigation.get_hypothesis(h_id)
-                    if h:
-                        if e_type == "supporting":
-                            h.supporting_evidence.append(finding.title)
-                        elif e_type == "contradicting":
-                            h.contradicting_evidence.append(finding.title)
-                yield FindingRecorded(
-                    title=finding.title,
-                    detail=finding.detail,
-                    hypothesis_id=h_id,
-                    evidence_type=e_type,
-                    evidence=finding.evidence,
-                    source_type=finding.source_type,
-                    source_id=finding.source_id,
-                    evidence_level=finding.evidence_level,
+                    cost.add_tool_call()
+                yield ToolCalled(
+                    tool_name=tool_block["name"],
+                    tool_input=tool_block["input"],
+                    experiment_id=experiment.id,
                     investigation_id=investigation.id,
                 )
 
-            if tool_name == "train_model":
-                try:
-                    train_result = json.loads(result_str)
-                    if isinstance(train_result, dict) and "model_id" in train_result:
-                        async with state_lock:
-                            investigation.trained_model_ids.append(train_result["model_id"])
-                except (json.JSONDecodeError, TypeError):
-                    pass
-
-            if tool_name == "record_negative_control":
-                control = NegativeControl(
-                    identifier=tool_input.get("identifier", tool_input.get("smiles", "")),
-                    identifier_type=tool_input.get("identifier_type", ""),
-                    name=tool_input.get("name", ""),
-                    score=float(tool_input.get("score", tool_input.get("prediction_score", 0.0))),
-                    threshold=float(tool_input.get("threshold", 0.5)),
-                    source=tool_input.get("source", ""),
-                )
-                async with state_lock:
-                    investigation.add_negative_control(control)
-                yield NegativeControlRecorded(
-                    identifier=control.identifier,
-                    identifier_type=control.identifier_type,
-                    name=control.name,
-                    score=control.score,
-                    threshold=control.threshold,
-                    correctly_classified=(control.correctly_classified),
-                    investigation_id=investigation.id,
-                )
-
-            tool_results.append(
-                {
-                    "type": "tool_result",
-                    "tool_use_id": tool_use_id,
-                    "content": content_for_model,
-                }
+            outcomes = await asyncio.gather(
+                *[
+                    _execute_tool(
+                        dispatcher,
+                        summarizer,
+                        cost,
+                        investigation,
+                        tool_block,
+                        summarizer_threshold,
+                        semaphore,
+                    )
+                    for tool_block in group
+                ]
             )
 
+            for tool_block, (result_str, summarized_str, summarize_event) in zip(
+                group, outcomes, strict=True
+            ):
+                async for event in _apply_tool_outcome(
+                    tool_block,
+                    result_str,
+                    summarize_event,
+                    investigation,
+                    hypothesis,
+                    experiment,
+                    state_lock,
+                ):
+                    yield event
+
+                tool_results.append(
+                    {
+                        "type": "tool_result",
+                        "tool_use_id": tool_block["id"],
+                        "content": summarized_str if summarize_event else result_str,
+                    }
+                )
+
         messages.append({"role": "user", "content": tool_results})
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+
+class SingleFlight:
+    """Coalesce concurrent calls sharing a key onto one in-flight task.
+
+    The first caller (leader) starts the work; callers arriving while it runs
+    (followers) await the same task. The task is shielded, so cancelling one
+    waiter never cancels the work for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Task[str]] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls served by another caller's in-flight task."""
+        return self._coalesced
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, fn: Callable[[], Coroutine[Any, Any, str]]) -> str:
+        task = self._calls.get(key)
+        if task is not None:
+            self._coalesced += 1
+            return await asyncio.shield(task)
+
+        task = asyncio.create_task(fn())
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task[str]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
@@ -3,6 +3,36 @@ from __future__ import annotations
 import hashlib
 import json
 import time
+from collections import OrderedDict
+from typing import Any
+
+from ehrlich.investigation.domain.tool_cache_backend import ToolCacheBackend
+
+
+class InMemoryToolCacheBackend(ToolCacheBackend):
+    """Process-local LRU store. Shared by every orchestrator holding the same instance."""
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        self._max_entries = max_entries
+        self._store: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+
+    async def get(self, key: str) -> tuple[str, float | None] | None:
+        entry = self._store.get(key)
+        if entry is not None:
+            self._store.move_to_end(key)
+        return entry
+
+    async def put(self, key: str, value: str, expires_at: float | None) -> None:
+        self._store[key] = (value, expires_at)
+        self._store.move_to_end(key)
+        while len(self._store) > self._max_entries:
+            self._store.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._store.pop(key, None)
+
+    async def size(self) -> int:
+        return len(self._store)
 
 
 class ToolCache:
@@ -21,27 +51,51 @@ class ToolCache:
         "search_pharmacology": 604800,
     }
 
-    def __init__(self) -> None:
-        self._store: dict[str, tuple[str, float]] = {}
+    def __init__(self, backend: ToolCacheBackend | None = None) -> None:
+        self._backend = backend or InMemoryToolCacheBackend()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def is_cacheable(tool_name: str) -> bool:
+        return tool_name in ToolCache._TTLS
 
-    def get(self, tool_name: str, args_hash: str) -> str | None:
+    async def get(self, tool_name: str, args_hash: str) -> str | None:
+        if not self.is_cacheable(tool_name):
+            return None
         key = f"{tool_name}:{args_hash}"
-        entry = self._store.get(key)
+        entry = await self._backend.get(key)
         if entry is None:
+            self._misses += 1
             return None
         result, expires_at = entry
-        if expires_at != float("inf") and time.monotonic() > expires_at:
-            del self._store[key]
+        if expires_at is not None and time.time() > expires_at:
+            await self._backend.delete(key)
+            self._misses += 1
             return None
+        self._hits += 1
         return result
 
-    def put(self, tool_name: str, args_hash: str, result: str) -> None:
+    async def put(self, tool_name: str, args_hash: str, result: str) -> None:
         ttl = self._TTLS.get(tool_name)
         if ttl is None:
             return
-        expires_at = float("inf") if ttl == float("inf") else time.monotonic() + ttl
-        key = f"{tool_name}:{args_hash}"
-        self._store[key] = (result, expires_at)
+        expires_at = None if ttl == float("inf") else time.time() + ttl
+        await self._backend.put(f"{tool_name}:{args_hash}", result, expires_at)
+
+    async def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for this process plus the backend's current entry count."""
+        lookups = self._hits + self._misses
+        return {
+            "backend": type(self._backend).__name__,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            "entries": await self._backend.size(),
+        }
+
+    async def close(self) -> None:
+        await self._backend.close()
 
     @staticmethod
     def hash_args(args: dict[str, object]) -> str:
@@ -4,10 +4,11 @@ import json
 import logging
 from typing import TYPE_CHECKING, Any
 
+from ehrlich.investigation.application.single_flight import SingleFlight
 from ehrlich.investigation.application.tool_cache import ToolCache
 
 if TYPE_CHECKING:
-    from ehrlich.investigation.application.tool_registry import ToolRegistry
+    from ehrlich.investigation.application.tool_registry import ToolFunction, ToolRegistry
     from ehrlich.investigation.domain.investigation import Investigation
     from ehrlich.investigation.domain.repository import InvestigationRepository
     from ehrlich.investigation.domain.uploaded_file import UploadedFile
@@ -22,9 +23,11 @@ class ToolDispatcher:
         cache: ToolCache,
         repository: InvestigationRepository | None,
         uploaded_files: dict[str, UploadedFile],
+        single_flight: SingleFlight | None = None,
     ) -> None:
         self._registry = registry
         self._cache = cache
+        self._single_flight = single_flight or SingleFlight()
         self._repository = repository
         self._uploaded_files = uploaded_files
         self._seen_paper_keys: set[str] = set()
@@ -50,7 +53,7 @@ class ToolDispatcher:
             return json.dumps({"results": results, "count": len(results), "query": query})
 
         args_hash = ToolCache.hash_args(tool_input)
-        cached = self._cache.get(tool_name, args_hash)
+        cached = await self._cache.get(tool_name, args_hash)
         if cached is not None:
             if tool_name in ("search_literature", "search_citations"):
                 return self._dedup_papers(cached)
@@ -61,9 +64,14 @@ class ToolDispatcher:
             return json.dumps({"error": f"Unknown tool: {tool_name}"})
 
         try:
-            result = await func(**tool_input)
-            result_str = str(result)
-            self._cache.put(tool_name, args_hash, result_str)
+            if ToolCache.is_cacheable(tool_name):
+                # Identical concurrent calls (e.g. parallel researchers) share one upstream request
+                result_str = await self._single_flight.do(
+                    f"{tool_name}:{args_hash}",
+                    lambda: self._call_and_cache(func, tool_name, args_hash, tool_input),
+                )
+            else:
+                result_str = str(await func(**tool_input))
 
             if tool_name in ("search_literature", "search_citations"):
                 result_str = self._dedup_papers(result_str)
@@ -73,6 +81,20 @@ class ToolDispatcher:
             logger.exception("Tool %s failed", tool_name)
             return json.dumps({"error": f"Tool {tool_name} failed"})
 
+    async def _call_and_cache(
+        self,
+        func: ToolFunction,
+        tool_name: str,
+        args_hash: str,
+        tool_input: dict[str, Any],
+    ) -> str:
+        result_str = str(await func(**tool_input))
+        # Tools report upstream failures (timeouts, rate limits) as error JSON;
+        # caching one would serve it to every investigation until it expires.
+        if not _is_error(result_str):
+            await self._cache.put(tool_name, args_hash, result_str)
+        return result_str
+
     def _dedup_papers(self, result_str: str) -> str:
         try:
             data = json.loads(result_str)
@@ -183,3 +205,12 @@ class ToolDispatcher:
                 "data": df.values.tolist(),
             }
         )
+
+
+def _is_error(result_str: str) -> bool:
+    """Whether a tool result is a JSON object with a top-level ``error`` key."""
+    try:
+        data = json.loads(result_str)
+    except (json.JSONDecodeError, TypeError):
+        return False
+    return isinstance(data, dict) and "error" in data
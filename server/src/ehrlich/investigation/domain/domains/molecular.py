@@ -224,6 +224,8 @@ Example: Training a predictive model
 1. search_bioactivity(target="beta-lactamase", organism="S. aureus")
 2. train_model(smiles_list=[...], activity_list=[...], model_type="xgboost")
 3. predict_candidates(smiles_list=[...], model_id="model_xyz")
+4. screen_library(library="<uploaded file id>", model_id="model_xyz", top_k=50)
+   -> screens a whole .smi/.csv library; only the top hits come back
 
 Example: Identifying disease-target associations
 1. search_disease_targets(disease="Alzheimer", limit=10)
@@ -243,6 +243,8 @@ hypothesis_id="h1", evidence_type="supporting")
 Example: Clustering training protocols by features
 1. cluster_data(feature_names=["sets", "reps", "intensity_pct", "rest_sec"], \
 feature_values=[...], n_clusters=4, identifiers="protocol_A,protocol_B,...")
+   For an uploaded CSV: cluster_data(feature_names=["sets", "reps"], feature_values=[], \
+dataset="<uploaded file id>", id_column="protocol", n_clusters=4)
 2. record_finding(title="4 distinct protocol clusters identified", \
 detail="Cluster 0: high-volume, Cluster 1: high-intensity...", \
 hypothesis_id="h1", evidence_type="neutral")
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class ToolCacheBackend(ABC):
+    """Storage for cached tool results.
+
+    Keys are opaque strings. ``expires_at`` is a wall-clock UNIX timestamp, or
+    ``None`` for entries that never expire. Backends enforce their own size cap
+    by evicting least-recently-used entries.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> tuple[str, float | None] | None:
+        """Return ``(value, expires_at)`` and mark the entry as recently used."""
+        ...
+
+    @abstractmethod
+    async def put(self, key: str, value: str, expires_at: float | None) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    async def size(self) -> int: ...
+
+    async def close(self) -> None:  # noqa: B027 -- optional hook
+        """Release backend resources. No-op by default."""
@@ -4,4 +4,7 @@ from __future__ import annotations
 
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50 MB
 MAX_FILES_PER_INVESTIGATION = 10
-ALLOWED_EXTENSIONS = frozenset({"csv", "xlsx", "pdf"})
+ALLOWED_EXTENSIONS = frozenset({"csv", "xlsx", "pdf", "smi"})
+# Kept on disk after parsing, so whole compound libraries can be screened and
+# large tables clustered.
+SPOOLED_EXTENSIONS = frozenset({"csv", "smi"})
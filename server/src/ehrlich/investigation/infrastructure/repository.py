@@ -181,6 +181,11 @@ class InvestigationRepository(_Base):
             raise RuntimeError(msg)
         return self._pool
 
+    @property
+    def pool(self) -> asyncpg.Pool[asyncpg.Record]:
+        """Connection pool, for infrastructure that shares the investigations database."""
+        return self._get_pool()
+
     async def save(self, investigation: Investigation, *, user_id: str | None = None) -> None:
         pool = self._get_pool()
         async with pool.acquire() as conn:
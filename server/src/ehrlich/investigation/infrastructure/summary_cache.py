@@ -0,0 +1,69 @@
+"""Tool-output summaries persisted in SQLite.
+
+Keys are content hashes computed by the caller, covering the summarizer
+model, its prompt, the tool name and the full output, so an identical
+output is summarized once across investigations and restarts.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from pathlib import Path
+
+from ehrlich.shared.sqlite_store import SQLiteStore
+
+_MAX_ENTRIES = 20_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summaries (
+    key TEXT PRIMARY KEY,
+    summary TEXT NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_summaries_accessed ON summaries(accessed_at);
+"""
+
+
+class SummaryCache(SQLiteStore):
+    """On-disk LRU of summaries. Methods block; call them from a thread."""
+
+    _table = "summaries"
+    _schema = _SCHEMA
+    _recency = "accessed_at"
+
+    def __init__(self, path: Path, max_entries: int = _MAX_ENTRIES) -> None:
+        super().__init__(path, max_entries)
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touch("key = ?", (key,))
+            self._conn.commit()
+            return str(row[0])
+
+    def put(self, key: str, summary: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, accessed_at) VALUES (?, ?, ?)",
+                (key, summary, time.time()),
+            )
+            self._trim()
+            self._conn.commit()
+
+
+@functools.cache
+def shared_summary_cache() -> SummaryCache:
+    """The process-wide cache at ``EHRLICH_SUMMARY_CACHE_PATH``."""
+    from ehrlich.config import get_settings
+
+    settings = get_settings()
+    return SummaryCache(
+        Path(settings.summary_cache_path), max_entries=settings.summary_cache_max_entries
+    )
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from ehrlich.investigation.domain.tool_cache_backend import ToolCacheBackend
+from ehrlich.shared.sqlite_store import SQLiteStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import asyncpg
+
+logger = logging.getLogger(__name__)
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tool_cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tool_cache_accessed ON tool_cache(accessed_at);
+"""
+
+_PG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tool_cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at DOUBLE PRECISION,
+    accessed_at DOUBLE PRECISION NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tool_cache_accessed ON tool_cache(accessed_at);
+"""
+
+
+class _ToolCacheFile(SQLiteStore):
+    _table = "tool_cache"
+    _schema = _SQLITE_SCHEMA
+    _recency = "accessed_at"
+
+    def get(self, key: str) -> tuple[str, float | None] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM tool_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._touch("key = ?", (key,))
+            self._conn.commit()
+            return row[0], row[1]
+
+    def put(self, key: str, value: str, expires_at: float | None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tool_cache (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, time.time()),
+            )
+            self._trim()
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        self._execute("DELETE FROM tool_cache WHERE key = ?", (key,))
+
+
+class SQLiteToolCacheBackend(ToolCacheBackend):
+    """On-disk LRU store in a single SQLite file. Survives restarts."""
+
+    def __init__(self, path: Path, max_entries: int = 10000) -> None:
+        self._file = _ToolCacheFile(path, max_entries)
+
+    async def get(self, key: str) -> tuple[str, float | None] | None:
+        return await asyncio.to_thread(self._file.get, key)
+
+    async def put(self, key: str, value: str, expires_at: float | None) -> None:
+        await asyncio.to_thread(self._file.put, key, value, expires_at)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._file.delete, key)
+
+    async def size(self) -> int:
+        return await asyncio.to_thread(self._file.count)
+
+    async def close(self) -> None:
+        self._file.close()
+
+
+class PostgresToolCacheBackend(ToolCacheBackend):
+    """LRU store in the investigations database, shared by every API worker."""
+
+    def __init__(self, pool: asyncpg.Pool[asyncpg.Record], max_entries: int = 10000) -> None:
+        self._pool = pool
+        self._max_entries = max_entries
+
+    async def initialize(self) -> None:
+        async with self._pool.acquire() as conn:
+            await conn.execute(_PG_SCHEMA)
+        logger.info("PostgreSQL tool cache initialized (max_entries=%d)", self._max_entries)
+
+    async def get(self, key: str) -> tuple[str, float | None] | None:
+        async with self._pool.acquire() as conn:
+            row = await conn.fetchrow(
+                "UPDATE tool_cache SET accessed_at = $1 WHERE key = $2 RETURNING value, expires_at",
+                time.time(),
+                key,
+            )
+        if row is None:
+            return None
+        return row["value"], row["expires_at"]
+
+    async def put(self, key: str, value: str, expires_at: float | None) -> None:
+        async with self._pool.acquire() as conn:
+            await conn.execute(
+                """INSERT INTO tool_cache (key, value, expires_at, accessed_at)
+                   VALUES ($1, $2, $3, $4)
+                   ON CONFLICT (key) DO UPDATE SET
+                   value = EXCLUDED.value,
+                   expires_at = EXCLUDED.expires_at,
+                   accessed_at = EXCLUDED.accessed_at""",
+                key,
+                value,
+                expires_at,
+                time.time(),
+            )
+            await conn.execute(
+                """DELETE FROM tool_cache WHERE key IN (
+                   SELECT key FROM tool_cache ORDER BY accessed_at DESC OFFSET $1)""",
+                self._max_entries,
+            )
+
+    async def delete(self, key: str) -> None:
+        async with self._pool.acquire() as conn:
+            await conn.execute("DELETE FROM tool_cache WHERE key = $1", key)
+
+    async def size(self) -> int:
+        async with self._pool.acquire() as conn:
+            count = await conn.fetchval("SELECT COUNT(*) FROM tool_cache")
+        return int(count)
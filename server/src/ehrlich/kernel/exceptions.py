@@ -8,6 +8,10 @@ class InvalidSMILESError(EhrlichError):
         self.reason = reason
         super().__init__(f"{reason}: '{smiles}'")
 
+    def __reduce__(self) -> tuple[type[EhrlichError], tuple[str, str]]:
+        # Keeps the original fields when raised inside a worker process.
+        return (InvalidSMILESError, (self.smiles, self.reason))
+
 
 class ModelNotTrainedError(EhrlichError):
     def __init__(self, model_type: str) -> None:
@@ -32,3 +36,9 @@ class ExternalServiceError(EhrlichError):
         self.service = service
         self.detail = detail
         super().__init__(f"External service error ({service}): {detail}")
+
+
+class JobCancelledError(EhrlichError):
+    def __init__(self, job: str) -> None:
+        self.job = job
+        super().__init__(f"Job cancelled: {job}")
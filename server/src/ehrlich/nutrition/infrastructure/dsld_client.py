@@ -1,24 +1,16 @@
-import asyncio
 import contextlib
-import logging
 
-import httpx
-
-from ehrlich.kernel.exceptions import ExternalServiceError
 from ehrlich.nutrition.domain.entities import IngredientEntry, SupplementLabel
 from ehrlich.nutrition.domain.repository import SupplementRepository
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://api.ods.od.nih.gov/dsld/v9"
 _TIMEOUT = 20.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 
 class DSLDClient(SupplementRepository):
     def __init__(self) -> None:
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("NIH DSLD", timeout=_TIMEOUT)
 
     async def search_labels(self, ingredient: str, max_results: int = 10) -> list[SupplementLabel]:
         data = await self._get(
@@ -39,42 +31,8 @@ class DSLDClient(SupplementRepository):
         return labels
 
     async def _get(self, url: str, params: dict[str, str | int]) -> dict[str, object]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(url, params=params)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "NIH DSLD rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("NIH DSLD", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "NIH DSLD timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("NIH DSLD", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "NIH DSLD",
-            f"Request failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.get(url, params=params)
+        return resp.json()  # type: ignore[no-any-return]
 
     @staticmethod
     def _parse_ingredient_result(item: dict[str, object]) -> SupplementLabel | None:
@@ -1,23 +1,14 @@
-import asyncio
-import logging
-
-import httpx
-
-from ehrlich.kernel.exceptions import ExternalServiceError
 from ehrlich.nutrition.domain.entities import AdverseEvent
 from ehrlich.nutrition.domain.repository import AdverseEventRepository
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://api.fda.gov/food/event.json"
 _TIMEOUT = 20.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 
 class OpenFDAClient(AdverseEventRepository):
     def __init__(self) -> None:
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("OpenFDA", timeout=_TIMEOUT)
 
     async def search(self, product_name: str, max_results: int = 10) -> list[AdverseEvent]:
         safe_name = product_name.replace('"', '\\"')
@@ -32,44 +23,10 @@ class OpenFDAClient(AdverseEventRepository):
         return [self._parse_event(e) for e in results[:max_results] if isinstance(e, dict)]
 
     async def _get(self, params: dict[str, str | int]) -> dict[str, object]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(_BASE_URL, params=params)
-                if resp.status_code == 404:
-                    return {"results": []}
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "OpenFDA rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("OpenFDA", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "OpenFDA timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("OpenFDA", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "OpenFDA",
-            f"Request failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.get(_BASE_URL, params=params, allow_statuses=(404,))
+        if resp.status_code == 404:
+            return {"results": []}
+        return resp.json()  # type: ignore[no-any-return]
 
     @staticmethod
     def _parse_event(event: dict[str, object]) -> AdverseEvent:
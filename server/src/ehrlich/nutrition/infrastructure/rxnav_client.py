@@ -1,25 +1,16 @@
 from __future__ import annotations
 
-import asyncio
-import logging
-
-import httpx
-
-from ehrlich.kernel.exceptions import ExternalServiceError
 from ehrlich.nutrition.domain.entities import DrugInteraction
 from ehrlich.nutrition.domain.repository import InteractionRepository
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://rxnav.nlm.nih.gov/REST"
 _TIMEOUT = 20.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 
 class RxNavClient(InteractionRepository):
     def __init__(self) -> None:
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("RxNav", timeout=_TIMEOUT)
 
     async def search_interactions(
         self, substance: str, max_results: int = 10
@@ -66,42 +57,8 @@ class RxNavClient(InteractionRepository):
         return None
 
     async def _get(self, url: str, params: dict[str, str | int]) -> dict[str, object]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(url, params=params)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "RxNav rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("RxNav", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "RxNav timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("RxNav", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "RxNav",
-            f"Request failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.get(url, params=params)
+        return resp.json()  # type: ignore[no-any-return]
 
     @staticmethod
     def _parse_pair(pair: dict[str, object], query_substance: str) -> DrugInteraction | None:
@@ -9,10 +9,14 @@ import numpy as np
 
 from ehrlich.prediction.domain.prediction_result import PredictionResult
 from ehrlich.prediction.domain.trained_model import TrainedModel
+from ehrlich.workers.pool import run_thread
 
 if TYPE_CHECKING:
+    from ehrlich.prediction.domain.clustering_result import ClusteringResult
+    from ehrlich.prediction.domain.feature_matrix import FeatureMatrix
     from ehrlich.prediction.domain.ports import Clusterer, DataSplitter
     from ehrlich.prediction.domain.repository import ModelRepository
+    from ehrlich.prediction.infrastructure.generic_adapters import DistanceClusterer
     from ehrlich.prediction.infrastructure.xgboost_adapter import XGBoostAdapter
 
 logger = logging.getLogger(__name__)
@@ -29,9 +33,8 @@ class PredictionService:
 
     async def train(
         self,
-        features: list[list[float]],
+        features: FeatureMatrix,
         labels: list[float],
-        identifiers: list[str],
         target_name: str,
         splitter: DataSplitter,
         comparison_splitter: DataSplitter,
@@ -40,10 +43,14 @@ class PredictionService:
         if len(features) < 10:
             raise ValueError(f"Dataset too small for training: {len(features)} samples")
 
-        x = np.array(features, dtype=np.float64)
+        if len(labels) != len(features):
+            raise ValueError(f"{len(labels)} labels for {len(features)} feature rows")
+
+        # Sparse features stay sparse: row indexing a CSR matrix copies only its nonzeros.
+        x = features.values
         y = np.array(labels, dtype=np.float64)
 
-        train_idx, test_idx = splitter.split(features, labels, identifiers)
+        train_idx, test_idx = splitter.split(features, labels)
         x_train, y_train = x[train_idx], y[train_idx]
         x_test, y_test = x[test_idx], y[test_idx]
 
@@ -52,7 +59,7 @@ class PredictionService:
         )
 
         # Comparison split for generalizability assessment
-        comp_train_idx, comp_test_idx = comparison_splitter.split(features, labels, identifiers)
+        comp_train_idx, comp_test_idx = comparison_splitter.split(features, labels)
         _, random_metrics, _ = await self._xgboost.train(
             x[comp_train_idx],
             y[comp_train_idx],
@@ -65,9 +72,11 @@ class PredictionService:
         metrics["random_f1"] = random_metrics["f1"]
 
         # Permutation significance (Y-scrambling)
-        metrics["permutation_p_value"] = self._xgboost.permutation_test(
+        permutation = await self._xgboost.permutation_test(
             x_train, y_train, x_test, y_test, metrics["auroc"]
         )
+        metrics["permutation_p_value"] = permutation.p_value
+        metrics["permutation_count"] = float(permutation.n_permutations)
 
         safe_target = target_name.lower().replace(" ", "_") if target_name else "generic"
         model_id = f"xgboost_{safe_target}_{uuid.uuid4().hex[:8]}"
@@ -81,6 +90,7 @@ class PredictionService:
             n_train=len(y_train),
             n_test=len(y_test),
             created_at=datetime.datetime.now(datetime.UTC).isoformat(),
+            feature_format=features.feature_format,
         )
 
         await self._model_repo.save(trained_model, model_artifact)
@@ -88,8 +98,7 @@ class PredictionService:
 
     async def predict(
         self,
-        features: list[list[float]],
-        identifiers: list[str],
+        features: FeatureMatrix,
         model_id: str,
     ) -> list[PredictionResult]:
         trained_model, artifact = await self._model_repo.load(model_id)
@@ -97,8 +106,9 @@ class PredictionService:
         if not features:
             return []
 
-        x = np.array(features, dtype=np.float64)
-        probas = await self._xgboost.predict(x, artifact)
+        probas = await self._xgboost.predict(
+            features.values, artifact, feature_format=trained_model.feature_format
+        )
 
         results = [
             PredictionResult(
@@ -106,7 +116,7 @@ class PredictionService:
                 probability=prob,
                 model_type=trained_model.model_type,
             )
-            for identifier, prob in zip(identifiers, probas, strict=True)
+            for identifier, prob in zip(features.identifiers, probas, strict=True)
         ]
         results.sort(key=lambda r: r.probability, reverse=True)
 
@@ -122,11 +132,20 @@ class PredictionService:
 
     async def cluster(
         self,
-        features: list[list[float]],
-        identifiers: list[str],
+        features: FeatureMatrix,
         n_clusters: int,
         clusterer: Clusterer,
     ) -> dict[int, list[str]]:
         if not features:
             return {}
-        return clusterer.cluster(features, identifiers, n_clusters)
+        # Thread lane: the feature matrix is too large to pickle to a process cheaply.
+        return await run_thread(clusterer.cluster, features, n_clusters)
+
+    async def cluster_with_summary(
+        self,
+        features: FeatureMatrix,
+        n_clusters: int,
+        clusterer: DistanceClusterer,
+    ) -> ClusteringResult:
+        """Cluster tabular rows, with centroids and a sampled silhouette estimate."""
+        return await run_thread(clusterer.cluster_with_summary, features, n_clusters)
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class ClusteringResult:
+    """Cluster assignments of a tabular dataset, with a summary of each cluster.
+
+    ``silhouette`` is estimated on a random sample of ``silhouette_sample``
+    rows; it is ``None`` when fewer than two clusters are non-empty.
+    """
+
+    method: str
+    clusters: dict[int, list[str]]
+    centroids: dict[int, list[float]] = field(default_factory=dict)
+    silhouette: float | None = None
+    silhouette_sample: int = 0
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+    from numpy.typing import NDArray
+    from scipy.sparse import csr_matrix
+
+
+@dataclass(frozen=True)
+class FeatureMatrix:
+    """Feature rows with the identifier of each row.
+
+    ``values`` has shape ``(len(identifiers), n_features)``: a dense array for
+    tabular data, or a CSR matrix for sparse features such as fingerprints.
+    XGBoost reads entries absent from a CSR matrix as missing rather than zero,
+    so a model must be scored in the layout it was trained on (see
+    ``TrainedModel.feature_format``).
+    """
+
+    values: NDArray[np.float64] | csr_matrix
+    identifiers: list[str]
+
+    def __post_init__(self) -> None:
+        if self.values.shape[0] != len(self.identifiers):
+            msg = f"{self.values.shape[0]} feature rows for {len(self.identifiers)} identifiers"
+            raise ValueError(msg)
+
+    def __len__(self) -> int:
+        return len(self.identifiers)
+
+    @property
+    def n_features(self) -> int:
+        return int(self.values.shape[1])
+
+    @property
+    def is_sparse(self) -> bool:
+        return getattr(self.values, "format", None) == "csr"
+
+    @property
+    def feature_format(self) -> str:
+        return "sparse" if self.is_sparse else "dense"
+
+    def rows(self, indices: Sequence[int]) -> FeatureMatrix:
+        """The rows at ``indices``, in that order, with their identifiers."""
+        index = list(indices)
+        return FeatureMatrix(self.values[index], [self.identifiers[i] for i in index])
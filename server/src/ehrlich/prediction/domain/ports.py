@@ -8,14 +8,18 @@ and clustering. Infrastructure adapters implement them for molecular
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ehrlich.prediction.domain.feature_matrix import FeatureMatrix
 
 
 class FeatureExtractor(ABC):
     @abstractmethod
-    def extract(self, identifiers: list[str]) -> tuple[list[list[float]], list[str]]:
+    def extract(self, identifiers: list[str]) -> FeatureMatrix:
         """Extract feature vectors from identifiers.
 
-        Returns (feature_vectors, valid_identifiers). Drops invalid identifiers.
+        Returns one row per valid identifier, in input order. Drops invalid identifiers.
         """
         ...
 
@@ -24,9 +28,8 @@ class DataSplitter(ABC):
     @abstractmethod
     def split(
         self,
-        features: list[list[float]],
+        features: FeatureMatrix,
         labels: list[float],
-        identifiers: list[str],
         test_size: float = 0.2,
     ) -> tuple[list[int], list[int]]:
         """Split data into train/test sets.
@@ -40,8 +43,7 @@ class Clusterer(ABC):
     @abstractmethod
     def cluster(
         self,
-        features: list[list[float]],
-        identifiers: list[str],
+        features: FeatureMatrix,
         n_clusters: int,
     ) -> dict[int, list[str]]:
         """Cluster data points.
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ehrlich.prediction.domain.prediction_result import PredictionResult
+
+
+@dataclass(frozen=True)
+class ScreeningReport:
+    """Outcome of screening a compound library against one model.
+
+    Every molecule read is counted exactly once: as invalid, as a duplicate of
+    one seen earlier, as flagged by a structural alert, or as scored. Only the
+    ``top_k`` best-scoring molecules are kept, in ``hits``.
+    """
+
+    model_id: str
+    n_read: int
+    n_invalid: int
+    n_duplicates: int
+    n_flagged: int
+    n_scored: int
+    n_predicted_active: int
+    mean_probability: float
+    hits: list[PredictionResult] = field(default_factory=list)
@@ -14,3 +14,5 @@ class TrainedModel:
     n_train: int = 0
     n_test: int = 0
     created_at: str = ""
+    # Layout the model was trained on, "dense" or "sparse" (see FeatureMatrix).
+    feature_format: str = "dense"
@@ -1,29 +1,221 @@
+"""Chemprop v2 D-MPNN training and batched ensemble inference.
+
+Chemprop is optional (``uv sync --extra deeplearning``). Inference is built for
+scoring whole candidate sets on CPU: molecules are featurized once per batch
+of ``batch_size`` and every ensemble member scores that same collated batch,
+loaded checkpoints stay in memory between calls, and torch's intra-op thread
+count can be pinned so concurrent work in the worker pool isn't starved.
+"""
+
 from __future__ import annotations
 
 import logging
+import math
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from rdkit import Chem
+
+from ehrlich.workers.pool import run_thread
 
 logger = logging.getLogger(__name__)
 
 _CHEMPROP_AVAILABLE = False
 try:
-    import chemprop as _chemprop  # noqa: F401
+    import torch
+    from chemprop import data, featurizers, models, nn
+    from lightning import pytorch as pl
 
     _CHEMPROP_AVAILABLE = True
 except ImportError:
     pass
 
+# Large batches amortize per-batch graph collation; D-MPNN memory per molecule is small.
+_BATCH_SIZE = 512
+_EPOCHS = 30
+_MAX_CHECKPOINTS = 8
+_SEED = 42
+
+_threads_lock = threading.Lock()
+_threads_set = 0
+
+
+def _require_chemprop() -> None:
+    if not _CHEMPROP_AVAILABLE:
+        raise ImportError("Chemprop not installed. Install with: uv sync --extra deeplearning")
+
+
+def _set_torch_threads(num_threads: int) -> None:
+    """Pin torch's intra-op threads once per process; ``0`` keeps torch's default."""
+    global _threads_set
+    if num_threads < 1 or num_threads == _threads_set:
+        return
+    with _threads_lock:
+        torch.set_num_threads(num_threads)
+        _threads_set = num_threads
+
+
+class _CheckpointCache:
+    """LRU of loaded models keyed by checkpoint path and modification time."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, int], Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: Path) -> Any:
+        resolved = path.resolve()
+        key = (str(resolved), resolved.stat().st_mtime_ns)
+        with self._lock:
+            model = self._entries.get(key)
+            if model is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return model
+            self.misses += 1
+        # Loaded outside the lock; two concurrent misses on one file both load it.
+        model = models.MPNN.load_from_file(resolved, map_location=torch.device("cpu"))
+        model.eval()
+        with self._lock:
+            self._entries[key] = model
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return model
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
 
 class ChempropAdapter:
+    def __init__(
+        self,
+        batch_size: int = _BATCH_SIZE,
+        num_threads: int = 0,
+        max_checkpoints: int = _MAX_CHECKPOINTS,
+        epochs: int = _EPOCHS,
+    ) -> None:
+        self._batch_size = batch_size
+        self._num_threads = num_threads
+        self._epochs = epochs
+        self._checkpoints = _CheckpointCache(max_checkpoints)
+
     @staticmethod
     def is_available() -> bool:
         return _CHEMPROP_AVAILABLE
 
     async def train(self, smiles_list: list[str], activities: list[float]) -> object:
-        if not _CHEMPROP_AVAILABLE:
-            raise ImportError("Chemprop not installed. Install with: uv sync --extra deeplearning")
-        raise NotImplementedError("Chemprop training not yet implemented")
+        """Fit a binary-classification D-MPNN. Invalid SMILES are skipped."""
+        _require_chemprop()
+        if len(smiles_list) != len(activities):
+            raise ValueError(f"{len(activities)} activities for {len(smiles_list)} SMILES")
+        # Thread lane: torch releases the GIL and a trained model is costly to pickle back.
+        return await run_thread(self._fit, smiles_list, activities)
 
     async def predict(self, smiles_list: list[str], model: object) -> list[float]:
-        if not _CHEMPROP_AVAILABLE:
-            raise ImportError("Chemprop not installed. Install with: uv sync --extra deeplearning")
-        raise NotImplementedError("Chemprop prediction not yet implemented")
+        """Positive-class probability per SMILES, ``nan`` where the SMILES is invalid.
+
+        ``model`` is a trained model, a checkpoint path, or a sequence of
+        either; a sequence is scored as an ensemble and its members averaged.
+        """
+        _require_chemprop()
+        if not smiles_list:
+            return []
+        members = model if isinstance(model, Sequence) and not isinstance(model, str) else [model]
+        if not members:
+            raise ValueError("Ensemble has no members")
+        return await run_thread(self._predict, smiles_list, list(members))
+
+    def save(self, model: object, path: Path) -> Path:
+        """Write ``model`` as a Chemprop checkpoint that ``predict`` can load by path."""
+        _require_chemprop()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        models.save_model(path, model)
+        return path
+
+    def cache_stats(self) -> dict[str, int]:
+        return self._checkpoints.stats()
+
+    def _fit(self, smiles_list: list[str], activities: list[float]) -> object:
+        _set_torch_threads(self._num_threads)
+        torch.manual_seed(_SEED)
+        featurizer = featurizers.SimpleMoleculeMolGraphFeaturizer()
+        points = [
+            data.MoleculeDatapoint(mol=mol, y=[float(y)])
+            for mol, y in zip(_parse(smiles_list), activities, strict=True)
+            if mol is not None
+        ]
+        if len(points) < 10:
+            raise ValueError(f"Dataset too small for training: {len(points)} valid molecules")
+        dataset = data.MoleculeDataset(points, featurizer)
+        dataset.cache = True  # featurize once, not once per epoch
+        loader = data.build_dataloader(
+            dataset, batch_size=min(self._batch_size, 64), num_workers=0, seed=_SEED
+        )
+        mpnn = models.MPNN(
+            nn.BondMessagePassing(d_v=featurizer.atom_fdim, d_e=featurizer.bond_fdim),
+            nn.MeanAggregation(),
+            nn.BinaryClassificationFFN(),
+            batch_norm=True,
+        )
+        trainer = pl.Trainer(
+            accelerator="cpu",
+            devices=1,
+            max_epochs=self._epochs,
+            logger=False,
+            enable_checkpointing=False,
+            enable_progress_bar=False,
+            enable_model_summary=False,
+        )
+        trainer.fit(mpnn, loader)
+        mpnn.eval()
+        return mpnn
+
+    def _predict(self, smiles_list: list[str], members: list[object]) -> list[float]:
+        _set_torch_threads(self._num_threads)
+        ensemble = [self._resolve(member) for member in members]
+        mols = _parse(smiles_list)
+        valid = [i for i, mol in enumerate(mols) if mol is not None]
+        scores = [math.nan] * len(smiles_list)
+        if not valid:
+            return scores
+
+        row = 0
+        with torch.inference_mode():
+            for batch in _batches([mols[i] for i in valid], self._batch_size):
+                # One featurized, collated batch is scored by every member.
+                total = sum(m(batch.bmg, batch.V_d, batch.X_d)[:, 0] for m in ensemble)
+                for value in (total / len(ensemble)).tolist():
+                    scores[valid[row]] = float(value)
+                    row += 1
+        return scores
+
+    def _resolve(self, member: object) -> Any:
+        if isinstance(member, str | Path):
+            return self._checkpoints.load(Path(member))
+        model: Any = member
+        model.eval()
+        return model
+
+
+def _batches(mols: list[Any], batch_size: int) -> Any:
+    """Featurized, collated batches of ``mols`` in input order."""
+    dataset = data.MoleculeDataset(
+        [data.MoleculeDatapoint(mol=mol) for mol in mols],
+        featurizers.SimpleMoleculeMolGraphFeaturizer(),
+    )
+    return data.build_dataloader(dataset, batch_size=batch_size, num_workers=0, shuffle=False)
+
+
+def _parse(smiles_list: list[str]) -> list[Any]:
+    return [Chem.MolFromSmiles(smi) if smi else None for smi in smiles_list]
@@ -7,20 +7,86 @@ future domain that needs ML capabilities.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 import numpy as np
+import pandas as pd
 from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.sparse import csr_matrix
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.metrics import silhouette_score
 
+from ehrlich.prediction.domain.clustering_result import ClusteringResult
+from ehrlich.prediction.domain.feature_matrix import FeatureMatrix
 from ehrlich.prediction.domain.ports import Clusterer, DataSplitter
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+# Ward linkage keeps n*(n-1)/2 distances; 2000 rows is about 16 MB of them.
+_WARD_LIMIT = 2_000
+_CHUNK_ROWS = 10_000
+_KMEANS_PASSES = 3
+_SILHOUETTE_SAMPLE = 2_000
+_SEED = 42
+_TABLE_SEPARATORS = {".csv": ",", ".tsv": "\t"}
+
+
+def tabular_features(values: list[float], n_features: int, identifiers: list[str]) -> FeatureMatrix:
+    """A dense feature matrix from a flattened row-major list of values.
+
+    Raises ValueError if ``identifiers`` doesn't match the number of rows.
+    """
+    x = np.asarray(values, dtype=np.float64).reshape(-1, n_features)
+    return FeatureMatrix(x, identifiers)
+
+
+def read_tabular_features(
+    path: Path,
+    feature_names: list[str],
+    id_column: str = "",
+    chunk_rows: int = _CHUNK_ROWS,
+) -> FeatureMatrix:
+    """A dense feature matrix from the ``feature_names`` columns of a CSV/TSV file.
+
+    The file is read ``chunk_rows`` rows at a time. Rows with a missing or
+    non-numeric value in any feature column are dropped. Identifiers come from
+    ``id_column``, or are ``row_<n>`` for the n-th data row of the file.
+    """
+    separator = _TABLE_SEPARATORS.get(path.suffix.lower())
+    if separator is None:
+        msg = f"Unsupported table format: {path.suffix or path.name}"
+        raise ValueError(msg)
+    header = [str(c) for c in pd.read_csv(path, sep=separator, nrows=0).columns]
+    missing = [c for c in [*feature_names, id_column] if c and c not in header]
+    if missing:
+        msg = f"Columns not in {path.name}: {', '.join(missing)}; columns are: {', '.join(header)}"
+        raise ValueError(msg)
+
+    usecols = [*feature_names, id_column] if id_column else feature_names
+    blocks: list[NDArray[np.float64]] = []
+    identifiers: list[str] = []
+    reader = pd.read_csv(path, sep=separator, usecols=usecols, chunksize=chunk_rows)
+    with reader:
+        for frame in reader:
+            values = frame[feature_names].apply(pd.to_numeric, errors="coerce")
+            keep = values.notna().all(axis=1).to_numpy()
+            blocks.append(values.to_numpy(dtype=np.float64)[keep])
+            ids = frame[id_column].astype(str) if id_column else "row_" + frame.index.astype(str)
+            identifiers.extend(ids[keep])
+    x = np.vstack(blocks) if blocks else np.empty((0, len(feature_names)))
+    return FeatureMatrix(x, identifiers)
+
 
 class RandomSplitter(DataSplitter):
     """Random shuffle train/test split with fixed seed."""
 
     def split(
         self,
-        features: list[list[float]],
+        features: FeatureMatrix,
         labels: list[float],
-        identifiers: list[str],
         test_size: float = 0.2,
     ) -> tuple[list[int], list[int]]:
         rng = np.random.RandomState(42)
@@ -31,27 +97,109 @@ class RandomSplitter(DataSplitter):
 
 
 class DistanceClusterer(Clusterer):
-    """Hierarchical clustering using Ward linkage (scipy)."""
+    """Clusters numeric rows, choosing the algorithm by dataset size.
+
+    Up to ``ward_limit`` rows get exact Ward linkage, which is quadratic in
+    memory and time. Larger sets get mini-batch k-means, fitted with
+    ``partial_fit`` over shuffled chunks of ``chunk_rows`` rows and then
+    labelled chunk by chunk, so working memory grows with the chunk rather
+    than the dataset. Silhouette is estimated on a random sample.
+    """
+
+    def __init__(
+        self,
+        ward_limit: int = _WARD_LIMIT,
+        chunk_rows: int = _CHUNK_ROWS,
+        silhouette_sample: int = _SILHOUETTE_SAMPLE,
+    ) -> None:
+        self._ward_limit = ward_limit
+        self._chunk_rows = chunk_rows
+        self._silhouette_sample = silhouette_sample
 
     def cluster(
         self,
-        features: list[list[float]],
-        identifiers: list[str],
+        features: FeatureMatrix,
         n_clusters: int,
     ) -> dict[int, list[str]]:
-        if not features:
-            return {}
+        return self.cluster_with_summary(features, n_clusters).clusters
 
+    def cluster_with_summary(self, features: FeatureMatrix, n_clusters: int) -> ClusteringResult:
+        identifiers = features.identifiers
         n_samples = len(features)
+        if n_samples == 0:
+            return ClusteringResult(method="none", clusters={})
+        x = features.values
         if n_samples <= n_clusters:
-            return {i: [identifiers[i]] for i in range(n_samples)}
+            return ClusteringResult(
+                method="singleton",
+                clusters={i: [identifiers[i]] for i in range(n_samples)},
+                centroids={i: _row(x, i) for i in range(n_samples)},
+            )
+
+        if n_samples <= self._ward_limit:
+            method, raw = "ward", self._ward(x, n_clusters)
+        else:
+            method, raw = "minibatch_kmeans", self._kmeans(x, n_clusters)
+        # Compact to 0..k-1: fcluster is 1-indexed and k-means can leave clusters empty.
+        _, labels = np.unique(raw, return_inverse=True)
+
+        clusters: dict[int, list[str]] = {}
+        for idx, cluster_id in enumerate(labels.tolist()):
+            clusters.setdefault(cluster_id, []).append(identifiers[idx])
+        silhouette, sample = self._silhouette(x, labels)
+        return ClusteringResult(
+            method=method,
+            clusters=clusters,
+            centroids=_centroids(x, labels),
+            silhouette=silhouette,
+            silhouette_sample=sample,
+        )
+
+    @staticmethod
+    def _ward(x: Any, n_clusters: int) -> NDArray[np.int64]:
+        # Ward linkage needs dense rows; it is quadratic anyway, so inputs stay small.
+        dense = np.asarray(x.toarray() if isinstance(x, csr_matrix) else x, np.float64)
+        z = linkage(dense, method="ward")
+        return np.asarray(fcluster(z, t=n_clusters, criterion="maxclust"), dtype=np.int64)
+
+    def _kmeans(self, x: Any, n_clusters: int) -> NDArray[np.int64]:
+        n_samples = x.shape[0]
+        # The first partial_fit call seeds the centroids, so it needs n_clusters rows.
+        chunk = max(self._chunk_rows, n_clusters)
+        model = MiniBatchKMeans(n_clusters=n_clusters, batch_size=chunk, random_state=_SEED)
+        rng = np.random.default_rng(_SEED)
+        for _ in range(_KMEANS_PASSES):
+            order = rng.permutation(n_samples)
+            for start in range(0, n_samples, chunk):
+                rows = np.sort(order[start : start + chunk])
+                model.partial_fit(x[rows])
+        return np.concatenate(
+            [model.predict(x[start : start + chunk]) for start in range(0, n_samples, chunk)]
+        ).astype(np.int64)
+
+    def _silhouette(self, x: Any, labels: NDArray[np.int64]) -> tuple[float | None, int]:
+        sample = min(x.shape[0], self._silhouette_sample)
+        try:
+            score = silhouette_score(x, labels, sample_size=sample, random_state=_SEED)
+        except ValueError:
+            # Fewer than two clusters (or one per row) in the sample.
+            return None, sample
+        return float(score), sample
+
+
+def _row(x: Any, i: int) -> list[float]:
+    row = x[i].toarray().ravel() if isinstance(x, csr_matrix) else np.asarray(x[i])
+    return [float(v) for v in row]
 
-        x = np.array(features, dtype=np.float64)
-        z = linkage(x, method="ward")
-        labels = fcluster(z, t=n_clusters, criterion="maxclust")
 
-        result: dict[int, list[str]] = {}
-        for idx, cluster_id in enumerate(labels):
-            cid = int(cluster_id) - 1  # fcluster is 1-indexed
-            result.setdefault(cid, []).append(identifiers[idx])
-        return result
+def _centroids(x: Any, labels: NDArray[np.int64]) -> dict[int, list[float]]:
+    """Mean row of each cluster, via one sparse indicator product instead of a mask per cluster."""
+    n_clusters = int(labels.max()) + 1
+    indicator = csr_matrix(
+        (np.ones(len(labels)), (labels, np.arange(len(labels)))),
+        shape=(n_clusters, len(labels)),
+    )
+    sums = indicator @ x
+    sums = sums.toarray() if isinstance(sums, csr_matrix) else np.asarray(sums)
+    means = sums / np.bincount(labels, minlength=n_clusters)[:, None]
+    return {i: [float(v) for v in means[i]] for i in range(n_clusters)}
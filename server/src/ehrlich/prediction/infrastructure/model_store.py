@@ -1,21 +1,103 @@
+"""Trained models on disk, with a metadata index and an in-memory model cache.
+
+``index.json`` in the models directory holds the metadata of every model, so
+listing and loading never parse per-model files. Each model directory keeps
+its own ``metadata.json`` (the index is rebuilt from these if it is missing or
+unreadable) and one artifact: ``model.ubj``, the booster in XGBoost's native
+UBJSON format, for XGBoost models, or ``model.joblib`` for anything else and
+for models saved before the native format.
+
+Artifacts are read on first ``load`` and then kept in an LRU bounded by their
+serialized size, so repeated scoring against one model skips deserialization.
+"""
+
 from __future__ import annotations
 
 import json
+import logging
+import math
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 import joblib
+import xgboost as xgb
 
 from ehrlich.prediction.domain.repository import ModelRepository
 from ehrlich.prediction.domain.trained_model import TrainedModel
 
+logger = logging.getLogger(__name__)
+
 _MODELS_DIR = Path(__file__).resolve().parents[5] / "data" / "models"
+_INDEX_FILE = "index.json"
+_NATIVE_FILE = "model.ubj"
+_JOBLIB_FILE = "model.joblib"
+_DEFAULT_CACHE_MB = 512
+
+
+class _ModelCache:
+    """LRU of loaded artifacts, bounded by the total size of their files on disk."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, model_id: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(model_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(model_id)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, model_id: str, artifact: Any, size: int) -> None:
+        with self._lock:
+            self._discard(model_id)
+            # An artifact larger than the whole budget is served uncached.
+            if size > self._max_bytes:
+                return
+            self._entries[model_id] = (artifact, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self.evictions += 1
+
+    def _discard(self, model_id: str) -> None:
+        entry = self._entries.pop(model_id, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
 
 
 class ModelStore(ModelRepository):
-    def __init__(self, models_dir: Path | None = None) -> None:
+    def __init__(self, models_dir: Path | None = None, cache_mb: int = _DEFAULT_CACHE_MB) -> None:
         self._dir = models_dir or _MODELS_DIR
         self._dir.mkdir(parents=True, exist_ok=True)
+        self._cache = _ModelCache(cache_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._index: dict[str, dict[str, Any]] = {}
+        # mtime_ns of index.json when last read; another process's writes change it.
+        self._index_mtime: int | None = None
 
     async def save(self, model: TrainedModel, artifact: object) -> str:
         model_dir = self._dir / model.model_id
@@ -25,40 +107,125 @@ class ModelStore(ModelRepository):
             "model_id": model.model_id,
             "model_type": model.model_type,
             "target": model.target,
-            "metrics": model.metrics,
-            "feature_importance": model.feature_importance,
+            "metrics": _to_json_floats(model.metrics),
+            "feature_importance": _to_json_floats(model.feature_importance),
             "is_trained": model.is_trained,
             "n_train": model.n_train,
             "n_test": model.n_test,
             "created_at": model.created_at,
+            "feature_format": model.feature_format,
         }
-        (model_dir / "metadata.json").write_text(json.dumps(meta, indent=2))
-        joblib.dump(artifact, model_dir / "model.joblib")
+        _write_atomic(model_dir / "metadata.json", json.dumps(meta, indent=2))
+        if isinstance(artifact, xgb.XGBClassifier):
+            # Saved through the booster: the sklearn wrapper's own save_model
+            # needs estimator tags that newer scikit-learn no longer provides.
+            tmp = model_dir / f"{_NATIVE_FILE}.part.ubj"
+            artifact.get_booster().save_model(tmp)
+            os.replace(tmp, model_dir / _NATIVE_FILE)
+            (model_dir / _JOBLIB_FILE).unlink(missing_ok=True)
+            artifact_path = model_dir / _NATIVE_FILE
+        else:
+            tmp = model_dir / f"{_JOBLIB_FILE}.part"
+            joblib.dump(artifact, tmp)
+            os.replace(tmp, model_dir / _JOBLIB_FILE)
+            (model_dir / _NATIVE_FILE).unlink(missing_ok=True)
+            artifact_path = model_dir / _JOBLIB_FILE
 
+        with self._lock:
+            self._refresh_index()
+            self._index[model.model_id] = meta
+            self._write_index()
+        self._cache.put(model.model_id, artifact, artifact_path.stat().st_size)
         return model.model_id
 
     async def load(self, model_id: str) -> tuple[TrainedModel, Any]:
-        model_dir = self._dir / model_id
-        if not model_dir.exists():
-            raise FileNotFoundError(f"Model not found: {model_id}")
-
-        meta = json.loads((model_dir / "metadata.json").read_text())
+        with self._lock:
+            self._refresh_index()
+            meta = self._index.get(model_id)
+            if meta is None:
+                # Saved by a process whose index write raced ours; adopt it.
+                meta = self._read_model_meta(model_id)
+                if meta is None:
+                    raise FileNotFoundError(f"Model not found: {model_id}")
+                self._index[model_id] = meta
+                self._write_index()
         trained_model = self._meta_to_model(meta)
-        artifact: Any = joblib.load(model_dir / "model.joblib")
 
+        artifact = self._cache.get(model_id)
+        if artifact is None:
+            artifact, size = self._read_artifact(model_id)
+            self._cache.put(model_id, artifact, size)
         return trained_model, artifact
 
     async def list_models(self) -> list[TrainedModel]:
-        models: list[TrainedModel] = []
-        if not self._dir.exists():
-            return models
-        for model_dir in sorted(self._dir.iterdir()):
-            meta_path = model_dir / "metadata.json"
-            if not meta_path.exists():
-                continue
-            meta = json.loads(meta_path.read_text())
-            models.append(self._meta_to_model(meta))
-        return models
+        with self._lock:
+            self._refresh_index()
+            if self._reconcile_index():
+                self._write_index()
+            return [self._meta_to_model(self._index[i]) for i in sorted(self._index)]
+
+    def cache_stats(self) -> dict[str, int]:
+        return self._cache.stats()
+
+    def _read_artifact(self, model_id: str) -> tuple[Any, int]:
+        model_dir = self._dir / model_id
+        native = model_dir / _NATIVE_FILE
+        if native.exists():
+            model = xgb.XGBClassifier()
+            model.load_model(native)
+            return model, native.stat().st_size
+        legacy = model_dir / _JOBLIB_FILE
+        if not legacy.exists():
+            raise FileNotFoundError(f"Model not found: {model_id}")
+        return joblib.load(legacy), legacy.stat().st_size
+
+    def _read_model_meta(self, model_id: str) -> dict[str, Any] | None:
+        meta_path = self._dir / model_id / "metadata.json"
+        try:
+            meta: dict[str, Any] = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def _refresh_index(self) -> None:
+        """Re-read index.json if it changed since the last read; rebuild it if unusable."""
+        path = self._dir / _INDEX_FILE
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime is not None and mtime == self._index_mtime:
+            return
+        if mtime is not None:
+            try:
+                self._index = json.loads(path.read_text())["models"]
+                self._index_mtime = mtime
+                return
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.warning("Model index %s is unreadable, rebuilding", path)
+        self._index = {}
+        self._reconcile_index()
+        self._write_index()
+
+    def _reconcile_index(self) -> bool:
+        """Sync the index with the model directories on disk. True if it changed."""
+        names = {p.name for p in self._dir.iterdir() if p.is_dir()}
+        changed = False
+        for model_id in list(self._index):
+            if model_id not in names:
+                del self._index[model_id]
+                changed = True
+        for model_id in names - self._index.keys():
+            meta = self._read_model_meta(model_id)
+            if meta is not None:
+                self._index[model_id] = meta
+                changed = True
+        return changed
+
+    def _write_index(self) -> None:
+        path = self._dir / _INDEX_FILE
+        _write_atomic(path, json.dumps({"models": self._index}))
+        self._index_mtime = path.stat().st_mtime_ns
 
     @staticmethod
     def _meta_to_model(meta: dict[str, Any]) -> TrainedModel:
@@ -66,10 +233,26 @@ class ModelStore(ModelRepository):
             model_id=meta["model_id"],
             model_type=meta["model_type"],
             target=meta["target"],
-            metrics=meta.get("metrics", {}),
-            feature_importance=meta.get("feature_importance", {}),
+            metrics=_from_json_floats(meta.get("metrics", {})),
+            feature_importance=_from_json_floats(meta.get("feature_importance", {})),
             is_trained=meta.get("is_trained", False),
             n_train=meta.get("n_train", 0),
             n_test=meta.get("n_test", 0),
             created_at=meta.get("created_at", ""),
+            feature_format=meta.get("feature_format", "dense"),
         )
+
+
+def _to_json_floats(values: dict[str, float]) -> dict[str, float | None]:
+    # json.dumps writes NaN/Infinity bare, which is not JSON; undefined metrics become null.
+    return {k: v if math.isfinite(v) else None for k, v in values.items()}
+
+
+def _from_json_floats(values: dict[str, float | None]) -> dict[str, float]:
+    return {k: math.nan if v is None else v for k, v in values.items()}
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f"{path.name}.part")
+    tmp.write_text(text)
+    os.replace(tmp, path)
@@ -2,23 +2,35 @@
 
 These adapters use ChemistryPort (RDKit) to implement feature extraction,
 scaffold-based splitting, and Butina clustering for molecular data.
+
+Fingerprint features are CSR matrices holding only the set bits (about 50 of
+2048 for a drug-like molecule), so a 20k-compound training set takes a few MB
+instead of the ~330 MB of a dense float64 matrix.
 """
 
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
 import numpy as np
+from scipy.sparse import csr_matrix
 
+from ehrlich.prediction.domain.feature_matrix import FeatureMatrix
 from ehrlich.prediction.domain.ports import Clusterer, DataSplitter, FeatureExtractor
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     from ehrlich.shared.chemistry_port import ChemistryPort
-    from ehrlich.shared.fingerprint import Fingerprint
 
 logger = logging.getLogger(__name__)
 
+_EXACT_CLUSTER_LIMIT = 20_000
+# Fingerprint rows unpacked at a time when building the CSR matrix.
+_UNPACK_CHUNK_ROWS = 4096
+
 
 class MolecularFeatureExtractor(FeatureExtractor):
     """Extracts Morgan fingerprint features from SMILES identifiers."""
@@ -26,25 +38,29 @@ class MolecularFeatureExtractor(FeatureExtractor):
     def __init__(self, rdkit: ChemistryPort) -> None:
         self._rdkit = rdkit
 
-    def extract(self, identifiers: list[str]) -> tuple[list[list[float]], list[str]]:
-        features: list[list[float]] = []
-        valid: list[str] = []
-        for smiles in identifiers:
-            try:
-                fp = self._rdkit.compute_fingerprint(smiles)  # type: ignore[arg-type]
-                dense = self._fingerprint_to_dense(fp)
-                features.append(dense)
-                valid.append(smiles)
-            except Exception:
-                continue
-        return features, valid
-
-    @staticmethod
-    def _fingerprint_to_dense(fp: Fingerprint) -> list[float]:
-        dense = [0.0] * fp.n_bits
-        for bit in fp.bits:
-            dense[bit] = 1.0
-        return dense
+    def extract(self, identifiers: list[str]) -> FeatureMatrix:
+        fps = self._rdkit.compute_fingerprints_batch(identifiers)  # type: ignore[arg-type]
+        valid = [s for s, ok in zip(identifiers, fps.valid, strict=True) if ok]
+        return FeatureMatrix(_words_to_csr(fps.words[fps.valid], fps.n_bits), valid)
+
+
+def _words_to_csr(words: NDArray[np.uint64], n_bits: int) -> csr_matrix:
+    """A float32 CSR matrix with a 1 at every set bit of the packed fingerprint rows."""
+    indices: list[NDArray[np.int32]] = []
+    counts: list[NDArray[np.intp]] = []
+    for start in range(0, len(words), _UNPACK_CHUNK_ROWS):
+        # Words are little-endian, so their bytes unpack LSB-first into bit order.
+        as_bytes = np.ascontiguousarray(words[start : start + _UNPACK_CHUNK_ROWS]).view(np.uint8)
+        bits = np.unpackbits(as_bytes, axis=1, count=n_bits, bitorder="little")
+        rows, cols = np.nonzero(bits)
+        indices.append(cols.astype(np.int32))
+        counts.append(np.bincount(rows, minlength=len(bits)))
+    indptr = np.zeros(len(words) + 1, dtype=np.int64)
+    if counts:
+        np.cumsum(np.concatenate(counts), out=indptr[1:])
+    col_idx = np.concatenate(indices) if indices else np.zeros(0, dtype=np.int32)
+    data = np.ones(len(col_idx), dtype=np.float32)
+    return csr_matrix((data, col_idx, indptr), shape=(len(words), n_bits))
 
 
 class ScaffoldSplitter(DataSplitter):
@@ -55,12 +71,14 @@ class ScaffoldSplitter(DataSplitter):
 
     def split(
         self,
-        features: list[list[float]],
+        features: FeatureMatrix,
         labels: list[float],
-        identifiers: list[str],
         test_size: float = 0.2,
     ) -> tuple[list[int], list[int]]:
-        scaffolds = [self._safe_murcko_scaffold(s) for s in identifiers]
+        scaffolds = [
+            scaffold or "unknown"
+            for scaffold in self._rdkit.murcko_scaffolds_batch(features.identifiers)  # type: ignore[arg-type]
+        ]
 
         unique_scaffolds = list(set(scaffolds))
         rng = np.random.RandomState(42)
@@ -81,39 +99,32 @@ class ScaffoldSplitter(DataSplitter):
 
         return train_idx, test_idx
 
-    def _safe_murcko_scaffold(self, smiles: str) -> str:
-        try:
-            return self._rdkit.murcko_scaffold(smiles)  # type: ignore[arg-type]
-        except Exception:
-            return "unknown"
-
 
 class MolecularClusterer(Clusterer):
-    """Butina clustering for molecular data using Tanimoto distance."""
+    """Butina clustering for molecular data using Tanimoto distance.
 
-    def __init__(self, rdkit: ChemistryPort) -> None:
+    Sets larger than ``exact_limit`` use approximate leader clustering, since
+    exact Butina compares every pair.
+    """
+
+    def __init__(self, rdkit: ChemistryPort, exact_limit: int = _EXACT_CLUSTER_LIMIT) -> None:
         self._rdkit = rdkit
+        self._exact_limit = exact_limit
 
     def cluster(
         self,
-        features: list[list[float]],
-        identifiers: list[str],
+        features: FeatureMatrix,
         n_clusters: int,
     ) -> dict[int, list[str]]:
-        fingerprints: list[Fingerprint] = []
-        valid_ids: list[str] = []
-        for smiles in identifiers:
-            try:
-                fp = self._rdkit.compute_fingerprint(smiles)  # type: ignore[arg-type]
-                fingerprints.append(fp)
-                valid_ids.append(smiles)
-            except Exception:
-                continue
-
-        if not fingerprints:
+        identifiers = features.identifiers
+        fps = self._rdkit.compute_fingerprints_batch(identifiers)  # type: ignore[arg-type]
+        valid_ids = [s for s, ok in zip(identifiers, fps.valid, strict=True) if ok]
+        if not valid_ids:
             return {}
 
-        clusters_indices = self._rdkit.butina_cluster(fingerprints, cutoff=0.35)
+        valid_fps = replace(fps, words=fps.words[fps.valid], valid=fps.valid[fps.valid], errors={})
+        method = "butina" if len(valid_ids) <= self._exact_limit else "leader"
+        clusters_indices = self._rdkit.cluster_fingerprints(valid_fps, cutoff=0.35, method=method)
 
         result: dict[int, list[str]] = {}
         for cluster_id, indices in enumerate(clusters_indices):
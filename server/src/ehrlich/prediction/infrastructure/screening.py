@@ -0,0 +1,290 @@
+"""Virtual screening of compound libraries too large to pass as tool arguments.
+
+A library file (``.smi``, or CSV/TSV with a SMILES column) is read in chunks.
+Each chunk is validated, canonicalized, checked against the structural alerts
+and fingerprinted in a worker process, which sends back only the canonical
+SMILES and a CSR fingerprint matrix. The parent drops molecules already seen
+in earlier chunks, scores the rest with a trained model and keeps the best
+``top_k`` in a min-heap. Memory is bounded by the chunks in flight and
+``top_k``, plus one 8-byte hash per distinct molecule for deduplication.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import heapq
+import logging
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from ehrlich.kernel.exceptions import InvalidSMILESError
+from ehrlich.kernel.types import SMILES
+from ehrlich.prediction.domain.prediction_result import PredictionResult
+from ehrlich.prediction.domain.screening_report import ScreeningReport
+from ehrlich.prediction.infrastructure.molecular_adapters import MolecularFeatureExtractor
+from ehrlich.workers.pool import cpu_workers, run_cpu, run_thread
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    import numpy as np
+    from numpy.typing import NDArray
+    from scipy.sparse import csr_matrix
+
+    from ehrlich.prediction.domain.repository import ModelRepository
+    from ehrlich.prediction.infrastructure.xgboost_adapter import XGBoostAdapter
+    from ehrlich.shared.alerts import AlertCatalog
+    from ehrlich.shared.chemistry_port import ChemistryPort
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CHUNK_SIZE = 2000
+_DEFAULT_TOP_K = 50
+_SMI_SUFFIXES = frozenset({".smi", ".smiles", ".txt"})
+_TABLE_SEPARATORS = {".csv": ",", ".tsv": "\t"}
+_SMILES_COLUMNS = ("smiles", "canonical_smiles", "smi")
+_FILE_ID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+
+def resolve_library(library: str, library_dir: Path, upload_dir: Path) -> Path:
+    """The file behind ``library``: an uploaded file's id, or a path inside ``library_dir``."""
+    if _FILE_ID_RE.match(library):
+        spooled = sorted(upload_dir.glob(f"{library}.*"))
+        if spooled:
+            return spooled[0]
+    root = library_dir.resolve()
+    path = (root / library).resolve()
+    if not path.is_relative_to(root) or not path.is_file():
+        msg = f"Library not found: {library}"
+        raise ValueError(msg)
+    return path
+
+
+def read_library(path: Path, chunk_size: int, smiles_column: str = "") -> Iterator[list[str]]:
+    """SMILES strings from ``path`` in lists of at most ``chunk_size``, in file order.
+
+    ``.smi`` files hold one molecule per line, SMILES first; blank lines and
+    ``#`` comments are skipped. CSV and TSV files are read from ``smiles_column``,
+    or from the first column named like a SMILES column.
+    """
+    suffix = path.suffix.lower()
+    if suffix in _SMI_SUFFIXES:
+        return _read_smi(path, chunk_size)
+    if suffix in _TABLE_SEPARATORS:
+        return _read_table(path, chunk_size, _TABLE_SEPARATORS[suffix], smiles_column)
+    msg = f"Unsupported library format: {path.suffix or path.name}"
+    raise ValueError(msg)
+
+
+def _read_smi(path: Path, chunk_size: int) -> Iterator[list[str]]:
+    chunk: list[str] = []
+    with path.open(encoding="utf-8", errors="replace") as f:
+        for line in f:
+            fields = line.split(maxsplit=1)
+            if not fields or fields[0].startswith("#"):
+                continue
+            chunk.append(fields[0])
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _read_table(
+    path: Path, chunk_size: int, separator: str, smiles_column: str
+) -> Iterator[list[str]]:
+    header = [str(c) for c in pd.read_csv(path, sep=separator, nrows=0).columns]
+    column = smiles_column or next((c for c in header if c.strip().lower() in _SMILES_COLUMNS), "")
+    if column not in header:
+        msg = f"No SMILES column in {path.name}; columns are: {', '.join(header)}"
+        raise ValueError(msg)
+    reader = pd.read_csv(path, sep=separator, usecols=[column], dtype=str, chunksize=chunk_size)
+    with reader:
+        for frame in reader:
+            chunk = [s.strip() for s in frame[column].dropna()]
+            if chunk:
+                yield chunk
+
+
+@dataclass(frozen=True)
+class _ChunkResult:
+    passed: list[str]  # canonical SMILES that cleared the alerts, one per row of features
+    features: NDArray[np.float64] | csr_matrix
+    flagged: list[str]  # canonical SMILES that matched an alert
+    n_read: int
+    n_invalid: int
+
+
+def _prepare_chunk(rdkit: ChemistryPort, smiles: list[str], alerts: AlertCatalog) -> _ChunkResult:
+    """Validate, alert-filter and fingerprint one chunk."""
+    passed: list[SMILES] = []
+    flagged: list[str] = []
+    for smi in smiles:
+        try:
+            canonical = rdkit.canonicalize(SMILES(smi))
+            if len(alerts) and rdkit.match_alerts(canonical, alerts):
+                flagged.append(str(canonical))
+            else:
+                passed.append(canonical)
+        except InvalidSMILESError:
+            continue
+    features = MolecularFeatureExtractor(rdkit).extract([str(s) for s in passed])
+    return _ChunkResult(
+        passed=features.identifiers,
+        features=features.values,
+        flagged=flagged,
+        n_read=len(smiles),
+        n_invalid=len(smiles) - len(flagged) - len(features),
+    )
+
+
+class _Tally:
+    """Running counts, the dedup set, and the top-k heap of one screening run."""
+
+    def __init__(self, top_k: int) -> None:
+        self.top_k = top_k
+        self.heap: list[tuple[float, str]] = []
+        # 8-byte hashes rather than the strings: a collision among a million
+        # molecules has a probability of about 1e-8.
+        self.seen: set[int] = set()
+        self.n_read = 0
+        self.n_invalid = 0
+        self.n_duplicates = 0
+        self.n_flagged = 0
+        self.n_scored = 0
+        self.n_active = 0
+        self.total_probability = 0.0
+
+    def first_seen(self, smiles: str) -> bool:
+        key = int.from_bytes(hashlib.blake2b(smiles.encode(), digest_size=8).digest())
+        if key in self.seen:
+            self.n_duplicates += 1
+            return False
+        self.seen.add(key)
+        return True
+
+    def offer(self, smiles: str, probability: float) -> None:
+        self.n_scored += 1
+        self.n_active += probability >= 0.5
+        self.total_probability += probability
+        item = (probability, smiles)
+        if len(self.heap) < self.top_k:
+            heapq.heappush(self.heap, item)
+        elif item > self.heap[0]:
+            heapq.heapreplace(self.heap, item)
+
+
+class LibraryScreener:
+    """Streams a library file through alert filtering and a trained model.
+
+    Up to twice as many chunks as there are CPU workers are in flight at once,
+    so the workers stay busy while the parent scores finished chunks.
+    """
+
+    def __init__(
+        self,
+        rdkit: ChemistryPort,
+        model_repo: ModelRepository,
+        xgboost: XGBoostAdapter,
+        alerts: AlertCatalog,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if chunk_size < 1:
+            msg = "chunk_size must be at least 1"
+            raise ValueError(msg)
+        self._rdkit = rdkit
+        self._model_repo = model_repo
+        self._xgboost = xgboost
+        self._alerts = alerts
+        self._chunk_size = chunk_size
+
+    async def screen(
+        self,
+        path: Path,
+        model_id: str,
+        top_k: int = _DEFAULT_TOP_K,
+        smiles_column: str = "",
+    ) -> ScreeningReport:
+        if top_k < 1:
+            msg = "top_k must be at least 1"
+            raise ValueError(msg)
+        trained, artifact = await self._model_repo.load(model_id)
+        model: Any = artifact
+        n_features = getattr(model, "n_features_in_", None)
+        chunks = read_library(path, self._chunk_size, smiles_column)
+        tally = _Tally(top_k)
+        pending: set[asyncio.Future[_ChunkResult]] = set()
+        try:
+            while True:
+                chunk = await run_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                pending.add(
+                    asyncio.ensure_future(run_cpu(_prepare_chunk, self._rdkit, chunk, self._alerts))
+                )
+                if len(pending) < 2 * cpu_workers():
+                    continue
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    await self._merge(
+                        future.result(), tally, model, trained.feature_format, n_features
+                    )
+                    pending.discard(future)
+            for future in asyncio.as_completed(pending):
+                await self._merge(await future, tally, model, trained.feature_format, n_features)
+        finally:
+            for future in pending:
+                future.cancel()
+            # Retrieves the outcome of every chunk, so a failure leaves no stray exceptions.
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        ranked = sorted(tally.heap, reverse=True)
+        return ScreeningReport(
+            model_id=model_id,
+            n_read=tally.n_read,
+            n_invalid=tally.n_invalid,
+            n_duplicates=tally.n_duplicates,
+            n_flagged=tally.n_flagged,
+            n_scored=tally.n_scored,
+            n_predicted_active=tally.n_active,
+            mean_probability=tally.total_probability / tally.n_scored if tally.n_scored else 0.0,
+            hits=[
+                PredictionResult(
+                    identifier=smiles,
+                    probability=probability,
+                    rank=rank,
+                    model_type=trained.model_type,
+                )
+                for rank, (probability, smiles) in enumerate(ranked, 1)
+            ],
+        )
+
+    async def _merge(
+        self,
+        result: _ChunkResult,
+        tally: _Tally,
+        model: Any,
+        feature_format: str,
+        n_features: int | None,
+    ) -> None:
+        if n_features is not None and n_features != result.features.shape[1]:
+            msg = (
+                f"Model expects {n_features} features; screening scores "
+                f"{result.features.shape[1]}-bit Morgan fingerprints"
+            )
+            raise ValueError(msg)
+        tally.n_read += result.n_read
+        tally.n_invalid += result.n_invalid
+        tally.n_flagged += sum(tally.first_seen(s) for s in result.flagged)
+        rows = [i for i, s in enumerate(result.passed) if tally.first_seen(s)]
+        if not rows:
+            return
+        scores = await self._xgboost.predict(result.features[rows], model, feature_format)
+        for i, probability in zip(rows, scores, strict=True):
+            tally.offer(result.passed[i], probability)
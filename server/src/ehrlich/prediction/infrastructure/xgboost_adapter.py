@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import Any
 
 import numpy as np
+from scipy.sparse import csr_matrix, issparse
 from sklearn.metrics import (
     accuracy_score,
     average_precision_score,
@@ -12,53 +14,58 @@ from sklearn.metrics import (
 )
 from xgboost import XGBClassifier
 
+from ehrlich.prediction.infrastructure import permutation
+from ehrlich.workers.pool import cpu_workers, run_cpu
+
 logger = logging.getLogger(__name__)
 
+# Rows scored per predict_proba call, so layout conversion stays bounded in memory.
+_PREDICT_CHUNK_ROWS = 4096
+
 
 class XGBoostAdapter:
+    def __init__(self, permutation_budget: int = permutation.DEFAULT_BUDGET) -> None:
+        self._permutation_budget = permutation_budget
+
     async def train(
         self,
-        x_train: np.ndarray[Any, np.dtype[np.float64]],
+        x_train: np.ndarray[Any, np.dtype[np.float64]] | csr_matrix,
         y_train: np.ndarray[Any, np.dtype[np.float64]],
-        x_test: np.ndarray[Any, np.dtype[np.float64]],
+        x_test: np.ndarray[Any, np.dtype[np.float64]] | csr_matrix,
         y_test: np.ndarray[Any, np.dtype[np.float64]],
         feature_names: list[str] | None = None,
     ) -> tuple[XGBClassifier, dict[str, float], dict[str, float]]:
-        n_pos = int(y_train.sum())
-        n_neg = len(y_train) - n_pos
-        scale_pos_weight = n_neg / n_pos if n_pos > 0 else 1.0
-
-        model = XGBClassifier(
-            n_estimators=100,
-            max_depth=6,
-            learning_rate=0.1,
-            scale_pos_weight=scale_pos_weight,
-            objective="binary:logistic",
-            eval_metric="logloss",
-            random_state=42,
-            n_jobs=-1,
-        )
-        model.fit(x_train, y_train)
-
-        metrics = self._compute_metrics(model, x_test, y_test)
-        feature_importance = self._extract_feature_importance(model, feature_names)
-
-        return model, metrics, feature_importance
+        # A share of the cores per fit, so concurrent jobs in the pool don't oversubscribe them.
+        threads = max(1, (os.cpu_count() or 1) // cpu_workers())
+        return await run_cpu(_fit, x_train, y_train, x_test, y_test, feature_names, threads)
 
     async def predict(
         self,
-        x: np.ndarray[Any, np.dtype[np.float64]],
+        x: np.ndarray[Any, np.dtype[np.float64]] | csr_matrix,
         model: Any,
+        feature_format: str = "dense",
     ) -> list[float]:
-        probas: np.ndarray[Any, np.dtype[np.float64]] = model.predict_proba(x)
-        if probas.shape[1] == 1:
-            return [float(p) for p in probas[:, 0]]
-        return [float(p) for p in probas[:, 1]]
+        """Positive-class probability for each row of ``x``.
+
+        Rows are converted to ``feature_format``, the layout the model was trained
+        on, since XGBoost reads absent sparse entries as missing rather than zero.
+        """
+        scores: list[float] = []
+        for start in range(0, x.shape[0], _PREDICT_CHUNK_ROWS):
+            chunk = x[start : start + _PREDICT_CHUNK_ROWS]
+            if feature_format == "sparse" and not issparse(chunk):
+                chunk = csr_matrix(chunk, dtype=np.float32)
+            elif feature_format == "dense" and issparse(chunk):
+                chunk = chunk.toarray()
+            probas: np.ndarray[Any, np.dtype[np.float64]] = model.predict_proba(chunk)
+            column = probas[:, 0] if probas.shape[1] == 1 else probas[:, 1]
+            scores.extend(float(p) for p in column)
+        return scores
 
     @staticmethod
     def _compute_metrics(
         model: XGBClassifier,
-        x_test: np.ndarray[Any, np.dtype[np.float64]],
+        x_test: np.ndarray[Any, np.dtype[np.float64]] | csr_matrix,
         y_test: np.ndarray[Any, np.dtype[np.float64]],
     ) -> dict[str, float]:
         probas: np.ndarray[Any, np.dtype[np.float64]] = model.predict_proba(x_test)
@@ -82,50 +89,28 @@ class XGBoostAdapter:
             "f1": float(f1_score(y_test, y_pred, zero_division=0.0)),
         }
 
-    @staticmethod
-    def permutation_test(
-        x_train: np.ndarray[Any, np.dtype[np.float64]],
+    async def permutation_test(
+        self,
+        x_train: np.ndarray[Any, np.dtype[np.float64]] | csr_matrix,
         y_train: np.ndarray[Any, np.dtype[np.float64]],
-        x_test: np.ndarray[Any, np.dtype[np.float64]],
+        x_test: np.ndarray[Any, np.dtype[np.float64]] | csr_matrix,
         y_test: np.ndarray[Any, np.dtype[np.float64]],
         original_auroc: float,
-        n_permutations: int = 100,
-    ) -> float:
+        n_permutations: int | None = None,
+    ) -> permutation.PermutationResult:
         """Y-scrambling permutation test (Phipson & Smyth 2010).
 
-        Returns p-value: fraction of permuted models with AUROC >= original.
+        Runs up to ``n_permutations`` (default: the adapter's budget) refits in
+        parallel, stopping early once the p-value is clearly above or below 0.05.
         """
-        rng = np.random.RandomState(42)
-        count_ge = 0
-        n_pos = int(y_train.sum())
-        n_neg = len(y_train) - n_pos
-        scale_pos_weight = n_neg / n_pos if n_pos > 0 else 1.0
-
-        for _ in range(n_permutations):
-            y_perm = rng.permutation(y_train)
-            if len(set(y_perm)) < 2:
-                continue
-            model = XGBClassifier(
-                n_estimators=50,
-                max_depth=4,
-                learning_rate=0.1,
-                scale_pos_weight=scale_pos_weight,
-                objective="binary:logistic",
-                eval_metric="logloss",
-                random_state=42,
-                n_jobs=-1,
-            )
-            model.fit(x_train, y_perm)
-            try:
-                probas = model.predict_proba(x_test)
-                y_pred_proba = probas[:, 1] if probas.shape[1] > 1 else probas[:, 0]
-                perm_auroc = float(roc_auc_score(y_test, y_pred_proba))
-            except ValueError:
-                perm_auroc = 0.0
-            if perm_auroc >= original_auroc:
-                count_ge += 1
-
-        return (count_ge + 1) / (n_permutations + 1)
+        return await permutation.permutation_test(
+            x_train,
+            y_train,
+            x_test,
+            y_test,
+            original_auroc,
+            budget=self._permutation_budget if n_permutations is None else n_permutations,
+        )
 
     @staticmethod
     def _extract_feature_importance(
@@ -141,3 +126,34 @@ class XGBoostAdapter:
                 if importances[i] > 0 and i < len(feature_names)
             }
         return {f"feature_{i}": float(importances[i]) for i in top_indices if importances[i] > 0}
+
+
+def _fit(
+    x_train: np.ndarray[Any, np.dtype[np.float64]] | csr_matrix,
+    y_train: np.ndarray[Any, np.dtype[np.float64]],
+    x_test: np.ndarray[Any, np.dtype[np.float64]] | csr_matrix,
+    y_test: np.ndarray[Any, np.dtype[np.float64]],
+    feature_names: list[str] | None,
+    threads: int,
+) -> tuple[XGBClassifier, dict[str, float], dict[str, float]]:
+    n_pos = int(y_train.sum())
+    n_neg = len(y_train) - n_pos
+    scale_pos_weight = n_neg / n_pos if n_pos > 0 else 1.0
+
+    model = XGBClassifier(
+        n_estimators=100,
+        max_depth=6,
+        learning_rate=0.1,
+        scale_pos_weight=scale_pos_weight,
+        objective="binary:logistic",
+        eval_metric="logloss",
+        tree_method="hist",
+        random_state=42,
+        n_jobs=threads,
+    )
+    model.fit(x_train, y_train)
+
+    metrics = XGBoostAdapter._compute_metrics(model, x_test, y_test)
+    feature_importance = XGBoostAdapter._extract_feature_importance(model, feature_names)
+
+    return model, metrics, feature_importance
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import json
+from pathlib import Path
 
 from ehrlich.analysis.infrastructure.chembl_loader import ChEMBLLoader
+from ehrlich.chemistry.infrastructure.alert_catalog import load_alert_catalog
+from ehrlich.chemistry.infrastructure.feature_store import shared_feature_store
 from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+from ehrlich.config import get_settings
 from ehrlich.kernel.types import SMILES
 from ehrlich.prediction.application.prediction_service import PredictionService
 from ehrlich.prediction.infrastructure.generic_adapters import (
     DistanceClusterer,
     RandomSplitter,
+    read_tabular_features,
+    tabular_features,
 )
 from ehrlich.prediction.infrastructure.model_store import ModelStore
 from ehrlich.prediction.infrastructure.molecular_adapters import (
@@ -16,12 +22,19 @@ from ehrlich.prediction.infrastructure.molecular_adapters import (
     MolecularFeatureExtractor,
     ScaffoldSplitter,
 )
+from ehrlich.prediction.infrastructure.screening import LibraryScreener, resolve_library
 from ehrlich.prediction.infrastructure.xgboost_adapter import XGBoostAdapter
-
-_rdkit: RDKitAdapter = RDKitAdapter()
-_xgboost = XGBoostAdapter()
-_model_store = ModelStore()
-_dataset_repo = ChEMBLLoader()
+from ehrlich.shared.alerts import AlertCatalog
+from ehrlich.workers.pool import run_thread
+
+_rdkit: RDKitAdapter = RDKitAdapter(store=shared_feature_store())
+_settings = get_settings()
+_xgboost = XGBoostAdapter(permutation_budget=_settings.permutation_budget)
+_model_store = ModelStore(Path(_settings.models_dir), cache_mb=_settings.model_cache_mb)
+_dataset_repo = ChEMBLLoader(
+    max_activities=_settings.chembl_max_activities,
+    concurrency=_settings.chembl_page_concurrency,
+)
 
 _mol_features = MolecularFeatureExtractor(_rdkit)
 _scaffold_splitter = ScaffoldSplitter(_rdkit)
@@ -34,6 +47,10 @@ _service = PredictionService(
     xgboost=_xgboost,
 )
 
+_DEFAULT_SCREENING_ALERTS = "mutagenic,hepatotoxic"
+# Identifiers listed per cluster by cluster_data; larger clusters are truncated.
+_MAX_LISTED_IDENTIFIERS = 100
+
 
 # ---------------------------------------------------------------------------
 # Molecular tools (domain-specific, tagged "prediction")
@@ -53,16 +70,15 @@ async def train_model(target: str, model_type: str = "xgboost") -> str:
             raise ValueError(f"Dataset too small for training: {dataset.size} compounds")
 
         smiles_strs = [str(s) for s in dataset.smiles_list]
-        features, valid_ids = _mol_features.extract(smiles_strs)
+        features = _mol_features.extract(smiles_strs)
 
         # Match labels to valid identifiers preserving order
         smiles_to_idx = {str(s): i for i, s in enumerate(dataset.smiles_list)}
-        labels = [dataset.activities[smiles_to_idx[vid]] for vid in valid_ids]
+        labels = [dataset.activities[smiles_to_idx[vid]] for vid in features.identifiers]
 
         trained = await _service.train(
             features,
             labels,
-            valid_ids,
             target,
             splitter=_scaffold_splitter,
             comparison_splitter=_random_splitter,
@@ -92,9 +108,9 @@ async def predict_candidates(smiles_list: list[str], model_id: str) -> str:
     """
     typed_smiles = [SMILES(s) for s in smiles_list]
     smiles_strs = [str(s) for s in typed_smiles]
-    features, valid_ids = _mol_features.extract(smiles_strs)
+    features = _mol_features.extract(smiles_strs)
     try:
-        results = await _service.predict(features, valid_ids, model_id)
+        results = await _service.predict(features, model_id)
     except (FileNotFoundError, KeyError) as e:
         return json.dumps({"error": f"Model not found: {model_id}", "detail": str(e)})
     return json.dumps(
@@ -114,6 +130,69 @@ async def predict_candidates(smiles_list: list[str], model_id: str) -> str:
     )
 
 
+async def screen_library(
+    library: str,
+    model_id: str,
+    top_k: int = 50,
+    smiles_column: str = "",
+    alert_categories: str = _DEFAULT_SCREENING_ALERTS,
+) -> str:
+    """Screen a large compound library file with a trained model, returning only the top hits.
+
+    Streams the library in chunks: invalid SMILES and duplicates are dropped,
+    molecules matching a structural alert are filtered out, and the rest are
+    scored. Use this instead of predict_candidates for libraries of thousands to
+    millions of compounds.
+
+    Args:
+        library: ID of an uploaded .smi/.csv file, or a file name in the screening library
+            directory
+        model_id: ID of trained model to use
+        top_k: Number of best-scoring compounds to return
+        smiles_column: SMILES column of a CSV library (detected from the header if empty)
+        alert_categories: Comma-separated alert categories to filter out (empty to keep all)
+    """
+    categories = {c.strip() for c in alert_categories.split(",") if c.strip()}
+    screener = LibraryScreener(
+        _rdkit,
+        _model_store,
+        _xgboost,
+        AlertCatalog(a for a in load_alert_catalog() if a.category in categories),
+        chunk_size=_settings.screening_chunk_size,
+    )
+    try:
+        path = resolve_library(
+            library, Path(_settings.screening_library_dir), Path(_settings.upload_dir)
+        )
+        report = await screener.screen(path, model_id, top_k=top_k, smiles_column=smiles_column)
+    except FileNotFoundError as e:
+        return json.dumps({"error": f"Model not found: {model_id}", "detail": str(e)})
+    except ValueError as e:
+        return json.dumps({"error": str(e), "library": library, "model_id": model_id})
+    return json.dumps(
+        {
+            "model_id": model_id,
+            "library": library,
+            "n_read": report.n_read,
+            "n_invalid": report.n_invalid,
+            "n_duplicates": report.n_duplicates,
+            "n_flagged": report.n_flagged,
+            "alert_categories": sorted(categories),
+            "n_scored": report.n_scored,
+            "n_predicted_active": report.n_predicted_active,
+            "mean_probability": round(report.mean_probability, 4),
+            "hits": [
+                {
+                    "rank": r.rank,
+                    "smiles": r.identifier,
+                    "probability": round(r.probability, 4),
+                }
+                for r in report.hits
+            ],
+        }
+    )
+
+
 async def cluster_compounds(smiles_list: list[str], n_clusters: int = 5) -> str:
     """Cluster compounds by structural similarity using Butina clustering.
 
@@ -122,8 +201,8 @@ async def cluster_compounds(smiles_list: list[str], n_clusters: int = 5) -> str:
         n_clusters: Maximum number of clusters
     """
     smiles_strs = [str(SMILES(s)) for s in smiles_list]
-    features, valid_ids = _mol_features.extract(smiles_strs)
-    clusters = await _service.cluster(features, valid_ids, n_clusters, _mol_clusterer)
+    features = _mol_features.extract(smiles_strs)
+    clusters = await _service.cluster(features, n_clusters, _mol_clusterer)
     return json.dumps(
         {
             "n_clusters": len(clusters),
@@ -182,7 +261,6 @@ async def train_classifier(
             }
         )
 
-    features = [feature_values[i * n_features : (i + 1) * n_features] for i in range(n_samples)]
     ids = (
         [s.strip() for s in identifiers.split(",")]
         if identifiers
@@ -190,10 +268,10 @@ async def train_classifier(
     )
 
     try:
+        features = tabular_features(feature_values, n_features, ids)
         trained = await _service.train(
             features,
             labels,
-            ids,
             target_name,
             splitter=_random_splitter,
             comparison_splitter=_random_splitter,
@@ -246,7 +324,6 @@ async def predict_scores(
             }
         )
 
-    features = [feature_values[i * n_features : (i + 1) * n_features] for i in range(n_samples)]
     ids = (
         [s.strip() for s in identifiers.split(",")]
         if identifiers
@@ -254,9 +331,12 @@ async def predict_scores(
     )
 
     try:
-        results = await _service.predict(features, ids, model_id)
+        features = tabular_features(feature_values, n_features, ids)
+        results = await _service.predict(features, model_id)
     except (FileNotFoundError, KeyError) as e:
         return json.dumps({"error": f"Model not found: {model_id}", "detail": str(e)})
+    except ValueError as e:
+        return json.dumps({"error": str(e), "model_id": model_id})
 
     return json.dumps(
         {
@@ -280,48 +360,76 @@ async def cluster_data(
     feature_values: list[float],
     n_clusters: int = 5,
     identifiers: str = "",
+    dataset: str = "",
+    id_column: str = "",
 ) -> str:
-    """Cluster samples by feature similarity using hierarchical clustering.
+    """Cluster samples by feature similarity.
 
-    Accepts a flat feature matrix and groups samples into clusters using
-    Ward linkage.
+    Accepts a flat feature matrix, or the columns of an uploaded CSV for
+    datasets too large to pass inline. Uses Ward linkage for small sets and
+    mini-batch k-means for large ones. Returns each cluster's size, centroid,
+    and members (up to 100 listed per cluster), plus a silhouette estimate.
 
     Args:
-        feature_names: Column names for the feature matrix
-        feature_values: Flattened row-major feature matrix
+        feature_names: Column names for the feature matrix (the CSV columns to use with dataset)
+        feature_values: Flattened row-major feature matrix (empty when using dataset)
         n_clusters: Number of clusters to create
         identifiers: Comma-separated sample identifiers (auto-generated if empty)
+        dataset: ID of an uploaded .csv file, or a file name in the library directory
+        id_column: CSV column holding sample identifiers (row numbers if empty)
     """
     n_features = len(feature_names)
     if n_features == 0:
         return json.dumps({"error": "feature_names cannot be empty"})
 
-    n_samples = len(feature_values) // n_features if n_features else 0
-    if n_features and len(feature_values) % n_features != 0:
-        return json.dumps(
-            {
-                "error": f"feature_values length {len(feature_values)} is not "
-                f"divisible by n_features ({n_features})"
-            }
-        )
+    if dataset:
+        try:
+            path = resolve_library(
+                dataset, Path(_settings.screening_library_dir), Path(_settings.upload_dir)
+            )
+            # Thread lane: reading a large table is I/O and pandas parsing, not worth a process.
+            features = await run_thread(read_tabular_features, path, feature_names, id_column)
+        except ValueError as e:
+            return json.dumps({"error": str(e), "dataset": dataset})
+    else:
+        n_samples = len(feature_values) // n_features
+        if len(feature_values) % n_features != 0:
+            return json.dumps(
+                {
+                    "error": f"feature_values length {len(feature_values)} is not "
+                    f"divisible by n_features ({n_features})"
+                }
+            )
 
-    features = [feature_values[i * n_features : (i + 1) * n_features] for i in range(n_samples)]
-    ids = (
-        [s.strip() for s in identifiers.split(",")]
-        if identifiers
-        else [f"sample_{i}" for i in range(n_samples)]
-    )
+        ids = (
+            [s.strip() for s in identifiers.split(",")]
+            if identifiers
+            else [f"sample_{i}" for i in range(n_samples)]
+        )
+        try:
+            features = tabular_features(feature_values, n_features, ids)
+        except ValueError as e:
+            return json.dumps({"error": str(e)})
 
-    clusters = await _service.cluster(features, ids, n_clusters, _distance_clusterer)
+    result = await _service.cluster_with_summary(features, n_clusters, _distance_clusterer)
     return json.dumps(
         {
-            "n_clusters": len(clusters),
+            "method": result.method,
+            "n_samples": len(features),
+            "n_clusters": len(result.clusters),
+            "silhouette": round(result.silhouette, 4) if result.silhouette is not None else None,
+            "silhouette_sample": result.silhouette_sample,
             "clusters": {
                 str(k): {
                     "size": len(v),
-                    "identifiers": v,
+                    "centroid": {
+                        name: round(value, 4)
+                        for name, value in zip(feature_names, result.centroids[k], strict=True)
+                    },
+                    "identifiers": v[:_MAX_LISTED_IDENTIFIERS],
+                    "identifiers_truncated": len(v) > _MAX_LISTED_IDENTIFIERS,
                 }
-                for k, v in clusters.items()
+                for k, v in result.clusters.items()
             },
         }
     )
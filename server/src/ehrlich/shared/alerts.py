@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+@dataclass(frozen=True)
+class StructuralAlert:
+    """A named SMARTS pattern. ``targets`` lists the protein targets it applies to, if any."""
+
+    name: str
+    smarts: str
+    category: str
+    description: str = ""
+    targets: tuple[str, ...] = ()
+
+
+class AlertCatalog:
+    """An ordered, immutable set of alerts matched together.
+
+    Matching returns a hit bitmap: bit ``i`` is set when ``alerts[i]`` matched.
+    Compare it against ``mask(...)`` to test a whole category at once.
+    Catalogs hash by identity, so adapters can keep compiled patterns per catalog.
+    """
+
+    def __init__(self, alerts: Iterable[StructuralAlert]) -> None:
+        self.alerts: tuple[StructuralAlert, ...] = tuple(alerts)
+        self._masks: dict[tuple[str | None, str | None], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.alerts)
+
+    def __iter__(self) -> Iterator[StructuralAlert]:
+        return iter(self.alerts)
+
+    def mask(self, category: str | None = None, target: str | None = None) -> int:
+        """Bits of the alerts in ``category`` (any if None) that apply to ``target``."""
+        key = (category, target)
+        if key not in self._masks:
+            self._masks[key] = sum(
+                1 << i
+                for i, alert in enumerate(self.alerts)
+                if (category is None or alert.category == category)
+                and (target is None or target in alert.targets)
+            )
+        return self._masks[key]
+
+    def matched(self, bitmap: int) -> list[StructuralAlert]:
+        return [alert for i, alert in enumerate(self.alerts) if bitmap >> i & 1]
+
+    def select(self, category: str) -> AlertCatalog:
+        """A catalog holding only ``category``, in the same order."""
+        return AlertCatalog(a for a in self.alerts if a.category == category)
@@ -4,10 +4,17 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+    from numpy.typing import NDArray
+
     from ehrlich.kernel.types import SMILES, InChIKey
+    from ehrlich.shared.alerts import AlertCatalog
     from ehrlich.shared.conformer import Conformer3D
-    from ehrlich.shared.descriptors import MolecularDescriptors
-    from ehrlich.shared.fingerprint import Fingerprint
+    from ehrlich.shared.descriptors import DescriptorMatrix, MolecularDescriptors
+    from ehrlich.shared.fingerprint import Fingerprint, FingerprintMatrix
+    from ehrlich.shared.substructure import SubstructureMatrix
 
 
 class ChemistryPort(ABC):
@@ -26,11 +33,44 @@ class ChemistryPort(ABC):
     @abstractmethod
     def compute_fingerprint(self, smiles: SMILES, fp_type: str = "morgan") -> Fingerprint: ...
 
+    @abstractmethod
+    def compute_descriptors_batch(self, smiles: Sequence[SMILES]) -> DescriptorMatrix: ...
+
+    @abstractmethod
+    def compute_fingerprints_batch(
+        self, smiles: Sequence[SMILES], fp_type: str = "morgan"
+    ) -> FingerprintMatrix: ...
+
+    @abstractmethod
+    def substructure_matrix(
+        self, smiles: Sequence[SMILES], patterns: Sequence[str]
+    ) -> SubstructureMatrix: ...
+
+    @abstractmethod
+    def match_alerts(self, smiles: SMILES, catalog: AlertCatalog) -> int: ...
+
+    @abstractmethod
+    def alert_matrix(
+        self, smiles: Sequence[SMILES], catalog: AlertCatalog
+    ) -> SubstructureMatrix: ...
+
     @abstractmethod
     def tanimoto_similarity(self, fp1: Fingerprint, fp2: Fingerprint) -> float: ...
 
     @abstractmethod
-    def generate_conformer(self, smiles: SMILES) -> Conformer3D: ...
+    def tanimoto_one_to_many(
+        self, query: Fingerprint, fingerprints: FingerprintMatrix
+    ) -> NDArray[np.float64]: ...
+
+    @abstractmethod
+    def tanimoto_matrix(
+        self, a: FingerprintMatrix, b: FingerprintMatrix | None = None
+    ) -> NDArray[np.float64]: ...
+
+    @abstractmethod
+    def generate_conformer(
+        self, smiles: SMILES, num_conformers: int = 10, num_threads: int = 0
+    ) -> Conformer3D: ...
 
     @abstractmethod
     def substructure_match(self, smiles: SMILES, pattern: str) -> tuple[bool, tuple[int, ...]]: ...
@@ -41,7 +81,15 @@ class ChemistryPort(ABC):
     @abstractmethod
     def murcko_scaffold(self, smiles: SMILES) -> str: ...
 
+    @abstractmethod
+    def murcko_scaffolds_batch(self, smiles: Sequence[SMILES]) -> list[str | None]: ...
+
     @abstractmethod
     def butina_cluster(
         self, fingerprints: list[Fingerprint], cutoff: float = 0.35
     ) -> list[list[int]]: ...
+
+    @abstractmethod
+    def cluster_fingerprints(
+        self, fingerprints: FingerprintMatrix, cutoff: float = 0.35, method: str = "butina"
+    ) -> list[list[int]]: ...
@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+    from numpy.typing import NDArray
 
 
 @dataclass(frozen=True)
@@ -14,6 +21,21 @@ class MolecularDescriptors:
     qed: float = 0.0
     num_rings: int = 0
 
+    @classmethod
+    def from_row(cls, values: Sequence[float]) -> MolecularDescriptors:
+        """Rebuild from one row of values in ``DESCRIPTOR_COLUMNS`` order."""
+        row = dict(zip(DESCRIPTOR_COLUMNS, values, strict=True))
+        return cls(
+            molecular_weight=float(row["molecular_weight"]),
+            logp=float(row["logp"]),
+            tpsa=float(row["tpsa"]),
+            hbd=int(row["hbd"]),
+            hba=int(row["hba"]),
+            rotatable_bonds=int(row["rotatable_bonds"]),
+            qed=float(row["qed"]),
+            num_rings=int(row["num_rings"]),
+        )
+
     @property
     def passes_lipinski(self) -> bool:
         violations = sum(
@@ -25,3 +47,19 @@ class MolecularDescriptors:
             ]
         )
         return violations <= 1
+
+
+DESCRIPTOR_COLUMNS: tuple[str, ...] = tuple(f.name for f in fields(MolecularDescriptors))
+
+
+@dataclass(frozen=True)
+class DescriptorMatrix:
+    """Descriptors for a batch, one row per input SMILES in ``DESCRIPTOR_COLUMNS`` order.
+
+    Rows that failed are NaN, flagged False in ``valid``, and explained in ``errors``.
+    """
+
+    values: NDArray[np.float64]
+    valid: NDArray[np.bool_]
+    errors: dict[int, str] = field(default_factory=dict)
+    columns: tuple[str, ...] = DESCRIPTOR_COLUMNS
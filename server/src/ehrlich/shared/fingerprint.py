@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
 
 
 @dataclass(frozen=True)
@@ -9,3 +14,19 @@ class Fingerprint:
     fp_type: str = "morgan"
     radius: int = 2
     n_bits: int = 2048
+
+
+@dataclass(frozen=True)
+class FingerprintMatrix:
+    """Fingerprints for a batch, packed into uint64 words, one row per input SMILES.
+
+    ``words`` has shape ``(n, ceil(n_bits / 64))`` with bit ``k`` at word
+    ``k // 64``, position ``k % 64``. Rows that failed are all zero, flagged
+    False in ``valid``, and explained in ``errors``.
+    """
+
+    words: NDArray[np.uint64]
+    valid: NDArray[np.bool_]
+    fp_type: str = "morgan"
+    n_bits: int = 2048
+    errors: dict[int, str] = field(default_factory=dict)
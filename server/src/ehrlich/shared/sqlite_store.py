@@ -0,0 +1,72 @@
+"""Base for the size-capped caches kept in a single SQLite file."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class SQLiteStore:
+    """One WAL-mode SQLite connection behind a lock, trimmed to ``max_entries`` rows.
+
+    Subclasses name their ``_table``, its ``_schema``, and the ``_recency``
+    timestamp column that orders rows for trimming, then run their queries on
+    ``_conn`` while holding ``_lock``. Stores that ``_touch`` rows on read are
+    trimmed least recently used first. Methods block; call them from a thread.
+    """
+
+    _table: ClassVar[str]
+    _schema: ClassVar[str]
+    _recency: ClassVar[str]
+
+    def __init__(self, path: Path, max_entries: int) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self._schema)
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": self.count(),
+            "max_entries": self._max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def count(self) -> int:
+        with self._lock:
+            row = self._conn.execute(f"SELECT COUNT(*) FROM {self._table}").fetchone()
+            return int(row[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _execute(self, sql: str, params: tuple[object, ...]) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+            self._conn.commit()
+
+    def _touch(self, where: str, params: tuple[object, ...]) -> None:
+        """Stamp the rows matching ``where`` as used now. Caller holds ``_lock``."""
+        self._conn.execute(
+            f"UPDATE {self._table} SET {self._recency} = ? WHERE {where}", (time.time(), *params)
+        )
+
+    def _trim(self) -> None:
+        """Keep only the ``max_entries`` most recent rows. Caller holds ``_lock``."""
+        self._conn.execute(
+            f"DELETE FROM {self._table} WHERE rowid IN (SELECT rowid FROM {self._table} "
+            f"ORDER BY {self._recency} DESC LIMIT -1 OFFSET ?)",
+            (self._max_entries,),
+        )
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+
+@dataclass(frozen=True)
+class SubstructureMatrix:
+    """Substructure hits for a batch: ``hits[i, j]`` is True if SMILES ``i`` matches pattern ``j``.
+
+    Rows that failed are all False, flagged False in ``valid``, and explained
+    in ``errors``. Patterns that fail to parse match nothing.
+    """
+
+    hits: NDArray[np.bool_]
+    valid: NDArray[np.bool_]
+    patterns: tuple[str, ...] = ()
+    errors: dict[int, str] = field(default_factory=dict)
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from ehrlich.kernel.exceptions import EhrlichError, JobCancelledError
+from ehrlich.kernel.types import SMILES
+from ehrlich.simulation.domain.docking_job import DockingJob, DockingJobStatus
+from ehrlich.simulation.domain.docking_result import DockingResult, interpret_energy
+from ehrlich.simulation.infrastructure import vina_docking
+from ehrlich.simulation.infrastructure.docking_cache import CachedDocking, DockingKey
+from ehrlich.workers.pool import WorkerPool, job_group
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from ehrlich.shared.chemistry_port import ChemistryPort
+    from ehrlich.simulation.domain.protein_target import ProteinTarget
+    from ehrlich.simulation.infrastructure.docking_cache import DockingCache
+    from ehrlich.simulation.infrastructure.protein_store import ProteinStore
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PROCESSES = 2
+_EXHAUSTIVENESS = 8
+_N_POSES = 5
+# Finished jobs kept for status and event replay before the oldest are dropped.
+_MAX_FINISHED_JOBS = 100
+
+
+def estimate_docking(rdkit: ChemistryPort, smiles: SMILES, target_id: str) -> DockingResult:
+    """Binding energy from a QED + LogP heuristic, for when Vina or the receptor is missing."""
+    desc = rdkit.compute_descriptors(smiles)
+    energy = round(-1.0 * (desc.qed * 7.0 + min(desc.logp, 5.0) * 0.6 + 1.5), 2)
+    energy = max(-12.0, min(-2.0, energy))
+    return DockingResult(
+        smiles=smiles,
+        target_id=target_id,
+        binding_energy=energy,
+        pose_rmsd=0.0,
+        interactions={
+            "method": ["rdkit_estimate"],
+            "interpretation": [interpret_energy(energy)],
+            "note": ["Estimated from molecular descriptors (QED + LogP heuristic)"],
+        },
+    )
+
+
+class DockingScheduler:
+    """Docks ligands against local PDBQT receptors without blocking the event loop.
+
+    Submitted ligand x target pairs go into one FIFO queue shared by all jobs,
+    drained by as many consumer tasks as the dedicated process pool has
+    workers. Each pair docks with AutoDock Vina in that pool when Vina is
+    installed and the receptor file exists, and falls back to the descriptor
+    estimate otherwise. Vina results are cached by ``(InChIKey, pdb_id, box,
+    engine settings)``.
+
+    Every job keeps an append-only event log for progress streaming.
+    Cancelling a job skips its queued pairs and discards the results of its
+    running ones.
+    """
+
+    def __init__(
+        self,
+        proteins: ProteinStore,
+        rdkit: ChemistryPort,
+        cache: DockingCache | None = None,
+        pool: WorkerPool | None = None,
+        exhaustiveness: int = _EXHAUSTIVENESS,
+        n_poses: int = _N_POSES,
+    ) -> None:
+        self._proteins = proteins
+        self._rdkit = rdkit
+        self._cache = cache
+        self._pool = pool or WorkerPool(processes=_DEFAULT_PROCESSES, threads=1)
+        self._exhaustiveness = exhaustiveness
+        self._n_poses = n_poses
+        self._variant = vina_docking.engine_variant(exhaustiveness, n_poses)
+        self._jobs: OrderedDict[str, DockingJob] = OrderedDict()
+        self._signals: dict[str, asyncio.Event] = {}
+        self._queue: asyncio.Queue[tuple[DockingJob, SMILES, str]] | None = None
+        self._consumers: list[asyncio.Task[None]] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def dock(self, smiles: SMILES, target_id: str) -> DockingResult:
+        """Dock one pair right away, bypassing the job queue."""
+        target = self._proteins.get_target(target_id)
+        receptor = await self._receptor(target)
+        if receptor is None:
+            return await self._pool.run_thread(estimate_docking, self._rdkit, smiles, target.pdb_id)
+
+        key = DockingKey(
+            inchikey=str(self._rdkit.to_inchikey(smiles)),
+            pdb_id=target.pdb_id,
+            box=target.box.key,
+            variant=self._variant,
+        )
+        if self._cache is not None:
+            cached = await self._pool.run_thread(self._cache.get, key)
+            if cached is not None:
+                return self._result(smiles, target.pdb_id, cached)
+
+        energy, pose = await self._pool.run_cpu(
+            vina_docking.dock_ligand,
+            str(smiles),
+            receptor,
+            target.box,
+            self._exhaustiveness,
+            self._n_poses,
+        )
+        docked = CachedDocking(
+            binding_energy=round(energy, 3),
+            pose=pose,
+            interactions={
+                "method": ["autodock_vina"],
+                "interpretation": [interpret_energy(energy)],
+                "engine": [self._variant],
+            },
+        )
+        if self._cache is not None:
+            await self._pool.run_thread(self._cache.put, key, docked)
+        return self._result(smiles, target.pdb_id, docked)
+
+    def submit(
+        self, ligands: Sequence[SMILES], targets: Sequence[str], owner: str = ""
+    ) -> DockingJob:
+        """Queue every ligand against every target. Unknown targets fail the whole job."""
+        pdb_ids = tuple(self._proteins.get_target(t).pdb_id for t in targets)
+        job = DockingJob(id=uuid.uuid4().hex, ligands=tuple(ligands), targets=pdb_ids, owner=owner)
+        self._jobs[job.id] = job
+        self._forget_old_jobs()
+        queue = self._ensure_consumers()
+        for smiles in job.ligands:
+            for pdb_id in job.targets:
+                queue.put_nowait((job, SMILES(smiles), pdb_id))
+        self._emit(job, {"type": "docking_queued", "total": job.total})
+        if job.total == 0:
+            self._finish(job, DockingJobStatus.COMPLETED)
+        return job
+
+    def get(self, job_id: str) -> DockingJob | None:
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> DockingJob | None:
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return job
+        self._finish(job, DockingJobStatus.CANCELLED)
+        self._pool.cancel_group(job.id)
+        return job
+
+    async def events(self, job_id: str, after: int = 0) -> AsyncIterator[dict[str, Any]]:
+        """Replay the job's events from index ``after``, then follow until it finishes."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        sent = after
+        while True:
+            while sent < len(job.events):
+                yield job.events[sent]
+                sent += 1
+            if job.finished:
+                return
+            await self._signals.setdefault(job.id, asyncio.Event()).wait()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "vina_available": vina_docking.is_available(),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "jobs": len(self._jobs),
+            "active_jobs": sum(1 for job in self._jobs.values() if not job.finished),
+            "pool": self._pool.stats(),
+            "cache": self._cache.stats() if self._cache is not None else None,
+        }
+
+    async def shutdown(self) -> None:
+        """Cancel the consumers, wait for them to exit, and stop the process pool."""
+        consumers, self._consumers = self._consumers, []
+        for task in consumers:
+            task.cancel()
+        if consumers and self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*consumers, return_exceptions=True)
+        self._queue = None
+        self._loop = None
+        self._pool.shutdown()
+
+    async def _receptor(self, target: ProteinTarget) -> str | None:
+        if not vina_docking.is_available():
+            return None
+        try:
+            return await self._proteins.get_pdbqt(target.pdb_id)
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _result(smiles: SMILES, target_id: str, docked: CachedDocking) -> DockingResult:
+        return DockingResult(
+            smiles=smiles,
+            target_id=target_id,
+            binding_energy=docked.binding_energy,
+            interactions=docked.interactions,
+            pose=docked.pose,
+        )
+
+    def _ensure_consumers(self) -> asyncio.Queue[tuple[DockingJob, SMILES, str]]:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._consumers = [
+                loop.create_task(self._consume(self._queue))
+                for _ in range(max(1, self._pool.cpu_workers))
+            ]
+        return self._queue
+
+    async def _consume(self, queue: asyncio.Queue[tuple[DockingJob, SMILES, str]]) -> None:
+        while True:
+            job, smiles, target_id = await queue.get()
+            if job.finished:
+                continue
+            job.status = DockingJobStatus.RUNNING
+            event: dict[str, Any] = {
+                "type": "docking_pair",
+                "smiles": smiles,
+                "target_id": target_id,
+            }
+            try:
+                with job_group(job.id):
+                    result = await self.dock(smiles, target_id)
+            except JobCancelledError:
+                continue
+            except EhrlichError as e:
+                job.errors.append({"smiles": smiles, "target_id": target_id, "error": str(e)})
+                event["error"] = str(e)
+            except Exception as e:
+                logger.warning("Docking %s against %s failed", smiles, target_id, exc_info=True)
+                job.errors.append({"smiles": smiles, "target_id": target_id, "error": str(e)})
+                event["error"] = str(e)
+            else:
+                job.results.append(result)
+                event["binding_energy"] = result.binding_energy
+                event["method"] = result.interactions.get("method", [""])[0]
+            if job.finished:
+                continue
+            self._emit(job, {**event, "done": job.done, "total": job.total})
+            if job.done == job.total:
+                self._finish(job, DockingJobStatus.COMPLETED)
+
+    def _finish(self, job: DockingJob, status: DockingJobStatus) -> None:
+        job.status = status
+        job.finished_at = time.time()
+        self._emit(job, {"type": f"docking_{status.value}", "done": job.done, "total": job.total})
+
+    def _emit(self, job: DockingJob, event: dict[str, Any]) -> None:
+        job.events.append({"seq": len(job.events), **event})
+        signal = self._signals.pop(job.id, None)
+        if signal is not None:
+            signal.set()
+
+    def _forget_old_jobs(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - _MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+
+@functools.cache
+def shared_docking_scheduler() -> DockingScheduler:
+    """The process-wide scheduler used by the docking tool and ``/docking`` routes."""
+    from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+    from ehrlich.config import get_settings
+    from ehrlich.simulation.infrastructure.docking_cache import shared_docking_cache
+    from ehrlich.simulation.infrastructure.protein_store import ProteinStore
+
+    settings = get_settings()
+    return DockingScheduler(
+        ProteinStore(),
+        RDKitAdapter(),
+        cache=shared_docking_cache(),
+        pool=WorkerPool(processes=settings.docking_processes, threads=1),
+        exhaustiveness=settings.docking_exhaustiveness,
+    )
+
+
+async def shutdown_docking() -> None:
+    """Stop the shared scheduler's consumers and pool, if it was ever created."""
+    if shared_docking_scheduler.cache_info().currsize:
+        await shared_docking_scheduler().shutdown()
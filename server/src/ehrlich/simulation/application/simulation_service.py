@@ -6,13 +6,16 @@ from typing import TYPE_CHECKING
 
 import yaml
 
-from ehrlich.simulation.domain.docking_result import DockingResult
+from ehrlich.simulation.application.docking_scheduler import estimate_docking
 from ehrlich.simulation.domain.resistance_assessment import MutationRisk, ResistanceAssessment
 
 if TYPE_CHECKING:
     from ehrlich.kernel.types import SMILES
+    from ehrlich.shared.alerts import AlertCatalog
     from ehrlich.shared.chemistry_port import ChemistryPort
+    from ehrlich.simulation.application.docking_scheduler import DockingScheduler
     from ehrlich.simulation.domain.admet_profile import ADMETProfile
+    from ehrlich.simulation.domain.docking_result import DockingResult
     from ehrlich.simulation.domain.protein_annotation import ProteinAnnotation
     from ehrlich.simulation.domain.protein_target import ProteinTarget
     from ehrlich.simulation.domain.repository import (
@@ -31,33 +34,17 @@ logger = logging.getLogger(__name__)
 _RESISTANCE_YAML = Path(__file__).resolve().parents[5] / "data" / "resistance" / "default.yaml"
 
 
-def _load_resistance_data(
-    yaml_path: Path,
-) -> tuple[dict[str, list[tuple[str, str, str]]], dict[str, list[str]]]:
+def _load_known_mutations(yaml_path: Path) -> dict[str, list[tuple[str, str, str]]]:
+    """Known resistance mutations per target; the YAML's patterns go to the alert catalog."""
     if not yaml_path.exists():
         logger.warning("Resistance YAML not found: %s", yaml_path)
-        return {}, {}
+        return {}
     with open(yaml_path) as f:
         data = yaml.safe_load(f)
-    mutations: dict[str, list[tuple[str, str, str]]] = {}
-    for target_id, entries in data.get("mutations", {}).items():
-        mutations[target_id] = [
-            (str(e["mutation"]), str(e["risk"]), str(e["mechanism"])) for e in entries
-        ]
-    patterns: dict[str, list[str]] = {}
-    for smarts, info in data.get("patterns", {}).items():
-        patterns[str(smarts)] = [str(t) for t in info.get("targets", [])]
-    return mutations, patterns
-
-
-def _interpret_energy(energy: float) -> str:
-    if energy <= -10.0:
-        return "excellent"
-    if energy <= -8.0:
-        return "strong"
-    if energy <= -6.0:
-        return "moderate"
-    return "weak"
+    return {
+        target_id: [(str(e["mutation"]), str(e["risk"]), str(e["mechanism"])) for e in entries]
+        for target_id, entries in data.get("mutations", {}).items()
+    }
 
 
 class SimulationService:
@@ -71,6 +58,8 @@ class SimulationService:
         annotation_repo: ProteinAnnotationRepository | None = None,
         association_repo: TargetAssociationRepository | None = None,
         resistance_yaml: Path | None = None,
+        alerts: AlertCatalog | None = None,
+        docking: DockingScheduler | None = None,
     ) -> None:
         self._proteins = protein_store
         self._rdkit = rdkit
@@ -79,9 +68,13 @@ class SimulationService:
         self._comptox = comptox_client
         self._annotations = annotation_repo
         self._associations = association_repo
-        mutations, patterns = _load_resistance_data(resistance_yaml or _RESISTANCE_YAML)
-        self._known_mutations = mutations
-        self._resistance_patterns = patterns
+        self._docking = docking
+        self._known_mutations = _load_known_mutations(resistance_yaml or _RESISTANCE_YAML)
+        if alerts is None:
+            from ehrlich.chemistry.infrastructure.alert_catalog import load_alert_catalog
+
+            alerts = load_alert_catalog(resistance_yaml or _RESISTANCE_YAML)
+        self._alerts = alerts
 
     async def search_targets(
         self, query: str, organism: str = "", limit: int = 10
@@ -111,8 +104,10 @@ class SimulationService:
         return await self._comptox.fetch(identifier)
 
     async def dock(self, smiles: SMILES, target_id: str) -> DockingResult:
+        if self._docking is not None:
+            return await self._docking.dock(smiles, target_id)
         self._proteins.get_target(target_id)
-        return self._estimate_docking(smiles, target_id)
+        return estimate_docking(self._rdkit, smiles, target_id)
 
     async def predict_admet(self, smiles: SMILES) -> ADMETProfile:
         return await self._admet.predict(smiles)
@@ -164,26 +159,8 @@ class SimulationService:
             ),
         )
 
-    def _estimate_docking(self, smiles: SMILES, target_id: str) -> DockingResult:
-        desc = self._rdkit.compute_descriptors(smiles)
-        energy = round(-1.0 * (desc.qed * 7.0 + min(desc.logp, 5.0) * 0.6 + 1.5), 2)
-        energy = max(-12.0, min(-2.0, energy))
-        return DockingResult(
-            smiles=smiles,
-            target_id=target_id,
-            binding_energy=energy,
-            pose_rmsd=0.0,
-            interactions={
-                "method": ["rdkit_estimate"],
-                "interpretation": [_interpret_energy(energy)],
-                "note": ["Estimated from molecular descriptors (QED + LogP heuristic)"],
-            },
-        )
-
     def _assess_compound_class_risk(self, smiles: SMILES, target_id: str) -> str:
-        for pattern, affected_targets in self._resistance_patterns.items():
-            if target_id.upper() in affected_targets:
-                matched, _ = self._rdkit.substructure_match(smiles, pattern)
-                if matched:
-                    return "HIGH"
+        relevant = self._alerts.mask("resistance", target=target_id.upper())
+        if relevant and self._rdkit.match_alerts(smiles, self._alerts) & relevant:
+            return "HIGH"
         return "MODERATE"
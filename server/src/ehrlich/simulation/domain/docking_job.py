@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ehrlich.simulation.domain.docking_result import DockingResult
+
+
+@dataclass(frozen=True)
+class DockingBox:
+    """Search box for docking, in receptor coordinates (Angstrom)."""
+
+    center_x: float
+    center_y: float
+    center_z: float
+    size: float
+
+    @property
+    def key(self) -> str:
+        """Stable text form used in result cache keys."""
+        return f"{self.center_x:.3f},{self.center_y:.3f},{self.center_z:.3f},{self.size:.3f}"
+
+
+class DockingJobStatus(StrEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class DockingJob:
+    """A ligands x targets docking request and its progress.
+
+    ``events`` is the append-only progress log that subscribers replay and
+    follow: one ``docking_pair`` per finished pair, then one terminal event.
+    ``owner`` is the WorkOS id of the submitting user.
+    """
+
+    id: str
+    ligands: tuple[str, ...]
+    targets: tuple[str, ...]
+    owner: str = ""
+    status: DockingJobStatus = DockingJobStatus.QUEUED
+    results: list[DockingResult] = field(default_factory=list)
+    errors: list[dict[str, str]] = field(default_factory=list)
+    events: list[dict[str, Any]] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+
+    @property
+    def total(self) -> int:
+        return len(self.ligands) * len(self.targets)
+
+    @property
+    def done(self) -> int:
+        return len(self.results) + len(self.errors)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DockingJobStatus.COMPLETED, DockingJobStatus.CANCELLED)
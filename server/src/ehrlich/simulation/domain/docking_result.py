@@ -14,3 +14,15 @@ class DockingResult:
     binding_energy: float
     pose_rmsd: float = 0.0
     interactions: dict[str, list[str]] = field(default_factory=dict)
+    # Best docked pose as a MolBlock; empty for descriptor-based estimates.
+    pose: str = ""
+
+
+def interpret_energy(energy: float) -> str:
+    if energy <= -10.0:
+        return "excellent"
+    if energy <= -8.0:
+        return "strong"
+    if energy <= -6.0:
+        return "moderate"
+    return "weak"
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from ehrlich.simulation.domain.docking_job import DockingBox
+
 
 @dataclass(frozen=True)
 class ProteinTarget:
@@ -12,3 +14,7 @@ class ProteinTarget:
     center_y: float = 0.0
     center_z: float = 0.0
     box_size: float = 20.0
+
+    @property
+    def box(self) -> DockingBox:
+        return DockingBox(self.center_x, self.center_y, self.center_z, self.box_size)
@@ -1,19 +1,14 @@
-import asyncio
 import logging
 import urllib.parse
 
-import httpx
-
-from ehrlich.kernel.exceptions import ExternalServiceError
 from ehrlich.simulation.domain.repository import ToxicityRepository
 from ehrlich.simulation.domain.toxicity_profile import ToxicityProfile
+from ehrlich.transport.client import ServiceClient
 
 logger = logging.getLogger(__name__)
 
 _BASE_URL = "https://api-ccte.epa.gov"
 _TIMEOUT = 15.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 
 class CompToxClient(ToxicityRepository):
@@ -22,7 +17,8 @@ class CompToxClient(ToxicityRepository):
         headers: dict[str, str] = {}
         if api_key:
             headers["x-api-key"] = api_key
-        self._client = httpx.AsyncClient(
+        self._client = ServiceClient(
+            "EPA CompTox",
             base_url=_BASE_URL,
             headers=headers,
             timeout=_TIMEOUT,
@@ -38,93 +34,27 @@ class CompToxClient(ToxicityRepository):
         return await self._fetch_hazard(dtxsid, identifier)
 
     async def _resolve_dtxsid(self, name: str) -> str | None:
-        last_error: Exception | None = None
         encoded_name = urllib.parse.quote(name, safe="")
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(f"/chemical/search/by-name/{encoded_name}")
-                if resp.status_code == 404:
-                    return None
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "CompTox rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("EPA CompTox", "Rate limit exceeded")
-                resp.raise_for_status()
-                data = resp.json()
-                if isinstance(data, list) and data:
-                    first = data[0]
-                    if isinstance(first, dict):
-                        return str(first.get("dtxsid", ""))
-                elif isinstance(data, dict):
-                    return str(data.get("dtxsid", ""))
-                return None
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "CompTox timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("EPA CompTox", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "EPA CompTox",
-            f"Chemical search failed after {_MAX_RETRIES} attempts: {last_error}",
+        resp = await self._client.get(
+            f"/chemical/search/by-name/{encoded_name}", allow_statuses=(404,)
         )
+        if resp.status_code == 404:
+            return None
+        data = resp.json()
+        if isinstance(data, list) and data:
+            first = data[0]
+            if isinstance(first, dict):
+                return str(first.get("dtxsid", ""))
+        elif isinstance(data, dict):
+            return str(data.get("dtxsid", ""))
+        return None
 
     async def _fetch_hazard(self, dtxsid: str, name: str) -> ToxicityProfile | None:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(f"/hazard/search/by-dtxsid/{dtxsid}")
-                if resp.status_code == 404:
-                    return None
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "CompTox hazard rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("EPA CompTox", "Rate limit exceeded")
-                resp.raise_for_status()
-                data = resp.json()
-                return self._parse_hazard(data, dtxsid, name)
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "CompTox hazard timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("EPA CompTox", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "EPA CompTox",
-            f"Hazard lookup failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.get(f"/hazard/search/by-dtxsid/{dtxsid}", allow_statuses=(404,))
+        if resp.status_code == 404:
+            return None
+        data = resp.json()
+        return self._parse_hazard(data, dtxsid, name)
 
     @staticmethod
     def _parse_hazard(data: object, dtxsid: str, name: str) -> ToxicityProfile:
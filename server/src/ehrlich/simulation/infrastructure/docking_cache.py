@@ -0,0 +1,104 @@
+"""Docking results persisted in SQLite.
+
+Keyed by ligand InChIKey, receptor PDB ID, search box, and engine variant
+(exhaustiveness, pose count, seed), so a result is reused only when every
+input that shaped it matches.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from ehrlich.shared.sqlite_store import SQLiteStore
+
+_MAX_ENTRIES = 200_000
+
+_KEY = "inchikey = ? AND pdb_id = ? AND box = ? AND variant = ?"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docking_results (
+    inchikey TEXT NOT NULL,
+    pdb_id TEXT NOT NULL,
+    box TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    binding_energy REAL NOT NULL,
+    pose TEXT NOT NULL,
+    interactions TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (inchikey, pdb_id, box, variant)
+);
+CREATE INDEX IF NOT EXISTS idx_docking_results_stored ON docking_results(stored_at);
+"""
+
+
+@dataclass(frozen=True)
+class DockingKey:
+    inchikey: str
+    pdb_id: str
+    box: str
+    variant: str
+
+    def params(self) -> tuple[str, str, str, str]:
+        return (self.inchikey, self.pdb_id.upper(), self.box, self.variant)
+
+
+@dataclass(frozen=True)
+class CachedDocking:
+    binding_energy: float
+    pose: str
+    interactions: dict[str, list[str]]
+
+
+class DockingCache(SQLiteStore):
+    _table = "docking_results"
+    _schema = _SCHEMA
+    _recency = "stored_at"
+
+    def __init__(self, path: Path, max_entries: int = _MAX_ENTRIES) -> None:
+        super().__init__(path, max_entries)
+
+    def get(self, key: DockingKey) -> CachedDocking | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT binding_energy, pose, interactions FROM docking_results WHERE {_KEY}",
+                key.params(),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touch(_KEY, key.params())
+            self._conn.commit()
+        return CachedDocking(binding_energy=row[0], pose=row[1], interactions=json.loads(row[2]))
+
+    def put(self, key: DockingKey, result: CachedDocking) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO docking_results "
+                "(inchikey, pdb_id, box, variant, binding_energy, pose, interactions, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    *key.params(),
+                    result.binding_energy,
+                    result.pose,
+                    json.dumps(result.interactions),
+                    time.time(),
+                ),
+            )
+            self._trim()
+            self._conn.commit()
+
+
+@functools.cache
+def shared_docking_cache() -> DockingCache:
+    """The process-wide cache at ``EHRLICH_DOCKING_CACHE_PATH``."""
+    from ehrlich.config import get_settings
+
+    settings = get_settings()
+    return DockingCache(
+        Path(settings.docking_cache_path), max_entries=settings.docking_cache_max_entries
+    )
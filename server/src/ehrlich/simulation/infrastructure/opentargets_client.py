@@ -1,21 +1,13 @@
 from __future__ import annotations
 
-import asyncio
-import logging
 from typing import Any
 
-import httpx
-
-from ehrlich.kernel.exceptions import ExternalServiceError
 from ehrlich.simulation.domain.repository import TargetAssociationRepository
 from ehrlich.simulation.domain.target_association import TargetAssociation
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _GRAPHQL_URL = "https://api.platform.opentargets.org/api/v4/graphql"
 _TIMEOUT = 15.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 _SEARCH_DISEASE_QUERY = """
 query SearchDisease($q: String!) {
@@ -60,7 +52,7 @@ query AssociatedTargets($efoId: String!, $size: Int!) {
 
 class OpenTargetsClient(TargetAssociationRepository):
     def __init__(self) -> None:
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("Open Targets", timeout=_TIMEOUT)
 
     async def search(self, disease: str, limit: int = 10) -> list[TargetAssociation]:
         efo_id, disease_name = await self._resolve_disease(disease)
@@ -156,39 +148,5 @@ class OpenTargetsClient(TargetAssociationRepository):
         return associations
 
     async def _execute(self, body: dict[str, Any]) -> dict[str, Any]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.post(_GRAPHQL_URL, json=body)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "Open Targets rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("Open Targets", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "Open Targets timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("Open Targets", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "Open Targets",
-            f"Search failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.post(_GRAPHQL_URL, json=body)
+        return resp.json()  # type: ignore[no-any-return]
@@ -2,43 +2,66 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from ehrlich.shared.descriptors import MolecularDescriptors
 from ehrlich.simulation.domain.admet_profile import ADMETProfile
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from ehrlich.kernel.types import SMILES
+    from ehrlich.shared.alerts import AlertCatalog
     from ehrlich.shared.chemistry_port import ChemistryPort
-    from ehrlich.shared.descriptors import MolecularDescriptors
-
-# Mutagenic substructure alerts (SMARTS)
-_MUTAGENIC_ALERTS = (
-    "[NX3](=O)=O",  # nitro group (uncharged)
-    "[N+](=O)[O-]",  # nitro group (charge-separated)
-    "[N]=[N]=[N]",  # azide
-    "O=C1C=CC(=O)C=C1",  # quinone
-)
-
-# Hepatotoxicity substructure alerts
-_HEPATOTOX_ALERTS = (
-    "C(=O)Cl",  # acyl chloride
-    "[SX2]C(=O)",  # thioester
-)
 
 
 class PkCSMClient:
     """ADMET prediction using RDKit molecular descriptors.
 
     Named PkCSMClient for interface compatibility; uses local RDKit computation
-    as the primary (and currently only) implementation.
+    as the primary (and currently only) implementation. ``alerts`` supplies the
+    mutagenic and hepatotoxic patterns and defaults to the shared catalog.
     """
 
-    def __init__(self, rdkit: ChemistryPort) -> None:
+    def __init__(self, rdkit: ChemistryPort, alerts: AlertCatalog | None = None) -> None:
         self._rdkit = rdkit
+        if alerts is None:
+            from ehrlich.chemistry.infrastructure.alert_catalog import load_alert_catalog
+
+            alerts = load_alert_catalog()
+        self._alerts = alerts
+        self._mutagenic = self._alerts.mask("mutagenic")
+        self._hepatotoxic = self._alerts.mask("hepatotoxic")
 
     async def predict(self, smiles: SMILES) -> ADMETProfile:
         desc = self._rdkit.compute_descriptors(smiles)
+        return self._profile(desc, self._rdkit.match_alerts(smiles, self._alerts))
+
+    def predict_batch(
+        self, smiles: Sequence[SMILES]
+    ) -> tuple[list[ADMETProfile | None], dict[int, str]]:
+        """Profiles for a batch through the chemistry batch path; None where a SMILES failed."""
+        descriptors = self._rdkit.compute_descriptors_batch(smiles)
+        hits = self._rdkit.alert_matrix(smiles, self._alerts)
+        profiles: list[ADMETProfile | None] = []
+        errors = dict(hits.errors)
+        errors.update(descriptors.errors)
+        for i in range(len(smiles)):
+            if not (descriptors.valid[i] and hits.valid[i]):
+                profiles.append(None)
+                errors.setdefault(i, f"Cannot predict ADMET: '{smiles[i]}'")
+                continue
+            bitmap = sum(1 << int(j) for j in np.flatnonzero(hits.hits[i]))
+            desc = MolecularDescriptors.from_row(descriptors.values[i])
+            profiles.append(self._profile(desc, bitmap))
+        return profiles, errors
+
+    def _profile(self, desc: MolecularDescriptors, hits: int) -> ADMETProfile:
         lipinski = self._count_lipinski_violations(desc)
-        ames = self._check_mutagenic_alerts(smiles)
-        hepatotox = self._check_hepatotoxicity(desc, smiles)
+        ames = bool(hits & self._mutagenic)
+        hepatotox = bool(hits & self._hepatotoxic) or (
+            desc.logp > 3.5 and desc.molecular_weight > 400
+        )
         herg = desc.logp > 3.7 and desc.molecular_weight > 350
         bbb = desc.tpsa < 90 and desc.molecular_weight < 400 and 0 < desc.logp < 3
         absorption = max(0.0, min(100.0, 100.0 - lipinski * 25.0))
@@ -61,22 +84,6 @@ class PkCSMClient:
             qed=round(desc.qed, 4),
         )
 
-    def _check_mutagenic_alerts(self, smiles: SMILES) -> bool:
-        for pattern in _MUTAGENIC_ALERTS:
-            matched, _ = self._rdkit.substructure_match(smiles, pattern)
-            if matched:
-                return True
-        return False
-
-    def _check_hepatotoxicity(self, desc: MolecularDescriptors, smiles: SMILES) -> bool:
-        if desc.logp > 3.5 and desc.molecular_weight > 400:
-            return True
-        for pattern in _HEPATOTOX_ALERTS:
-            matched, _ = self._rdkit.substructure_match(smiles, pattern)
-            if matched:
-                return True
-        return False
-
     @staticmethod
     def _count_lipinski_violations(desc: MolecularDescriptors) -> int:
         violations = 0
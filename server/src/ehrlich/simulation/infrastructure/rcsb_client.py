@@ -1,25 +1,21 @@
-import asyncio
 import logging
 import re
 
-import httpx
-
 from ehrlich.kernel.exceptions import ExternalServiceError
 from ehrlich.simulation.domain.protein_target import ProteinTarget
 from ehrlich.simulation.domain.repository import ProteinTargetRepository
+from ehrlich.transport.client import ServiceClient
 
 logger = logging.getLogger(__name__)
 
 _SEARCH_URL = "https://search.rcsb.org/rcsbsearch/v2/query"
 _DATA_URL = "https://data.rcsb.org/rest/v1/core/entry"
 _TIMEOUT = 15.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 
 class RCSBClient(ProteinTargetRepository):
     def __init__(self) -> None:
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("RCSB PDB", timeout=_TIMEOUT)
 
     async def search(self, query: str, organism: str = "", limit: int = 10) -> list[ProteinTarget]:
         search_query = self._build_query(query, organism, limit)
@@ -74,43 +70,10 @@ class RCSBClient(ProteinTargetRepository):
         }
 
     async def _execute_search(self, search_query: dict[str, object]) -> list[str]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.post(_SEARCH_URL, json=search_query)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "RCSB PDB rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("RCSB PDB", "Rate limit exceeded")
-                resp.raise_for_status()
-                data = resp.json()
-                results = data.get("result_set", [])
-                return [r["identifier"] for r in results if "identifier" in r]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "RCSB PDB timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("RCSB PDB", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "RCSB PDB", f"Search failed after {_MAX_RETRIES} attempts: {last_error}"
-        )
+        resp = await self._client.post(_SEARCH_URL, json=search_query)
+        data = resp.json()
+        results = data.get("result_set", [])
+        return [r["identifier"] for r in results if "identifier" in r]
 
     async def _fetch_entry(self, pdb_id: str) -> ProteinTarget | None:
         # Validate PDB ID format to prevent URL path injection
@@ -118,10 +81,9 @@ class RCSBClient(ProteinTargetRepository):
             msg = f"Invalid PDB ID format: {pdb_id}"
             raise ValueError(msg)
         try:
-            resp = await self._client.get(f"{_DATA_URL}/{pdb_id}")
+            resp = await self._client.get(f"{_DATA_URL}/{pdb_id}", allow_statuses=(404,))
             if resp.status_code == 404:
                 return None
-            resp.raise_for_status()
             data = resp.json()
             struct = data.get("struct", {})
             name = str(struct.get("title", pdb_id))
@@ -144,6 +106,6 @@ class RCSBClient(ProteinTargetRepository):
                 center_z=0.0,
                 box_size=22.0,
             )
-        except httpx.HTTPError as e:
+        except ExternalServiceError as e:
             logger.warning("Failed to fetch RCSB entry %s: %s", pdb_id, e)
             return None
@@ -1,27 +1,19 @@
 from __future__ import annotations
 
-import asyncio
-import logging
 from typing import Any
 
-import httpx
-
-from ehrlich.kernel.exceptions import ExternalServiceError
 from ehrlich.simulation.domain.protein_annotation import ProteinAnnotation
 from ehrlich.simulation.domain.repository import ProteinAnnotationRepository
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://rest.uniprot.org/uniprotkb/search"
 _TIMEOUT = 15.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 _FIELDS = "accession,protein_name,organism_name,cc_function,cc_disease,xref_pdb,xref_reactome,go"
 
 
 class UniProtClient(ProteinAnnotationRepository):
     def __init__(self) -> None:
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("UniProt", timeout=_TIMEOUT)
 
     async def search(
         self, query: str, organism: str = "", limit: int = 5
@@ -42,41 +34,8 @@ class UniProtClient(ProteinAnnotationRepository):
         return [self._parse_entry(entry) for entry in results]
 
     async def _execute(self, params: dict[str, str]) -> dict[str, Any]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(_BASE_URL, params=params)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "UniProt rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("UniProt", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "UniProt timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("UniProt", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "UniProt", f"Search failed after {_MAX_RETRIES} attempts: {last_error}"
-        )
+        resp = await self._client.get(_BASE_URL, params=params)
+        return resp.json()  # type: ignore[no-any-return]
 
     def _parse_entry(self, entry: dict[str, Any]) -> ProteinAnnotation:
         accession = str(entry.get("primaryAccession", ""))
@@ -0,0 +1,88 @@
+"""AutoDock Vina docking of one ligand against one PDBQT receptor.
+
+Vina and Meeko are optional (``uv sync --extra docking``). ``dock_ligand`` is
+a plain module-level function so it can be sent to a worker process; each
+call embeds the ligand with RDKit, prepares it with Meeko, and docks it on a
+single Vina thread, leaving parallelism to the process pool.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from rdkit import Chem
+from rdkit.Chem import AllChem
+
+from ehrlich.kernel.exceptions import InvalidSMILESError
+
+if TYPE_CHECKING:
+    from ehrlich.simulation.domain.docking_job import DockingBox
+
+logger = logging.getLogger(__name__)
+
+_VINA_AVAILABLE = False
+try:
+    from meeko import MoleculePreparation, PDBQTMolecule, PDBQTWriterLegacy, RDKitMolCreate
+    from vina import Vina
+
+    _VINA_AVAILABLE = True
+except ImportError:
+    pass
+
+_SEED = 42
+
+
+def is_available() -> bool:
+    return _VINA_AVAILABLE
+
+
+def engine_variant(exhaustiveness: int, n_poses: int) -> str:
+    """Names every setting a docking result depends on, for the result cache key."""
+    return f"vina-ex{exhaustiveness}-n{n_poses}-s{_SEED}"
+
+
+def dock_ligand(
+    smiles: str,
+    receptor_path: str,
+    box: DockingBox,
+    exhaustiveness: int = 8,
+    n_poses: int = 5,
+) -> tuple[float, str]:
+    """Best binding energy (kcal/mol) and its pose as a MolBlock."""
+    if not _VINA_AVAILABLE:
+        raise ImportError("AutoDock Vina not installed. Install with: uv sync --extra docking")
+    mol = Chem.MolFromSmiles(smiles)
+    if mol is None:
+        raise InvalidSMILESError(smiles)
+    mol = Chem.AddHs(mol)
+    params = AllChem.ETKDGv3()
+    params.randomSeed = _SEED
+    if AllChem.EmbedMolecule(mol, params) == -1:
+        raise InvalidSMILESError(smiles, "Cannot generate 3D conformer")
+    if AllChem.MMFFHasAllMoleculeParams(mol):
+        AllChem.MMFFOptimizeMolecule(mol, maxIters=200)
+
+    setups = MoleculePreparation().prepare(mol)
+    ligand, ok, error = PDBQTWriterLegacy.write_string(setups[0])
+    if not ok:
+        raise InvalidSMILESError(smiles, f"Cannot prepare ligand for docking ({error})")
+
+    vina = Vina(sf_name="vina", cpu=1, seed=_SEED, verbosity=0)
+    vina.set_receptor(receptor_path)
+    vina.set_ligand_from_string(ligand)
+    vina.compute_vina_maps(
+        center=[box.center_x, box.center_y, box.center_z], box_size=[box.size] * 3
+    )
+    vina.dock(exhaustiveness=exhaustiveness, n_poses=n_poses)
+    energy = float(vina.energies(n_poses=1)[0][0])
+    return energy, _pose_molblock(vina.poses(n_poses=1))
+
+
+def _pose_molblock(pdbqt: str) -> str:
+    try:
+        mols = RDKitMolCreate.from_pdbqt_mol(PDBQTMolecule(pdbqt, skip_typing=True))
+        return str(Chem.MolToMolBlock(mols[0])) if mols and mols[0] is not None else ""
+    except Exception:
+        logger.warning("Could not convert docked pose to MolBlock", exc_info=True)
+        return ""
@@ -6,6 +6,7 @@ from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
 from ehrlich.config import get_settings
 from ehrlich.kernel.exceptions import ExternalServiceError, InvalidSMILESError, TargetNotFoundError
 from ehrlich.kernel.types import SMILES
+from ehrlich.simulation.application.docking_scheduler import shared_docking_scheduler
 from ehrlich.simulation.application.simulation_service import SimulationService
 from ehrlich.simulation.infrastructure.comptox_client import CompToxClient
 from ehrlich.simulation.infrastructure.opentargets_client import OpenTargetsClient
@@ -30,6 +31,7 @@ _service = SimulationService(
     comptox_client=_comptox_client,
     annotation_repo=_uniprot_client,
     association_repo=_opentargets_client,
+    docking=shared_docking_scheduler(),
 )
 
 
@@ -1,23 +1,14 @@
-import asyncio
-import logging
-
-import httpx
-
-from ehrlich.kernel.exceptions import ExternalServiceError
 from ehrlich.training.domain.entities import ClinicalTrial
 from ehrlich.training.domain.repository import ClinicalTrialRepository
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://clinicaltrials.gov/api/v2/studies"
 _TIMEOUT = 20.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 
 class ClinicalTrialsClient(ClinicalTrialRepository):
     def __init__(self) -> None:
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("ClinicalTrials.gov", timeout=_TIMEOUT)
 
     async def search(
         self, condition: str, intervention: str = "", max_results: int = 10
@@ -36,44 +27,8 @@ class ClinicalTrialsClient(ClinicalTrialRepository):
         return [self._parse_study(s) for s in studies[:max_results] if s]
 
     async def _get(self, params: dict[str, str | int]) -> dict[str, object]:
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(_BASE_URL, params=params)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "ClinicalTrials.gov rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("ClinicalTrials.gov", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "ClinicalTrials.gov timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError(
-                    "ClinicalTrials.gov", f"HTTP {e.response.status_code}"
-                ) from e
-        raise ExternalServiceError(
-            "ClinicalTrials.gov",
-            f"Request failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.get(_BASE_URL, params=params)
+        return resp.json()  # type: ignore[no-any-return]
 
     @staticmethod
     def _parse_study(study: dict[str, object]) -> ClinicalTrial:
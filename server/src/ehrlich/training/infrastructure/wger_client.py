@@ -1,21 +1,13 @@
 from __future__ import annotations
 
-import asyncio
-import logging
 import re
 
-import httpx
-
-from ehrlich.kernel.exceptions import ExternalServiceError
 from ehrlich.training.domain.entities import Exercise
 from ehrlich.training.domain.repository import ExerciseRepository
-
-logger = logging.getLogger(__name__)
+from ehrlich.transport.client import ServiceClient
 
 _BASE_URL = "https://wger.de/api/v2"
 _TIMEOUT = 15.0
-_MAX_RETRIES = 3
-_BASE_DELAY = 1.0
 
 _MUSCLE_IDS: dict[str, int] = {
     "chest": 4,
@@ -60,7 +52,7 @@ _HTML_TAG_RE = re.compile(r"<[^>]+>")
 
 class WgerClient(ExerciseRepository):
     def __init__(self) -> None:
-        self._client = httpx.AsyncClient(timeout=_TIMEOUT)
+        self._client = ServiceClient("wger", timeout=_TIMEOUT)
 
     async def search(
         self, muscle_group: str = "", equipment: str = "", category: str = "", limit: int = 20
@@ -90,42 +82,8 @@ class WgerClient(ExerciseRepository):
 
     async def _get(self, params: dict[str, str | int]) -> dict[str, object]:
         url = f"{_BASE_URL}/exercise/"
-        last_error: Exception | None = None
-        for attempt in range(_MAX_RETRIES):
-            try:
-                resp = await self._client.get(url, params=params)
-                if resp.status_code == 429:
-                    delay = _BASE_DELAY * (2**attempt)
-                    logger.warning(
-                        "wger rate limited (attempt %d/%d), retrying in %.1fs",
-                        attempt + 1,
-                        _MAX_RETRIES,
-                        delay,
-                    )
-                    if attempt < _MAX_RETRIES - 1:
-                        await asyncio.sleep(delay)
-                        continue
-                    raise ExternalServiceError("wger", "Rate limit exceeded")
-                resp.raise_for_status()
-                return resp.json()  # type: ignore[no-any-return]
-            except httpx.TimeoutException as e:
-                last_error = e
-                delay = _BASE_DELAY * (2**attempt)
-                logger.warning(
-                    "wger timeout (attempt %d/%d), retrying in %.1fs",
-                    attempt + 1,
-                    _MAX_RETRIES,
-                    delay,
-                )
-                if attempt < _MAX_RETRIES - 1:
-                    await asyncio.sleep(delay)
-                    continue
-            except httpx.HTTPStatusError as e:
-                raise ExternalServiceError("wger", f"HTTP {e.response.status_code}") from e
-        raise ExternalServiceError(
-            "wger",
-            f"Request failed after {_MAX_RETRIES} attempts: {last_error}",
-        )
+        resp = await self._client.get(url, params=params)
+        return resp.json()  # type: ignore[no-any-return]
 
     @staticmethod
     def _parse_exercise(data: dict[str, object]) -> Exercise:
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import random
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from ehrlich.kernel.exceptions import ExternalServiceError
+from ehrlich.transport.circuit_breaker import CircuitBreaker
+from ehrlich.transport.metrics import TransportMetrics
+from ehrlich.transport.rate_limiter import TokenBucket
+from ehrlich.transport.response_cache import ResponseCache, freshness_for, request_key
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Mapping
+    from pathlib import Path
+
+    from ehrlich.transport.metrics import SourceMetrics
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_TIMEOUT = 20.0
+_MAX_RETRIES = 3
+_BASE_DELAY = 1.0
+_MAX_RETRY_AFTER = 30.0
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Requests per second and burst per host. Unlisted hosts use _DEFAULT_RATE.
+_HOST_RATES: dict[str, tuple[float, int]] = {
+    "api.semanticscholar.org": (1.0, 2),
+    "eutils.ncbi.nlm.nih.gov": (3.0, 3),
+    "pubchem.ncbi.nlm.nih.gov": (5.0, 5),
+}
+_DEFAULT_RATE = (10.0, 10)
+
+
+class _Transport:
+    """Process-wide pool, per-host limiters/breakers, and per-source metrics."""
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._buckets: dict[str, TokenBucket] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self.metrics = TransportMetrics()
+        self.response_cache: ResponseCache | None = None
+
+    def client(self) -> httpx.AsyncClient:
+        # A pooled client is bound to the loop that opened its connections.
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = httpx.AsyncClient(limits=_LIMITS, http2=_HTTP2)
+            self._loop = loop
+        return self._client
+
+    def bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, burst = _HOST_RATES.get(host, _DEFAULT_RATE)
+            bucket = self._buckets[host] = TokenBucket(rate, burst)
+        return bucket
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker()
+        return breaker
+
+    def circuits(self) -> dict[str, str]:
+        return {host: b.state for host, b in sorted(self._breakers.items())}
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+        if self.response_cache is not None:
+            self.response_cache.close()
+            self.response_cache = None
+
+
+_transport = _Transport()
+
+
+def set_rate_limit(host: str, rate: float, burst: int = 1) -> None:
+    """Override the request rate for ``host`` (e.g. with an API key granting more)."""
+    _HOST_RATES[host] = (rate, burst)
+    _transport._buckets.pop(host, None)
+
+
+def enable_response_cache(path: Path, *, offline: bool = False, max_entries: int = 50000) -> None:
+    """Serve GET/POST responses from an on-disk store shared by every client."""
+    if _transport.response_cache is not None:
+        _transport.response_cache.close()
+    _transport.response_cache = ResponseCache(path, offline=offline, max_entries=max_entries)
+
+
+def transport_stats() -> dict[str, Any]:
+    cache = _transport.response_cache
+    return {
+        "http2": _HTTP2,
+        "response_cache": "off" if cache is None else "offline" if cache.offline else "on",
+        "sources": _transport.metrics.snapshot(),
+        "circuits": _transport.circuits(),
+    }
+
+
+async def close_transport() -> None:
+    await _transport.close()
+
+
+def reset_transport() -> None:
+    """Drop pooled connections, limiter/breaker state, metrics, and cache (tests only)."""
+    global _transport
+    if _transport.response_cache is not None:
+        _transport.response_cache.close()
+    _transport = _Transport()
+
+
+def _backoff(base_delay: float, attempt: int) -> float:
+    # Equal jitter: half the exponential step is fixed, half is random.
+    step: float = base_delay * 2**attempt
+    return step / 2 + random.uniform(0, step / 2)  # noqa: S311
+
+
+def _retry_after(resp: httpx.Response) -> float | None:
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(UTC)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), _MAX_RETRY_AFTER)
+
+
+class ServiceClient:
+    """Per-source facade over the shared transport.
+
+    Every request is throttled by the host's token bucket, guarded by its
+    circuit breaker, and retried on 429, 502-504, and transport errors with
+    jittered backoff (honoring ``Retry-After``). Other non-2xx statuses raise
+    ``ExternalServiceError`` at once unless listed in ``allow_statuses``.
+
+    When a response cache is enabled, fresh entries (per-source freshness)
+    are served without a request and stale ones are revalidated with
+    ``If-None-Match``/``If-Modified-Since``.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        *,
+        base_url: str = "",
+        headers: Mapping[str, str] | None = None,
+        timeout: float = _DEFAULT_TIMEOUT,
+        max_retries: int = _MAX_RETRIES,
+        base_delay: float = _BASE_DELAY,
+    ) -> None:
+        self._source = source
+        self._base_url = base_url.rstrip("/")
+        self._headers = dict(headers or {})
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+
+    @property
+    def source(self) -> str:
+        return self._source
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any = None,
+        content: str | bytes | None = None,
+        headers: Mapping[str, str] | None = None,
+        allow_statuses: Collection[int] = (),
+    ) -> httpx.Response:
+        full_url = f"{self._base_url}{url}" if self._base_url else url
+        merged_headers = {**self._headers, **(headers or {})}
+        stats = _transport.metrics.source(self._source)
+        cache = _transport.response_cache
+        if cache is None:
+            return await self._send(
+                method, full_url, params, json, content, merged_headers, allow_statuses
+            )
+
+        key = request_key(method, full_url, params, json, content)
+        cached = await cache.get(key)
+        if cached is not None and (cache.offline or cached.is_fresh(freshness_for(self._source))):
+            stats.cache_hits += 1
+            return cached.to_response(method, full_url)
+        if cache.offline:
+            stats.cache_misses += 1
+            endpoint = httpx.URL(full_url).copy_with(query=None)
+            raise ExternalServiceError(
+                self._source, f"No recorded response for {method} {endpoint} (offline mode)"
+            )
+
+        stats.cache_misses += 1
+        if cached is not None:
+            merged_headers.update(cached.validators())
+            allow_statuses = {*allow_statuses, 304}
+        resp = await self._send(
+            method, full_url, params, json, content, merged_headers, allow_statuses
+        )
+        if resp.status_code == 304 and cached is not None:
+            stats.revalidated += 1
+            await cache.touch(key)
+            return cached.to_response(method, full_url)
+        if resp.status_code == 200 or resp.status_code in allow_statuses:
+            await cache.put(key, self._source, resp)
+        return resp
+
+    async def _send(
+        self,
+        method: str,
+        full_url: str,
+        params: Mapping[str, Any] | None,
+        json: Any,
+        content: str | bytes | None,
+        headers: dict[str, str],
+        allow_statuses: Collection[int],
+    ) -> httpx.Response:
+        host = httpx.URL(full_url).host
+        transport = _transport
+        bucket = transport.bucket(host)
+        breaker = transport.breaker(host)
+        stats = transport.metrics.source(self._source)
+
+        last_error: str = ""
+        for attempt in range(self._max_retries):
+            trial = breaker.state == "half_open"
+            if not breaker.allow():
+                stats.circuit_rejections += 1
+                raise ExternalServiceError(
+                    self._source,
+                    f"Circuit open for {host}, retry in {breaker.retry_after:.0f}s",
+                )
+            try:
+                stats.throttle_wait_s += await bucket.acquire()
+                stats.requests += 1
+                start = time.perf_counter()
+                resp = await transport.client().request(
+                    method,
+                    full_url,
+                    params=params,
+                    json=json,
+                    content=content,
+                    headers=headers,
+                    timeout=self._timeout,
+                )
+            except httpx.TransportError as e:
+                stats.observe(time.perf_counter() - start)
+                stats.errors += 1
+                breaker.record_failure()
+                last_error = str(e) or type(e).__name__
+                await self._pause(stats, attempt, type(e).__name__, None)
+                continue
+            except BaseException:
+                # Cancelled, or an error that says nothing about the host's health:
+                # hand the half-open trial back so the next request can take it.
+                if trial:
+                    breaker.release_trial()
+                raise
+            stats.observe(time.perf_counter() - start)
+
+            status = resp.status_code
+            if status >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            if status == 429 or status in _RETRY_STATUSES:
+                if status == 429:
+                    stats.rate_limited += 1
+                last_error = f"HTTP {status}"
+                if attempt < self._max_retries - 1:
+                    await self._pause(stats, attempt, last_error, _retry_after(resp))
+                    continue
+                stats.errors += 1
+                if status == 429:
+                    raise ExternalServiceError(self._source, "Rate limit exceeded")
+                raise ExternalServiceError(self._source, last_error)
+
+            if resp.is_success or status in allow_statuses:
+                return resp
+            stats.errors += 1
+            raise ExternalServiceError(self._source, f"HTTP {status}")
+
+        raise ExternalServiceError(
+            self._source,
+            f"Request failed after {self._max_retries} attempts: {last_error}",
+        )
+
+    async def _pause(
+        self, stats: SourceMetrics, attempt: int, reason: str, retry_after: float | None
+    ) -> None:
+        if attempt >= self._max_retries - 1:
+            return
+        delay = retry_after if retry_after is not None else _backoff(self._base_delay, attempt)
+        logger.warning(
+            "%s %s (attempt %d/%d), retrying in %.1fs",
+            self._source,
+            reason,
+            attempt + 1,
+            self._max_retries,
+            delay,
+        )
+        stats.retries += 1
+        await asyncio.sleep(delay)
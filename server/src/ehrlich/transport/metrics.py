@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+
+_LATENCY_WINDOW = 512
+
+
+@dataclass
+class SourceMetrics:
+    """Counters and a rolling latency window for one upstream source."""
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    circuit_rejections: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    revalidated: int = 0
+    throttle_wait_s: float = 0.0
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+
+    def observe(self, seconds: float) -> None:
+        self.latencies.append(seconds)
+
+    def to_dict(self) -> dict[str, int | float]:
+        ordered = sorted(self.latencies)
+
+        def percentile(q: float) -> float:
+            if not ordered:
+                return 0.0
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 1)
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "circuit_rejections": self.circuit_rejections,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "revalidated": self.revalidated,
+            "throttle_wait_s": round(self.throttle_wait_s, 3),
+            "latency_p50_ms": percentile(0.5),
+            "latency_p95_ms": percentile(0.95),
+        }
+
+
+class TransportMetrics:
+    def __init__(self) -> None:
+        self._sources: dict[str, SourceMetrics] = {}
+
+    def source(self, name: str) -> SourceMetrics:
+        metrics = self._sources.get(name)
+        if metrics is None:
+            metrics = self._sources[name] = SourceMetrics()
+        return metrics
+
+    def snapshot(self) -> dict[str, dict[str, int | float]]:
+        return {name: m.to_dict() for name, m in sorted(self._sources.items())}
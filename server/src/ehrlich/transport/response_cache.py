@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from ehrlich.shared.sqlite_store import SQLiteStore
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+_HOUR = 3600.0
+_DAY = 24 * _HOUR
+
+# Seconds a stored response is served without revalidation, per source.
+_FRESHNESS: dict[str, float] = {
+    "World Bank": 7 * _DAY,
+    "WHO GHO": 7 * _DAY,
+    "FRED": 7 * _DAY,
+    "Census": 7 * _DAY,
+    "BLS": _DAY,
+    "INEGI": _DAY,
+    "Banxico": _DAY,
+    "ChEMBL": 7 * _DAY,
+    "PubChem": 7 * _DAY,
+    "GtoPdb": 7 * _DAY,
+    "UniProt": 7 * _DAY,
+    "RCSB PDB": 7 * _DAY,
+    "SemanticScholar": _DAY,
+    "PubMed": 6 * _HOUR,
+    "ClinicalTrials.gov": _HOUR,
+    "OpenFDA": 6 * _HOUR,
+}
+_DEFAULT_FRESHNESS = 6 * _HOUR
+
+# Credentials are left out of the key so recordings replay without them.
+_SECRET_FIELDS = frozenset(
+    {"api_key", "apikey", "key", "token", "access_token", "registrationkey", "x-api-key"}
+)
+_STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_http_cache_stored ON http_cache(stored_at);
+"""
+
+
+def freshness_for(source: str) -> float:
+    return _FRESHNESS.get(source, _DEFAULT_FRESHNESS)
+
+
+def set_freshness(source: str, seconds: float) -> None:
+    _FRESHNESS[source] = seconds
+
+
+def request_key(
+    method: str,
+    url: str,
+    params: Mapping[str, Any] | None,
+    json_body: Any,
+    content: str | bytes | None,
+) -> str:
+    parsed = httpx.URL(url)
+    query = [(k, v) for k, v in parsed.params.multi_items() if k.lower() not in _SECRET_FIELDS]
+    query += [(k, str(v)) for k, v in (params or {}).items() if k.lower() not in _SECRET_FIELDS]
+    if isinstance(json_body, dict):
+        json_body = {k: v for k, v in json_body.items() if k.lower() not in _SECRET_FIELDS}
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", errors="replace")
+    raw = json.dumps(
+        [method.upper(), str(parsed.copy_with(query=None)), sorted(query), json_body, content],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+
+    def is_fresh(self, max_age: float) -> bool:
+        return time.time() - self.stored_at < max_age
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers: dict[str, str] = {}
+        if etag := self.headers.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def to_response(self, method: str, url: str) -> httpx.Response:
+        return httpx.Response(
+            self.status,
+            headers=self.headers,
+            content=self.body,
+            request=httpx.Request(method, url),
+        )
+
+
+class ResponseCache(SQLiteStore):
+    """On-disk store of upstream response bodies in a single SQLite file.
+
+    In offline mode the store is read-only and every entry is served
+    regardless of age, so recorded responses replay without network access.
+    ``stored_at`` doubles as the freshness clock, so reads do not touch it
+    and trimming drops the least recently validated responses.
+    """
+
+    _table = "http_cache"
+    _schema = _SCHEMA
+    _recency = "stored_at"
+
+    def __init__(self, path: Path, offline: bool = False, max_entries: int = 50000) -> None:
+        super().__init__(path, max_entries)
+        self._offline = offline
+
+    @property
+    def offline(self) -> bool:
+        return self._offline
+
+    async def get(self, key: str) -> CachedResponse | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def put(self, key: str, source: str, resp: httpx.Response) -> None:
+        if self._offline or "no-store" in resp.headers.get("cache-control", ""):
+            return
+        headers = {h: resp.headers[h] for h in _STORED_HEADERS if h in resp.headers}
+        await asyncio.to_thread(self._put, key, source, resp.status_code, headers, resp.content)
+
+    async def touch(self, key: str) -> None:
+        """Mark an entry fresh again after a 304 Not Modified."""
+        if self._offline:
+            return
+        await asyncio.to_thread(
+            self._execute, "UPDATE http_cache SET stored_at = ? WHERE key = ?", (time.time(), key)
+        )
+
+    async def size(self) -> int:
+        return await asyncio.to_thread(self.count)
+
+    def _get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, stored_at FROM http_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(
+            status=int(row[0]), headers=json.loads(row[1]), body=bytes(row[2]), stored_at=row[3]
+        )
+
+    def _put(
+        self, key: str, source: str, status: int, headers: dict[str, str], body: bytes
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache (key, source, status, headers, body, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, source, status, json.dumps(headers), body, time.time()),
+            )
+            self._trim()
+            self._conn.commit()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+_WAIT_WINDOW = 512
+
+
+@dataclass
+class LaneMetrics:
+    """Queue depth, occupancy, and outcome counters for one executor lane."""
+
+    workers: int
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    queued: int = 0
+    running: int = 0
+    busy_s: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+    waits: deque[float] = field(default_factory=lambda: deque(maxlen=_WAIT_WINDOW))
+
+    def to_dict(self) -> dict[str, int | float]:
+        ordered = sorted(self.waits)
+
+        def percentile(q: float) -> float:
+            if not ordered:
+                return 0.0
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 1)
+
+        capacity = max(time.monotonic() - self.started_at, 1e-9) * self.workers
+        return {
+            "workers": self.workers,
+            "queued": self.queued,
+            "running": self.running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "utilization": round(self.running / self.workers, 3),
+            "busy_ratio": round(min(self.busy_s / capacity, 1.0), 3),
+            "queue_wait_p50_ms": percentile(0.5),
+            "queue_wait_p95_ms": percentile(0.95),
+        }
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import time
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from ehrlich.kernel.exceptions import JobCancelledError
+from ehrlich.workers.metrics import LaneMetrics
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from concurrent.futures import Executor, Future
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PROCESSES = 2
+_DEFAULT_THREADS = 4
+
+_job_group: ContextVar[str | None] = ContextVar("ehrlich_job_group", default=None)
+
+
+class _Lane:
+    """One executor plus the admission semaphore that makes queue depth observable."""
+
+    def __init__(self, kind: str, workers: int) -> None:
+        self.kind = kind
+        self.workers = workers
+        self.metrics = LaneMetrics(workers=workers)
+        self._executor: Executor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots = asyncio.Semaphore(self.workers)
+            self._loop = loop
+        return self._slots
+
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                # spawn, not fork: the server process holds threads and open sockets.
+                self._executor = ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    self.workers, thread_name_prefix="ehrlich-worker"
+                )
+        return self._executor
+
+    def discard_executor(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class WorkerPool:
+    """Process and thread executors for CPU-bound work called from async code.
+
+    ``run_cpu`` is for GIL-bound work with compact, picklable inputs (conformer
+    embedding, model fitting); ``run_thread`` is for work that releases the GIL
+    or whose inputs are too large to pickle cheaply. With ``processes=0`` CPU
+    jobs run on the thread lane instead.
+
+    Jobs started inside ``job_group(name)`` can be cancelled together with
+    ``cancel_group(name)``: queued jobs never start and running ones have their
+    result discarded (a process cannot be interrupted mid-call, so its slot is
+    freed only when the call returns).
+    """
+
+    def __init__(
+        self, processes: int = _DEFAULT_PROCESSES, threads: int = _DEFAULT_THREADS
+    ) -> None:
+        if threads < 1:
+            msg = "threads must be at least 1"
+            raise ValueError(msg)
+        self._thread = _Lane("thread", threads)
+        self._process = _Lane("process", processes) if processes > 0 else None
+        self._groups: dict[str, set[asyncio.Task[Any]]] = {}
+
+    async def run_cpu[**P, T](self, fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        return await self._run(self._process or self._thread, fn, *args, **kwargs)
+
+    async def run_thread[**P, T](self, fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        return await self._run(self._thread, fn, *args, **kwargs)
+
+    @property
+    def cpu_workers(self) -> int:
+        """How many ``run_cpu`` jobs can run at once."""
+        return (self._process or self._thread).workers
+
+    def cancel_group(self, group: str) -> int:
+        """Cancel every unfinished job started under ``group``. Returns how many."""
+        jobs = self._groups.pop(group, set())
+        for job in jobs:
+            job.cancel()
+        return len(jobs)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "process": self._process.metrics.to_dict() if self._process else None,
+            "thread": self._thread.metrics.to_dict(),
+            "active_groups": len(self._groups),
+        }
+
+    def shutdown(self) -> None:
+        for lane in (self._process, self._thread):
+            if lane is not None:
+                lane.discard_executor()
+
+    async def _run[**P, T](
+        self, lane: _Lane, fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        job = asyncio.ensure_future(self._execute(lane, fn, *args, **kwargs))
+        group = _job_group.get()
+        if group is not None:
+            self._groups.setdefault(group, set()).add(job)
+            job.add_done_callback(lambda t: self._forget(group, t))
+        try:
+            return await job
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if task is not None and task.cancelling():
+                raise
+            # Cancelled through cancel_group, not by our caller's own cancellation.
+            raise JobCancelledError(getattr(fn, "__qualname__", repr(fn))) from None
+
+    async def _execute[**P, T](
+        self, lane: _Lane, fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        stats = lane.metrics
+        stats.submitted += 1
+        stats.queued += 1
+        enqueued = time.perf_counter()
+        slots = lane.slots()
+        try:
+            await slots.acquire()
+        except asyncio.CancelledError:
+            stats.cancelled += 1
+            raise
+        finally:
+            stats.queued -= 1
+        stats.waits.append(time.perf_counter() - enqueued)
+        stats.running += 1
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+
+        def finish() -> None:
+            stats.running -= 1
+            stats.busy_s += time.perf_counter() - started
+            slots.release()
+
+        def on_done(_: Future[T]) -> None:
+            # The slot is held until the call really ends, even if its awaiter was cancelled.
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(finish)
+
+        try:
+            future = lane.executor().submit(fn, *args, **kwargs)
+        except BaseException:
+            finish()
+            stats.failed += 1
+            raise
+        future.add_done_callback(on_done)
+        try:
+            result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            stats.cancelled += 1
+            raise
+        except BrokenExecutor:
+            stats.failed += 1
+            logger.error("%s pool broken, restarting on next job", lane.kind)
+            lane.discard_executor()
+            raise
+        except BaseException:
+            stats.failed += 1
+            raise
+        stats.completed += 1
+        return result
+
+    def _forget(self, group: str, job: asyncio.Task[Any]) -> None:
+        jobs = self._groups.get(group)
+        if jobs is not None:
+            jobs.discard(job)
+            if not jobs:
+                del self._groups[group]
+
+
+_pool = WorkerPool()
+
+
+@contextlib.contextmanager
+def job_group(name: str) -> Iterator[None]:
+    """Tag pool jobs started in this context (and tasks it spawns) with ``name``."""
+    token = _job_group.set(name)
+    try:
+        yield
+    finally:
+        _job_group.reset(token)
+
+
+async def run_cpu[**P, T](fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    return await _pool.run_cpu(fn, *args, **kwargs)
+
+
+async def run_thread[**P, T](fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    return await _pool.run_thread(fn, *args, **kwargs)
+
+
+def cpu_workers() -> int:
+    return _pool.cpu_workers
+
+
+def cancel_jobs(group: str) -> int:
+    return _pool.cancel_group(group)
+
+
+def configure_workers(processes: int, threads: int) -> None:
+    """Replace the process-wide pool with one of the given sizes."""
+    global _pool
+    _pool.shutdown()
+    _pool = WorkerPool(processes=processes, threads=threads)
+
+
+def worker_stats() -> dict[str, Any]:
+    return _pool.stats()
+
+
+def shutdown_workers() -> None:
+    _pool.shutdown()
+
+
+def reset_workers() -> None:
+    """Replace the pool with a thread-only one so tests don't spawn interpreters (tests only)."""
+    configure_workers(processes=0, threads=_DEFAULT_THREADS)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pytest
+import respx
+from httpx import Request, Response
+
+from ehrlich.analysis.infrastructure.chembl_loader import ChEMBLLoader
+from ehrlich.kernel.exceptions import ExternalServiceError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_URL = "https://www.ebi.ac.uk/chembl/api/data/activity.json"
+
+
+def _activity(i: int, value: float = 500.0, units: str = "nM") -> dict[str, object]:
+    return {
+        "canonical_smiles": f"C{'C' * i}O",
+        "standard_value": str(value),
+        "standard_units": units,
+        "standard_type": "MIC",
+        "assay_chembl_id": f"CHEMBL{i}",
+    }
+
+
+def _page_server(total: int, page_size: int) -> respx.Route:
+    def handler(request: Request) -> Response:
+        offset = int(request.url.params["offset"])
+        limit = min(int(request.url.params["limit"]), page_size)
+        acts = [_activity(i) for i in range(offset, min(offset + limit, total))]
+        return Response(200, json={"page_meta": {"total_count": total}, "activities": acts})
+
+    return respx.get(_URL).mock(side_effect=handler)
+
+
+class TestChEMBLLoader:
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_fetches_all_pages_into_parquet(self, tmp_path: Path) -> None:
+        route = _page_server(total=25, page_size=10)
+        loader = ChEMBLLoader(cache_dir=tmp_path, page_size=10, concurrency=3)
+        dataset = await loader.load("Staphylococcus aureus")
+        assert dataset.size == 25
+        assert route.call_count == 3
+        cached = pd.read_parquet(tmp_path / "chembl_staphylococcus_aureus.parquet")
+        assert len(cached) == 25
+        assert not list(tmp_path.glob("*.part"))
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_max_activities_caps_pages(self, tmp_path: Path) -> None:
+        route = _page_server(total=100, page_size=10)
+        loader = ChEMBLLoader(cache_dir=tmp_path, page_size=10, max_activities=30)
+        dataset = await loader.search_bioactivity("E. coli", ["IC50"])
+        assert dataset.size == 30
+        assert route.call_count == 3
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_max_activities_is_exact_mid_page(self, tmp_path: Path) -> None:
+        route = _page_server(total=100, page_size=10)
+        loader = ChEMBLLoader(cache_dir=tmp_path, page_size=10, max_activities=25)
+        dataset = await loader.load("E. coli")
+        assert dataset.size == 25
+        assert route.calls[-1].request.url.params["limit"] == "5"
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_of_one_target(self, tmp_path: Path) -> None:
+        _page_server(total=25, page_size=10)
+        loader = ChEMBLLoader(cache_dir=tmp_path, page_size=10, concurrency=1)
+        first, second = await asyncio.gather(
+            loader.load("target", threshold=1.0), loader.load("target", threshold=10.0)
+        )
+        assert first.size == second.size == 25
+        assert len(pd.read_parquet(tmp_path / "chembl_target.parquet")) == 25
+        assert [p.name for p in tmp_path.iterdir()] == ["chembl_target.parquet"]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_second_load_reads_cache(self, tmp_path: Path) -> None:
+        route = _page_server(total=5, page_size=10)
+        loader = ChEMBLLoader(cache_dir=tmp_path, page_size=10)
+        await loader.load("target")
+        dataset = await loader.load("target", threshold=7.0)
+        assert route.call_count == 1
+        # 500 nM -> pIC50 6.3, below the stricter threshold
+        assert sum(dataset.activities) == 0
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_duplicate_smiles_are_aggregated(self, tmp_path: Path) -> None:
+        acts = [_activity(1, 100.0), _activity(1, 1.0, "uM"), _activity(2, 10.0, "mg/L")]
+        respx.get(_URL).mock(return_value=Response(200, json={"activities": acts}))
+        dataset = await ChEMBLLoader(cache_dir=tmp_path).load("target")
+        assert dataset.size == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_empty_result_is_not_cached(self, tmp_path: Path) -> None:
+        respx.get(_URL).mock(return_value=Response(200, json={"activities": []}))
+        dataset = await ChEMBLLoader(cache_dir=tmp_path).load("nothing")
+        assert dataset.size == 0
+        assert not list(tmp_path.iterdir())
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_failed_page_leaves_no_cache(self, tmp_path: Path) -> None:
+        def handler(request: Request) -> Response:
+            offset = int(request.url.params["offset"])
+            if offset >= 20:
+                return Response(404)
+            acts = [_activity(i) for i in range(offset, offset + 10)]
+            return Response(200, json={"page_meta": {"total_count": 40}, "activities": acts})
+
+        respx.get(_URL).mock(side_effect=handler)
+        loader = ChEMBLLoader(cache_dir=tmp_path, page_size=10)
+        with pytest.raises(ExternalServiceError, match="ChEMBL"):
+            await loader.load("target")
+        assert not list(tmp_path.iterdir())
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ehrlich.analysis.infrastructure.chembl_similarity import ChEMBLSimilarityIndex
+from ehrlich.kernel.exceptions import InvalidSMILESError
+
+
+def _write_cache(path: Path, smiles: list[str]) -> None:
+    pd.DataFrame({"smiles": smiles, "value_um": [1.0] * len(smiles)}).to_parquet(path)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    _write_cache(
+        tmp_path / "chembl_staphylococcus_aureus.parquet",
+        ["c1ccccc1O", "Cc1ccccc1O", "c1ccccc1O", "CCCCCCCC", "not-a-smiles"],
+    )
+    return tmp_path
+
+
+class TestChEMBLSimilarityIndex:
+    @pytest.mark.asyncio
+    async def test_finds_analogs(self, cache_dir: Path) -> None:
+        index = ChEMBLSimilarityIndex(cache_dir=cache_dir)
+        results = await index.search_by_similarity("c1ccccc1O", threshold=0.3, limit=5)
+        assert results[0].smiles == "c1ccccc1O"
+        assert results[0].similarity == 1.0
+        assert results[0].source == "chembl:staphylococcus_aureus"
+        assert results[0].molecular_weight == pytest.approx(94.11, abs=0.01)
+        assert [r.smiles for r in results] == ["c1ccccc1O", "Cc1ccccc1O"]
+
+    @pytest.mark.asyncio
+    async def test_picks_up_new_and_removed_caches(self, cache_dir: Path) -> None:
+        index = ChEMBLSimilarityIndex(cache_dir=cache_dir)
+        assert await index.search_by_similarity("CCN(CC)CC", threshold=0.9) == []
+        new_file = cache_dir / "chembl_escherichia_coli_ic50.parquet"
+        _write_cache(new_file, ["CCN(CC)CC"])
+        results = await index.search_by_similarity("CCN(CC)CC", threshold=0.9)
+        assert [r.source for r in results] == ["chembl:escherichia_coli_ic50"]
+        new_file.unlink()
+        assert await index.search_by_similarity("CCN(CC)CC", threshold=0.9) == []
+
+    def test_collapses_compounds_shared_across_caches(self, tmp_path: Path) -> None:
+        for name in ("a", "b", "c"):
+            _write_cache(tmp_path / f"chembl_{name}.parquet", ["c1ccccc1O", "Cc1ccccc1O", "CCCCO"])
+        results = ChEMBLSimilarityIndex(cache_dir=tmp_path).search("c1ccccc1O", 0.3, 3)
+        assert [r.smiles for r in results] == ["c1ccccc1O", "Cc1ccccc1O"]
+        assert results[0].source == "chembl:a,chembl:b,chembl:c"
+        assert results[1].source == "chembl:a,chembl:b,chembl:c"
+
+    def test_reloads_persisted_index(
+        self, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        ChEMBLSimilarityIndex(cache_dir=cache_dir).sync()
+        assert (cache_dir / "similarity_index.npz").exists()
+        reloaded = ChEMBLSimilarityIndex(cache_dir=cache_dir)
+
+        def fail(path: Path) -> None:
+            raise AssertionError(f"re-fingerprinted {path}")
+
+        monkeypatch.setattr(reloaded, "_fingerprint", fail)
+        assert len(reloaded.sync()) == 3
+
+    def test_rebuilds_corrupt_index(self, cache_dir: Path) -> None:
+        (cache_dir / "similarity_index.npz").write_bytes(b"garbage")
+        assert len(ChEMBLSimilarityIndex(cache_dir=cache_dir).sync()) == 3
+
+    def test_invalid_query(self, cache_dir: Path) -> None:
+        with pytest.raises(InvalidSMILESError):
+            ChEMBLSimilarityIndex(cache_dir=cache_dir).search("not-a-smiles")
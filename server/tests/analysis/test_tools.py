@@ -137,6 +137,42 @@ class TestSearchCompounds:
             assert result["count"] == 1
             assert result["search_type"] == "similarity"
 
+    @pytest.mark.asyncio
+    async def test_search_local_similarity(self) -> None:
+        from ehrlich.analysis import tools
+
+        mock_results = [
+            CompoundSearchResult(
+                cid=0,
+                smiles="CCO",
+                iupac_name="",
+                molecular_formula="",
+                molecular_weight=46.07,
+                source="chembl:escherichia_coli",
+                similarity=1.0,
+            )
+        ]
+        with patch.object(
+            tools._service, "search_local_similarity", new_callable=AsyncMock
+        ) as mock:
+            mock.return_value = mock_results
+            result = json.loads(await tools.search_compounds("CCO", search_type="local_similarity"))
+            assert result["search_type"] == "local_similarity"
+            assert result["compounds"][0]["similarity"] == 1.0
+            assert result["compounds"][0]["source"] == "chembl:escherichia_coli"
+
+    @pytest.mark.asyncio
+    async def test_local_similarity_invalid_smiles(self) -> None:
+        from ehrlich.analysis import tools
+        from ehrlich.kernel.exceptions import InvalidSMILESError
+
+        with patch.object(
+            tools._service, "search_local_similarity", new_callable=AsyncMock
+        ) as mock:
+            mock.side_effect = InvalidSMILESError("xx")
+            result = json.loads(await tools.search_compounds("xx", search_type="local_similarity"))
+            assert "error" in result
+
     @pytest.mark.asyncio
     async def test_error_handling(self) -> None:
         from ehrlich.analysis import tools
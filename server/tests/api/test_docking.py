@@ -0,0 +1,141 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from ehrlich.api.app import create_app
+from ehrlich.api.auth import get_current_user, get_current_user_sse
+from ehrlich.simulation.application.docking_scheduler import (
+    shared_docking_scheduler,
+    shutdown_docking,
+)
+
+_TEST_USER = {"workos_id": "workos_docking_test", "email": "docking@test.com"}
+_OTHER_USER = {"workos_id": "workos_other_user", "email": "other@test.com"}
+
+
+async def _mock_user() -> dict[str, str]:
+    return _TEST_USER
+
+
+async def _mock_other_user() -> dict[str, str]:
+    return _OTHER_USER
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = create_app()
+    app.dependency_overrides[get_current_user] = _mock_user
+    app.dependency_overrides[get_current_user_sse] = _mock_user
+    return app
+
+
+@pytest.fixture
+async def client(app: FastAPI) -> AsyncIterator[httpx.AsyncClient]:
+    # Requests run on the test's own event loop, so the shared scheduler's
+    # consumer tasks keep draining the queue between requests.
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+    await shutdown_docking()
+    shared_docking_scheduler.cache_clear()
+
+
+async def _wait(client: httpx.AsyncClient, job_id: str) -> dict[str, Any]:
+    for _ in range(200):
+        body: dict[str, Any] = (await client.get(f"/api/v1/docking/jobs/{job_id}")).json()
+        if body["status"] in ("completed", "cancelled"):
+            return body
+        await asyncio.sleep(0.05)
+    raise AssertionError("docking job did not finish")
+
+
+def _events(text: str) -> list[dict[str, Any]]:
+    return [json.loads(line[5:]) for line in text.splitlines() if line.startswith("data:")]
+
+
+class TestDockingJobs:
+    async def test_submit_and_complete(self, client: httpx.AsyncClient) -> None:
+        resp = await client.post(
+            "/api/v1/docking/jobs", json={"smiles": ["CCO", "c1ccccc1"], "targets": ["1VQQ"]}
+        )
+        assert resp.status_code == 202
+        job_id = resp.json()["job_id"]
+        assert resp.json()["total"] == 2
+
+        body = await _wait(client, job_id)
+        assert body["status"] == "completed"
+        assert body["done"] == 2
+        assert {r["smiles"] for r in body["results"]} == {"CCO", "c1ccccc1"}
+        assert all(r["binding_energy"] < 0 for r in body["results"])
+
+    async def test_event_stream_replays_finished_job(self, client: httpx.AsyncClient) -> None:
+        resp = await client.post(
+            "/api/v1/docking/jobs", json={"smiles": ["CCO"], "targets": ["1VQQ", "2XCT"]}
+        )
+        job_id = resp.json()["job_id"]
+        await _wait(client, job_id)
+
+        resp = await client.get(f"/api/v1/docking/jobs/{job_id}/events")
+        events = _events(resp.text)
+        assert events[0]["type"] == "docking_queued"
+        assert events[-1]["type"] == "docking_completed"
+
+        resumed = await client.get(
+            f"/api/v1/docking/jobs/{job_id}/events", headers={"Last-Event-ID": "0"}
+        )
+        assert _events(resumed.text) == events[1:]
+
+    async def test_unknown_target_400(self, client: httpx.AsyncClient) -> None:
+        resp = await client.post(
+            "/api/v1/docking/jobs", json={"smiles": ["CCO"], "targets": ["0XXX"]}
+        )
+        assert resp.status_code == 400
+
+    async def test_too_many_pairs_422(self, client: httpx.AsyncClient) -> None:
+        resp = await client.post(
+            "/api/v1/docking/jobs",
+            json={"smiles": ["C"] * 1000, "targets": ["1VQQ"] * 6},
+        )
+        assert resp.status_code == 422
+
+    async def test_unknown_job_404(self, client: httpx.AsyncClient) -> None:
+        assert (await client.get("/api/v1/docking/jobs/nope")).status_code == 404
+        assert (await client.get("/api/v1/docking/jobs/nope/events")).status_code == 404
+        assert (await client.post("/api/v1/docking/jobs/nope/cancel")).status_code == 404
+
+    async def test_cancel(self, client: httpx.AsyncClient) -> None:
+        ligands = ["C" * n for n in range(1, 40)]
+        resp = await client.post(
+            "/api/v1/docking/jobs", json={"smiles": ligands, "targets": ["1VQQ"]}
+        )
+        resp = await client.post(f"/api/v1/docking/jobs/{resp.json()['job_id']}/cancel")
+        assert resp.status_code == 200
+        assert resp.json()["status"] in ("cancelled", "completed")
+
+    async def test_requires_auth(self, app: FastAPI, client: httpx.AsyncClient) -> None:
+        app.dependency_overrides.clear()
+        resp = await client.post(
+            "/api/v1/docking/jobs", json={"smiles": ["CCO"], "targets": ["1VQQ"]}
+        )
+        assert resp.status_code == 401
+
+    async def test_other_user_forbidden(self, app: FastAPI, client: httpx.AsyncClient) -> None:
+        resp = await client.post(
+            "/api/v1/docking/jobs", json={"smiles": ["CCO"], "targets": ["1VQQ"]}
+        )
+        job_id = resp.json()["job_id"]
+        app.dependency_overrides[get_current_user] = _mock_other_user
+        app.dependency_overrides[get_current_user_sse] = _mock_other_user
+        assert (await client.get(f"/api/v1/docking/jobs/{job_id}")).status_code == 403
+        assert (await client.get(f"/api/v1/docking/jobs/{job_id}/events")).status_code == 403
+        assert (await client.post(f"/api/v1/docking/jobs/{job_id}/cancel")).status_code == 403
+
+    async def test_health(self, client: httpx.AsyncClient) -> None:
+        resp = await client.get("/api/v1/health/docking")
+        assert resp.status_code == 200
+        assert "vina_available" in resp.json()
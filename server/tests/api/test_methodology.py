@@ -72,7 +72,7 @@ class TestMethodology:
     def test_total_tool_count(self, client: TestClient) -> None:
         data = client.get("/api/v1/methodology").json()
         total = sum(len(g["tools"]) for g in data["tools"])
-        assert total == 91
+        assert total == 92
 
     def test_tool_has_name_and_description(self, client: TestClient) -> None:
         data = client.get("/api/v1/methodology").json()
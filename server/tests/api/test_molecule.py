@@ -1,7 +1,12 @@
+import json
+from typing import Any
+
 import pytest
 from fastapi.testclient import TestClient
+from httpx import Response
 
 from ehrlich.api.app import create_app
+from ehrlich.api.auth import get_current_user
 
 
 @pytest.fixture
@@ -10,6 +15,17 @@ def client() -> TestClient:
     return TestClient(app)
 
 
+async def _mock_user() -> dict[str, str]:
+    return {"workos_id": "workos_molecule_test", "email": "molecule@test.com"}
+
+
+@pytest.fixture
+def authed_client() -> TestClient:
+    app = create_app()
+    app.dependency_overrides[get_current_user] = _mock_user
+    return TestClient(app)
+
+
 class TestDepict:
     def test_returns_svg(self, client: TestClient) -> None:
         resp = client.get("/api/v1/molecule/depict", params={"smiles": "CCO"})
@@ -32,6 +48,44 @@ class TestDepict:
         resp = client.get("/api/v1/molecule/depict", params={"smiles": "CCO"})
         assert "max-age=86400" in resp.headers.get("cache-control", "")
 
+    def test_etag_revalidation_304(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/molecule/depict", params={"smiles": "CCO"})
+        etag = resp.headers["etag"]
+        again = client.get(
+            "/api/v1/molecule/depict", params={"smiles": "OCC"}, headers={"If-None-Match": etag}
+        )
+        assert again.status_code == 304
+        assert again.headers["etag"] == etag
+        assert again.content == b""
+
+    def test_etag_differs_by_size(self, client: TestClient) -> None:
+        small = client.get("/api/v1/molecule/depict", params={"smiles": "CCO", "w": 100})
+        large = client.get("/api/v1/molecule/depict", params={"smiles": "CCO", "w": 400})
+        assert small.headers["etag"] != large.headers["etag"]
+
+
+class TestDepictBatch:
+    def test_returns_one_result_per_smiles(self, client: TestClient) -> None:
+        resp = client.post(
+            "/api/v1/molecule/depict/batch",
+            json={"smiles": ["CCO", "invalid!!!", "OCC"], "w": 120, "h": 90},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [r["smiles"] for r in data] == ["CCO", "invalid!!!", "OCC"]
+        assert "<svg" in data[0]["svg"]
+        assert "error" in data[1]
+        assert data[2]["etag"] == data[0]["etag"]
+
+    def test_matches_single_endpoint_etag(self, client: TestClient) -> None:
+        batch = client.post("/api/v1/molecule/depict/batch", json={"smiles": ["c1ccccc1O"]})
+        single = client.get("/api/v1/molecule/depict", params={"smiles": "c1ccccc1O"})
+        assert batch.json()[0]["etag"] == single.headers["etag"]
+
+    def test_rejects_oversized_batch(self, client: TestClient) -> None:
+        resp = client.post("/api/v1/molecule/depict/batch", json={"smiles": ["C"] * 201})
+        assert resp.status_code == 422
+
 
 class TestConformer:
     def test_returns_molblock(self, client: TestClient) -> None:
@@ -48,6 +102,91 @@ class TestConformer:
         assert resp.status_code == 400
 
 
+class TestConformerBatch:
+    def test_returns_one_result_per_smiles(self, client: TestClient) -> None:
+        resp = client.post(
+            "/api/v1/molecule/conformers", json={"smiles": ["CCO", "invalid!!!", "c1ccccc1"]}
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [r["smiles"] for r in data] == ["CCO", "invalid!!!", "c1ccccc1"]
+        assert data[0]["num_atoms"] > 0
+        assert "error" in data[1]
+        assert "mol_block" in data[2]
+
+    def test_empty_batch_422(self, client: TestClient) -> None:
+        resp = client.post("/api/v1/molecule/conformers", json={"smiles": []})
+        assert resp.status_code == 422
+
+
+def _ndjson(resp: Response) -> list[dict[str, Any]]:
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+class TestStreamingBatch:
+    def test_validate(self, authed_client: TestClient) -> None:
+        rows = _ndjson(
+            authed_client.post(
+                "/api/v1/molecule/validate/batch", json={"smiles": ["OCC", "invalid!!!"]}
+            )
+        )
+        assert rows == [
+            {"index": 0, "smiles": "OCC", "valid": True, "canonical": "CCO"},
+            {"index": 1, "smiles": "invalid!!!", "valid": False, "canonical": None},
+        ]
+
+    @pytest.mark.parametrize("kind", ["validate", "descriptors", "fingerprints", "admet"])
+    def test_requires_auth(self, client: TestClient, kind: str) -> None:
+        resp = client.post(f"/api/v1/molecule/{kind}/batch", json={"smiles": ["CCO"]})
+        assert resp.status_code == 401
+
+    def test_descriptors_match_single_endpoint(self, authed_client: TestClient) -> None:
+        rows = _ndjson(
+            authed_client.post(
+                "/api/v1/molecule/descriptors/batch", json={"smiles": ["CCO", "bad!!!"]}
+            )
+        )
+        single = authed_client.get("/api/v1/molecule/descriptors", params={"smiles": "CCO"}).json()
+        assert rows[0] == {"index": 0, "smiles": "CCO", **single}
+        assert rows[1]["index"] == 1
+        assert "error" in rows[1]
+
+    def test_fingerprints(self, authed_client: TestClient) -> None:
+        rows = _ndjson(
+            authed_client.post(
+                "/api/v1/molecule/fingerprints/batch",
+                json={"smiles": ["c1ccccc1O", "bad!!!"], "fp_type": "maccs"},
+            )
+        )
+        assert rows[0]["fp_type"] == "maccs"
+        assert rows[0]["on_bits_count"] == len(rows[0]["on_bits"]) > 0
+        assert "error" in rows[1]
+
+    def test_admet(self, authed_client: TestClient) -> None:
+        rows = _ndjson(
+            authed_client.post("/api/v1/molecule/admet/batch", json={"smiles": ["CCO", "bad!!!"]})
+        )
+        assert rows[0]["absorption"] == 100.0
+        assert "has_toxicity_flags" in rows[0]
+        assert "error" in rows[1]
+
+    def test_many_rows_stay_in_order(self, authed_client: TestClient) -> None:
+        smiles = ["C" * n for n in range(1, 31)] * 20
+        rows = _ndjson(
+            authed_client.post("/api/v1/molecule/validate/batch", json={"smiles": smiles})
+        )
+        assert [r["index"] for r in rows] == list(range(len(smiles)))
+        assert [r["smiles"] for r in rows] == smiles
+
+    def test_rejects_unknown_fp_type(self, authed_client: TestClient) -> None:
+        resp = authed_client.post(
+            "/api/v1/molecule/fingerprints/batch", json={"smiles": ["CCO"], "fp_type": "ecfp"}
+        )
+        assert resp.status_code == 422
+
+
 class TestDescriptors:
     def test_returns_data(self, client: TestClient) -> None:
         resp = client.get("/api/v1/molecule/descriptors", params={"smiles": "CCO"})
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ehrlich.api.routes import upload
+from ehrlich.investigation.application.file_processor import FileProcessor
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_CSV = b"smiles,activity\nCCO,1\nCCN,0\n"
+
+
+@pytest.fixture
+def upload_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("EHRLICH_UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(upload, "_pending_uploads", {})
+    monkeypatch.setattr(upload, "_pending_upload_times", {})
+    return tmp_path
+
+
+def _pending(file_id: str, age: float) -> None:
+    uploaded = FileProcessor().process("data.csv", _CSV)
+    upload._spool(file_id, "data.csv", _CSV)
+    upload._pending_uploads[file_id] = ("user", uploaded)
+    upload._pending_upload_times[file_id] = time.time() - age
+
+
+class TestSpoolLifetime:
+    def test_claimed_upload_keeps_spool_until_discarded(self, upload_dir: Path) -> None:
+        _pending("f1", age=0)
+        assert upload.get_pending_upload("f1", "user") is not None
+        assert (upload_dir / "f1.csv").exists()
+        upload.discard_spool("f1")
+        assert not (upload_dir / "f1.csv").exists()
+
+    def test_expired_upload_is_dropped_on_lookup(self, upload_dir: Path) -> None:
+        _pending("f1", age=upload._UPLOAD_TTL_SECONDS + 1)
+        assert upload.get_pending_upload("f1", "user") is None
+        assert not (upload_dir / "f1.csv").exists()
+
+    def test_unclaimed_uploads_are_swept(self, upload_dir: Path) -> None:
+        _pending("old", age=upload._UPLOAD_TTL_SECONDS + 1)
+        _pending("new", age=0)
+        upload._sweep_expired()
+        assert set(upload._pending_uploads) == {"new"}
+        assert [p.name for p in upload_dir.iterdir()] == ["new.csv"]
+
+    def test_orphaned_spools_swept_at_startup(self, upload_dir: Path) -> None:
+        stale = upload_dir / "stale.smi"
+        stale.write_text("CCO\n")
+        old = time.time() - upload._ORPHAN_SPOOL_SECONDS - 1
+        os.utime(stale, (old, old))
+        (upload_dir / "fresh.smi").write_text("CCN\n")
+        upload.sweep_orphaned_spools()
+        assert [p.name for p in upload_dir.iterdir()] == ["fresh.smi"]
@@ -0,0 +1,105 @@
+from pathlib import Path
+
+import pytest
+from rdkit import Chem
+
+from ehrlich.chemistry.infrastructure import alert_catalog
+from ehrlich.chemistry.infrastructure.alert_catalog import load_alert_catalog
+from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+from ehrlich.kernel.exceptions import InvalidSMILESError
+from ehrlich.kernel.types import SMILES
+from ehrlich.shared.alerts import AlertCatalog, StructuralAlert
+
+_MOLECULES = [
+    "CCO",
+    "c1ccccc1[N+](=O)[O-]",
+    "O=C1C=CC(=O)C=C1",
+    "CC(=O)Cl",
+    "CC(=O)SC",
+    "CC(=O)Oc1ccccc1C(=O)O",
+    "NS(=O)(=O)c1ccc(N)cc1",
+    "CC1(C)SC2C(NC(=O)Cc3ccccc3)C(=O)N2C1C(=O)O",
+    "O=C(O)c1cn(C2CC2)c2cc(N3CCNCC3)c(F)cc2c1=O",
+    "CN=[N+]=[N-]",
+    "c1ccc2c(c1)cccc2O",
+]
+
+
+def _catalog() -> AlertCatalog:
+    return AlertCatalog(
+        [
+            StructuralAlert("nitro", "[N+](=O)[O-]", "mutagenic"),
+            StructuralAlert("acyl_chloride", "C(=O)Cl", "hepatotoxic"),
+            StructuralAlert("phenol", "c1ccc(cc1)O", "enrichment"),
+            StructuralAlert("phenol_again", "c1ccc(cc1)O", "other"),
+            StructuralAlert("bad", "[[not smarts", "other"),
+            StructuralAlert("lactam", "C1C(C(=O)N1)S", "resistance", targets=("1VQQ",)),
+        ]
+    )
+
+
+class TestCatalog:
+    def test_masks(self) -> None:
+        catalog = _catalog()
+        assert catalog.mask("mutagenic") == 0b1
+        assert catalog.mask("resistance", target="1VQQ") == 0b100000
+        assert catalog.mask("resistance", target="2XCT") == 0
+        assert catalog.mask() == 0b111111
+
+    def test_matched_and_select(self) -> None:
+        catalog = _catalog()
+        assert [a.name for a in catalog.matched(0b1001)] == ["nitro", "phenol_again"]
+        assert [a.name for a in catalog.select("hepatotoxic")] == ["acyl_chloride"]
+
+    def test_default_catalog_loaded_once(self) -> None:
+        catalog = load_alert_catalog()
+        assert catalog is load_alert_catalog()
+        assert catalog.mask("mutagenic") and catalog.mask("enrichment")
+        assert catalog.mask("resistance", target="1VQQ")
+
+    def test_resistance_yaml(self, tmp_path: Path) -> None:
+        path = tmp_path / "resistance.yaml"
+        path.write_text('patterns:\n  "NS(=O)(=O)":\n    targets: ["1ad4"]\n')
+        catalog = load_alert_catalog(path)
+        (alert,) = catalog.select("resistance")
+        assert alert.smarts == "NS(=O)(=O)"
+        assert alert.targets == ("1AD4",)
+
+    def test_missing_yaml(self, tmp_path: Path) -> None:
+        catalog = load_alert_catalog(tmp_path / "missing.yaml")
+        assert not catalog.select("resistance").alerts
+
+
+class TestMatching:
+    @pytest.mark.parametrize("smiles", _MOLECULES)
+    def test_screened_matches_equal_direct_search(self, smiles: str) -> None:
+        catalog = load_alert_catalog()
+        bitmap = RDKitAdapter().match_alerts(SMILES(smiles), catalog)
+        mol = Chem.MolFromSmiles(smiles)
+        for i, alert in enumerate(catalog):
+            pattern = alert_catalog.compile_pattern(alert.smarts)
+            assert bool(bitmap >> i & 1) == mol.HasSubstructMatch(pattern), alert.name
+
+    def test_duplicate_patterns_set_every_bit(self) -> None:
+        bitmap = RDKitAdapter().match_alerts(SMILES("c1ccccc1O"), _catalog())
+        assert bitmap == 0b1100
+
+    def test_compiled_once_per_catalog(self) -> None:
+        catalog = _catalog()
+        assert alert_catalog.compiled(catalog) is alert_catalog.compiled(catalog)
+
+    def test_invalid_smiles(self) -> None:
+        with pytest.raises(InvalidSMILESError):
+            RDKitAdapter().match_alerts(SMILES("not-a-smiles"), _catalog())
+
+    def test_alert_matrix(self) -> None:
+        matrix = RDKitAdapter().alert_matrix(
+            [SMILES("CC(=O)Cl"), SMILES("xx"), SMILES("c1ccccc1O")], _catalog()
+        )
+        assert matrix.valid.tolist() == [True, False, True]
+        assert matrix.hits.tolist() == [
+            [False, True, False, False, False, False],
+            [False] * 6,
+            [False, False, True, True, False, False],
+        ]
+        assert matrix.patterns[1] == "C(=O)Cl"
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from rdkit import Chem
+from rdkit.Chem import rdFingerprintGenerator
+from rdkit.DataStructs import BulkTanimotoSimilarity
+
+from ehrlich.chemistry.infrastructure import bitset
+from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+from ehrlich.kernel.types import SMILES
+
+_SMILES = [
+    "CCO",
+    "c1ccccc1O",
+    "CC(=O)Oc1ccccc1C(=O)O",
+    "CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+    "CC(C)Cc1ccc(cc1)C(C)C(=O)O",
+    "c1ccc2c(c1)cccc2",
+    "NS(=O)(=O)c1ccc(N)cc1",
+]
+
+
+def _rdkit_reference() -> np.ndarray:
+    gen = rdFingerprintGenerator.GetMorganGenerator(radius=2, fpSize=2048)
+    fps = [gen.GetFingerprint(Chem.MolFromSmiles(s)) for s in _SMILES]
+    return np.array([BulkTanimotoSimilarity(fp, fps) for fp in fps])
+
+
+class TestPacking:
+    def test_round_trip(self) -> None:
+        rows = [(0, 63, 64, 2047), (), (5,)]
+        words = bitset.pack_on_bits(rows, 2048)
+        assert words.shape == (3, 32)
+        dense = bitset.unpack(words, 2048)
+        assert [tuple(np.flatnonzero(r)) for r in dense] == rows
+
+    def test_popcount(self) -> None:
+        words = bitset.pack_on_bits([(1, 2, 3), (), (100,)], 167)
+        assert words.shape == (3, 3)
+        assert bitset.popcount(words).tolist() == [3, 0, 1]
+
+
+class TestKernels:
+    def test_matrix_matches_rdkit(self) -> None:
+        adapter = RDKitAdapter()
+        fps = adapter.compute_fingerprints_batch([SMILES(s) for s in _SMILES])
+        sim = bitset.tanimoto_matrix(fps.words, fps.words)
+        np.testing.assert_allclose(sim, _rdkit_reference())
+
+    def test_one_to_many_matches_matrix_row(self) -> None:
+        adapter = RDKitAdapter()
+        fps = adapter.compute_fingerprints_batch([SMILES(s) for s in _SMILES])
+        row = bitset.tanimoto_one_to_many(fps.words[2], fps.words)
+        np.testing.assert_allclose(row, _rdkit_reference()[2])
+
+    def test_chunked_matrix(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(bitset, "_CHUNK_BYTES", 1)
+        adapter = RDKitAdapter()
+        fps = adapter.compute_fingerprints_batch([SMILES(s) for s in _SMILES])
+        np.testing.assert_allclose(bitset.tanimoto_matrix(fps.words, fps.words), _rdkit_reference())
+
+    def test_empty_rows_score_zero(self) -> None:
+        words = bitset.pack_on_bits([(), (), (3,)], 64)
+        assert bitset.tanimoto_matrix(words, words).tolist() == [
+            [0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0],
+        ]
+
+    def test_empty_inputs(self) -> None:
+        words = bitset.pack_on_bits([], 2048)
+        assert bitset.tanimoto_matrix(words, words).shape == (0, 0)
+
+
+class TestAdapterSimilarity:
+    def test_one_to_many(self) -> None:
+        adapter = RDKitAdapter()
+        fps = adapter.compute_fingerprints_batch([SMILES(s) for s in _SMILES])
+        query = adapter.compute_fingerprint(SMILES("c1ccccc1O"))
+        sims = adapter.tanimoto_one_to_many(query, fps)
+        assert sims[1] == pytest.approx(1.0)
+        for j, smi in enumerate(_SMILES):
+            other = adapter.compute_fingerprint(SMILES(smi))
+            assert sims[j] == pytest.approx(adapter.tanimoto_similarity(query, other))
+
+    def test_matrix_defaults_to_self(self) -> None:
+        adapter = RDKitAdapter()
+        fps = adapter.compute_fingerprints_batch([SMILES(s) for s in _SMILES])
+        sim = adapter.tanimoto_matrix(fps)
+        assert sim.shape == (len(_SMILES), len(_SMILES))
+        np.testing.assert_allclose(np.diag(sim), 1.0)
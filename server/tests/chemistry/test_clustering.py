@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+from rdkit.ML.Cluster import Butina
+
+from ehrlich.chemistry.infrastructure import bitset, clustering
+from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+from ehrlich.kernel.types import SMILES
+from ehrlich.prediction.domain.feature_matrix import FeatureMatrix
+from ehrlich.prediction.infrastructure.molecular_adapters import MolecularClusterer
+
+_SMILES = (
+    [f"{'C' * k}O" for k in range(1, 9)]
+    + [f"c1ccccc1{'C' * k}" for k in range(0, 6)]
+    + [f"c1ccc(cc1){'C' * k}N" for k in range(0, 5)]
+    + [f"O=C(O){'C' * k}c1ccccc1" for k in range(0, 5)]
+    + ["CC(=O)Oc1ccccc1C(=O)O", "CN1C=NC2=C1C(=O)N(C(=O)N2C)C", "NS(=O)(=O)c1ccc(N)cc1"]
+)
+
+
+@pytest.fixture
+def words() -> np.ndarray:
+    fps = RDKitAdapter().compute_fingerprints_batch([SMILES(s) for s in _SMILES])
+    return fps.words
+
+
+def _unfeatured(smiles: list[str]) -> FeatureMatrix:
+    """MolecularClusterer fingerprints the identifiers itself; features are unused."""
+    return FeatureMatrix(np.zeros((len(smiles), 0)), list(smiles))
+
+
+def _rdkit_butina(words: np.ndarray, cutoff: float) -> list[list[int]]:
+    sim = bitset.tanimoto_matrix(words, words)
+    n = len(words)
+    dists = [1.0 - sim[i, j] for i in range(1, n) for j in range(i)]
+    return [list(c) for c in Butina.ClusterData(dists, n, cutoff, isDistData=True)]
+
+
+class TestNeighborGraph:
+    def test_only_pairs_under_cutoff(self, words: np.ndarray) -> None:
+        graph = clustering.neighbor_graph(words, 0.35)
+        sim = bitset.tanimoto_matrix(words, words)
+        assert len(graph.indices) == int((1.0 - sim <= 0.35).sum())
+        for i in range(graph.n):
+            assert i in graph.neighbors(i)
+            assert graph.neighbors(i).tolist() == np.flatnonzero(1.0 - sim[i] <= 0.35).tolist()
+
+    def test_blocked_matches_single_block(
+        self, words: np.ndarray, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        whole = clustering.neighbor_graph(words, 0.5)
+        monkeypatch.setattr(bitset, "_CHUNK_BYTES", 8 * len(words) * 3)
+        blocked = clustering.neighbor_graph(words, 0.5)
+        assert blocked.indptr.tolist() == whole.indptr.tolist()
+        assert blocked.indices.tolist() == whole.indices.tolist()
+
+
+class TestButina:
+    @pytest.mark.parametrize("cutoff", [0.2, 0.35, 0.6])
+    def test_matches_rdkit(self, words: np.ndarray, cutoff: float) -> None:
+        graph = clustering.neighbor_graph(words, cutoff)
+        assert clustering.butina(graph) == _rdkit_butina(words, cutoff)
+
+    def test_empty(self) -> None:
+        graph = clustering.neighbor_graph(bitset.pack_on_bits([], 2048), 0.35)
+        assert clustering.butina(graph) == []
+
+
+class TestLeader:
+    def test_partitions_all_points(self, words: np.ndarray) -> None:
+        clusters = clustering.leader(words, 0.6)
+        flat = sorted(i for c in clusters for i in c)
+        assert flat == list(range(len(words)))
+        assert [len(c) for c in clusters] == sorted((len(c) for c in clusters), reverse=True)
+
+    def test_members_within_cutoff_of_leader(self, words: np.ndarray) -> None:
+        sim = bitset.tanimoto_matrix(words, words)
+        for cluster in clustering.leader(words, 0.6):
+            head = cluster[0]
+            assert all(1.0 - sim[head, m] <= 0.6 for m in cluster)
+
+    def test_small_blocks(self, words: np.ndarray, monkeypatch: pytest.MonkeyPatch) -> None:
+        expected = clustering.leader(words, 0.6)
+        monkeypatch.setattr(clustering, "_LEADER_BLOCK", 4)
+        assert clustering.leader(words, 0.6) == expected
+
+    def test_duplicates_share_cluster(self) -> None:
+        words = bitset.pack_on_bits([(1, 2, 3), (1, 2, 3), (40, 41)], 64)
+        assert clustering.leader(words, 0.1) == [[0, 1], [2]]
+
+
+class TestMolecularClusterer:
+    def test_exact_and_truncated(self) -> None:
+        clusterer = MolecularClusterer(RDKitAdapter())
+        clusters = clusterer.cluster(_unfeatured(_SMILES), n_clusters=3)
+        assert len(clusters) == 3
+        assert len(clusters[0]) >= len(clusters[2])
+
+    def test_leader_above_exact_limit(self) -> None:
+        clusterer = MolecularClusterer(RDKitAdapter(), exact_limit=5)
+        clusters = clusterer.cluster(_unfeatured([*_SMILES, "invalid!!"]), n_clusters=100)
+        assert sorted(s for members in clusters.values() for s in members) == sorted(_SMILES)
+
+    def test_unknown_method(self) -> None:
+        adapter = RDKitAdapter()
+        fps = adapter.compute_fingerprints_batch([SMILES("CCO")])
+        with pytest.raises(ValueError, match="Unknown clustering method"):
+            adapter.cluster_fingerprints(fps, method="kmeans")
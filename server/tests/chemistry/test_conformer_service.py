@@ -0,0 +1,98 @@
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ehrlich.chemistry.application import conformer_service
+from ehrlich.chemistry.application.conformer_service import ConformerService
+from ehrlich.chemistry.infrastructure.conformer_store import ConformerStore, conformer_variant
+from ehrlich.kernel.exceptions import InvalidSMILESError
+from ehrlich.kernel.types import SMILES, MolBlock
+from ehrlich.shared.conformer import Conformer3D
+
+# InChIKey of ethanol
+_ETHANOL = "LFQSCWFLJHTTHZ-UHFFFAOYSA-N"
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ConformerStore:
+    return ConformerStore(tmp_path / "conformers.db")
+
+
+class TestConformerStore:
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        conf = Conformer3D(mol_block=MolBlock("block"), energy=-1.5, num_atoms=9)
+        ConformerStore(tmp_path / "c.db").put_many("v1", {_ETHANOL: conf})
+        assert ConformerStore(tmp_path / "c.db").get_many("v1", [_ETHANOL, "OTHER"]) == {
+            _ETHANOL: conf
+        }
+
+    def test_variants_are_separate(self, store: ConformerStore) -> None:
+        store.put_many("v1", {_ETHANOL: Conformer3D(mol_block=MolBlock("block"))})
+        assert store.get_many("v2", [_ETHANOL]) == {}
+
+    def test_evicts_oldest(self, tmp_path: Path) -> None:
+        store = ConformerStore(tmp_path / "c.db", max_entries=2)
+        for key in "abc":
+            store.put_many("v1", {key: Conformer3D(mol_block=MolBlock(key))})
+        assert store.stats()["entries"] == 2
+        assert set(store.get_many("v1", "abc")) == {"b", "c"}
+
+    def test_evicts_least_recently_read(self, tmp_path: Path) -> None:
+        store = ConformerStore(tmp_path / "c.db", max_entries=2)
+        store.put_many("v1", {"a": Conformer3D(mol_block=MolBlock("a"))})
+        store.put_many("v1", {"b": Conformer3D(mol_block=MolBlock("b"))})
+        store.get_many("v1", ["a"])
+        store.put_many("v1", {"c": Conformer3D(mol_block=MolBlock("c"))})
+        assert set(store.get_many("v1", "abc")) == {"a", "c"}
+
+
+class TestConformerService:
+    @pytest.mark.asyncio
+    async def test_lowest_energy_conformer(self) -> None:
+        conf = await ConformerService(num_conformers=5).generate(SMILES("CCCCO"))
+        assert conf.num_atoms > 0
+        assert "V2000" in conf.mol_block or "V3000" in conf.mol_block
+
+    @pytest.mark.asyncio
+    async def test_invalid_raises(self) -> None:
+        with pytest.raises(InvalidSMILESError):
+            await ConformerService().generate(SMILES("INVALID!!!"))
+
+    @pytest.mark.asyncio
+    async def test_serves_repeats_from_store(self, store: ConformerStore) -> None:
+        service = ConformerService(store=store, num_conformers=3)
+        first = await service.generate(SMILES("CCO"))
+        # Another spelling of the same molecule shares the InChIKey entry.
+        second = await service.generate(SMILES("OCC"))
+        assert second == first
+        assert store.stats()["hits"] == 1
+        assert _ETHANOL in store.get_many(conformer_variant(3), [_ETHANOL])
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_errors_by_index(self, store: ConformerStore) -> None:
+        service = ConformerService(store=store, num_conformers=3)
+        confs, errors = await service.generate_many(
+            [SMILES("CCO"), SMILES("INVALID!!!"), SMILES("OCC"), SMILES("c1ccccc1")]
+        )
+        assert confs[1] is None
+        assert set(errors) == {1}
+        assert confs[0] == confs[2]
+        assert confs[3] is not None
+        assert store.stats()["entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_lone_miss_uses_every_core(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        threads: list[int] = []
+
+        async def run_inline(fn: Callable[..., Any], *args: Any) -> Any:
+            threads.append(args[-1])
+            return fn(*args)
+
+        monkeypatch.setattr(conformer_service, "run_cpu", run_inline)
+        service = ConformerService(num_conformers=2, num_threads=1)
+        await service.generate(SMILES("CCO"))
+        assert threads == [0]
+        await service.generate_many([SMILES("CCO"), SMILES("CCN")])
+        assert threads[1:] == [1, 1]
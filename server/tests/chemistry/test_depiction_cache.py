@@ -0,0 +1,35 @@
+import pytest
+
+from ehrlich.chemistry.infrastructure.depiction_cache import Depiction, DepictionCache
+
+
+class TestDepictionCache:
+    def test_miss_then_hit(self) -> None:
+        cache = DepictionCache()
+        assert cache.get("CCO", 300, 200) is None
+        stored = cache.put("CCO", 300, 200, "<svg/>")
+        assert cache.get("CCO", 300, 200) is stored
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_sizes_are_separate_entries(self) -> None:
+        cache = DepictionCache()
+        cache.put("CCO", 300, 200, "<svg/>")
+        assert cache.get("CCO", 100, 80) is None
+
+    def test_etag_is_content_addressed(self) -> None:
+        assert Depiction.of("<svg/>").etag == Depiction.of("<svg/>").etag
+        assert Depiction.of("<svg/>").etag != Depiction.of("<svg></svg>").etag
+        assert Depiction.of("<svg/>").etag.startswith('"')
+
+    def test_evicts_by_bytes(self) -> None:
+        cache = DepictionCache(max_bytes=10)
+        cache.put("C", 1, 1, "x" * 6)
+        cache.put("CC", 1, 1, "x" * 6)
+        assert cache.get("C", 1, 1) is None
+        assert cache.get("CC", 1, 1) is not None
+        assert cache.stats()["bytes"] == 6
+        assert cache.evictions == 1
+
+    def test_rejects_non_positive_budget(self) -> None:
+        with pytest.raises(ValueError, match="max_bytes"):
+            DepictionCache(max_bytes=0)
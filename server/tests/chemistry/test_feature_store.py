@@ -0,0 +1,138 @@
+from pathlib import Path
+
+import numpy as np
+import pyarrow.parquet as pq
+import pytest
+import rdkit
+
+from ehrlich.chemistry.infrastructure.alert_catalog import load_alert_catalog
+from ehrlich.chemistry.infrastructure.feature_store import FeatureStore
+from ehrlich.chemistry.infrastructure.mol_cache import MolCache
+from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+from ehrlich.kernel.types import SMILES
+
+_SMILES = [SMILES(s) for s in ["CCO", "c1ccccc1O", "not-a-smiles", "CC(=O)Oc1ccccc1C(=O)O"]]
+
+
+def _parts(root: Path) -> list[Path]:
+    return sorted(root.glob("*/part-*.parquet"))
+
+
+def _store(root: Path, **kwargs: int) -> FeatureStore:
+    """A store that writes every put straight to disk."""
+    return FeatureStore(root, flush_rows=1, **kwargs)
+
+
+class TestFeatureStore:
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        _store(tmp_path).put_many("kind-v1", {"CCO": ([1, 2], None), "xx": (None, "bad")})
+        rows = FeatureStore(tmp_path).get_many("kind-v1", ["CCO", "xx", "CCC"])
+        assert rows == {"CCO": ([1, 2], None), "xx": (None, "bad")}
+
+    def test_writes_only_new_rows(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        store.put_many("kind-v1", {"a": ("1", None)})
+        store.put_many("kind-v1", {"a": ("1", None)})
+        assert len(_parts(tmp_path)) == 1
+        store.put_many("kind-v1", {"a": ("1", None), "b": ("2", None)})
+        assert len(_parts(tmp_path)) == 2
+
+    def test_stamps_are_separate_partitions(self, tmp_path: Path) -> None:
+        store = FeatureStore(tmp_path)
+        store.put_many("kind-v1", {"a": ("old", None)})
+        assert store.get_many("kind-v2", ["a"]) == {}
+
+    def test_compacts_parts(self, tmp_path: Path) -> None:
+        store = _store(tmp_path, compact_after=2)
+        for key in "abc":
+            store.put_many("kind-v1", {key: (key, None)})
+        assert len(_parts(tmp_path)) == 1
+        assert set(FeatureStore(tmp_path).get_many("kind-v1", "abcd")) == {"a", "b", "c"}
+
+    def test_reads_parts_from_other_writers(self, tmp_path: Path) -> None:
+        reader = FeatureStore(tmp_path)
+        assert reader.get_many("kind-v1", ["a"]) == {}
+        _store(tmp_path).put_many("kind-v1", {"a": ("1", None)})
+        assert reader.get_many("kind-v1", ["a"]) == {"a": ("1", None)}
+
+    def test_skips_unreadable_part(self, tmp_path: Path) -> None:
+        store = _store(tmp_path)
+        store.put_many("kind-v1", {"a": ("1", None)})
+        (tmp_path / "kind-v1" / "part-broken.parquet").write_bytes(b"garbage")
+        assert FeatureStore(tmp_path).get_many("kind-v1", ["a"]) == {"a": ("1", None)}
+
+    def test_rejects_unsafe_stamp(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Invalid feature stamp"):
+            FeatureStore(tmp_path).get_many("../escape", ["a"])
+
+    def test_buffers_small_writes(self, tmp_path: Path) -> None:
+        store = FeatureStore(tmp_path, flush_rows=3)
+        store.put_many("kind-v1", {"a": ("1", None)})
+        store.put_many("kind-v1", {"b": ("2", None)})
+        assert _parts(tmp_path) == []
+        assert store.get_many("kind-v1", ["a", "b"]) == {"a": ("1", None), "b": ("2", None)}
+        store.put_many("kind-v1", {"c": ("3", None)})
+        assert len(_parts(tmp_path)) == 1
+
+    def test_flush_writes_pending_rows(self, tmp_path: Path) -> None:
+        store = FeatureStore(tmp_path)
+        store.put_many("kind-v1", {"a": ("1", None)})
+        assert store.stats()["pending"] == 1
+        store.flush()
+        assert store.stats()["pending"] == 0
+        assert FeatureStore(tmp_path).get_many("kind-v1", ["a"]) == {"a": ("1", None)}
+
+    def test_memory_is_bounded(self, tmp_path: Path) -> None:
+        store = _store(tmp_path, max_rows=2)
+        store.put_many("kind-v1", {key: (key, None) for key in "abcd"})
+        assert store.stats()["rows"] == 2
+        # Evicted rows are read back from disk on demand.
+        assert store.get_many("kind-v1", "abcd") == {key: (key, None) for key in "abcd"}
+        assert store.stats()["rows"] == 2
+
+    def test_compaction_drops_duplicate_keys(self, tmp_path: Path) -> None:
+        _store(tmp_path).put_many("kind-v1", {"a": ("1", None)})
+        _store(tmp_path, compact_after=1).put_many("kind-v1", {"a": ("1", None), "b": ("2", None)})
+        (part,) = _parts(tmp_path)
+        assert sorted(pq.read_table(part).column("key").to_pylist()) == ["a", "b"]
+
+
+class TestAdapterReadsStoreFirst:
+    def test_batches_match_uncached(self, tmp_path: Path) -> None:
+        plain = RDKitAdapter(cache=MolCache())
+        stored = RDKitAdapter(cache=MolCache(), store=FeatureStore(tmp_path))
+        catalog = load_alert_catalog()
+        for _ in range(2):  # compute and persist, then serve from the store
+            fps = stored.compute_fingerprints_batch(_SMILES)
+            expected = plain.compute_fingerprints_batch(_SMILES)
+            np.testing.assert_array_equal(fps.words, expected.words)
+            np.testing.assert_array_equal(fps.valid, expected.valid)
+            assert fps.errors == expected.errors
+
+            desc = stored.compute_descriptors_batch(_SMILES)
+            np.testing.assert_array_equal(
+                desc.values, plain.compute_descriptors_batch(_SMILES).values
+            )
+
+            hits = stored.alert_matrix(_SMILES, catalog)
+            np.testing.assert_array_equal(hits.hits, plain.alert_matrix(_SMILES, catalog).hits)
+
+            scaffolds = stored.murcko_scaffolds_batch(_SMILES)
+            assert scaffolds == ["", "c1ccccc1", None, "c1ccccc1"]
+
+    def test_hits_skip_rdkit(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        RDKitAdapter(cache=MolCache(), store=_store(tmp_path)).compute_fingerprints_batch(_SMILES)
+        fresh = RDKitAdapter(cache=MolCache(), store=FeatureStore(tmp_path))
+
+        def fail(smiles: str) -> None:
+            raise AssertionError(f"parsed {smiles}")
+
+        monkeypatch.setattr(fresh._cache, "get", fail)
+        fps = fresh.compute_fingerprints_batch(_SMILES)
+        assert fps.valid.tolist() == [True, True, False, True]
+        assert "not-a-smiles" in fps.errors[2]
+
+    def test_partition_names_fingerprint_parameters(self, tmp_path: Path) -> None:
+        RDKitAdapter(store=_store(tmp_path)).compute_fingerprints_batch([SMILES("CCO")])
+        (partition,) = [p.name for p in tmp_path.iterdir()]
+        assert partition == f"morgan-r2-2048-rdkit{rdkit.__version__}"
@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+
+from ehrlich.chemistry.infrastructure.mol_cache import MolCache
+from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+from ehrlich.kernel.exceptions import InvalidSMILESError
+from ehrlich.kernel.types import SMILES
+
+
+class TestMolCache:
+    def test_miss_then_hit(self) -> None:
+        cache = MolCache(max_size=8)
+        first = cache.get("CCO")
+        second = cache.get("CCO")
+        assert first is not None
+        assert first is second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_spellings_share_canonical_entry(self) -> None:
+        cache = MolCache(max_size=8)
+        a = cache.get("OCC")
+        b = cache.get("CCO")
+        assert a is b
+        assert a is not None and a.canonical == "CCO"
+        assert len(cache) == 1
+
+    def test_invalid_smiles_not_cached(self) -> None:
+        cache = MolCache(max_size=8)
+        assert cache.get("not_a_smiles!!!") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        cache = MolCache(max_size=2)
+        cache.get("C")
+        cache.get("CC")
+        cache.get("C")  # refresh, so CC is least recently used
+        cache.get("CCC")
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        cache.get("C")
+        assert cache.hits == 2
+        cache.get("CC")
+        assert cache.misses == 4
+
+    def test_resize_evicts(self) -> None:
+        cache = MolCache(max_size=4)
+        for smi in ("C", "CC", "CCC", "CCCC"):
+            cache.get(smi)
+        cache.resize(1)
+        assert len(cache) == 1
+        assert cache.evictions == 3
+
+    def test_rejects_zero_size(self) -> None:
+        with pytest.raises(ValueError, match="max_size"):
+            MolCache(max_size=0)
+
+    def test_stats(self) -> None:
+        cache = MolCache(max_size=8)
+        cache.get("CCO")
+        cache.get("CCO")
+        cache.get("CCO")
+        stats = cache.stats()
+        assert stats["size"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.6667)
+
+    def test_concurrent_access(self) -> None:
+        cache = MolCache(max_size=16)
+        smiles = ["C" * n for n in range(1, 33)]
+
+        def worker() -> None:
+            for _ in range(20):
+                for smi in smiles:
+                    assert cache.get(smi) is not None
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(cache) == 16
+        assert cache.hits + cache.misses == 8 * 20 * len(smiles)
+
+
+class TestAdapterCaching:
+    def test_fingerprint_reused(self) -> None:
+        adapter = RDKitAdapter(MolCache(max_size=8))
+        fp1 = adapter.compute_fingerprint(SMILES("OCC"))
+        fp2 = adapter.compute_fingerprint(SMILES("CCO"))
+        assert fp1 is fp2
+        assert adapter.compute_fingerprint(SMILES("CCO"), "maccs").fp_type == "maccs"
+
+    def test_descriptors_reused(self) -> None:
+        adapter = RDKitAdapter(MolCache(max_size=8))
+        assert adapter.compute_descriptors(SMILES("CCO")) is adapter.compute_descriptors(
+            SMILES("CCO")
+        )
+
+    def test_depiction_does_not_mutate_cached_mol(self) -> None:
+        cache = MolCache(max_size=8)
+        adapter = RDKitAdapter(cache)
+        adapter.depict_2d(SMILES("c1ccccc1"))
+        entry = cache.get("c1ccccc1")
+        assert entry is not None
+        assert entry.mol.GetNumConformers() == 0
+
+    def test_invalid_raises(self) -> None:
+        adapter = RDKitAdapter(MolCache(max_size=8))
+        with pytest.raises(InvalidSMILESError):
+            adapter.compute_descriptors(SMILES("not_a_smiles!!!"))
+        assert adapter.validate_smiles(SMILES("not_a_smiles!!!")) is False
@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
 
+from ehrlich.chemistry.infrastructure.bitset import unpack
 from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
 from ehrlich.kernel.exceptions import InvalidSMILESError
 from ehrlich.kernel.types import SMILES
@@ -155,3 +157,48 @@ class TestSubstructureMatch:
     def test_invalid_pattern(self, adapter: RDKitAdapter) -> None:
         matched, atoms = adapter.substructure_match(SMILES("CCO"), "INVALID_PATTERN_!@#$%^&*()")
         assert matched is False
+
+
+class TestBatch:
+    def test_descriptor_matrix(self, adapter: RDKitAdapter) -> None:
+        smiles = [SMILES("CCO"), SMILES("not_a_smiles!!!"), SMILES("c1ccccc1")]
+        matrix = adapter.compute_descriptors_batch(smiles)
+        assert matrix.values.shape == (3, len(matrix.columns))
+        assert matrix.valid.tolist() == [True, False, True]
+        assert set(matrix.errors) == {1}
+        mw = matrix.columns.index("molecular_weight")
+        expected = adapter.compute_descriptors(SMILES("CCO")).molecular_weight
+        assert matrix.values[0, mw] == pytest.approx(expected)
+        assert np.isnan(matrix.values[1]).all()
+
+    def test_fingerprint_matrix_round_trips(self, adapter: RDKitAdapter) -> None:
+        smiles = [SMILES("CCO"), SMILES("bad!!"), SMILES("c1ccccc1O")]
+        matrix = adapter.compute_fingerprints_batch(smiles)
+        assert matrix.words.shape == (3, 32)
+        assert matrix.words.dtype == np.uint64
+        assert matrix.valid.tolist() == [True, False, True]
+        dense = unpack(matrix.words, matrix.n_bits)
+        fp = adapter.compute_fingerprint(SMILES("c1ccccc1O"))
+        assert tuple(np.flatnonzero(dense[2])) == fp.bits
+        assert not dense[1].any()
+
+    def test_maccs_fingerprint_matrix(self, adapter: RDKitAdapter) -> None:
+        matrix = adapter.compute_fingerprints_batch([SMILES("CCO")], "maccs")
+        assert matrix.fp_type == "maccs"
+        assert matrix.n_bits == 167
+        assert matrix.words.shape == (1, 3)
+
+    def test_substructure_matrix(self, adapter: RDKitAdapter) -> None:
+        smiles = [SMILES("c1ccccc1O"), SMILES("CCO"), SMILES("bad!!")]
+        matrix = adapter.substructure_matrix(smiles, ["c1ccccc1", "[OX2H]", "[[invalid"])
+        assert matrix.hits.tolist() == [
+            [True, True, False],
+            [False, True, False],
+            [False, False, False],
+        ]
+        assert matrix.valid.tolist() == [True, True, False]
+        assert set(matrix.errors) == {2}
+
+    def test_empty_batch(self, adapter: RDKitAdapter) -> None:
+        assert adapter.compute_descriptors_batch([]).values.shape[0] == 0
+        assert adapter.compute_fingerprints_batch([]).words.shape == (0, 32)
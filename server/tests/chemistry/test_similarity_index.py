@@ -0,0 +1,98 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ehrlich.chemistry.infrastructure import bitset
+from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+from ehrlich.chemistry.infrastructure.similarity_index import SimilarityIndex
+from ehrlich.kernel.types import SMILES
+
+_SMILES = [
+    "CCO",
+    "CCCO",
+    "CCCCO",
+    "c1ccccc1O",
+    "c1ccccc1N",
+    "Cc1ccccc1O",
+    "CC(=O)Oc1ccccc1C(=O)O",
+    "CC(C)Cc1ccc(cc1)C(C)C(=O)O",
+    "CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+    "NS(=O)(=O)c1ccc(N)cc1",
+    "c1ccc2c(c1)cccc2",
+]
+
+
+def _words(smiles: list[str]) -> np.ndarray:
+    return RDKitAdapter().compute_fingerprints_batch([SMILES(s) for s in smiles]).words
+
+
+@pytest.fixture
+def index() -> SimilarityIndex:
+    idx = SimilarityIndex()
+    idx.add("first", _SMILES[:6], _words(_SMILES[:6]))
+    idx.add("second", _SMILES[6:], _words(_SMILES[6:]))
+    return idx
+
+
+def _brute_force(query: str, threshold: float) -> list[tuple[str, float]]:
+    sims = bitset.tanimoto_one_to_many(_words([query])[0], _words(_SMILES))
+    ranked = sorted(zip(_SMILES, sims.tolist(), strict=True), key=lambda p: -p[1])
+    return [(s, v) for s, v in ranked if v >= threshold]
+
+
+class TestSearch:
+    @pytest.mark.parametrize("query", ["c1ccccc1O", "CCCCCO", "CC(=O)Oc1ccccc1C(=O)OC"])
+    @pytest.mark.parametrize("k", [1, 3, None])
+    def test_matches_brute_force(self, index: SimilarityIndex, query: str, k: int | None) -> None:
+        hits = index.search(_words([query])[0], k=k, threshold=0.1)
+        expected = _brute_force(query, 0.1)[:k]
+        assert [h.similarity for h in hits] == pytest.approx([v for _, v in expected])
+        assert {h.label for h in hits if h.similarity > expected[-1][1]} == {
+            s for s, v in expected if v > expected[-1][1]
+        }
+
+    def test_threshold_only(self, index: SimilarityIndex) -> None:
+        hits = index.search(_words(["CCCO"])[0], k=None, threshold=0.5)
+        assert [h.label for h in hits][0] == "CCCO"
+        assert all(h.similarity >= 0.5 for h in hits)
+        assert len(hits) == len(_brute_force("CCCO", 0.5))
+
+    def test_hit_carries_segment(self, index: SimilarityIndex) -> None:
+        top = index.search(_words(["NS(=O)(=O)c1ccc(N)cc1"])[0], k=1)[0]
+        assert top.label == "NS(=O)(=O)c1ccc(N)cc1"
+        assert top.segment == "second"
+        assert top.similarity == pytest.approx(1.0)
+
+    def test_empty_query_and_index(self, index: SimilarityIndex) -> None:
+        assert index.search(np.zeros(32, dtype=np.uint64)) == []
+        assert SimilarityIndex().search(_words(["CCO"])[0]) == []
+
+
+class TestSegments:
+    def test_replace_segment(self, index: SimilarityIndex) -> None:
+        index.add("first", ["CCO"], _words(["CCO"]))
+        assert len(index) == 1 + len(_SMILES[6:])
+        assert index.segments == ("second", "first")
+
+    def test_remove_segment(self, index: SimilarityIndex) -> None:
+        index.remove("second")
+        assert len(index) == 6
+        assert index.segments == ("first",)
+        assert all(h.segment == "first" for h in index.search(_words(["CCO"])[0], k=None))
+
+    def test_label_count_mismatch(self) -> None:
+        with pytest.raises(ValueError, match="labels"):
+            SimilarityIndex().add("x", ["CCO", "CCN"], _words(["CCO"]))
+
+
+class TestPersistence:
+    def test_round_trip(self, index: SimilarityIndex, tmp_path: Path) -> None:
+        path = tmp_path / "index.npz"
+        index.save(path, manifest={"a.parquet": [1, 2]})
+        loaded, manifest = SimilarityIndex.load(path)
+        assert manifest == {"a.parquet": [1, 2]}
+        assert len(loaded) == len(index)
+        query = _words(["c1ccccc1O"])[0]
+        assert loaded.search(query, k=5) == index.search(query, k=5)
+        assert not list(tmp_path.glob("*.part"))
@@ -1,6 +1,44 @@
+import os
+import shutil
+import tempfile
+
 import pytest
 
 from ehrlich.kernel.types import SMILES
+from ehrlich.transport.client import reset_transport
+from ehrlich.workers.pool import reset_workers
+
+# Stores the tool modules build at import time, redirected out of the repo's data/
+_STORE_DIRS = {
+    "EHRLICH_FEATURE_STORE_DIR": "features",
+    "EHRLICH_CONFORMER_CACHE_PATH": "conformers.db",
+    "EHRLICH_DOCKING_CACHE_PATH": "docking.db",
+    "EHRLICH_SUMMARY_CACHE_PATH": "summaries.db",
+    "EHRLICH_MODELS_DIR": "models",
+}
+_store_root: str | None = None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    global _store_root
+    _store_root = tempfile.mkdtemp(prefix="ehrlich-tests-")
+    for var, name in _STORE_DIRS.items():
+        os.environ[var] = os.path.join(_store_root, name)
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    if _store_root is not None:
+        shutil.rmtree(_store_root, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_transport() -> None:
+    reset_transport()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_workers() -> None:
+    reset_workers()
 
 
 @pytest.fixture
@@ -8,16 +8,51 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock
 
 import pytest
+from httpx import Response
 
 from ehrlich.api.sse import SSEEventType, domain_event_to_sse
 from ehrlich.investigation.application.multi_orchestrator import MultiModelOrchestrator
 from ehrlich.investigation.application.registry_factory import build_tool_registry
 from ehrlich.investigation.domain.events import ToolResultEvent
 from ehrlich.investigation.domain.investigation import Investigation, InvestigationStatus
+from ehrlich.transport.client import enable_response_cache
+from ehrlich.transport.response_cache import ResponseCache, request_key
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_S2_SEARCH_URL = "https://api.semanticscholar.org/graph/v1/paper/search"
+_S2_FIELDS = "title,authors,year,abstract,externalIds,citationCount"
+_RECORDED_PAPER = {
+    "paperId": "abc123",
+    "title": "Recorded paper on MRSA efflux pumps",
+    "authors": [{"name": "Smith"}],
+    "year": 2021,
+    "abstract": "Replayed from the offline HTTP cache.",
+    "externalIds": {"DOI": "10.1000/recorded"},
+    "citationCount": 12,
+}
+
+
+@pytest.fixture(autouse=True)
+async def offline_http(tmp_path: Path) -> None:
+    """Replay recorded upstream responses; any unrecorded request fails fast."""
+    path = tmp_path / "http.db"
+    recorder = ResponseCache(path)
+    key = request_key(
+        "GET",
+        _S2_SEARCH_URL,
+        {"query": "MRSA efflux", "limit": 5, "fields": _S2_FIELDS},
+        None,
+        None,
+    )
+    await recorder.put(key, "SemanticScholar", Response(200, json={"data": [_RECORDED_PAPER]}))
+    recorder.close()
+    enable_response_cache(path, offline=True)
 
 
 @dataclass(frozen=True)
@@ -140,7 +175,7 @@ class TestToolRegistry:
     def test_build_registry_has_expected_tools(self) -> None:
         registry = build_tool_registry()
         tools = registry.list_tools()
-        assert len(tools) == 91
+        assert len(tools) == 92
         assert "validate_smiles" in tools
         assert "search_literature" in tools
         assert "search_citations" in tools
@@ -191,7 +226,7 @@ class TestToolRegistry:
     def test_all_tools_have_schemas(self) -> None:
         registry = build_tool_registry()
         schemas = registry.list_schemas()
-        assert len(schemas) == 91
+        assert len(schemas) == 92
         for schema in schemas:
             assert "name" in schema
             assert "description" in schema
@@ -324,3 +359,44 @@ class TestE2EPipeline:
 
         tool_results = [e for e in events if isinstance(e, ToolResultEvent)]
         assert len(tool_results) >= 1
+
+    @pytest.mark.asyncio
+    async def test_literature_tool_replays_offline(self) -> None:
+        """Network-backed tools replay recorded responses from the offline cache."""
+        director, researcher, summarizer = _make_clients()
+
+        director.stream_message = _make_director_side_effect(
+            _formulation_json(),
+            _experiment_design_json(),
+            _evaluation_json(),
+            _synthesis_json(),
+        )
+        researcher.create_message = AsyncMock(
+            side_effect=[
+                _make_response([_text("Lit done.")]),
+                _make_response(
+                    [_tool("tu_1", "search_literature", {"query": "MRSA efflux"})],
+                    stop_reason="tool_use",
+                ),
+                _make_response([_text("Experiment done.")]),
+            ]
+        )
+
+        orchestrator = MultiModelOrchestrator(
+            director=director,
+            researcher=researcher,
+            summarizer=summarizer,
+            registry=build_tool_registry(),
+            max_iterations_per_experiment=5,
+        )
+        investigation = Investigation(prompt="MRSA efflux pump inhibitors")
+
+        events = [event async for event in orchestrator.run(investigation)]
+
+        previews = [
+            e.result_preview
+            for e in events
+            if isinstance(e, ToolResultEvent) and e.tool_name == "search_literature"
+        ]
+        assert previews
+        assert "Recorded paper on MRSA efflux pumps" in previews[0]
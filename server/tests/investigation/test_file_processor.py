@@ -62,6 +62,28 @@ class TestCSVProcessing:
         assert result.file_id
         assert len(result.file_id) == 36  # UUID format
 
+    def test_csv_without_numeric_columns(self, processor: FileProcessor) -> None:
+        content = b"smiles,name\nCCO,ethanol\nc1ccccc1,benzene"
+        result = processor.process("library.csv", content)
+        assert result.tabular is not None
+        assert result.tabular.row_count == 2
+        assert result.tabular.summary_stats == {}
+
+
+class TestSMIProcessing:
+    def test_valid_smi(self, processor: FileProcessor) -> None:
+        content = b"# library\nCCO ethanol\n\nc1ccccc1\nCC(=O)O acetic acid\n"
+        result = processor.process("library.smi", content)
+        assert result.content_type == "chemical/x-daylight-smiles"
+        assert result.tabular is not None
+        assert result.tabular.columns == ("smiles", "name")
+        assert result.tabular.row_count == 3
+        assert result.tabular.sample_rows[2] == ("CC(=O)O", "acetic acid")
+
+    def test_smi_with_null_bytes_raises(self, processor: FileProcessor) -> None:
+        with pytest.raises(ValueError, match="SMI format"):
+            processor.process("library.smi", b"CCO\x00")
+
 
 class TestXLSXProcessing:
     def test_valid_xlsx(self, processor: FileProcessor) -> None:
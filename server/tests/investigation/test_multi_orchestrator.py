@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import copy
 import json
 from dataclasses import dataclass
 from typing import Any
@@ -768,6 +770,93 @@ class TestParallelExecution:
         assert investigation.status == InvestigationStatus.COMPLETED
 
 
+class TestParallelToolUse:
+    @staticmethod
+    def _multi_tool_response() -> FakeResponse:
+        return FakeResponse(
+            content=[
+                {"type": "tool_use", "id": "t1", "name": "slow_lookup", "input": {"key": "a"}},
+                {"type": "tool_use", "id": "t2", "name": "slow_lookup", "input": {"key": "b"}},
+                {
+                    "type": "tool_use",
+                    "id": "t3",
+                    "name": "record_finding",
+                    "input": {"title": "F", "detail": "d"},
+                },
+                {"type": "tool_use", "id": "t4", "name": "slow_lookup", "input": {"key": "c"}},
+            ],
+            stop_reason="tool_use",
+            input_tokens=100,
+            output_tokens=50,
+        )
+
+    @staticmethod
+    def _registry(active: list[int], peak: list[int]) -> ToolRegistry:
+        registry = _build_registry()
+
+        async def slow_lookup(key: str) -> str:
+            """Slow lookup. Args: key: k"""
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.02)
+            active[0] -= 1
+            return json.dumps({"key": key})
+
+        registry.register("slow_lookup", slow_lookup)
+        return registry
+
+    async def _run(self, max_parallel_tools: int) -> tuple[int, list[dict[str, Any]]]:
+        director, researcher, summarizer = _make_clients()
+        director.stream_message = _make_director_side_effect(
+            _formulation_json(),
+            _experiment_design_json(),
+            _evaluation_json(),
+            _synthesis_json(),
+        )
+        responses = iter(
+            [
+                _make_text_response("Lit done."),
+                self._multi_tool_response(),
+                _make_text_response("Experiment done."),
+            ]
+        )
+        sent: list[list[dict[str, Any]]] = []
+
+        async def _create_message(**kwargs: Any) -> FakeResponse:
+            sent.append(copy.deepcopy(kwargs["messages"]))
+            return next(responses)
+
+        researcher.create_message = _create_message
+        active, peak = [0], [0]
+        orchestrator = MultiModelOrchestrator(
+            director=director,
+            researcher=researcher,
+            summarizer=summarizer,
+            registry=self._registry(active, peak),
+            max_iterations_per_experiment=5,
+            max_parallel_tools=max_parallel_tools,
+        )
+        investigation = Investigation(prompt="Test parallel tools")
+        async for _ in orchestrator.run(investigation):
+            pass
+        return peak[0], sent[-1][-1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_independent_blocks_run_concurrently(self) -> None:
+        peak, _ = await self._run(max_parallel_tools=4)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_respected(self) -> None:
+        peak, _ = await self._run(max_parallel_tools=1)
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_tool_results_keep_request_order(self) -> None:
+        _, tool_results = await self._run(max_parallel_tools=4)
+        assert [r["tool_use_id"] for r in tool_results] == ["t1", "t2", "t3", "t4"]
+
+
 class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_director_api_error(self) -> None:
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ehrlich.investigation.application.cost_tracker import CostTracker
+from ehrlich.investigation.application.output_compaction import compact_output
+from ehrlich.investigation.application.researcher_executor import summarize_output
+from ehrlich.investigation.infrastructure.summary_cache import SummaryCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclass
+class FakeResponse:
+    content: list[dict[str, Any]]
+    input_tokens: int = 100
+    output_tokens: int = 20
+    cache_read_input_tokens: int = 0
+    cache_write_input_tokens: int = 0
+
+
+def _summarizer(text: str = "Compressed.") -> AsyncMock:
+    summarizer = AsyncMock()
+    summarizer.model = "claude-haiku-4-5-20251001"
+    summarizer.create_message = AsyncMock(
+        return_value=FakeResponse(content=[{"type": "text", "text": text}])
+    )
+    return summarizer
+
+
+def _papers(n: int) -> str:
+    return json.dumps(
+        {
+            "query": "beta-lactamase",
+            "count": n,
+            "papers": [
+                {
+                    "title": f"Paper {i}",
+                    "authors": ["A. Author", "B. Author", "C. Author"],
+                    "year": 2020,
+                    "doi": f"10.1000/{i}",
+                    "abstract": "Resistance " * 50,
+                    "citations": 0.123456789 * i,
+                    "url": None,
+                }
+                for i in range(n)
+            ],
+        }
+    )
+
+
+class TestCompactOutput:
+    def test_not_json(self) -> None:
+        assert compact_output("search_literature", "x" * 3000, 2000) is None
+        assert compact_output("validate_smiles", "42", 2000) is None
+
+    def test_first_level_drops_empties_bulk_and_rounds(self) -> None:
+        output = json.dumps(
+            {"energy": -7.123456789, "mol_block": "M  END" * 500, "note": "", "hits": []}
+        )
+        assert json.loads(compact_output("generate_3d", output, 2000) or "") == {"energy": -7.12346}
+
+    def test_truncates_arrays_with_marker(self) -> None:
+        compacted = compact_output("search_literature", _papers(40), 2000)
+        assert compacted is not None and len(compacted) <= 2000
+        data = json.loads(compacted)
+        assert data["count"] == 40
+        assert data["papers"][-1].endswith("more")
+        assert "authors" not in data["papers"][0]
+        assert data["papers"][0]["doi"] == "10.1000/0"
+
+    def test_keeps_least_compacted_form_that_fits(self) -> None:
+        compacted = compact_output("search_literature", _papers(3), 4000)
+        assert compacted is not None
+        assert len(json.loads(compacted)["papers"]) == 3
+
+    def test_returns_most_compacted_when_nothing_fits(self) -> None:
+        compacted = compact_output("search_literature", _papers(40), 100)
+        assert compacted is not None
+        assert json.loads(compacted)["papers"][-1] == "... 37 more"
+
+
+class TestSummarizeOutput:
+    @pytest.mark.asyncio
+    async def test_small_output_passes_through(self, tmp_path: Path) -> None:
+        summarizer = _summarizer()
+        text, event = await summarize_output(
+            summarizer, CostTracker(), "t", "short", "inv", 2000, SummaryCache(tmp_path / "s.db")
+        )
+        assert (text, event) == ("short", None)
+        summarizer.create_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_compaction_avoids_model_call(self, tmp_path: Path) -> None:
+        summarizer = _summarizer()
+        output = _papers(40)
+        text, event = await summarize_output(
+            summarizer,
+            CostTracker(),
+            "search_literature",
+            output,
+            "inv",
+            2000,
+            SummaryCache(tmp_path / "s.db"),
+        )
+        assert len(text) <= 2000
+        assert json.loads(text)["count"] == 40
+        assert event is not None and event.original_length == len(output)
+        summarizer.create_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_identical_output_summarized_once(self, tmp_path: Path) -> None:
+        summarizer = _summarizer()
+        cache = SummaryCache(tmp_path / "s.db")
+        cost = CostTracker()
+        output = "free text " * 300
+        first, _ = await summarize_output(summarizer, cost, "t", output, "inv1", 2000, cache)
+        second, event = await summarize_output(summarizer, cost, "t", output, "inv2", 2000, cache)
+        assert first == second == "Compressed."
+        assert event is not None and event.summarized_length == len("Compressed.")
+        assert summarizer.create_message.await_count == 1
+        assert cost.input_tokens == 100
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_key_includes_tool_and_model(self, tmp_path: Path) -> None:
+        cache = SummaryCache(tmp_path / "s.db")
+        output = "free text " * 300
+        await summarize_output(_summarizer(), CostTracker(), "a", output, "inv", 2000, cache)
+        other_tool = _summarizer()
+        await summarize_output(other_tool, CostTracker(), "b", output, "inv", 2000, cache)
+        other_model = _summarizer()
+        other_model.model = "claude-sonnet-4-5-20250929"
+        await summarize_output(other_model, CostTracker(), "a", output, "inv", 2000, cache)
+        assert other_tool.create_message.await_count == 1
+        assert other_model.create_message.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_oversized_json_sends_compacted_form(self, tmp_path: Path) -> None:
+        summarizer = _summarizer()
+        await summarize_output(
+            summarizer,
+            CostTracker(),
+            "search_literature",
+            _papers(40),
+            "inv",
+            100,
+            SummaryCache(tmp_path / "s.db"),
+        )
+        prompt = summarizer.create_message.call_args.kwargs["messages"][0]["content"]
+        assert "... 37 more" in prompt
+        assert "authors" not in prompt
+
+
+class TestSummaryCache:
+    def test_round_trip_and_eviction(self, tmp_path: Path) -> None:
+        cache = SummaryCache(tmp_path / "s.db", max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, f"summary {key}")
+        assert cache.get("a") is None
+        assert cache.get("c") == "summary c"
+        assert cache.stats()["entries"] == 2
+
+    def test_survives_reopen(self, tmp_path: Path) -> None:
+        SummaryCache(tmp_path / "s.db").put("k", "kept")
+        assert SummaryCache(tmp_path / "s.db").get("k") == "kept"
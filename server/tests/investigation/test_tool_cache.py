@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+
+from ehrlich.investigation.application.tool_cache import InMemoryToolCacheBackend, ToolCache
+from ehrlich.investigation.infrastructure.tool_cache_backends import SQLiteToolCacheBackend
+
+
+class TestToolCache:
+    @pytest.mark.asyncio
+    async def test_roundtrip(self) -> None:
+        cache = ToolCache()
+        await cache.put("search_literature", "abc", '{"papers": []}')
+        assert await cache.get("search_literature", "abc") == '{"papers": []}'
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_tool_is_skipped(self) -> None:
+        cache = ToolCache()
+        await cache.put("record_finding", "abc", "{}")
+        assert await cache.get("record_finding", "abc") is None
+        stats = await cache.stats()
+        assert stats["misses"] == 0
+        assert stats["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_dropped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache = ToolCache()
+        await cache.put("search_literature", "abc", "result")
+        monkeypatch.setattr("ehrlich.investigation.application.tool_cache.time.time", lambda: 1e12)
+        assert await cache.get("search_literature", "abc") is None
+        assert (await cache.stats())["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_hit_miss_counters(self) -> None:
+        cache = ToolCache()
+        await cache.get("validate_smiles", "x")
+        await cache.put("validate_smiles", "x", "ok")
+        await cache.get("validate_smiles", "x")
+        await cache.get("validate_smiles", "x")
+        stats = await cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.6667)
+
+    @pytest.mark.asyncio
+    async def test_shared_backend_across_instances(self) -> None:
+        backend = InMemoryToolCacheBackend()
+        await ToolCache(backend).put("search_compounds", "q", "hit")
+        assert await ToolCache(backend).get("search_compounds", "q") == "hit"
+
+
+class TestInMemoryBackend:
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self) -> None:
+        backend = InMemoryToolCacheBackend(max_entries=2)
+        await backend.put("a", "1", None)
+        await backend.put("b", "2", None)
+        await backend.get("a")
+        await backend.put("c", "3", None)
+        assert await backend.get("b") is None
+        assert await backend.get("a") == ("1", None)
+        assert await backend.size() == 2
+
+
+class TestSQLiteBackend:
+    @pytest.mark.asyncio
+    async def test_persists_across_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / "tools.db"
+        first = SQLiteToolCacheBackend(path)
+        await first.put("k", "v", 123.0)
+        await first.close()
+
+        second = SQLiteToolCacheBackend(path)
+        assert await second.get("k") == ("v", 123.0)
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        backend = SQLiteToolCacheBackend(tmp_path / "tools.db", max_entries=2)
+        await backend.put("a", "1", None)
+        await backend.put("b", "2", None)
+        await backend.get("a")
+        await backend.put("c", "3", None)
+        assert await backend.get("b") is None
+        assert await backend.get("a") == ("1", None)
+        assert await backend.size() == 2
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_delete(self, tmp_path: Path) -> None:
+        backend = SQLiteToolCacheBackend(tmp_path / "tools.db")
+        await backend.put("a", "1", None)
+        await backend.delete("a")
+        assert await backend.get("a") is None
+        await backend.close()
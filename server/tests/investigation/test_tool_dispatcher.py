@@ -1,8 +1,10 @@
+import asyncio
 import json
 from unittest.mock import AsyncMock
 
 import pytest
 
+from ehrlich.investigation.application.single_flight import SingleFlight
 from ehrlich.investigation.application.tool_cache import ToolCache
 from ehrlich.investigation.application.tool_dispatcher import ToolDispatcher
 from ehrlich.investigation.application.tool_registry import ToolRegistry
@@ -120,3 +122,112 @@ class TestPaperDeduplication:
         )
         result2 = json.loads(result2_str)
         assert result2["count"] == 0
+
+
+class TestSingleFlight:
+    @staticmethod
+    def _counting_registry(calls: list[str]) -> ToolRegistry:
+        reg = ToolRegistry()
+
+        async def explore_dataset(target: str) -> str:
+            calls.append(target)
+            await asyncio.sleep(0.01)
+            return json.dumps({"target": target, "size": 10})
+
+        async def record_finding(title: str) -> str:
+            calls.append(title)
+            await asyncio.sleep(0.01)
+            return json.dumps({"title": title})
+
+        reg.register("explore_dataset", explore_dataset, {"chemistry"})
+        reg.register("record_finding", record_finding, {"investigation"})
+        return reg
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_execution(
+        self, investigation: Investigation
+    ) -> None:
+        calls: list[str] = []
+        dispatcher = ToolDispatcher(self._counting_registry(calls), ToolCache(), None, {})
+
+        results = await asyncio.gather(
+            *[
+                dispatcher.dispatch("explore_dataset", {"target": "S. aureus"}, investigation)
+                for _ in range(3)
+            ]
+        )
+
+        assert calls == ["S. aureus"]
+        assert len(set(results)) == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_across_dispatchers(self, investigation: Investigation) -> None:
+        calls: list[str] = []
+        registry = self._counting_registry(calls)
+        flight = SingleFlight()
+        first = ToolDispatcher(registry, ToolCache(), None, {}, flight)
+        second = ToolDispatcher(registry, ToolCache(), None, {}, flight)
+
+        await asyncio.gather(
+            first.dispatch("explore_dataset", {"target": "E. coli"}, investigation),
+            second.dispatch("explore_dataset", {"target": "E. coli"}, investigation),
+        )
+
+        assert calls == ["E. coli"]
+        assert flight.coalesced == 1
+        assert flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_stateful_tools_are_not_coalesced(self, investigation: Investigation) -> None:
+        calls: list[str] = []
+        dispatcher = ToolDispatcher(self._counting_registry(calls), ToolCache(), None, {})
+
+        await asyncio.gather(
+            dispatcher.dispatch("record_finding", {"title": "F"}, investigation),
+            dispatcher.dispatch("record_finding", {"title": "F"}, investigation),
+        )
+
+        assert calls == ["F", "F"]
+
+    @pytest.mark.asyncio
+    async def test_leader_failure_reaches_followers(self, investigation: Investigation) -> None:
+        reg = ToolRegistry()
+
+        async def explore_dataset(target: str) -> str:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        reg.register("explore_dataset", explore_dataset, {"chemistry"})
+        dispatcher = ToolDispatcher(reg, ToolCache(), None, {})
+
+        results = await asyncio.gather(
+            dispatcher.dispatch("explore_dataset", {"target": "x"}, investigation),
+            dispatcher.dispatch("explore_dataset", {"target": "x"}, investigation),
+        )
+
+        assert all("error" in json.loads(r) for r in results)
+
+
+class TestCaching:
+    @pytest.mark.asyncio
+    async def test_error_results_are_not_cached(self, investigation: Investigation) -> None:
+        calls: list[str] = []
+        reg = ToolRegistry()
+
+        async def search_compounds(query: str) -> str:
+            calls.append(query)
+            if len(calls) == 1:
+                return json.dumps({"error": "Compound search failed: 429 Too Many Requests"})
+            return json.dumps({"query": query, "count": 1})
+
+        reg.register("search_compounds", search_compounds, {"chemistry"})
+        cache = ToolCache()
+        dispatcher = ToolDispatcher(reg, cache, None, {})
+
+        first = await dispatcher.dispatch("search_compounds", {"query": "x"}, investigation)
+        second = await dispatcher.dispatch("search_compounds", {"query": "x"}, investigation)
+        third = await dispatcher.dispatch("search_compounds", {"query": "x"}, investigation)
+
+        assert "error" in json.loads(first)
+        assert json.loads(second) == json.loads(third) == {"query": "x", "count": 1}
+        assert calls == ["x", "x"]
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import numpy as np
+import pytest
+from scipy.sparse import csr_matrix, issparse
 
 from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+from ehrlich.kernel.types import SMILES
+from ehrlich.prediction.domain.feature_matrix import FeatureMatrix
+from ehrlich.prediction.infrastructure import molecular_adapters
 from ehrlich.prediction.infrastructure.generic_adapters import (
     DistanceClusterer,
     RandomSplitter,
+    read_tabular_features,
+    tabular_features,
 )
 from ehrlich.prediction.infrastructure.molecular_adapters import (
     MolecularClusterer,
@@ -15,28 +24,71 @@ from ehrlich.prediction.infrastructure.molecular_adapters import (
     ScaffoldSplitter,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _dense(rows: list[list[float]], ids: list[str]) -> FeatureMatrix:
+    if not rows:
+        return FeatureMatrix(np.zeros((0, 0)), ids)
+    return FeatureMatrix(np.array(rows, dtype=np.float64), ids)
+
+
+# -- Feature matrix ------------------------------------------------------------
+
+
+class TestFeatureMatrix:
+    def test_rows_keep_identifiers_aligned(self) -> None:
+        matrix = _dense([[0.0], [1.0], [2.0]], ["a", "b", "c"])
+        subset = matrix.rows([2, 0])
+        assert subset.identifiers == ["c", "a"]
+        assert subset.values[:, 0].tolist() == [2.0, 0.0]
+
+    def test_rejects_misaligned_identifiers(self) -> None:
+        with pytest.raises(ValueError, match="2 feature rows for 3 identifiers"):
+            FeatureMatrix(np.zeros((2, 4)), ["a", "b", "c"])
+
+    def test_tabular_features_row_major(self) -> None:
+        matrix = tabular_features([1.0, 2.0, 3.0, 4.0, 5.0, 6.0], 3, ["a", "b"])
+        assert matrix.values.tolist() == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+        assert matrix.feature_format == "dense"
+
+
 # -- Molecular adapters -------------------------------------------------------
 
 
 class TestMolecularFeatureExtractor:
     def test_extracts_features_from_valid_smiles(self) -> None:
         ext = MolecularFeatureExtractor(RDKitAdapter())
-        features, valid = ext.extract(["c1ccccc1", "CCO", "c1ccncc1"])
+        features = ext.extract(["c1ccccc1", "CCO", "c1ccncc1"])
         assert len(features) == 3
-        assert len(valid) == 3
-        assert len(features[0]) == 2048  # Morgan fingerprint default
+        assert features.identifiers == ["c1ccccc1", "CCO", "c1ccncc1"]
+        assert features.n_features == 2048  # Morgan fingerprint default
+        assert features.is_sparse
 
     def test_drops_invalid_smiles(self) -> None:
         ext = MolecularFeatureExtractor(RDKitAdapter())
-        features, valid = ext.extract(["c1ccccc1", "INVALID_SMILES_XYZ", "CCO"])
+        features = ext.extract(["c1ccccc1", "INVALID_SMILES_XYZ", "CCO"])
         assert len(features) == 2
-        assert valid == ["c1ccccc1", "CCO"]
+        assert features.identifiers == ["c1ccccc1", "CCO"]
 
     def test_empty_input_returns_empty(self) -> None:
         ext = MolecularFeatureExtractor(RDKitAdapter())
-        features, valid = ext.extract([])
-        assert features == []
-        assert valid == []
+        features = ext.extract([])
+        assert len(features) == 0
+        assert features.values.shape == (0, 2048)
+
+    def test_sparse_rows_match_fingerprint_bits(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Small chunks so rows span several unpacking chunks.
+        monkeypatch.setattr(molecular_adapters, "_UNPACK_CHUNK_ROWS", 2)
+        adapter = RDKitAdapter()
+        smiles = ["c1ccccc1O", "CCO", "CC(=O)Oc1ccccc1C(=O)O", "C", "c1ccncc1"]
+        features = MolecularFeatureExtractor(adapter).extract(smiles)
+        assert issparse(features.values)
+        for row, s in zip(features.values, smiles, strict=True):
+            bits = adapter.compute_fingerprint(SMILES(s)).bits
+            assert row.indices.tolist() == sorted(bits)
+            assert row.data.tolist() == [1.0] * len(bits)
 
 
 class TestScaffoldSplitter:
@@ -60,7 +112,7 @@ class TestScaffoldSplitter:
         ]
         features = [[float(i)] * 10 for i in range(len(smiles))]
         labels = [1.0] * 7 + [0.0] * 7
-        train_idx, test_idx = splitter.split(features, labels, smiles)
+        train_idx, test_idx = splitter.split(_dense(features, smiles), labels)
         assert len(train_idx) + len(test_idx) == len(smiles)
         assert len(train_idx) > 0
         assert len(test_idx) > 0
@@ -70,7 +122,7 @@ class TestScaffoldSplitter:
         smiles = ["CCCCCC"] * 14  # All same scaffold
         features = [[float(i)] * 10 for i in range(14)]
         labels = [1.0] * 7 + [0.0] * 7
-        train_idx, test_idx = splitter.split(features, labels, smiles)
+        train_idx, test_idx = splitter.split(_dense(features, smiles), labels)
         assert len(train_idx) + len(test_idx) == 14
         assert len(test_idx) > 0
 
@@ -87,15 +139,15 @@ class TestMolecularClusterer:
             "CCCCCCCCCC",
             "C1CCCCC1",
         ]
-        features = [[0.0]] * len(smiles)  # Not used by MolecularClusterer
-        clusters = clusterer.cluster(features, smiles, n_clusters=20)
+        features = _dense([[0.0]] * len(smiles), smiles)  # Not used by MolecularClusterer
+        clusters = clusterer.cluster(features, n_clusters=20)
         assert len(clusters) > 0
         all_items = [s for group in clusters.values() for s in group]
         assert len(all_items) == len(smiles)
 
     def test_empty_input(self) -> None:
         clusterer = MolecularClusterer(RDKitAdapter())
-        clusters = clusterer.cluster([], [], n_clusters=5)
+        clusters = clusterer.cluster(_dense([], []), n_clusters=5)
         assert clusters == {}
 
 
@@ -108,7 +160,7 @@ class TestRandomSplitter:
         features = [[float(i)] * 4 for i in range(20)]
         labels = [1.0] * 10 + [0.0] * 10
         ids = [f"s_{i}" for i in range(20)]
-        train_idx, test_idx = splitter.split(features, labels, ids)
+        train_idx, test_idx = splitter.split(_dense(features, ids), labels)
         assert len(train_idx) + len(test_idx) == 20
         assert len(train_idx) == 16  # 80% of 20
         assert len(test_idx) == 4
@@ -118,8 +170,8 @@ class TestRandomSplitter:
         features = [[float(i)] * 4 for i in range(20)]
         labels = [1.0] * 10 + [0.0] * 10
         ids = [f"s_{i}" for i in range(20)]
-        t1, te1 = splitter.split(features, labels, ids)
-        t2, te2 = splitter.split(features, labels, ids)
+        t1, te1 = splitter.split(_dense(features, ids), labels)
+        t2, te2 = splitter.split(_dense(features, ids), labels)
         assert t1 == t2
         assert te1 == te2
 
@@ -130,21 +182,87 @@ class TestDistanceClusterer:
         rng = np.random.RandomState(42)
         features = rng.rand(20, 4).tolist()
         ids = [f"s_{i}" for i in range(20)]
-        clusters = clusterer.cluster(features, ids, n_clusters=3)
+        clusters = clusterer.cluster(_dense(features, ids), n_clusters=3)
         assert len(clusters) == 3
         all_items = [s for group in clusters.values() for s in group]
         assert len(all_items) == 20
 
     def test_empty_input(self) -> None:
         clusterer = DistanceClusterer()
-        clusters = clusterer.cluster([], [], n_clusters=5)
+        clusters = clusterer.cluster(_dense([], []), n_clusters=5)
         assert clusters == {}
 
     def test_fewer_samples_than_clusters(self) -> None:
         clusterer = DistanceClusterer()
         features = [[1.0, 2.0], [3.0, 4.0]]
         ids = ["a", "b"]
-        clusters = clusterer.cluster(features, ids, n_clusters=5)
+        clusters = clusterer.cluster(_dense(features, ids), n_clusters=5)
         assert len(clusters) == 2
         assert clusters[0] == ["a"]
         assert clusters[1] == ["b"]
+
+    def test_small_set_uses_ward_with_summary(self) -> None:
+        x, ids = _blobs(60)
+        result = DistanceClusterer().cluster_with_summary(FeatureMatrix(x, ids), n_clusters=3)
+        assert result.method == "ward"
+        assert sorted(len(v) for v in result.clusters.values()) == [20, 20, 20]
+        assert result.silhouette is not None and result.silhouette > 0.8
+        assert result.silhouette_sample == 60
+
+    def test_large_set_uses_minibatch_kmeans(self) -> None:
+        x, ids = _blobs(3000)
+        clusterer = DistanceClusterer(ward_limit=500, chunk_rows=400, silhouette_sample=300)
+        result = clusterer.cluster_with_summary(FeatureMatrix(x, ids), n_clusters=3)
+        assert result.method == "minibatch_kmeans"
+        assert sorted(result.clusters) == [0, 1, 2]
+        assert sum(len(v) for v in result.clusters.values()) == 3000
+        # Each blob lands in one cluster, and each centroid sits on a blob center.
+        for members in result.clusters.values():
+            assert len({int(i.split("_")[1]) % 3 for i in members}) == 1
+        centers = sorted(round(c[0]) for c in result.centroids.values())
+        assert centers == [0, 10, 20]
+        assert result.silhouette_sample == 300
+        assert result.silhouette is not None and result.silhouette > 0.8
+
+    def test_sparse_rows_match_dense(self) -> None:
+        x, ids = _blobs(90)
+        dense = DistanceClusterer().cluster_with_summary(FeatureMatrix(x, ids), 3)
+        sparse = DistanceClusterer().cluster_with_summary(FeatureMatrix(csr_matrix(x), ids), 3)
+        assert sparse.clusters == dense.clusters
+        for k, centroid in dense.centroids.items():
+            assert sparse.centroids[k] == pytest.approx(centroid)
+
+
+def _blobs(n: int) -> tuple[np.ndarray[..., np.dtype[np.float64]], list[str]]:
+    """Three tight, well-separated blobs; row i belongs to blob i % 3."""
+    rng = np.random.RandomState(0)
+    centers = np.array([[0.0, 0.0], [10.0, 10.0], [20.0, 0.0]])
+    x = centers[np.arange(n) % 3] + rng.normal(scale=0.3, size=(n, 2))
+    return x, [f"s_{i}" for i in range(n)]
+
+
+class TestReadTabularFeatures:
+    def test_reads_columns_in_chunks(self, tmp_path: Path) -> None:
+        path = tmp_path / "table.csv"
+        path.write_text("name,a,b,c\nx,1,2,9\ny,3,,9\nz,5,6,9\nw,7,oops,9\nv,9,10,9\n")
+        features = read_tabular_features(path, ["a", "b"], id_column="name", chunk_rows=2)
+        assert features.identifiers == ["x", "z", "v"]
+        assert features.values.tolist() == [[1.0, 2.0], [5.0, 6.0], [9.0, 10.0]]
+
+    def test_row_numbers_as_identifiers(self, tmp_path: Path) -> None:
+        path = tmp_path / "table.tsv"
+        path.write_text("a\tb\n1\t2\n\t4\n5\t6\n")
+        features = read_tabular_features(path, ["a", "b"], chunk_rows=1)
+        assert features.identifiers == ["row_0", "row_2"]
+
+    def test_missing_column(self, tmp_path: Path) -> None:
+        path = tmp_path / "table.csv"
+        path.write_text("a,b\n1,2\n")
+        with pytest.raises(ValueError, match="Columns not in table.csv: z"):
+            read_tabular_features(path, ["a", "z"])
+
+    def test_unsupported_format(self, tmp_path: Path) -> None:
+        path = tmp_path / "table.xlsx"
+        path.write_bytes(b"")
+        with pytest.raises(ValueError, match="Unsupported table format"):
+            read_tabular_features(path, ["a"])
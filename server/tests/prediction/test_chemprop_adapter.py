@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import os
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+
+from ehrlich.prediction.infrastructure import chemprop_adapter
+from ehrlich.prediction.infrastructure.chemprop_adapter import ChempropAdapter, _CheckpointCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Real Chemprop/Lightning tests; CI runs them in a job with the deeplearning extra.
+_REQUIRES_CHEMPROP = [
+    pytest.mark.chemprop,
+    pytest.mark.skipif(not ChempropAdapter.is_available(), reason="chemprop not installed"),
+]
+
+_ACTIVE = [
+    "c1ccccc1O",
+    "c1ccc(O)cc1C",
+    "c1ccc(O)cc1Cl",
+    "c1ccc(O)cc1N",
+    "c1cc(O)ccc1F",
+    "Oc1ccccc1CC",
+]
+_INACTIVE = ["CCCC", "CCCCC", "CCCCCC", "CC(C)C", "CCC(C)C", "CCCCCCC"]
+
+
+@pytest.fixture(scope="module")
+def adapter() -> ChempropAdapter:
+    return ChempropAdapter(batch_size=4, epochs=2, num_threads=1)
+
+
+@pytest.fixture(scope="module")
+def trained(adapter: ChempropAdapter) -> object:
+    # Trained once for the module; a D-MPNN fit is slow even for two epochs.
+    return asyncio.run(adapter.train(_ACTIVE + _INACTIVE, [1.0] * 6 + [0.0] * 6))
+
+
+class _StubModel:
+    """Scores each molecule as heavy atoms / 10 plus ``offset``, as an ``(n, 1)`` array."""
+
+    def __init__(self, offset: float = 0.0) -> None:
+        self.offset = offset
+
+    def eval(self) -> None:
+        pass
+
+    def __call__(self, bmg: list[Any], v_d: None, x_d: None) -> np.ndarray:
+        return np.array([[mol.GetNumAtoms() / 10 + self.offset] for mol in bmg])
+
+
+@pytest.fixture
+def stub_chemprop(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Stand-ins for torch and Chemprop loading/batching; returns the paths loaded."""
+    loaded: list[Path] = []
+
+    def load_from_file(path: Path, map_location: object) -> _StubModel:
+        loaded.append(path)
+        return _StubModel(float(path.read_text()))
+
+    def batches(mols: list[Any], batch_size: int) -> list[SimpleNamespace]:
+        return [
+            SimpleNamespace(bmg=mols[i : i + batch_size], V_d=None, X_d=None)
+            for i in range(0, len(mols), batch_size)
+        ]
+
+    torch = SimpleNamespace(device=str, inference_mode=contextlib.nullcontext)
+    models = SimpleNamespace(MPNN=SimpleNamespace(load_from_file=load_from_file))
+    monkeypatch.setattr(chemprop_adapter, "torch", torch, raising=False)
+    monkeypatch.setattr(chemprop_adapter, "models", models, raising=False)
+    monkeypatch.setattr(chemprop_adapter, "_batches", batches)
+    return loaded
+
+
+def _checkpoint(path: Path, offset: float) -> Path:
+    path.write_text(str(offset))
+    return path
+
+
+class TestCheckpointCache:
+    def test_hit_and_miss(self, stub_chemprop: list[Path], tmp_path: Path) -> None:
+        cache = _CheckpointCache(max_entries=2)
+        path = _checkpoint(tmp_path / "a.pt", 0.1)
+        assert cache.load(path) is cache.load(path)
+        assert len(stub_chemprop) == 1
+        assert cache.stats() == {"size": 1, "max_entries": 2, "hits": 1, "misses": 1}
+
+    def test_rewritten_checkpoint_reloads(self, stub_chemprop: list[Path], tmp_path: Path) -> None:
+        cache = _CheckpointCache(max_entries=2)
+        path = _checkpoint(tmp_path / "a.pt", 0.1)
+        cache.load(path)
+        _checkpoint(path, 0.3)
+        stamp = path.stat().st_mtime_ns + 1_000_000
+        os.utime(path, ns=(stamp, stamp))
+        assert cache.load(path).offset == 0.3
+        assert cache.stats()["misses"] == 2
+
+    def test_evicts_least_recently_used(self, stub_chemprop: list[Path], tmp_path: Path) -> None:
+        cache = _CheckpointCache(max_entries=2)
+        a, b, c = (_checkpoint(tmp_path / f"{n}.pt", 0.0) for n in "abc")
+        cache.load(a)
+        cache.load(b)
+        cache.load(a)
+        cache.load(c)
+        cache.load(a)
+        cache.load(b)
+        assert [p.name for p in stub_chemprop] == ["a.pt", "b.pt", "c.pt", "b.pt"]
+
+
+class TestEnsembleAveraging:
+    def test_averages_members_and_keeps_invalid_as_nan(
+        self, stub_chemprop: list[Path], tmp_path: Path
+    ) -> None:
+        adapter = ChempropAdapter(batch_size=2)
+        members: list[object] = [_StubModel(0.0), _checkpoint(tmp_path / "m.pt", 0.2)]
+        scores = adapter._predict(["CCO", "not_a_molecule", "", "CCCO", "C"], members)
+        assert math.isnan(scores[1])
+        assert math.isnan(scores[2])
+        assert [scores[i] for i in (0, 3, 4)] == pytest.approx([0.4, 0.5, 0.2])
+
+    def test_all_invalid(self, stub_chemprop: list[Path]) -> None:
+        scores = ChempropAdapter()._predict(["bad!!!"], [_StubModel()])
+        assert len(scores) == 1
+        assert math.isnan(scores[0])
+
+
+class TestPredict:
+    pytestmark = _REQUIRES_CHEMPROP
+
+    @pytest.mark.asyncio
+    async def test_probabilities_in_input_order(
+        self, adapter: ChempropAdapter, trained: object
+    ) -> None:
+        # batch_size=4 splits the inputs across several collated batches.
+        scores = await adapter.predict(["CCO", "not_a_molecule", *_ACTIVE], trained)
+        assert len(scores) == 8
+        assert math.isnan(scores[1])
+        assert all(0.0 <= s <= 1.0 for i, s in enumerate(scores) if i != 1)
+
+    @pytest.mark.asyncio
+    async def test_ensemble_of_identical_members_matches_single(
+        self, adapter: ChempropAdapter, trained: object
+    ) -> None:
+        single = await adapter.predict(_INACTIVE, trained)
+        ensemble = await adapter.predict(_INACTIVE, [trained, trained, trained])
+        assert ensemble == pytest.approx(single)
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_loaded_once(
+        self, adapter: ChempropAdapter, trained: object, tmp_path: Path
+    ) -> None:
+        path = adapter.save(trained, tmp_path / "model.pt")
+        first = await adapter.predict(_ACTIVE, path)
+        second = await adapter.predict(_ACTIVE, [str(path), path])
+        assert second == pytest.approx(first)
+        assert first == pytest.approx(await adapter.predict(_ACTIVE, trained))
+        stats = adapter.cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self, adapter: ChempropAdapter, trained: object) -> None:
+        assert await adapter.predict([], trained) == []
+
+
+class TestTrain:
+    pytestmark = _REQUIRES_CHEMPROP
+
+    @pytest.mark.asyncio
+    async def test_rejects_tiny_dataset(self, adapter: ChempropAdapter) -> None:
+        with pytest.raises(ValueError, match="too small"):
+            await adapter.train(["CCO", "CCC"], [1.0, 0.0])
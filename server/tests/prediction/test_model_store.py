@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
+import joblib
+import numpy as np
 import pytest
+from xgboost import XGBClassifier
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -70,3 +74,102 @@ class TestListModels:
         models = await store.list_models()
         assert len(models) == 3
         assert [m.model_id for m in models] == ["model_000", "model_001", "model_002"]
+
+
+def _fit_xgb() -> XGBClassifier:
+    rng = np.random.RandomState(0)
+    model = XGBClassifier(n_estimators=5, max_depth=2, tree_method="hist")
+    model.fit(rng.rand(40, 8), np.arange(40) % 2)
+    return model
+
+
+class TestNativeFormat:
+    @pytest.mark.asyncio
+    async def test_xgboost_saved_as_ubjson(self, tmp_path: Path) -> None:
+        model = _fit_xgb()
+        await ModelStore(models_dir=tmp_path).save(_make_model(), model)
+        assert (tmp_path / "test_model_001" / "model.ubj").exists()
+        assert not (tmp_path / "test_model_001" / "model.joblib").exists()
+
+        _, loaded = await ModelStore(models_dir=tmp_path).load("test_model_001")
+        x = np.random.RandomState(1).rand(5, 8)
+        np.testing.assert_allclose(loaded.predict_proba(x), model.predict_proba(x), rtol=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_loads_legacy_joblib(self, tmp_path: Path) -> None:
+        await ModelStore(models_dir=tmp_path).save(_make_model(), {"legacy": True})
+        (tmp_path / "index.json").unlink()
+        joblib.dump(_fit_xgb(), tmp_path / "test_model_001" / "model.joblib")
+
+        loaded_model, artifact = await ModelStore(models_dir=tmp_path).load("test_model_001")
+        assert loaded_model.metrics == {"auroc": 0.85, "f1": 0.78}
+        assert isinstance(artifact, XGBClassifier)
+
+
+class TestIndex:
+    @pytest.mark.asyncio
+    async def test_list_reads_index_only(self, store: ModelStore, tmp_path: Path) -> None:
+        await store.save(_make_model("model_a"), {"data": 1})
+        (tmp_path / "model_a" / "metadata.json").write_text("not json")
+        models = await ModelStore(models_dir=tmp_path).list_models()
+        assert [m.model_id for m in models] == ["model_a"]
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_missing_or_corrupt_index(
+        self, store: ModelStore, tmp_path: Path
+    ) -> None:
+        await store.save(_make_model("model_a"), {"data": 1})
+        await store.save(_make_model("model_b"), {"data": 2})
+        (tmp_path / "index.json").write_text("garbage")
+        models = await ModelStore(models_dir=tmp_path).list_models()
+        assert [m.model_id for m in models] == ["model_a", "model_b"]
+        assert set(json.loads((tmp_path / "index.json").read_text())["models"]) == {
+            "model_a",
+            "model_b",
+        }
+
+    @pytest.mark.asyncio
+    async def test_sees_models_saved_by_another_store(self, tmp_path: Path) -> None:
+        first = ModelStore(models_dir=tmp_path)
+        assert await first.list_models() == []
+        await ModelStore(models_dir=tmp_path).save(_make_model("model_x"), {"data": 1})
+        assert [m.model_id for m in await first.list_models()] == ["model_x"]
+        loaded_model, _ = await first.load("model_x")
+        assert loaded_model.model_id == "model_x"
+
+    @pytest.mark.asyncio
+    async def test_undefined_metrics_written_as_null(self, tmp_path: Path) -> None:
+        model = _make_model()
+        model.metrics = {"auroc": float("nan"), "f1": 0.78}
+        await ModelStore(models_dir=tmp_path).save(model, {"data": 1})
+        index = json.loads((tmp_path / "index.json").read_text(), parse_constant=pytest.fail)
+        assert index["models"]["test_model_001"]["metrics"] == {"auroc": None, "f1": 0.78}
+        (listed,) = await ModelStore(models_dir=tmp_path).list_models()
+        assert np.isnan(listed.metrics["auroc"])
+
+
+class TestCache:
+    @pytest.mark.asyncio
+    async def test_repeated_loads_hit_cache(self, tmp_path: Path) -> None:
+        await ModelStore(models_dir=tmp_path).save(_make_model(), _fit_xgb())
+        store = ModelStore(models_dir=tmp_path)
+        _, first = await store.load("test_model_001")
+        _, second = await store.load("test_model_001")
+        assert first is second
+        stats = store.cache_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["bytes"] == (tmp_path / "test_model_001" / "model.ubj").stat().st_size
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        store = ModelStore(models_dir=tmp_path, cache_mb=1)
+        blob = "x" * 400_000
+        for name in ("a", "b", "c"):
+            await store.save(_make_model(name), {"blob": blob})
+        stats = store.cache_stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+        assert stats["bytes"] <= stats["max_bytes"]
+        _, artifact = await store.load("a")
+        assert artifact == {"blob": blob}
+        assert store.cache_stats()["misses"] == 1
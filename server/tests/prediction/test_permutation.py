@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ehrlich.prediction.infrastructure import permutation
+
+
+def _noise() -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.RandomState(7)
+    x_train = rng.randint(0, 2, size=(60, 16)).astype(np.float64)
+    x_test = rng.randint(0, 2, size=(20, 16)).astype(np.float64)
+    y_train = rng.choice([0.0, 1.0], size=60)
+    y_test = np.array([0.0, 1.0] * 10)
+    return x_train, y_train, x_test, y_test
+
+
+class TestStoppingRule:
+    def test_undecided_at_start(self) -> None:
+        assert not permutation._decided(0, 0)
+        assert not permutation._decided(1, 20)
+
+    def test_clearly_above(self) -> None:
+        assert permutation._decided(8, 20)
+
+    def test_clearly_below_needs_enough_permutations(self) -> None:
+        assert not permutation._decided(0, 40)
+        assert permutation._decided(0, 200)
+
+
+class TestPermutationTest:
+    @pytest.mark.asyncio
+    async def test_independent_of_worker_split(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        data = _noise()
+        monkeypatch.setattr(permutation, "cpu_workers", lambda: 1)
+        single = await permutation.permutation_test(*data, original_auroc=0.7, budget=30)
+        monkeypatch.setattr(permutation, "cpu_workers", lambda: 3)
+        split = await permutation.permutation_test(*data, original_auroc=0.7, budget=30)
+        assert single == split
+
+    @pytest.mark.asyncio
+    async def test_p_value_counts_only_permutations_run(self) -> None:
+        result = await permutation.permutation_test(*_noise(), original_auroc=0.0, budget=100)
+        assert result.stopped_early
+        assert result.n_permutations == 20
+        assert result.p_value == 1.0
+
+    @pytest.mark.asyncio
+    async def test_single_class_labels(self) -> None:
+        x_train, _, x_test, y_test = _noise()
+        result = await permutation.permutation_test(
+            x_train, np.ones(60), x_test, y_test, original_auroc=0.9
+        )
+        assert result.p_value == 1.0
+        assert result.n_permutations == 0
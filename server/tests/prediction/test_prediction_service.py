@@ -6,8 +6,10 @@ from pathlib import Path
 
 import numpy as np
 import pytest
+from scipy.sparse import csr_matrix
 
 from ehrlich.prediction.application.prediction_service import PredictionService
+from ehrlich.prediction.domain.feature_matrix import FeatureMatrix
 from ehrlich.prediction.infrastructure.generic_adapters import (
     DistanceClusterer,
     RandomSplitter,
@@ -16,16 +18,15 @@ from ehrlich.prediction.infrastructure.model_store import ModelStore
 from ehrlich.prediction.infrastructure.xgboost_adapter import XGBoostAdapter
 
 
-def _make_synthetic_features() -> tuple[list[list[float]], list[float], list[str]]:
+def _make_synthetic_features() -> tuple[FeatureMatrix, list[float]]:
     """Generate synthetic binary features with a clear signal in the first 3 bits."""
     rng = np.random.RandomState(42)
     n_samples, n_features = 20, 64
     x = rng.randint(0, 2, size=(n_samples, n_features)).astype(float)
     # Labels correlated with first 3 features
     labels = (x[:, :3].sum(axis=1) >= 2).astype(float).tolist()
-    features = x.tolist()
     identifiers = [f"sample_{i}" for i in range(n_samples)]
-    return features, labels, identifiers
+    return FeatureMatrix(x, identifiers), labels
 
 
 @pytest.fixture
@@ -46,11 +47,10 @@ class TestTrain:
     async def test_train_returns_trained_model(
         self, service: PredictionService, splitter: RandomSplitter
     ) -> None:
-        features, labels, ids = _make_synthetic_features()
+        features, labels = _make_synthetic_features()
         result = await service.train(
             features,
             labels,
-            ids,
             "synthetic_target",
             splitter=splitter,
             comparison_splitter=splitter,
@@ -67,14 +67,12 @@ class TestTrain:
     async def test_train_dataset_too_small(
         self, service: PredictionService, splitter: RandomSplitter
     ) -> None:
-        features = [[1.0] * 10] * 3
+        features = FeatureMatrix(np.ones((3, 10)), ["a", "b", "c"])
         labels = [1.0, 0.0, 1.0]
-        ids = ["a", "b", "c"]
         with pytest.raises(ValueError, match="too small"):
             await service.train(
                 features,
                 labels,
-                ids,
                 "test",
                 splitter=splitter,
                 comparison_splitter=splitter,
@@ -84,11 +82,10 @@ class TestTrain:
     async def test_train_includes_random_metrics(
         self, service: PredictionService, splitter: RandomSplitter
     ) -> None:
-        features, labels, ids = _make_synthetic_features()
+        features, labels = _make_synthetic_features()
         result = await service.train(
             features,
             labels,
-            ids,
             "synthetic_target",
             splitter=splitter,
             comparison_splitter=splitter,
@@ -103,28 +100,27 @@ class TestTrain:
     async def test_train_includes_permutation_p_value(
         self, service: PredictionService, splitter: RandomSplitter
     ) -> None:
-        features, labels, ids = _make_synthetic_features()
+        features, labels = _make_synthetic_features()
         result = await service.train(
             features,
             labels,
-            ids,
             "synthetic_target",
             splitter=splitter,
             comparison_splitter=splitter,
         )
         assert "permutation_p_value" in result.metrics
         assert 0.0 < result.metrics["permutation_p_value"] <= 1.0
+        assert 0 < result.metrics["permutation_count"] <= 100
 
     @pytest.mark.asyncio
     async def test_train_with_feature_names(
         self, service: PredictionService, splitter: RandomSplitter
     ) -> None:
-        features, labels, ids = _make_synthetic_features()
+        features, labels = _make_synthetic_features()
         names = [f"feat_{i}" for i in range(64)]
         result = await service.train(
             features,
             labels,
-            ids,
             "named_target",
             splitter=splitter,
             comparison_splitter=splitter,
@@ -140,19 +136,16 @@ class TestPredict:
     async def test_predict_returns_ranked_results(
         self, service: PredictionService, splitter: RandomSplitter
     ) -> None:
-        features, labels, ids = _make_synthetic_features()
+        features, labels = _make_synthetic_features()
         trained = await service.train(
             features,
             labels,
-            ids,
             "target",
             splitter=splitter,
             comparison_splitter=splitter,
         )
         # Predict on a subset
-        pred_features = features[:3]
-        pred_ids = ids[:3]
-        results = await service.predict(pred_features, pred_ids, trained.model_id)
+        results = await service.predict(features.rows([0, 1, 2]), trained.model_id)
         assert len(results) == 3
         assert results[0].rank == 1
         assert results[1].rank == 2
@@ -163,18 +156,33 @@ class TestPredict:
     async def test_predict_empty_returns_empty(
         self, service: PredictionService, splitter: RandomSplitter
     ) -> None:
-        features, labels, ids = _make_synthetic_features()
+        features, labels = _make_synthetic_features()
         trained = await service.train(
             features,
             labels,
-            ids,
             "target",
             splitter=splitter,
             comparison_splitter=splitter,
         )
-        results = await service.predict([], [], trained.model_id)
+        results = await service.predict(features.rows([]), trained.model_id)
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_sparse_model_scores_either_layout(
+        self, service: PredictionService, splitter: RandomSplitter
+    ) -> None:
+        features, labels = _make_synthetic_features()
+        sparse = FeatureMatrix(csr_matrix(features.values), features.identifiers)
+        trained = await service.train(
+            sparse, labels, "target", splitter=splitter, comparison_splitter=splitter
+        )
+        assert trained.feature_format == "sparse"
+        from_sparse = await service.predict(sparse, trained.model_id)
+        from_dense = await service.predict(features, trained.model_id)
+        assert [(r.identifier, r.probability) for r in from_sparse] == [
+            (r.identifier, r.probability) for r in from_dense
+        ]
+
 
 class TestCluster:
     @pytest.mark.asyncio
@@ -184,9 +192,8 @@ class TestCluster:
             xgboost=XGBoostAdapter(),
         )
         rng = np.random.RandomState(42)
-        features = rng.rand(14, 4).tolist()
-        ids = [f"item_{i}" for i in range(14)]
-        clusters = await service.cluster(features, ids, 3, DistanceClusterer())
+        features = FeatureMatrix(rng.rand(14, 4), [f"item_{i}" for i in range(14)])
+        clusters = await service.cluster(features, 3, DistanceClusterer())
         assert len(clusters) == 3
         all_items = [s for group in clusters.values() for s in group]
         assert len(all_items) == 14
@@ -197,5 +204,7 @@ class TestCluster:
             model_repo=ModelStore(models_dir=Path("/tmp/unused")),
             xgboost=XGBoostAdapter(),
         )
-        clusters = await service.cluster([], [], 5, DistanceClusterer())
+        clusters = await service.cluster(
+            FeatureMatrix(np.zeros((0, 4)), []), 5, DistanceClusterer()
+        )
         assert clusters == {}
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from xgboost import XGBClassifier
+
+from ehrlich.chemistry.infrastructure.alert_catalog import load_alert_catalog
+from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+from ehrlich.prediction.domain.trained_model import TrainedModel
+from ehrlich.prediction.infrastructure.model_store import ModelStore
+from ehrlich.prediction.infrastructure.molecular_adapters import MolecularFeatureExtractor
+from ehrlich.prediction.infrastructure.screening import (
+    LibraryScreener,
+    read_library,
+    resolve_library,
+)
+from ehrlich.prediction.infrastructure.xgboost_adapter import XGBoostAdapter
+from ehrlich.shared.alerts import AlertCatalog
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_TRAIN_ACTIVE = ["c1ccc(cc1)O", "c1ccc(cc1)N", "Oc1ccccc1C", "c1ccc(cc1)CO", "Nc1ccccc1C"]
+_TRAIN_INACTIVE = ["CCCCCC", "CCCCCCCCCC", "C1CCCCC1", "CC(C)CC", "CCOC(=O)CC"]
+_LIBRARY = [
+    "c1ccccc1O",  # phenol
+    "Oc1ccccc1",  # the same phenol, spelled differently
+    "CCCCCCC",
+    "not-a-smiles",
+    "O=[N+]([O-])c1ccccc1",  # nitrobenzene: mutagenic alert
+    "Nc1ccccc1",
+    "CCO",
+]
+
+
+async def _store_model(store: ModelStore, rdkit: RDKitAdapter) -> str:
+    features = MolecularFeatureExtractor(rdkit).extract(_TRAIN_ACTIVE + _TRAIN_INACTIVE)
+    labels = np.array([1.0] * len(_TRAIN_ACTIVE) + [0.0] * len(_TRAIN_INACTIVE))
+    model = XGBClassifier(n_estimators=20, max_depth=2, eval_metric="logloss")
+    model.fit(features.values, labels)
+    trained = TrainedModel(
+        model_id="screen_model",
+        model_type="xgboost",
+        target="test",
+        is_trained=True,
+        feature_format="sparse",
+    )
+    return await store.save(trained, model)
+
+
+def _write(path: Path, lines: list[str]) -> Path:
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+class TestReadLibrary:
+    def test_smi_skips_comments_and_names(self, tmp_path: Path) -> None:
+        path = _write(
+            tmp_path / "lib.smi", ["# header", "CCO ethanol", "", "c1ccccc1\tbenzene", "C"]
+        )
+        assert list(read_library(path, chunk_size=2)) == [["CCO", "c1ccccc1"], ["C"]]
+
+    def test_csv_detects_smiles_column(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "lib.csv", ["id,SMILES", "a,CCO", "b,", "c,CCN"])
+        assert list(read_library(path, chunk_size=10)) == [["CCO", "CCN"]]
+
+    def test_csv_named_column(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "lib.csv", ["structure,id", "CCO,a"])
+        assert list(read_library(path, chunk_size=10, smiles_column="structure")) == [["CCO"]]
+
+    def test_csv_without_smiles_column(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "lib.csv", ["id,value", "a,1"])
+        with pytest.raises(ValueError, match="No SMILES column"):
+            list(read_library(path, chunk_size=10))
+
+    def test_unsupported_format(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Unsupported library format"):
+            read_library(tmp_path / "lib.sdf", chunk_size=10)
+
+
+class TestResolveLibrary:
+    def test_file_in_library_dir(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "lib.smi", ["CCO"])
+        assert resolve_library("lib.smi", tmp_path, tmp_path / "uploads") == path
+
+    def test_uploaded_file_id(self, tmp_path: Path) -> None:
+        uploads = tmp_path / "uploads"
+        uploads.mkdir()
+        file_id = "0b6c1c1e-6a43-4d55-9b1e-3f3c2a1d9e10"
+        path = _write(uploads / f"{file_id}.csv", ["smiles", "CCO"])
+        assert resolve_library(file_id, tmp_path / "libraries", uploads) == path
+
+    def test_rejects_paths_outside_library_dir(self, tmp_path: Path) -> None:
+        _write(tmp_path / "secret.smi", ["CCO"])
+        library_dir = tmp_path / "libraries"
+        library_dir.mkdir()
+        with pytest.raises(ValueError, match="Library not found"):
+            resolve_library("../secret.smi", library_dir, tmp_path)
+
+
+class TestLibraryScreener:
+    @pytest.mark.asyncio
+    async def test_counts_and_top_hits(self, tmp_path: Path) -> None:
+        rdkit = RDKitAdapter()
+        store = ModelStore(models_dir=tmp_path / "models")
+        model_id = await _store_model(store, rdkit)
+        alerts = load_alert_catalog().select("mutagenic")
+        screener = LibraryScreener(rdkit, store, XGBoostAdapter(), alerts, chunk_size=2)
+
+        report = await screener.screen(_write(tmp_path / "lib.smi", _LIBRARY), model_id, top_k=2)
+
+        assert report.n_read == 7
+        assert report.n_invalid == 1
+        assert report.n_duplicates == 1
+        assert report.n_flagged == 1
+        assert report.n_scored == 4
+        assert [hit.rank for hit in report.hits] == [1, 2]
+        probabilities = [hit.probability for hit in report.hits]
+        assert probabilities == sorted(probabilities, reverse=True)
+
+        # The hits are the best of what predict_candidates would score for the same molecules.
+        _, model = await store.load(model_id)
+        scored = ["Oc1ccccc1", "CCCCCCC", "Nc1ccccc1", "CCO"]
+        features = MolecularFeatureExtractor(rdkit).extract(scored)
+        expected = await XGBoostAdapter().predict(features.values, model, "sparse")
+        best = sorted(zip(expected, features.identifiers, strict=True), reverse=True)[:2]
+        assert [h.identifier for h in report.hits] == [smiles for _, smiles in best]
+        assert probabilities == pytest.approx([p for p, _ in best])
+
+    @pytest.mark.asyncio
+    async def test_no_alerts_keeps_flagged_molecules(self, tmp_path: Path) -> None:
+        rdkit = RDKitAdapter()
+        store = ModelStore(models_dir=tmp_path / "models")
+        model_id = await _store_model(store, rdkit)
+        screener = LibraryScreener(rdkit, store, XGBoostAdapter(), AlertCatalog([]))
+
+        report = await screener.screen(_write(tmp_path / "lib.smi", _LIBRARY), model_id)
+
+        assert report.n_flagged == 0
+        assert report.n_scored == 5
+        assert len(report.hits) == 5
+
+    @pytest.mark.asyncio
+    async def test_rejects_model_with_other_features(self, tmp_path: Path) -> None:
+        store = ModelStore(models_dir=tmp_path / "models")
+        model = XGBClassifier(n_estimators=2).fit(np.eye(4), [0, 1, 0, 1])
+        await store.save(TrainedModel("tabular", "xgboost", "t", is_trained=True), model)
+        screener = LibraryScreener(RDKitAdapter(), store, XGBoostAdapter(), AlertCatalog([]))
+
+        with pytest.raises(ValueError, match="expects 4 features"):
+            await screener.screen(_write(tmp_path / "lib.smi", ["CCO"]), "tabular")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, patch
 
 import numpy as np
@@ -10,6 +11,11 @@ import pytest
 
 from ehrlich.analysis.domain.dataset import Dataset
 from ehrlich.kernel.types import SMILES
+from ehrlich.prediction.application.prediction_service import PredictionService
+from ehrlich.prediction.infrastructure.model_store import ModelStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 # -- Molecular tools -----------------------------------------------------------
 
@@ -34,6 +40,19 @@ _INACTIVE_SMILES = [
 ]
 
 
+@pytest.fixture
+def model_store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ModelStore:
+    """Points the tools' model store, and the service that saves through it, at tmp_path."""
+    from ehrlich.prediction import tools
+
+    store = ModelStore(models_dir=tmp_path / "models")
+    monkeypatch.setattr(tools, "_model_store", store)
+    monkeypatch.setattr(
+        tools, "_service", PredictionService(model_repo=store, xgboost=tools._xgboost)
+    )
+    return store
+
+
 def _mock_dataset() -> Dataset:
     return Dataset(
         name="ChEMBL Test",
@@ -90,6 +109,36 @@ class TestClusterCompounds:
         assert total == len(smiles)
 
 
+class TestScreenLibrary:
+    @pytest.mark.asyncio
+    async def test_screens_library_file(self, tmp_path: Path, model_store: ModelStore) -> None:
+        from ehrlich.prediction import tools
+
+        with patch.object(tools._dataset_repo, "load", new_callable=AsyncMock) as mock:
+            mock.return_value = _mock_dataset()
+            model_id = json.loads(await tools.train_model("Staphylococcus aureus"))["model_id"]
+        assert (tmp_path / "models" / model_id).is_dir()
+
+        library = tmp_path / "library.smi"
+        library.write_text("c1ccccc1O\nOc1ccccc1\nO=[N+]([O-])c1ccccc1\nCCCCCC\nxyz\n")
+        with patch.object(tools._settings, "screening_library_dir", str(tmp_path)):
+            result = json.loads(await tools.screen_library("library.smi", model_id, top_k=1))
+        assert result["n_read"] == 5
+        assert result["n_invalid"] == 1
+        assert result["n_duplicates"] == 1
+        assert result["n_flagged"] == 1
+        assert result["n_scored"] == 2
+        assert len(result["hits"]) == 1
+        assert result["hits"][0]["rank"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_library(self) -> None:
+        from ehrlich.prediction import tools
+
+        result = json.loads(await tools.screen_library("missing.smi", "model_xyz"))
+        assert "Library not found" in result["error"]
+
+
 # -- Generic ML tools ---------------------------------------------------------
 
 
@@ -166,6 +215,13 @@ class TestPredictScores:
         result = json.loads(await tools.predict_scores(["a"], [1.0], "nonexistent_model"))
         assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_identifier_count_mismatch_error(self) -> None:
+        from ehrlich.prediction import tools
+
+        result = json.loads(await tools.predict_scores(["a"], [1.0, 2.0], "m", identifiers="x"))
+        assert "error" in result
+
 
 class TestClusterData:
     @pytest.mark.asyncio
@@ -188,3 +244,43 @@ class TestClusterData:
 
         result = json.loads(await tools.cluster_data([], [1.0]))
         assert "error" in result
+
+    @pytest.mark.asyncio
+    async def test_identifier_count_mismatch_error(self) -> None:
+        from ehrlich.prediction import tools
+
+        result = json.loads(await tools.cluster_data(["a"], [1.0, 2.0, 3.0], identifiers="x,y"))
+        assert "error" in result
+
+    @pytest.mark.asyncio
+    async def test_clusters_uploaded_table(self, tmp_path: Path) -> None:
+        from ehrlich.prediction import tools
+
+        rng = np.random.RandomState(0)
+        rows = ["id,x,y"] + [
+            f"p{i},{(i % 2) * 10 + rng.normal(scale=0.2)},{rng.normal(scale=0.2)}"
+            for i in range(300)
+        ]
+        file_id = "0f8e7d6c-5b4a-4392-8170-6f5e4d3c2b1a"
+        (tmp_path / f"{file_id}.csv").write_text("\n".join(rows) + "\n")
+        with patch.object(tools._settings, "upload_dir", str(tmp_path)):
+            result = json.loads(
+                await tools.cluster_data(
+                    ["x", "y"], [], n_clusters=2, dataset=file_id, id_column="id"
+                )
+            )
+        assert result["n_samples"] == 300
+        assert result["n_clusters"] == 2
+        sizes = sorted(c["size"] for c in result["clusters"].values())
+        assert sizes == [150, 150]
+        assert all(len(c["identifiers"]) == 100 for c in result["clusters"].values())
+        assert all(c["identifiers_truncated"] for c in result["clusters"].values())
+        assert sorted(round(c["centroid"]["x"]) for c in result["clusters"].values()) == [0, 10]
+        assert result["silhouette"] > 0.8
+
+    @pytest.mark.asyncio
+    async def test_unknown_dataset_error(self) -> None:
+        from ehrlich.prediction import tools
+
+        result = json.loads(await tools.cluster_data(["x"], [], dataset="missing.csv"))
+        assert "error" in result
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import numpy as np
 import pytest
+from scipy.sparse import csr_matrix
 
+from ehrlich.prediction.infrastructure import xgboost_adapter
 from ehrlich.prediction.infrastructure.xgboost_adapter import XGBoostAdapter
 
 
@@ -81,9 +83,27 @@ class TestTrain:
         assert len(importance) > 0
         assert all(v > 0 for v in importance.values())
 
+    @pytest.mark.asyncio
+    async def test_threads_split_cores_between_workers(
+        self,
+        adapter: XGBoostAdapter,
+        synthetic_data: tuple[
+            np.ndarray[..., np.dtype[np.float64]],
+            np.ndarray[..., np.dtype[np.float64]],
+            np.ndarray[..., np.dtype[np.float64]],
+            np.ndarray[..., np.dtype[np.float64]],
+        ],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(xgboost_adapter.os, "cpu_count", lambda: 8)
+        monkeypatch.setattr(xgboost_adapter, "cpu_workers", lambda: 3)
+        model, _, _ = await adapter.train(*synthetic_data)
+        assert model.get_params()["n_jobs"] == 2
+
 
 class TestPermutationTest:
-    def test_permutation_real_signal(
+    @pytest.mark.asyncio
+    async def test_permutation_real_signal(
         self,
         adapter: XGBoostAdapter,
         synthetic_data: tuple[
@@ -94,23 +114,29 @@ class TestPermutationTest:
         ],
     ) -> None:
         x_train, y_train, x_test, y_test = synthetic_data
-        p_value = adapter.permutation_test(
+        result = await adapter.permutation_test(
             x_train, y_train, x_test, y_test, original_auroc=0.9, n_permutations=50
         )
-        assert p_value < 0.1
+        assert result.p_value < 0.1
+        assert result.n_permutations == 50
+        assert not result.stopped_early
 
-    def test_permutation_noise(self, adapter: XGBoostAdapter) -> None:
+    @pytest.mark.asyncio
+    async def test_permutation_noise(self, adapter: XGBoostAdapter) -> None:
         rng = np.random.RandomState(123)
         x_train = rng.randint(0, 2, size=(80, 64)).astype(np.float64)
         x_test = rng.randint(0, 2, size=(20, 64)).astype(np.float64)
         y_train = rng.choice([0.0, 1.0], size=80)
         y_test = rng.choice([0.0, 1.0], size=20)
-        p_value = adapter.permutation_test(
+        result = await adapter.permutation_test(
             x_train, y_train, x_test, y_test, original_auroc=0.5, n_permutations=50
         )
-        assert p_value > 0.1
+        assert result.p_value > 0.1
+        assert result.stopped_early
+        assert result.n_permutations < 50
 
-    def test_permutation_p_bounded(
+    @pytest.mark.asyncio
+    async def test_permutation_p_bounded(
         self,
         adapter: XGBoostAdapter,
         synthetic_data: tuple[
@@ -121,10 +147,27 @@ class TestPermutationTest:
         ],
     ) -> None:
         x_train, y_train, x_test, y_test = synthetic_data
-        p_value = adapter.permutation_test(
+        result = await adapter.permutation_test(
             x_train, y_train, x_test, y_test, original_auroc=0.5, n_permutations=50
         )
-        assert 0.0 < p_value <= 1.0
+        assert 0.0 < result.p_value <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_permutation_uses_adapter_budget(
+        self,
+        synthetic_data: tuple[
+            np.ndarray[..., np.dtype[np.float64]],
+            np.ndarray[..., np.dtype[np.float64]],
+            np.ndarray[..., np.dtype[np.float64]],
+            np.ndarray[..., np.dtype[np.float64]],
+        ],
+    ) -> None:
+        x_train, y_train, x_test, y_test = synthetic_data
+        result = await XGBoostAdapter(permutation_budget=7).permutation_test(
+            x_train, y_train, x_test, y_test, original_auroc=0.99
+        )
+        assert result.budget == 7
+        assert result.n_permutations == 7
 
 
 class TestPredict:
@@ -160,3 +203,20 @@ class TestPredict:
         model, _, _ = await adapter.train(x_train, y_train, x_test, y_test)
         probas = await adapter.predict(x_test, model)
         assert all(isinstance(p, float) for p in probas)
+
+    @pytest.mark.asyncio
+    async def test_dense_model_scores_sparse_rows_as_dense(
+        self,
+        adapter: XGBoostAdapter,
+        synthetic_data: tuple[
+            np.ndarray[..., np.dtype[np.float64]],
+            np.ndarray[..., np.dtype[np.float64]],
+            np.ndarray[..., np.dtype[np.float64]],
+            np.ndarray[..., np.dtype[np.float64]],
+        ],
+    ) -> None:
+        x_train, y_train, x_test, y_test = synthetic_data
+        model, _, _ = await adapter.train(x_train, y_train, x_test, y_test)
+        dense = await adapter.predict(x_test, model)
+        sparse = await adapter.predict(csr_matrix(x_test), model, feature_format="dense")
+        assert sparse == dense
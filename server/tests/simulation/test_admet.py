@@ -49,3 +49,18 @@ class TestPredictADMET:
         assert profile.excretion_clearance is not None
         assert profile.toxicity_ld50 is not None
         assert profile.qed is not None
+
+
+class TestPredictADMETBatch:
+    @pytest.mark.asyncio
+    async def test_matches_single_predictions(self, client: PkCSMClient) -> None:
+        smiles = [SMILES("CC(=O)Oc1ccccc1C(=O)O"), SMILES("c1ccc(cc1)[N+](=O)[O-]")]
+        profiles, errors = client.predict_batch(smiles)
+        assert errors == {}
+        assert profiles == [await client.predict(smi) for smi in smiles]
+
+    def test_invalid_rows_report_errors(self, client: PkCSMClient) -> None:
+        profiles, errors = client.predict_batch([SMILES("CCO"), SMILES("not_a_smiles!!!")])
+        assert profiles[0] is not None
+        assert profiles[1] is None
+        assert set(errors) == {1}
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ehrlich.chemistry.infrastructure.rdkit_adapter import RDKitAdapter
+from ehrlich.kernel.exceptions import TargetNotFoundError
+from ehrlich.kernel.types import SMILES
+from ehrlich.simulation.application.docking_scheduler import DockingScheduler
+from ehrlich.simulation.domain.docking_job import DockingJobStatus
+from ehrlich.simulation.infrastructure.docking_cache import (
+    CachedDocking,
+    DockingCache,
+    DockingKey,
+)
+from ehrlich.simulation.infrastructure.protein_store import ProteinStore
+from ehrlich.workers.pool import WorkerPool
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+
+@pytest.fixture
+async def scheduler(tmp_path: Path) -> AsyncIterator[DockingScheduler]:
+    scheduler = DockingScheduler(
+        ProteinStore(proteins_dir=tmp_path),
+        RDKitAdapter(),
+        cache=DockingCache(tmp_path / "docking.db"),
+        pool=WorkerPool(processes=0, threads=1),
+    )
+    yield scheduler
+    await scheduler.shutdown()
+
+
+async def _drain(scheduler: DockingScheduler, job_id: str) -> list[dict[str, object]]:
+    return [event async for event in scheduler.events(job_id)]
+
+
+class TestDock:
+    @pytest.mark.asyncio
+    async def test_estimate_without_receptor(self, scheduler: DockingScheduler) -> None:
+        result = await scheduler.dock(SMILES("c1ccccc1"), "1vqq")
+        assert result.target_id == "1VQQ"
+        assert "rdkit_estimate" in result.interactions["method"]
+        assert -12.0 <= result.binding_energy <= -2.0
+
+    @pytest.mark.asyncio
+    async def test_unknown_target_raises(self, scheduler: DockingScheduler) -> None:
+        with pytest.raises(TargetNotFoundError):
+            await scheduler.dock(SMILES("c1ccccc1"), "0XXX")
+
+
+class TestJobs:
+    @pytest.mark.asyncio
+    async def test_docks_every_ligand_against_every_target(
+        self, scheduler: DockingScheduler
+    ) -> None:
+        job = scheduler.submit([SMILES("CCO"), SMILES("c1ccccc1")], ["1VQQ", "2XCT"])
+        assert job.total == 4
+
+        events = await _drain(scheduler, job.id)
+        assert events[0]["type"] == "docking_queued"
+        assert events[-1]["type"] == "docking_completed"
+        assert [e["seq"] for e in events] == list(range(len(events)))
+        assert sum(1 for e in events if e["type"] == "docking_pair") == 4
+        assert job.status is DockingJobStatus.COMPLETED
+        assert {(r.smiles, r.target_id) for r in job.results} == {
+            ("CCO", "1VQQ"),
+            ("CCO", "2XCT"),
+            ("c1ccccc1", "1VQQ"),
+            ("c1ccccc1", "2XCT"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_invalid_smiles_recorded_as_error(self, scheduler: DockingScheduler) -> None:
+        job = scheduler.submit([SMILES("CCO"), SMILES("not_a_molecule")], ["1VQQ"])
+        events = await _drain(scheduler, job.id)
+        assert job.status is DockingJobStatus.COMPLETED
+        assert len(job.results) == 1
+        assert job.errors[0]["smiles"] == "not_a_molecule"
+        assert any("error" in e for e in events if e["type"] == "docking_pair")
+
+    @pytest.mark.asyncio
+    async def test_replay_from_last_event(self, scheduler: DockingScheduler) -> None:
+        job = scheduler.submit([SMILES("CCO")], ["1VQQ"])
+        events = await _drain(scheduler, job.id)
+        tail = [event async for event in scheduler.events(job.id, after=1)]
+        assert tail == events[1:]
+
+    @pytest.mark.asyncio
+    async def test_cancel_skips_queued_pairs(self, scheduler: DockingScheduler) -> None:
+        ligands = [SMILES("C" * n) for n in range(1, 21)]
+        job = scheduler.submit(ligands, ["1VQQ"])
+        scheduler.cancel(job.id)
+
+        events = await _drain(scheduler, job.id)
+        assert job.status is DockingJobStatus.CANCELLED
+        assert events[-1]["type"] == "docking_cancelled"
+        assert job.done < job.total
+
+    @pytest.mark.asyncio
+    async def test_unknown_target_rejects_job(self, scheduler: DockingScheduler) -> None:
+        with pytest.raises(TargetNotFoundError):
+            scheduler.submit([SMILES("CCO")], ["1VQQ", "0XXX"])
+        assert scheduler.stats()["jobs"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stats(self, scheduler: DockingScheduler) -> None:
+        job = scheduler.submit([SMILES("CCO")], ["1VQQ"])
+        await _drain(scheduler, job.id)
+        stats = scheduler.stats()
+        assert stats["jobs"] == 1
+        assert stats["active_jobs"] == 0
+        assert "vina_available" in stats
+
+
+class TestDockingCache:
+    def _key(self, **overrides: str) -> DockingKey:
+        fields = {
+            "inchikey": "LFQSCWFLJHTTHZ-UHFFFAOYSA-N",
+            "pdb_id": "1vqq",
+            "box": "0.000,0.000,0.000,20.000",
+            "variant": "vina-e8-n5",
+        }
+        return DockingKey(**{**fields, **overrides})
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        cache = DockingCache(tmp_path / "docking.db")
+        docked = CachedDocking(-7.2, "pose", {"method": ["autodock_vina"]})
+        cache.put(self._key(), docked)
+        assert cache.get(self._key(pdb_id="1VQQ")) == docked
+        assert cache.stats()["hits"] == 1
+
+    def test_box_and_variant_are_part_of_key(self, tmp_path: Path) -> None:
+        cache = DockingCache(tmp_path / "docking.db")
+        cache.put(self._key(), CachedDocking(-7.2, "", {}))
+        assert cache.get(self._key(box="1.000,0.000,0.000,20.000")) is None
+        assert cache.get(self._key(variant="vina-e32-n5")) is None
+
+    def test_evicts_oldest(self, tmp_path: Path) -> None:
+        cache = DockingCache(tmp_path / "docking.db", max_entries=2)
+        for pdb_id in ("1AAA", "2BBB", "3CCC"):
+            cache.put(self._key(pdb_id=pdb_id), CachedDocking(-5.0, "", {}))
+        assert cache.stats()["entries"] == 2
+        assert cache.get(self._key(pdb_id="1AAA")) is None
+
+    def test_evicts_least_recently_read(self, tmp_path: Path) -> None:
+        cache = DockingCache(tmp_path / "docking.db", max_entries=2)
+        cache.put(self._key(pdb_id="1AAA"), CachedDocking(-5.0, "", {}))
+        cache.put(self._key(pdb_id="2BBB"), CachedDocking(-5.0, "", {}))
+        cache.get(self._key(pdb_id="1AAA"))
+        cache.put(self._key(pdb_id="3CCC"), CachedDocking(-5.0, "", {}))
+        assert cache.get(self._key(pdb_id="2BBB")) is None
+        assert cache.get(self._key(pdb_id="1AAA")) is not None
@@ -5,7 +5,8 @@ from typing import TYPE_CHECKING
 import pytest
 import yaml
 
-from ehrlich.simulation.application.simulation_service import _load_resistance_data
+from ehrlich.chemistry.infrastructure.alert_catalog import load_alert_catalog
+from ehrlich.simulation.application.simulation_service import _load_known_mutations
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -34,26 +35,25 @@ def resistance_yaml(tmp_path: Path) -> Path:
     return path
 
 
-class TestLoadResistanceData:
+class TestLoadKnownMutations:
     def test_loads_mutations(self, resistance_yaml: Path) -> None:
-        mutations, patterns = _load_resistance_data(resistance_yaml)
+        mutations = _load_known_mutations(resistance_yaml)
         assert "1VQQ" in mutations
         assert len(mutations["1VQQ"]) == 2
         assert mutations["1VQQ"][0] == ("S403A", "HIGH", "Reduced binding")
         assert mutations["1VQQ"][1] == ("N146K", "MODERATE", "Altered access")
 
-    def test_loads_patterns(self, resistance_yaml: Path) -> None:
-        mutations, patterns = _load_resistance_data(resistance_yaml)
-        assert "C1C(C(=O)N1)S" in patterns
-        assert patterns["C1C(C(=O)N1)S"] == ["1VQQ"]
+    def test_patterns_go_to_alert_catalog(self, resistance_yaml: Path) -> None:
+        targets = {
+            a.smarts: a.targets for a in load_alert_catalog(resistance_yaml).select("resistance")
+        }
+        assert targets["C1C(C(=O)N1)S"] == ("1VQQ",)
 
     def test_missing_file_returns_empty(self, tmp_path: Path) -> None:
-        mutations, patterns = _load_resistance_data(tmp_path / "nonexistent.yaml")
-        assert mutations == {}
-        assert patterns == {}
+        assert _load_known_mutations(tmp_path / "nonexistent.yaml") == {}
 
     def test_multiple_targets(self, resistance_yaml: Path) -> None:
-        mutations, _ = _load_resistance_data(resistance_yaml)
+        mutations = _load_known_mutations(resistance_yaml)
         assert "2XCT" in mutations
         assert len(mutations["2XCT"]) == 1
         assert mutations["2XCT"][0][0] == "S84L"
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+
+from ehrlich.kernel.exceptions import ExternalServiceError
+from ehrlich.transport import client as transport
+from ehrlich.transport.circuit_breaker import CircuitBreaker
+from ehrlich.transport.client import ServiceClient, transport_stats
+
+_URL = "https://api.example.org/items"
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    recorded: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        recorded.append(delay)
+
+    monkeypatch.setattr(transport.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+class TestServiceClient:
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_success_records_metrics(self) -> None:
+        respx.get(_URL).mock(return_value=Response(200, json={"ok": True}))
+        resp = await ServiceClient("Example").get(_URL)
+        assert resp.json() == {"ok": True}
+        stats = transport_stats()["sources"]["Example"]
+        assert stats["requests"] == 1
+        assert stats["errors"] == 0
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_base_url_and_headers(self) -> None:
+        route = respx.get(_URL).mock(return_value=Response(200, json={}))
+        http = ServiceClient("Example", base_url="https://api.example.org/", headers={"x-k": "1"})
+        await http.get("/items", params={"q": "a"})
+        request = route.calls[0].request
+        assert request.headers["x-k"] == "1"
+        assert request.url.params["q"] == "a"
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(self, sleeps: list[float]) -> None:
+        respx.get(_URL).mock(
+            side_effect=[Response(429, headers={"Retry-After": "7"}), Response(200, json={})]
+        )
+        await ServiceClient("Example").get(_URL)
+        assert sleeps == [7.0]
+        assert transport_stats()["sources"]["Example"]["rate_limited"] == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_retry_after_is_capped(self, sleeps: list[float]) -> None:
+        respx.get(_URL).mock(
+            side_effect=[Response(429, headers={"Retry-After": "3600"}), Response(200, json={})]
+        )
+        await ServiceClient("Example").get(_URL)
+        assert sleeps == [30.0]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_rate_limit_exhausted(self, sleeps: list[float]) -> None:
+        respx.get(_URL).mock(return_value=Response(429))
+        with pytest.raises(ExternalServiceError, match="Rate limit exceeded"):
+            await ServiceClient("Example").get(_URL)
+        assert len(sleeps) == 2
+        assert 0.5 <= sleeps[0] <= 1.0
+        assert 1.0 <= sleeps[1] <= 2.0
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_retries_timeouts_then_fails(self, sleeps: list[float]) -> None:
+        route = respx.get(_URL).mock(side_effect=httpx.ReadTimeout("slow"))
+        with pytest.raises(ExternalServiceError, match="failed after 3 attempts"):
+            await ServiceClient("Example").get(_URL)
+        assert route.call_count == 3
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_retries_service_unavailable(self, sleeps: list[float]) -> None:
+        respx.get(_URL).mock(side_effect=[Response(503), Response(200, json={})])
+        resp = await ServiceClient("Example").get(_URL)
+        assert resp.status_code == 200
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_client_error_raises_immediately(self) -> None:
+        route = respx.get(_URL).mock(return_value=Response(400))
+        with pytest.raises(ExternalServiceError, match="HTTP 400"):
+            await ServiceClient("Example").get(_URL)
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_allowed_status_is_returned(self) -> None:
+        respx.get(_URL).mock(return_value=Response(404))
+        resp = await ServiceClient("Example").get(_URL, allow_statuses=(404,))
+        assert resp.status_code == 404
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_circuit_opens_for_host(self) -> None:
+        route = respx.get(_URL).mock(return_value=Response(500))
+        http = ServiceClient("Example")
+        for _ in range(5):
+            with pytest.raises(ExternalServiceError, match="HTTP 500"):
+                await http.get(_URL)
+        with pytest.raises(ExternalServiceError, match="Circuit open"):
+            await ServiceClient("Other").get(_URL)
+        assert route.call_count == 5
+        assert transport_stats()["circuits"]["api.example.org"] == "open"
+
+
+@pytest.fixture
+def half_open(monkeypatch: pytest.MonkeyPatch) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    monkeypatch.setattr(transport._Transport, "breaker", lambda self, host: breaker)
+    return breaker
+
+
+class TestHalfOpenTrial:
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_cancelled_trial_is_released(self, half_open: CircuitBreaker) -> None:
+        started = asyncio.Event()
+
+        async def hang(request: httpx.Request) -> Response:
+            started.set()
+            await asyncio.Event().wait()
+            raise AssertionError("unreachable")
+
+        respx.get(_URL).mock(side_effect=hang)
+        task = asyncio.create_task(ServiceClient("Example").get(_URL))
+        await started.wait()
+        assert not half_open.allow()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert half_open.state == "half_open"
+        assert half_open.allow()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_non_transport_error_releases_trial(self, half_open: CircuitBreaker) -> None:
+        respx.get(_URL).mock(side_effect=httpx.TooManyRedirects("loop"))
+        with pytest.raises(httpx.TooManyRedirects):
+            await ServiceClient("Example").get(_URL)
+        assert half_open.allow()
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_successful_trial_closes_circuit(self, half_open: CircuitBreaker) -> None:
+        respx.get(_URL).mock(return_value=Response(200, json={"ok": True}))
+        await ServiceClient("Example").get(_URL)
+        assert half_open.state == "closed"
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from ehrlich.transport.circuit_breaker import CircuitBreaker
+from ehrlich.transport.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_burst_is_immediate(self) -> None:
+        bucket = TokenBucket(rate=1.0, burst=3)
+        waits = [await bucket.acquire() for _ in range(3)]
+        assert waits == [0.0, 0.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_waits_once_burst_spent(self) -> None:
+        bucket = TokenBucket(rate=20.0, burst=1)
+        await bucket.acquire()
+        start = time.monotonic()
+        waited = await bucket.acquire()
+        assert waited > 0
+        assert time.monotonic() - start >= 0.04
+
+    def test_rejects_bad_config(self) -> None:
+        with pytest.raises(ValueError, match="rate"):
+            TokenBucket(rate=0.0)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30.0)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+        assert breaker.retry_after > 0
+
+    def test_success_resets_count(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == "closed"
+
+    def test_half_open_allows_single_trial(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+        breaker.record_failure()
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_released_trial_can_be_retaken(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.0)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.release_trial()
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+
+    def test_failed_trial_reopens(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open"
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+import respx
+from httpx import Response
+
+from ehrlich.kernel.exceptions import ExternalServiceError
+from ehrlich.transport import response_cache
+from ehrlich.transport.client import ServiceClient, enable_response_cache, transport_stats
+from ehrlich.transport.response_cache import ResponseCache, request_key
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_URL = "https://api.example.org/series"
+
+
+class TestRequestKey:
+    def test_param_order_does_not_matter(self) -> None:
+        a = request_key("GET", _URL, {"a": 1, "b": 2}, None, None)
+        b = request_key("GET", f"{_URL}?b=2", {"a": 1}, None, None)
+        assert a == b
+
+    def test_credentials_are_ignored(self) -> None:
+        a = request_key("GET", _URL, {"q": "x", "api_key": "secret"}, None, None)
+        b = request_key("GET", _URL, {"q": "x"}, None, None)
+        assert a == b
+
+    def test_body_is_part_of_key(self) -> None:
+        a = request_key("POST", _URL, None, {"series": ["A"]}, None)
+        b = request_key("POST", _URL, None, {"series": ["B"]}, None)
+        assert a != b
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_persists_across_instances(self, tmp_path: Path) -> None:
+        first = ResponseCache(tmp_path / "http.db")
+        await first.put("k", "Example", Response(200, json={"v": 1}, headers={"ETag": '"a"'}))
+        first.close()
+        second = ResponseCache(tmp_path / "http.db")
+        cached = await second.get("k")
+        assert cached is not None
+        assert cached.status == 200
+        assert cached.validators() == {"If-None-Match": '"a"'}
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_no_store_is_skipped(self, tmp_path: Path) -> None:
+        cache = ResponseCache(tmp_path / "http.db")
+        await cache.put("k", "Example", Response(200, headers={"Cache-Control": "no-store"}))
+        assert await cache.size() == 0
+        cache.close()
+
+
+class TestCachedServiceClient:
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_fresh_entry_skips_network(self, tmp_path: Path) -> None:
+        enable_response_cache(tmp_path / "http.db")
+        route = respx.get(_URL).mock(return_value=Response(200, json={"v": 1}))
+        http = ServiceClient("Example")
+        await http.get(_URL, params={"id": "A"})
+        resp = await http.get(_URL, params={"id": "A"})
+        assert resp.json() == {"v": 1}
+        assert route.call_count == 1
+        assert transport_stats()["sources"]["Example"]["cache_hits"] == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidates(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        enable_response_cache(tmp_path / "http.db")
+        monkeypatch.setitem(response_cache._FRESHNESS, "Example", 0.0)
+        route = respx.get(_URL).mock(
+            side_effect=[
+                Response(200, json={"v": 1}, headers={"ETag": '"v1"'}),
+                Response(304),
+            ]
+        )
+        http = ServiceClient("Example")
+        await http.get(_URL)
+        resp = await http.get(_URL)
+        assert resp.status_code == 200
+        assert resp.json() == {"v": 1}
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert transport_stats()["sources"]["Example"]["revalidated"] == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_offline_replays_recording(self, tmp_path: Path) -> None:
+        path = tmp_path / "http.db"
+        enable_response_cache(path)
+        respx.get(_URL).mock(return_value=Response(200, json={"v": 1}))
+        await ServiceClient("Example").get(_URL)
+
+        respx.reset()
+        enable_response_cache(path, offline=True)
+        resp = await ServiceClient("Example").get(_URL)
+        assert resp.json() == {"v": 1}
+        assert not respx.calls
+
+    @pytest.mark.asyncio
+    async def test_offline_miss_raises(self, tmp_path: Path) -> None:
+        enable_response_cache(tmp_path / "http.db", offline=True)
+        with pytest.raises(ExternalServiceError, match="offline mode"):
+            await ServiceClient("Example").get(_URL)
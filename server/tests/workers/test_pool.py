@@ -0,0 +1,123 @@
+import asyncio
+import operator
+import threading
+
+import pytest
+
+from ehrlich.chemistry.application.chemistry_service import ChemistryService
+from ehrlich.kernel.exceptions import InvalidSMILESError, JobCancelledError
+from ehrlich.kernel.types import SMILES
+from ehrlich.workers.pool import WorkerPool, job_group
+
+
+async def _wait_for(predicate: object, timeout: float = 5.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():  # type: ignore[operator]
+        if loop.time() > deadline:
+            raise AssertionError("condition not reached")
+        await asyncio.sleep(0.01)
+
+
+class TestThreadLane:
+    @pytest.mark.asyncio
+    async def test_returns_result(self) -> None:
+        pool = WorkerPool(processes=0, threads=2)
+        assert await pool.run_thread(operator.add, 2, 3) == 5
+        stats = pool.stats()["thread"]
+        assert stats["completed"] == 1
+        assert stats["running"] == 0
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates(self) -> None:
+        pool = WorkerPool(processes=0, threads=1)
+        with pytest.raises(ZeroDivisionError):
+            await pool.run_thread(operator.truediv, 1, 0)
+        assert pool.stats()["thread"]["failed"] == 1
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cpu_falls_back_to_threads(self) -> None:
+        pool = WorkerPool(processes=0, threads=1)
+        assert await pool.run_cpu(operator.mul, 4, 5) == 20
+        stats = pool.stats()
+        assert stats["process"] is None
+        assert stats["thread"]["completed"] == 1
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_and_utilization(self) -> None:
+        pool = WorkerPool(processes=0, threads=1)
+        gate = threading.Event()
+        first = asyncio.create_task(pool.run_thread(gate.wait))
+        second = asyncio.create_task(pool.run_thread(gate.wait))
+        await _wait_for(lambda: pool.stats()["thread"]["queued"] == 1)
+        stats = pool.stats()["thread"]
+        assert stats["running"] == 1
+        assert stats["utilization"] == 1.0
+        gate.set()
+        await asyncio.gather(first, second)
+        stats = pool.stats()["thread"]
+        assert (stats["queued"], stats["running"], stats["completed"]) == (0, 0, 2)
+        pool.shutdown()
+
+    def test_rejects_zero_threads(self) -> None:
+        with pytest.raises(ValueError, match="threads"):
+            WorkerPool(threads=0)
+
+
+class TestCancellation:
+    @pytest.mark.asyncio
+    async def test_cancel_group(self) -> None:
+        pool = WorkerPool(processes=0, threads=1)
+        gate = threading.Event()
+        with job_group("inv-1"):
+            running = asyncio.create_task(pool.run_thread(gate.wait))
+            queued = asyncio.create_task(pool.run_thread(gate.wait))
+        other = asyncio.create_task(pool.run_thread(operator.add, 1, 1))
+        await _wait_for(lambda: pool.stats()["thread"]["queued"] == 2)
+
+        assert pool.cancel_group("inv-1") == 2
+        with pytest.raises(JobCancelledError):
+            await running
+        with pytest.raises(JobCancelledError):
+            await queued
+        # The running call can't be interrupted; its slot frees once it returns.
+        gate.set()
+        assert await other == 2
+        assert pool.stats()["thread"]["cancelled"] == 2
+        assert pool.stats()["active_groups"] == 0
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_caller_cancellation_stays_cancelled_error(self) -> None:
+        pool = WorkerPool(processes=0, threads=1)
+        gate = threading.Event()
+        task = asyncio.create_task(pool.run_thread(gate.wait))
+        await _wait_for(lambda: pool.stats()["thread"]["running"] == 1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        gate.set()
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_unknown_group(self) -> None:
+        assert WorkerPool(processes=0).cancel_group("missing") == 0
+
+
+class TestProcessLane:
+    @pytest.mark.asyncio
+    async def test_conformer_in_worker_process(self) -> None:
+        pool = WorkerPool(processes=1, threads=1)
+        service = ChemistryService()
+        try:
+            conf = await pool.run_cpu(service.generate_conformer, SMILES("CCO"))
+            assert conf.num_atoms == 9
+            with pytest.raises(InvalidSMILESError) as exc_info:
+                await pool.run_cpu(service.generate_conformer, SMILES("not_a_smiles!!!"))
+            assert exc_info.value.smiles == "not_a_smiles!!!"
+            assert pool.stats()["process"]["completed"] == 1
+        finally:
+            pool.shutdown()
@@ -82,7 +82,7 @@ export function OpenSource() {
             </div>
             <div>
               <h3 className="text-foreground text-lg font-bold mb-2">
-                91 Tools, 4 Domains
+                92 Tools, 4 Domains
               </h3>
               <p className="text-muted-foreground leading-relaxed text-sm">
                 Molecular, training, nutrition, and impact evaluation. Each domain brings its own tools, scoring, and visualization. Add a{" "}
@@ -16,7 +16,7 @@ const PERSONAS = [
   {
     label: "Industry / Government",
     usage: "BYOK. Your Anthropic key, our methodology + tools.",
-    description: "91 computational tools, 28 data sources, structured reporting. Commercial license for private modifications. Self-host or use the hosted instance with your own Anthropic key.",
+    description: "92 computational tools, 28 data sources, structured reporting. Commercial license for private modifications. Self-host or use the hosted instance with your own Anthropic key.",
   },
 ] as const;
 
@@ -43,7 +43,7 @@ export function WhoItsFor() {
           Same product at every level.
         </h2>
         <p className="text-base text-muted-foreground leading-relaxed">
-          All 91 tools, all 28 data sources, and the full 6-phase methodology at every tier.
+          All 92 tools, all 28 data sources, and the full 6-phase methodology at every tier.
           The only variable is the Director model quality.
         </p>
       </div>
@@ -1,5 +1,5 @@
 export const STATS = {
-  tools: 91,
+  tools: 92,
   dataSources: 28,
   domains: 4,
   models: 3,
@@ -46,7 +46,7 @@ export const EXAMPLE_PROMPTS = [
 export const DIFFERENTIATORS = [
   {
     label: "Real Computation",
-    tagline: "91 tools that compute, not summarize.",
+    tagline: "92 tools that compute, not summarize.",
     description:
       "Ehrlich trains ML models, runs causal inference, executes statistical tests, and validates with controls. Every tool returns structured data from real computation or real APIs -- not summaries.",
     capabilities: [
@@ -61,7 +61,7 @@ export const DIFFERENTIATORS = [
     label: "Open Source, Self-Hostable",
     tagline: "COSS. Same code, two paths.",
     description:
-      "Self-host with your own API key for free -- no limits, no credits, no account. Or use the hosted instance where credits cover Anthropic API costs. A student in Mexico and a pharma company in Boston get the same 91 tools, the same 28 data sources, the same methodology.",
+      "Self-host with your own API key for free -- no limits, no credits, no account. Or use the hosted instance where credits cover Anthropic API costs. A student in Mexico and a pharma company in Boston get the same 92 tools, the same 28 data sources, the same methodology.",
     capabilities: [
       "Self-host: clone, bring your API key, no limits",
       "Hosted: credits cover Anthropic costs (Opus is expensive)",
@@ -211,7 +211,7 @@ export const METHODOLOGY_PHASES = [
     number: "04",
     label: "Experiment Execution",
     foundation: "Fisher (1935)",
-    description: "Experiments with independent/dependent variables, controls, confounders, and analysis plans. Two experiments run in parallel. 91 tools across 4 domains.",
+    description: "Experiments with independent/dependent variables, controls, confounders, and analysis plans. Two experiments run in parallel. 92 tools across 4 domains.",
   },
   {
     number: "05",
@@ -322,10 +322,10 @@ export const PRICING_TIERS_ORIGINAL = [
     price: "$0",
     period: "forever",
     credits: "3 Haiku investigations/month",
-    description: "Full methodology. All 91 tools. All 28 data sources. Findings indexed for future research.",
+    description: "Full methodology. All 92 tools. All 28 data sources. Findings indexed for future research.",
     features: [
       "Full 6-phase scientific methodology",
-      "All 91 tools, all 28 data sources, 4 domains",
+      "All 92 tools, all 28 data sources, 4 domains",
       "Full audit trail and report",
       "Self-referential search (tsvector)",
       "No feature gates",
@@ -411,7 +411,7 @@ export const PUBLIC_BETA_TIERS = [
       "Your own Anthropic API key",
       "No Ehrlich credit limits",
       "We cover the compute/hosting cost",
-      "Full 91 tool access",
+      "Full 92 tool access",
       "Perfect for hackathon evaluation",
     ],
     cta: "Use Own Key",